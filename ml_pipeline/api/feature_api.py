@@ -2,11 +2,15 @@
 FastAPI endpoints for feature store operations
 Provides REST API for feature retrieval with caching
 """
-from typing import List, Optional
+from typing import Iterator, List, Optional
 from datetime import date, datetime
+import io
 from fastapi import APIRouter, HTTPException, Query, Depends
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
 import pandas as pd
+import pyarrow as pa
 
 from ml_pipeline.data_storage.feature_store import FeatureStore
 from ml_pipeline.config.logging_config import main_logger
@@ -27,6 +31,86 @@ def get_feature_store() -> FeatureStore:
     return _feature_store
 
 
+# Streaming response formats
+ARROW_STREAM_MEDIA_TYPE = "application/vnd.apache.arrow.stream"
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+FORMAT_PATTERN = "^(json|arrow|ndjson)$"
+
+
+def _arrow_stream_chunks(
+    schema: pa.Schema,
+    batches: Iterator[pa.RecordBatch]
+) -> Iterator[bytes]:
+    """
+    Encode record batches as an Arrow IPC stream, one chunk per batch
+    
+    Args:
+        schema: Schema shared by all batches
+        batches: Record batches to encode
+        
+    Yields:
+        Encoded stream bytes
+    """
+    buffer = io.BytesIO()
+    
+    def drain() -> bytes:
+        data = buffer.getvalue()
+        buffer.seek(0)
+        buffer.truncate()
+        return data
+    
+    writer = pa.ipc.new_stream(buffer, schema)
+    yield drain()
+    
+    for batch in batches:
+        writer.write_batch(batch)
+        yield drain()
+    
+    writer.close()
+    yield drain()
+
+
+def _ndjson_chunks(batches: Iterator[pa.RecordBatch]) -> Iterator[bytes]:
+    """
+    Encode record batches as newline-delimited JSON, one chunk per batch
+    
+    Args:
+        batches: Record batches to encode
+        
+    Yields:
+        NDJSON bytes with ISO dates and nulls for missing values
+    """
+    for batch in batches:
+        yield batch.to_pandas().to_json(
+            orient='records', lines=True, date_format='iso'
+        ).encode('utf-8')
+
+
+def _streaming_response(
+    schema: pa.Schema,
+    batches: Iterator[pa.RecordBatch],
+    format: str
+) -> StreamingResponse:
+    """
+    Build a streaming response in the requested format
+    
+    Args:
+        schema: Schema shared by all batches
+        batches: Record batches to stream
+        format: 'arrow' or 'ndjson'
+        
+    Returns:
+        StreamingResponse producing the batches as they are read
+    """
+    if format == 'arrow':
+        return StreamingResponse(
+            _arrow_stream_chunks(schema, batches),
+            media_type=ARROW_STREAM_MEDIA_TYPE
+        )
+    
+    return StreamingResponse(_ndjson_chunks(batches), media_type=NDJSON_MEDIA_TYPE)
+
+
 # Request/Response models
 class FeatureQuery(BaseModel):
     """Feature query parameters"""
@@ -36,6 +120,14 @@ class FeatureQuery(BaseModel):
     end_date: Optional[date] = Field(None, description="End date for filtering")
     columns: Optional[List[str]] = Field(None, description="Specific columns to retrieve")
     use_cache: bool = Field(True, description="Whether to use Redis cache")
+    max_workers: Optional[int] = Field(
+        None, ge=1, le=16,
+        description="Threads reading files in parallel for multi-patient queries"
+    )
+    format: str = Field(
+        "json", pattern=FORMAT_PATTERN,
+        description="Response format: json, or arrow/ndjson to stream record batches"
+    )
 
 
 class FeatureResponse(BaseModel):
@@ -100,6 +192,12 @@ async def query_features(
     - Date range
     - Specific columns
     
+    Multi-patient queries are batched: locations are grouped by file and
+    each file is read once, optionally on max_workers threads.
+    
+    With format 'arrow' or 'ndjson' the result is streamed record batch by
+    record batch instead of being built as a single JSON document.
+    
     Uses Redis caching for frequently accessed features
     """
     try:
@@ -109,12 +207,22 @@ async def query_features(
         elif query.start_date:
             date_range = (query.start_date, query.start_date)
         
+        if query.format != 'json':
+            schema, batches = feature_store.stream_features(
+                patient_ids=query.patient_ids,
+                cohorts=query.cohorts,
+                date_range=date_range,
+                columns=query.columns
+            )
+            return _streaming_response(schema, batches, query.format)
+        
         df = feature_store.read_features(
             patient_ids=query.patient_ids,
             cohorts=query.cohorts,
             date_range=date_range,
             columns=query.columns,
-            use_cache=query.use_cache
+            use_cache=query.use_cache,
+            max_workers=query.max_workers
         )
         
         # Convert DataFrame to list of dicts
@@ -156,6 +264,7 @@ async def query_features(
 async def get_patient_features(
     patient_id: str,
     use_cache: bool = Query(True, description="Use Redis cache"),
+    format: str = Query("json", pattern=FORMAT_PATTERN, description="json, arrow or ndjson"),
     feature_store: FeatureStore = Depends(get_feature_store)
 ):
     """
@@ -163,8 +272,13 @@ async def get_patient_features(
     
     Returns all visits and features for the patient.
     Results are cached in Redis for fast subsequent access.
+    With format 'arrow' or 'ndjson' the visits are streamed uncached.
     """
     try:
+        if format != 'json':
+            schema, batches = feature_store.stream_features(patient_ids=[patient_id])
+            return _streaming_response(schema, batches, format)
+        
         df = feature_store.get_patient_features(
             patient_id=patient_id,
             use_cache=use_cache
@@ -425,6 +539,7 @@ async def get_training_data(
     start_date: Optional[date] = Query(None, description="Start date"),
     end_date: Optional[date] = Query(None, description="End date"),
     min_completeness: float = Query(0.7, description="Minimum completeness threshold"),
+    format: str = Query("json", pattern=FORMAT_PATTERN, description="json, arrow or ndjson"),
     feature_store: FeatureStore = Depends(get_feature_store)
 ):
     """
@@ -436,14 +551,27 @@ async def get_training_data(
     - Feature names
     - Label distribution
     
-    Note: This endpoint returns metadata only. Use the download endpoint for actual data.
+    Note: With format 'json' this endpoint returns metadata only. Use format
+    'arrow' or 'ndjson' to stream the feature columns followed by 'diagnosis'.
     """
     try:
         date_range = None
         if start_date and end_date:
             date_range = (start_date, end_date)
         
-        features, labels = feature_store.get_training_data(
+        # Both paths scan the selected cohorts, so they run in a worker
+        # thread rather than blocking the event loop
+        if format != 'json':
+            schema, batches = await run_in_threadpool(
+                feature_store.stream_training_data,
+                cohorts=cohorts,
+                date_range=date_range,
+                min_completeness=min_completeness
+            )
+            return _streaming_response(schema, batches, format)
+        
+        features, labels = await run_in_threadpool(
+            feature_store.get_training_data,
             cohorts=cohorts,
             date_range=date_range,
             min_completeness=min_completeness
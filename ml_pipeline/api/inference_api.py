@@ -13,6 +13,12 @@ Implements Requirements:
 - 9.2: Generate 6, 12, 24-month progression forecasts
 - 12.3: Cache loaded models in memory
 - 3.5: Validate feature inputs
+
+Model loading, prediction, SHAP explanations and forecasting block, so they
+run on bounded worker pools (see inference_executor) instead of the event
+loop. Saturated pools answer 503 and responses report per-stage timings.
+Concurrent single /predict calls are micro-batched into one predict_proba.
+Models are cached per version and follow promotions without a restart.
 """
 from typing import List, Optional, Dict, Any
 from datetime import datetime
@@ -27,19 +33,44 @@ from ml_pipeline.models.model_registry import ModelRegistry
 from ml_pipeline.interpretability.interpretability_system import InterpretabilitySystem
 from ml_pipeline.forecasting.progression_forecaster import ProgressionForecaster
 from ml_pipeline.config.logging_config import main_logger
+from ml_pipeline.config.settings import settings
+from ml_pipeline.api.inference_executor import (
+    InferenceExecutor,
+    InferenceQueueFull,
+    InferenceTimeout
+)
+from ml_pipeline.api.micro_batcher import MicroBatcher
+from ml_pipeline.api.model_cache import ModelCache
 
 
 # Initialize router
 router = APIRouter(prefix="/api/v1", tags=["inference"])
 
-# Model cache (Requirement 12.3: Cache loaded models in memory)
-_model_cache = {}
+# Per-version state derived from cached models
 _interpretability_cache = {}
 _forecaster_cache = {}
 
 # Model registry
 _model_registry = None
 
+# Worker pools for blocking work; explanations get their own pool so slow
+# SHAP runs cannot starve predictions
+_inference_executor = InferenceExecutor(
+    "predict",
+    max_workers=settings.INFERENCE_WORKERS,
+    max_queue_depth=settings.INFERENCE_MAX_QUEUE_DEPTH,
+    timeout=settings.INFERENCE_TIMEOUT_SECONDS
+)
+_explanation_executor = InferenceExecutor(
+    "explain",
+    max_workers=settings.EXPLANATION_WORKERS,
+    max_queue_depth=settings.EXPLANATION_MAX_QUEUE_DEPTH,
+    timeout=settings.INFERENCE_TIMEOUT_SECONDS
+)
+
+# Micro-batchers for single predictions, keyed by model name and version
+_micro_batchers: Dict[str, MicroBatcher] = {}
+
 
 def get_model_registry() -> ModelRegistry:
     """Get model registry instance"""
@@ -49,6 +80,26 @@ def get_model_registry() -> ModelRegistry:
     return _model_registry
 
 
+def _drop_version_state(model_name: str, version_id: str):
+    """Drop interpretability systems, batchers and forecasters of an evicted model"""
+    cache_key = f"{model_name}_{version_id}"
+    _interpretability_cache.pop(cache_key, None)
+    _micro_batchers.pop(cache_key, None)
+    _forecaster_cache.pop(cache_key, None)
+
+
+# Model cache (Requirement 12.3: Cache loaded models in memory), bounded and
+# keyed by version; promotions preload the new version before it is served
+_model_cache = ModelCache(
+    get_model_registry,
+    max_bytes=settings.MODEL_CACHE_MAX_BYTES,
+    max_entries=settings.MODEL_CACHE_MAX_ENTRIES,
+    pointer_ttl=settings.MODEL_POINTER_TTL_SECONDS,
+    on_evict=_drop_version_state
+)
+ModelRegistry.add_promotion_listener(_model_cache.on_promotion)
+
+
 # Request/Response models
 
 class FeatureInput(BaseModel):
@@ -128,6 +179,7 @@ class PredictionResponse(BaseModel):
     model_version: str
     explanation: Optional[Dict[str, Any]] = None
     generation_time: float
+    timings: Optional[Dict[str, float]] = None
 
 
 class BatchPredictionRequest(BaseModel):
@@ -143,6 +195,7 @@ class BatchPredictionResponse(BaseModel):
     predictions: List[PredictionResponse]
     total_count: int
     generation_time: float
+    timings: Optional[Dict[str, float]] = None
 
 
 class ForecastRequest(BaseModel):
@@ -171,6 +224,7 @@ class ForecastResponse(BaseModel):
     uncertainty: Dict[str, float]
     timestamp: str
     generation_time: float
+    timings: Optional[Dict[str, float]] = None
 
 
 class ExplanationResponse(BaseModel):
@@ -184,7 +238,7 @@ class ExplanationResponse(BaseModel):
 
 def load_model_with_cache(model_name: str, registry: ModelRegistry):
     """
-    Load model with caching (Requirement 12.3)
+    Load production model with caching (Requirement 12.3)
     
     Args:
         model_name: Name of the model
@@ -193,20 +247,7 @@ def load_model_with_cache(model_name: str, registry: ModelRegistry):
     Returns:
         Tuple of (model, metadata)
     """
-    cache_key = f"{model_name}_production"
-    
-    if cache_key in _model_cache:
-        main_logger.debug(f"Using cached model: {model_name}")
-        return _model_cache[cache_key]
-    
-    # Load from registry
-    main_logger.info(f"Loading model from registry: {model_name}")
-    model, metadata = registry.load_model(model_name)
-    
-    # Cache the model
-    _model_cache[cache_key] = (model, metadata)
-    
-    return model, metadata
+    return _model_cache.get(model_name, registry)
 
 
 def get_interpretability_system(model_name: str, model, metadata):
@@ -240,7 +281,10 @@ def get_interpretability_system(model_name: str, model, metadata):
         feature_names=metadata.get('feature_names', []),
         output_dir=f"ml_pipeline/data_storage/interpretability/{model_name}",
         cache_explanations=True,
-        max_background_samples=100
+        max_background_samples=100,
+        model_version=metadata['version_id'],
+        cache_max_entries=settings.EXPLANATION_CACHE_MAX_ENTRIES,
+        cache_max_bytes=settings.EXPLANATION_CACHE_MAX_BYTES
     )
     
     # Initialize (without background data for now)
@@ -308,6 +352,185 @@ def get_risk_category(probability: float) -> str:
         return "Very High Risk"
 
 
+def predict_probabilities(model, X: np.ndarray) -> np.ndarray:
+    """
+    Get positive-class probabilities for a feature matrix
+    
+    Args:
+        model: Model object
+        X: Feature matrix
+        
+    Returns:
+        Array of probabilities, one per row
+    """
+    if hasattr(model, 'predict_proba'):
+        return model.predict_proba(X)[:, 1]
+    return model.predict(X)
+
+
+def get_micro_batcher(model_name: str, model, metadata: Dict[str, Any]) -> MicroBatcher:
+    """
+    Get or create the micro-batcher for a model version
+    
+    Args:
+        model_name: Name of the model
+        model: Model object
+        metadata: Model metadata
+        
+    Returns:
+        MicroBatcher running predict_probabilities on the model
+    """
+    cache_key = f"{model_name}_{metadata['version_id']}"
+    
+    if cache_key not in _micro_batchers:
+        _micro_batchers[cache_key] = MicroBatcher(
+            model_name,
+            lambda X: predict_probabilities(model, X),
+            _inference_executor,
+            max_batch_size=settings.MICRO_BATCH_MAX_SIZE,
+            max_wait_ms=settings.MICRO_BATCH_MAX_WAIT_MS
+        )
+    
+    return _micro_batchers[cache_key]
+
+
+def generate_explanation(
+    model_name: str,
+    model,
+    metadata: Dict[str, Any],
+    X: np.ndarray,
+    prediction: int,
+    probability: float
+) -> Dict[str, Any]:
+    """
+    Generate SHAP explanation for a single prediction
+    
+    Args:
+        model_name: Name of the model
+        model: Model object
+        metadata: Model metadata
+        X: Feature matrix with one row
+        prediction: Predicted class
+        probability: Predicted probability
+        
+    Returns:
+        Explanation dictionary
+    """
+    interp_system = get_interpretability_system(model_name, model, metadata)
+    return interp_system.explain_prediction(
+        X,
+        prediction,
+        probability,
+        use_cache=True
+    )
+
+
+def generate_batch_explanations(
+    model_name: str,
+    model,
+    metadata: Dict[str, Any],
+    X_batch: np.ndarray,
+    predictions: np.ndarray,
+    probabilities: np.ndarray
+) -> List[Optional[Dict[str, Any]]]:
+    """
+    Generate SHAP explanations for a batch of predictions
+    
+    SHAP values for the batch are computed in one vectorized call. If that
+    fails, rows are explained one at a time so a single bad row does not
+    cost the whole batch its explanations.
+    
+    Args:
+        model_name: Name of the model
+        model: Model object
+        metadata: Model metadata
+        X_batch: Feature matrix
+        predictions: Predicted classes
+        probabilities: Predicted probabilities
+        
+    Returns:
+        Explanation per row, None where explanation failed
+    """
+    interp_system = get_interpretability_system(model_name, model, metadata)
+    try:
+        return interp_system.explain_batch(
+            X_batch,
+            predictions,
+            probabilities,
+            use_cache=True
+        )
+    except Exception as e:
+        main_logger.warning(f"Batch explanation failed, explaining rows individually: {e}")
+    
+    explanations = []
+    for i, (pred, prob) in enumerate(zip(predictions, probabilities)):
+        try:
+            explanations.append(generate_explanation(
+                model_name,
+                model,
+                metadata,
+                X_batch[i:i+1],
+                int(pred),
+                float(prob)
+            ))
+        except Exception as e:
+            main_logger.warning(f"Failed to generate explanation: {e}")
+            explanations.append(None)
+    
+    return explanations
+
+
+def load_forecaster_with_cache(registry: ModelRegistry) -> ProgressionForecaster:
+    """
+    Load progression forecaster with caching
+    
+    Args:
+        registry: Model registry instance
+        
+    Returns:
+        ProgressionForecaster instance
+        
+    Raises:
+        HTTPException if the forecaster is not registered
+    """
+    # Load forecaster model from registry (cached per version)
+    try:
+        forecaster_model, forecaster_metadata = _model_cache.get("progression_forecaster", registry)
+    except Exception as e:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Progression forecaster not found: {str(e)}"
+        )
+    
+    forecaster_key = f"progression_forecaster_{forecaster_metadata['version_id']}"
+    
+    if forecaster_key not in _forecaster_cache:
+        forecaster = ProgressionForecaster()
+        forecaster.model = forecaster_model
+        _forecaster_cache[forecaster_key] = forecaster
+    
+    return _forecaster_cache[forecaster_key]
+
+
+def executor_http_error(error: Exception) -> HTTPException:
+    """
+    Convert an executor backpressure error to an HTTP error
+    
+    Args:
+        error: InferenceQueueFull or InferenceTimeout
+        
+    Returns:
+        HTTPException with 503 (saturated, retry later) or 504 (timed out)
+    """
+    if isinstance(error, InferenceQueueFull):
+        return HTTPException(
+            status_code=503,
+            detail=str(error),
+            headers={"Retry-After": "1"}
+        )
+    return HTTPException(status_code=504, detail=str(error))
+
+
 # API Endpoints
 
 @router.post("/predict", response_model=PredictionResponse)
@@ -332,10 +555,17 @@ async def predict(
     """
     start_time = time.time()
     prediction_id = str(uuid.uuid4())
+    timings: Dict[str, float] = {}
     
     try:
         # Load model with caching (Requirement 12.3)
-        model, metadata = load_model_with_cache(request.model_name, registry)
+        model, metadata = await _inference_executor.run(
+            load_model_with_cache,
+            request.model_name,
+            registry,
+            stage='model_load',
+            timings=timings
+        )
         
         # Validate and prepare features (Requirement 3.5)
         required_features = metadata.get('feature_names', [])
@@ -347,11 +577,9 @@ async def predict(
         
         X = validate_features(request.features, required_features)
         
-        # Generate prediction
-        if hasattr(model, 'predict_proba'):
-            probability = float(model.predict_proba(X)[0, 1])
-        else:
-            probability = float(model.predict(X)[0])
+        # Generate prediction, batched with concurrent requests
+        batcher = get_micro_batcher(request.model_name, model, metadata)
+        probability = float(await batcher.predict(X, timings=timings))
         
         prediction = int(probability >= 0.5)
         
@@ -372,22 +600,23 @@ async def predict(
         explanation = None
         if request.include_explanation:
             try:
-                interp_system = get_interpretability_system(
+                explanation = await _explanation_executor.run(
+                    generate_explanation,
                     request.model_name,
                     model,
-                    metadata
-                )
-                explanation = interp_system.explain_prediction(
+                    metadata,
                     X,
                     prediction,
                     probability,
-                    use_cache=True
+                    stage='explanation',
+                    timings=timings
                 )
             except Exception as e:
                 main_logger.warning(f"Failed to generate explanation: {e}")
                 explanation = {"error": str(e)}
         
         generation_time = time.time() - start_time
+        timings['total'] = generation_time
         
         main_logger.info(
             f"Prediction generated: {prediction} (prob={probability:.3f}) "
@@ -410,11 +639,14 @@ async def predict(
             model_name=request.model_name,
             model_version=metadata['version_id'],
             explanation=explanation,
-            generation_time=generation_time
+            generation_time=generation_time,
+            timings=timings
         )
         
     except HTTPException:
         raise
+    except (InferenceQueueFull, InferenceTimeout) as e:
+        raise executor_http_error(e)
     except Exception as e:
         main_logger.error(
             f"Prediction failed: {str(e)}",
@@ -481,25 +713,16 @@ async def forecast_progression(
     - Provide uncertainty quantification
     """
     start_time = time.time()
+    timings: Dict[str, float] = {}
     
     try:
         # Load forecaster model
-        forecaster_key = "progression_forecaster"
-        
-        if forecaster_key not in _forecaster_cache:
-            # Load forecaster from registry
-            try:
-                forecaster_model, forecaster_metadata = registry.load_model("progression_forecaster")
-                forecaster = ProgressionForecaster()
-                forecaster.model = forecaster_model
-                _forecaster_cache[forecaster_key] = forecaster
-            except Exception as e:
-                raise HTTPException(
-                    status_code=404,
-                    detail=f"Progression forecaster not found: {str(e)}"
-                )
-        else:
-            forecaster = _forecaster_cache[forecaster_key]
+        forecaster = await _inference_executor.run(
+            load_forecaster_with_cache,
+            registry,
+            stage='model_load',
+            timings=timings
+        )
         
         # Validate patient history length
         if len(request.patient_history) < 4:
@@ -516,9 +739,12 @@ async def forecast_progression(
         feature_columns = [col for col in patient_df.columns if patient_df[col].notna().any()]
         
         # Generate forecast
-        forecasts = forecaster.forecast_single_patient(
+        forecasts = await _inference_executor.run(
+            forecaster.forecast_single_patient,
             patient_df,
-            feature_columns
+            feature_columns,
+            stage='forecast',
+            timings=timings
         )
         
         # Calculate uncertainty (simple placeholder)
@@ -528,6 +754,7 @@ async def forecast_progression(
         }
         
         generation_time = time.time() - start_time
+        timings['total'] = generation_time
         
         main_logger.info(
             f"Forecast generated for patient {request.patient_id} "
@@ -544,11 +771,14 @@ async def forecast_progression(
             forecasts=forecasts,
             uncertainty=uncertainty,
             timestamp=datetime.utcnow().isoformat(),
-            generation_time=generation_time
+            generation_time=generation_time,
+            timings=timings
         )
         
     except HTTPException:
         raise
+    except (InferenceQueueFull, InferenceTimeout) as e:
+        raise executor_http_error(e)
     except Exception as e:
         main_logger.error(
             f"Forecast failed: {str(e)}",
@@ -572,10 +802,17 @@ async def batch_predict(
     - Cache model loading
     """
     start_time = time.time()
+    timings: Dict[str, float] = {}
     
     try:
         # Load model with caching
-        model, metadata = load_model_with_cache(request.model_name, registry)
+        model, metadata = await _inference_executor.run(
+            load_model_with_cache,
+            request.model_name,
+            registry,
+            stage='model_load',
+            timings=timings
+        )
         
         required_features = metadata.get('feature_names', [])
         if not required_features:
@@ -593,13 +830,34 @@ async def batch_predict(
         X_batch = np.array(X_batch)
         
         # Batch prediction
-        if hasattr(model, 'predict_proba'):
-            probabilities = model.predict_proba(X_batch)[:, 1]
-        else:
-            probabilities = model.predict(X_batch)
+        probabilities = await _inference_executor.run(
+            predict_probabilities,
+            model,
+            X_batch,
+            stage='predict',
+            timings=timings
+        )
         
         predictions = (probabilities >= 0.5).astype(int)
         
+        # Explanations (optional, slower)
+        explanations = [None] * len(predictions)
+        if request.include_explanation:
+            try:
+                explanations = await _explanation_executor.run(
+                    generate_batch_explanations,
+                    request.model_name,
+                    model,
+                    metadata,
+                    X_batch,
+                    predictions,
+                    probabilities,
+                    stage='explanation',
+                    timings=timings
+                )
+            except Exception as e:
+                main_logger.warning(f"Failed to generate explanations: {e}")
+        
         # Generate responses
         responses = []
         for i, (pred, prob) in enumerate(zip(predictions, probabilities)):
@@ -616,24 +874,6 @@ async def batch_predict(
                     "confidence_level": 0.95
                 }
             
-            # Explanations (optional, slower)
-            explanation = None
-            if request.include_explanation:
-                try:
-                    interp_system = get_interpretability_system(
-                        request.model_name,
-                        model,
-                        metadata
-                    )
-                    explanation = interp_system.explain_prediction(
-                        X_batch[i:i+1],
-                        int(pred),
-                        float(prob),
-                        use_cache=True
-                    )
-                except Exception as e:
-                    main_logger.warning(f"Failed to generate explanation: {e}")
-            
             responses.append(PredictionResponse(
                 prediction_id=prediction_id,
                 prediction=int(pred),
@@ -643,11 +883,12 @@ async def batch_predict(
                 timestamp=datetime.utcnow().isoformat(),
                 model_name=request.model_name,
                 model_version=metadata['version_id'],
-                explanation=explanation,
+                explanation=explanations[i],
                 generation_time=0.0  # Individual time not tracked in batch
             ))
         
         generation_time = time.time() - start_time
+        timings['total'] = generation_time
         
         main_logger.info(
             f"Batch prediction completed: {len(responses)} predictions "
@@ -662,11 +903,14 @@ async def batch_predict(
         return BatchPredictionResponse(
             predictions=responses,
             total_count=len(responses),
-            generation_time=generation_time
+            generation_time=generation_time,
+            timings=timings
         )
         
     except HTTPException:
         raise
+    except (InferenceQueueFull, InferenceTimeout) as e:
+        raise executor_http_error(e)
     except Exception as e:
         main_logger.error(
             f"Batch prediction failed: {str(e)}",
@@ -680,13 +924,25 @@ async def get_cache_status():
     """
     Get status of model cache
     
-    Returns information about cached models
+    Returns information about cached models and inference worker load
     """
     return {
-        "cached_models": list(_model_cache.keys()),
+        "cached_models": _model_cache.keys(),
         "cached_interpretability_systems": list(_interpretability_cache.keys()),
         "cached_forecasters": list(_forecaster_cache.keys()),
-        "total_cached": len(_model_cache) + len(_interpretability_cache) + len(_forecaster_cache)
+        "total_cached": len(_model_cache) + len(_interpretability_cache) + len(_forecaster_cache),
+        "model_cache": _model_cache.get_stats(),
+        "executors": {
+            "predict": _inference_executor.get_stats(),
+            "explain": _explanation_executor.get_stats()
+        },
+        "micro_batchers": {
+            key: batcher.get_stats() for key, batcher in list(_micro_batchers.items())
+        },
+        "explanation_caches": {
+            key: interp_system.get_cache_stats()
+            for key, interp_system in list(_interpretability_cache.items())
+        }
     }
 
 
@@ -695,19 +951,19 @@ async def clear_model_cache():
     """
     Clear model cache
     
-    Useful for forcing model reload after updates
+    Not needed after promotions, which the cache follows on its own; useful
+    for forcing a reload of the same version
     """
-    global _model_cache, _interpretability_cache, _forecaster_cache
-    
     cache_sizes = {
         "models_cleared": len(_model_cache),
         "interpretability_systems_cleared": len(_interpretability_cache),
         "forecasters_cleared": len(_forecaster_cache)
     }
     
-    _model_cache = {}
-    _interpretability_cache = {}
-    _forecaster_cache = {}
+    _model_cache.clear()
+    _interpretability_cache.clear()
+    _forecaster_cache.clear()
+    _micro_batchers.clear()
     
     main_logger.info("Model cache cleared", extra={'operation': 'clear_cache'})
     
@@ -0,0 +1,173 @@
+"""
+Bounded executors for blocking inference work
+
+Model prediction, SHAP explanations and forecasting are CPU-bound and would
+stall the event loop if called from async endpoints. InferenceExecutor runs
+them on a sized worker pool with a queue-depth limit, so a saturated pool
+rejects new work (HTTP 503) instead of letting the queue grow without bound.
+"""
+import asyncio
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Optional
+
+from ml_pipeline.config.logging_config import main_logger
+
+
+class InferenceQueueFull(Exception):
+    """Raised when an executor's queue is at its depth limit"""
+
+
+class InferenceTimeout(Exception):
+    """Raised when work does not finish within the executor's timeout"""
+
+
+class InferenceExecutor:
+    """
+    Worker pool for blocking inference calls with backpressure.
+
+    Threads are used rather than processes: the models are shared without
+    pickling, and numpy, scikit-learn, XGBoost and TensorFlow release the
+    GIL in their numeric kernels.
+
+    At most max_workers calls run at once and at most max_queue_depth wait
+    for a worker; further calls raise InferenceQueueFull immediately. A call
+    that exceeds the timeout raises InferenceTimeout but keeps its slot until
+    the worker finishes, so timed-out work still counts against the limit.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_workers: int,
+        max_queue_depth: int,
+        timeout: Optional[float] = None
+    ):
+        """
+        Initialize inference executor
+
+        Args:
+            name: Name used for worker threads and logging
+            max_workers: Number of worker threads
+            max_queue_depth: Number of calls allowed to wait for a worker
+            timeout: Seconds to wait for a call, or None to wait indefinitely
+        """
+        self.name = name
+        self.max_workers = max_workers
+        self.max_queue_depth = max_queue_depth
+        self.timeout = timeout
+
+        self._executor = ThreadPoolExecutor(
+            max_workers=max_workers,
+            thread_name_prefix=f"inference-{name}"
+        )
+        self._lock = threading.Lock()
+        self._in_flight = 0
+        self._rejected = 0
+        self._timed_out = 0
+
+    @property
+    def capacity(self) -> int:
+        """Maximum number of running and queued calls"""
+        return self.max_workers + self.max_queue_depth
+
+    def _acquire(self) -> bool:
+        """Reserve a slot, returning False if the executor is saturated"""
+        with self._lock:
+            if self._in_flight >= self.capacity:
+                self._rejected += 1
+                return False
+            self._in_flight += 1
+            return True
+
+    def _release(self, _future=None):
+        """Free a slot when a call finishes or is cancelled before starting"""
+        with self._lock:
+            self._in_flight -= 1
+
+    async def run(
+        self,
+        func: Callable[..., Any],
+        *args,
+        stage: Optional[str] = None,
+        timings: Optional[Dict[str, float]] = None,
+        **kwargs
+    ) -> Any:
+        """
+        Run a blocking call on the worker pool
+
+        Args:
+            func: Function to call
+            *args: Positional arguments for func
+            stage: Name under which to record timings
+            timings: Dictionary receiving '<stage>_queue' (seconds waiting
+                for a worker) and '<stage>' (seconds running)
+            **kwargs: Keyword arguments for func
+
+        Returns:
+            Return value of func
+
+        Raises:
+            InferenceQueueFull if the executor is saturated
+            InferenceTimeout if the call exceeds the timeout
+        """
+        if not self._acquire():
+            main_logger.warning(
+                f"Inference executor '{self.name}' saturated, rejecting request",
+                extra={'operation': 'inference_executor', 'executor': self.name}
+            )
+            raise InferenceQueueFull(f"Inference queue '{self.name}' is full")
+
+        submitted = time.perf_counter()
+
+        def timed_call():
+            started = time.perf_counter()
+            result = func(*args, **kwargs)
+            return result, started - submitted, time.perf_counter() - started
+
+        try:
+            future = self._executor.submit(timed_call)
+        except Exception:
+            self._release()
+            raise
+        future.add_done_callback(self._release)
+
+        try:
+            result, queue_time, run_time = await asyncio.wait_for(
+                asyncio.wrap_future(future),
+                timeout=self.timeout
+            )
+        except asyncio.TimeoutError:
+            with self._lock:
+                self._timed_out += 1
+            raise InferenceTimeout(
+                f"Inference stage '{stage or self.name}' exceeded {self.timeout}s"
+            )
+
+        if stage and timings is not None:
+            timings[f"{stage}_queue"] = timings.get(f"{stage}_queue", 0.0) + queue_time
+            timings[stage] = timings.get(stage, 0.0) + run_time
+
+        return result
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get executor load statistics
+
+        Returns:
+            Dictionary with limits, calls in flight and rejection counts
+        """
+        with self._lock:
+            return {
+                'max_workers': self.max_workers,
+                'max_queue_depth': self.max_queue_depth,
+                'in_flight': self._in_flight,
+                'queued': max(0, self._in_flight - self.max_workers),
+                'rejected': self._rejected,
+                'timed_out': self._timed_out
+            }
+
+    def shutdown(self, wait: bool = True):
+        """Stop the worker pool"""
+        self._executor.shutdown(wait=wait)
@@ -0,0 +1,168 @@
+"""
+Dynamic micro-batching for single-sample predictions
+
+Models are much cheaper per row in batches, so MicroBatcher collects
+concurrent single-row requests and runs them as one vectorized call on an
+InferenceExecutor, then hands each caller its own row of the result.
+"""
+import asyncio
+import time
+from typing import Callable, Dict, List, Optional, Tuple, Any
+
+import numpy as np
+
+from ml_pipeline.api.inference_executor import InferenceExecutor
+from ml_pipeline.config.prometheus_metrics import metrics_collector
+
+
+class MicroBatcher:
+    """
+    Coalesces concurrent single-row predictions into batches.
+
+    Batching adapts to load: when no batch is running a request is sent at
+    once, so a lone request pays no extra latency. While a batch is running,
+    new requests accumulate and are sent when the batch finishes, when
+    max_batch_size rows are waiting, or after max_wait_ms, whichever comes
+    first.
+
+    All methods must be called from the same event loop.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        predict_fn: Callable[[np.ndarray], np.ndarray],
+        executor: InferenceExecutor,
+        max_batch_size: int = 32,
+        max_wait_ms: float = 2.0
+    ):
+        """
+        Initialize micro-batcher
+
+        Args:
+            name: Model name used in metrics
+            predict_fn: Function mapping an N×F matrix to N results
+            executor: Executor running predict_fn
+            max_batch_size: Maximum rows per batch
+            max_wait_ms: Maximum milliseconds a request waits for a batch
+        """
+        self.name = name
+        self.predict_fn = predict_fn
+        self.executor = executor
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+
+        # Waiting requests: (row, future, enqueue time, caller timings)
+        self._pending: List[Tuple[np.ndarray, asyncio.Future, float, Optional[Dict[str, float]]]] = []
+        self._flush_handle: Optional[asyncio.TimerHandle] = None
+        self._running_batches = 0
+
+        self._batches = 0
+        self._requests = 0
+        self._max_batch_seen = 0
+        self._total_queue_delay = 0.0
+
+    async def predict(
+        self,
+        x: np.ndarray,
+        timings: Optional[Dict[str, float]] = None
+    ) -> Any:
+        """
+        Predict a single row as part of a batch
+
+        Args:
+            x: Feature row (shape (F,) or (1, F))
+            timings: Dictionary receiving 'batch_wait' (seconds waiting for
+                the batch to close), 'predict_queue', 'predict' and
+                'batch_size'
+
+        Returns:
+            This row's element of predict_fn's result
+
+        Raises:
+            The executor's or predict_fn's exception for the whole batch
+        """
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((np.asarray(x).reshape(-1), future, time.perf_counter(), timings))
+
+        if self._running_batches == 0 or len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._flush_handle is None:
+            self._flush_handle = loop.call_later(self.max_wait, self._flush)
+
+        return await future
+
+    def _flush(self):
+        """Send waiting requests as batches"""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        while self._pending:
+            batch = self._pending[:self.max_batch_size]
+            del self._pending[:self.max_batch_size]
+            self._running_batches += 1
+            asyncio.ensure_future(self._run_batch(batch))
+
+    async def _run_batch(self, batch: List[Tuple[np.ndarray, asyncio.Future, float, Optional[Dict[str, float]]]]):
+        """Run one batch and resolve its callers' futures"""
+        closed = time.perf_counter()
+        queue_delays = [closed - enqueued for _, _, enqueued, _ in batch]
+
+        try:
+            batch_timings: Dict[str, float] = {}
+            X = np.vstack([row for row, _, _, _ in batch])
+            results = await self.executor.run(
+                self.predict_fn,
+                X,
+                stage='predict',
+                timings=batch_timings
+            )
+        except Exception as e:
+            for _, future, _, _ in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+        else:
+            for i, (_, future, _, timings) in enumerate(batch):
+                if timings is not None:
+                    timings['batch_wait'] = queue_delays[i]
+                    timings['batch_size'] = float(len(batch))
+                    timings.update(batch_timings)
+                if not future.done():
+                    future.set_result(results[i])
+        finally:
+            self._running_batches -= 1
+            self._record_batch(len(batch), queue_delays)
+
+            # Requests that gathered while this batch ran go next
+            if self._pending and self._running_batches == 0:
+                self._flush()
+
+    def _record_batch(self, batch_size: int, queue_delays: List[float]):
+        """Update batch size and queueing delay metrics"""
+        self._batches += 1
+        self._requests += batch_size
+        self._max_batch_seen = max(self._max_batch_seen, batch_size)
+        self._total_queue_delay += sum(queue_delays)
+
+        metrics_collector.record_inference_batch(self.name, batch_size, queue_delays)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get batching statistics
+
+        Returns:
+            Dictionary with batch counts, batch sizes and mean queueing delay
+        """
+        return {
+            'max_batch_size': self.max_batch_size,
+            'max_wait_ms': self.max_wait * 1000.0,
+            'batches': self._batches,
+            'requests': self._requests,
+            'pending': len(self._pending),
+            'mean_batch_size': self._requests / self._batches if self._batches else 0.0,
+            'largest_batch': self._max_batch_seen,
+            'mean_queue_delay_ms': (self._total_queue_delay / self._requests * 1000.0) if self._requests else 0.0
+        }
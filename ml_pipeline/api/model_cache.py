@@ -0,0 +1,328 @@
+"""
+Version-aware, memory-bounded cache of production models
+
+Models are cached by version ID and evicted least-recently-used once the
+cache exceeds its byte or entry limit. Which version is in production is
+looked up in the registry at most once per pointer TTL, so promotions made
+by other processes are picked up without a registry query per request.
+
+When a new version is promoted, it is loaded in the background while the
+previous version keeps serving, and requests switch to it once it is
+loaded, so promotion causes no cold-start spike.
+"""
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ml_pipeline.config.logging_config import main_logger
+from ml_pipeline.models.model_registry import ModelRegistry
+
+
+@dataclass
+class CachedModel:
+    """Model loaded for one version"""
+    model_name: str
+    version_id: str
+    model: Any
+    metadata: Dict[str, Any]
+    size_bytes: int
+
+
+class ModelCache:
+    """
+    LRU cache of models keyed by version ID.
+
+    Sizes are estimated from the model artifact files. Versions that are no
+    longer in production are evicted before production versions, and the
+    version just loaded is never evicted.
+    """
+
+    def __init__(
+        self,
+        registry_factory: Callable[[], ModelRegistry],
+        max_bytes: int,
+        max_entries: int,
+        pointer_ttl: float = 5.0,
+        on_evict: Optional[Callable[[str, str], None]] = None
+    ):
+        """
+        Initialize model cache
+
+        Args:
+            registry_factory: Returns the registry used for background loads
+            max_bytes: Maximum total artifact size of cached models
+            max_entries: Maximum number of cached models
+            pointer_ttl: Seconds a production version lookup is reused
+            on_evict: Called with (model_name, version_id) after eviction,
+                for dropping state derived from the model
+        """
+        self.registry_factory = registry_factory
+        self.max_bytes = max_bytes
+        self.max_entries = max_entries
+        self.pointer_ttl = pointer_ttl
+        self.on_evict = on_evict
+
+        self._lock = threading.RLock()
+        self._entries: "OrderedDict[str, CachedModel]" = OrderedDict()
+        self._serving: Dict[str, str] = {}  # model name -> version ID served
+        self._pointers: Dict[str, Tuple[str, Optional[str], float]] = {}
+        self._loading: Dict[str, Future] = {}
+        self._failed: Dict[str, float] = {}  # version ID -> time of failed load
+        self._total_bytes = 0
+
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def get(
+        self,
+        model_name: str,
+        registry: Optional[ModelRegistry] = None
+    ) -> Tuple[Any, Dict[str, Any]]:
+        """
+        Get the production model
+
+        If the production version is not loaded yet but an earlier version
+        of the model is, the earlier version is returned while the new one
+        loads in the background.
+
+        Args:
+            model_name: Name of the model
+            registry: Registry to query (default: from registry_factory)
+
+        Returns:
+            Tuple of (model, metadata)
+
+        Raises:
+            ValueError if the model has no production version
+        """
+        registry = registry or self.registry_factory()
+        version_id, artifact_path = self._production_pointer(model_name, registry)
+
+        with self._lock:
+            entry = self._entries.get(version_id)
+            if entry is not None:
+                self._entries.move_to_end(version_id)
+                self._serving[model_name] = version_id
+                self._hits += 1
+                return entry.model, entry.metadata
+
+            self._misses += 1
+            serving = self._entries.get(self._serving.get(model_name))
+
+        if serving is not None:
+            # Keep serving the previous version until the new one is loaded
+            self.preload(model_name, version_id, artifact_path, registry)
+            return serving.model, serving.metadata
+
+        entry = self._load(model_name, version_id, artifact_path, registry)
+        with self._lock:
+            self._serving[model_name] = version_id
+        return entry.model, entry.metadata
+
+    def preload(
+        self,
+        model_name: str,
+        version_id: str,
+        artifact_path: Optional[str] = None,
+        registry: Optional[ModelRegistry] = None
+    ):
+        """
+        Load a version in the background
+
+        Args:
+            model_name: Name of the model
+            version_id: Version ID to load
+            artifact_path: Path of the model artifact, for size estimation
+            registry: Registry to load from (default: from registry_factory)
+        """
+        with self._lock:
+            if version_id in self._entries or version_id in self._loading:
+                return
+            # Retry failed loads at most once per pointer TTL
+            failed_at = self._failed.get(version_id)
+            if failed_at is not None and time.monotonic() - failed_at < self.pointer_ttl:
+                return
+
+        def load():
+            try:
+                self._load(model_name, version_id, artifact_path, registry or self.registry_factory())
+            except Exception as e:
+                main_logger.error(f"Background load of {model_name} v{version_id} failed: {e}")
+
+        threading.Thread(target=load, name=f"model-preload-{version_id}", daemon=True).start()
+
+    def on_promotion(self, model_name: str, version_id: str):
+        """
+        Point a model at a newly promoted version and preload it
+
+        Args:
+            model_name: Name of the model
+            version_id: Promoted version ID
+        """
+        main_logger.info(f"Preloading promoted model {model_name} v{version_id}")
+        with self._lock:
+            self._pointers[model_name] = (version_id, None, time.monotonic())
+        self.preload(model_name, version_id)
+
+    def _production_pointer(
+        self,
+        model_name: str,
+        registry: ModelRegistry
+    ) -> Tuple[str, Optional[str]]:
+        """Production version ID and artifact path, cached for pointer_ttl"""
+        with self._lock:
+            pointer = self._pointers.get(model_name)
+        if pointer is not None and time.monotonic() - pointer[2] < self.pointer_ttl:
+            return pointer[0], pointer[1]
+
+        model_version = registry.get_model_version(model_name)
+        if model_version is None:
+            raise ValueError(f"Model not found: {model_name} (production)")
+
+        with self._lock:
+            self._pointers[model_name] = (
+                model_version.version_id,
+                model_version.artifact_path,
+                time.monotonic()
+            )
+        return model_version.version_id, model_version.artifact_path
+
+    def _load(
+        self,
+        model_name: str,
+        version_id: str,
+        artifact_path: Optional[str],
+        registry: ModelRegistry
+    ) -> CachedModel:
+        """Load a version once, however many callers ask for it"""
+        with self._lock:
+            entry = self._entries.get(version_id)
+            if entry is not None:
+                return entry
+
+            future = self._loading.get(version_id)
+            owner = future is None
+            if owner:
+                future = Future()
+                self._loading[version_id] = future
+
+        if not owner:
+            return future.result()
+
+        try:
+            main_logger.info(f"Loading model from registry: {model_name} v{version_id}")
+            model, metadata = registry.load_model(model_name, version_id)
+            if artifact_path is None:
+                model_version = registry.get_model_version(model_name, version_id)
+                artifact_path = model_version.artifact_path if model_version else None
+            entry = CachedModel(
+                model_name=model_name,
+                version_id=version_id,
+                model=model,
+                metadata=metadata,
+                size_bytes=self._artifact_size(artifact_path)
+            )
+            evicted = self._insert(entry)
+            future.set_result(entry)
+        except Exception as e:
+            with self._lock:
+                self._failed[version_id] = time.monotonic()
+            future.set_exception(e)
+            raise
+        finally:
+            with self._lock:
+                self._loading.pop(version_id, None)
+
+        for evicted_entry in evicted:
+            main_logger.info(f"Evicted cached model {evicted_entry.model_name} v{evicted_entry.version_id}")
+            if self.on_evict:
+                self.on_evict(evicted_entry.model_name, evicted_entry.version_id)
+
+        return entry
+
+    @staticmethod
+    def _artifact_size(artifact_path: Optional[str]) -> int:
+        """Size of a model artifact file, 0 if unknown"""
+        try:
+            return os.path.getsize(artifact_path) if artifact_path else 0
+        except OSError:
+            return 0
+
+    def _insert(self, entry: CachedModel) -> List[CachedModel]:
+        """Add an entry and evict others until within limits"""
+        with self._lock:
+            self._entries[entry.version_id] = entry
+            self._total_bytes += entry.size_bytes
+            self._failed.pop(entry.version_id, None)
+
+            # Production versions of each model, as of the latest pointers
+            production = {pointer[0] for pointer in self._pointers.values()}
+            production.update(self._serving.values())
+
+            evicted = []
+            while len(self._entries) > 1 and (
+                len(self._entries) > self.max_entries or self._total_bytes > self.max_bytes
+            ):
+                candidates = [key for key in self._entries if key != entry.version_id]
+                victim = next((key for key in candidates if key not in production), candidates[0])
+                victim_entry = self._entries.pop(victim)
+                self._total_bytes -= victim_entry.size_bytes
+                if self._serving.get(victim_entry.model_name) == victim:
+                    del self._serving[victim_entry.model_name]
+                self._evictions += 1
+                evicted.append(victim_entry)
+
+            return evicted
+
+    def keys(self) -> List[str]:
+        """Cached models as '<model_name>_<version_id>', least recent first"""
+        with self._lock:
+            return [f"{entry.model_name}_{entry.version_id}" for entry in self._entries.values()]
+
+    def clear(self) -> int:
+        """
+        Drop all cached models and production pointers
+
+        Returns:
+            Number of models dropped
+        """
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+            self._serving.clear()
+            self._pointers.clear()
+            self._total_bytes = 0
+
+        if self.on_evict:
+            for entry in entries:
+                self.on_evict(entry.model_name, entry.version_id)
+        return len(entries)
+
+    def __len__(self) -> int:
+        with self._lock:
+            return len(self._entries)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics
+
+        Returns:
+            Dictionary with sizes, limits, hit/miss and eviction counts
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'max_entries': self.max_entries,
+                'total_bytes': self._total_bytes,
+                'max_bytes': self.max_bytes,
+                'serving': dict(self._serving),
+                'loading': list(self._loading),
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions
+            }
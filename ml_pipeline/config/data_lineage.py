@@ -3,7 +3,10 @@ Data lineage tracking for ML pipeline
 Tracks data from source to predictions
 """
 import json
+import os
+import threading
 import uuid
+from collections import defaultdict
 from datetime import datetime
 from pathlib import Path
 from typing import Dict, List, Any, Optional
@@ -83,69 +86,158 @@ class LineageEdge:
 
 
 class DataLineageTracker:
-    """Track data lineage throughout the ML pipeline"""
+    """
+    Track data lineage throughout the ML pipeline
     
-    def __init__(self):
-        self.lineage_path = settings.METADATA_PATH / "lineage"
+    New nodes and edges are appended to a JSON-lines journal. The journal is
+    folded into the nodes.json/edges.json snapshot once it holds as many
+    entries as the snapshot (and at least compact_threshold), so writes cost
+    O(1) amortized. Forward and backward adjacency maps answer upstream and
+    downstream queries in O(degree).
+    """
+    
+    def __init__(self, lineage_path: Optional[Path] = None, compact_threshold: int = 10_000):
+        """
+        Initialize lineage tracker
+        
+        Args:
+            lineage_path: Directory for lineage files (default: METADATA_PATH/lineage)
+            compact_threshold: Minimum journal entries before compaction
+        """
+        self.lineage_path = Path(lineage_path) if lineage_path else settings.METADATA_PATH / "lineage"
         self.lineage_path.mkdir(parents=True, exist_ok=True)
+        self.nodes_file = self.lineage_path / "nodes.json"
+        self.edges_file = self.lineage_path / "edges.json"
+        self.journal_file = self.lineage_path / "journal.jsonl"
+        self.compact_threshold = compact_threshold
+        
         self.nodes: Dict[str, LineageNode] = {}
         self.edges: List[LineageEdge] = []
+        self._edge_ids: set = set()
+        self._incoming: Dict[str, List[LineageEdge]] = defaultdict(list)
+        self._outgoing: Dict[str, List[LineageEdge]] = defaultdict(list)
+        self._snapshot_entries = 0
+        self._journal_entries = 0
+        self._lock = threading.RLock()
         self._load_lineage()
     
+    @staticmethod
+    def _node_from_dict(node_data: Dict[str, Any]) -> LineageNode:
+        """Build node from its saved dictionary"""
+        return LineageNode(
+            node_id=node_data['node_id'],
+            node_type=LineageNodeType(node_data['node_type']),
+            name=node_data['name'],
+            created_at=node_data['created_at'],
+            metadata=node_data['metadata']
+        )
+    
+    @staticmethod
+    def _edge_from_dict(edge_data: Dict[str, Any]) -> LineageEdge:
+        """Build edge from its saved dictionary"""
+        return LineageEdge(
+            edge_id=edge_data['edge_id'],
+            source_node_id=edge_data['source_node_id'],
+            target_node_id=edge_data['target_node_id'],
+            operation=LineageOperation(edge_data['operation']),
+            operation_details=edge_data['operation_details'],
+            created_at=edge_data['created_at'],
+            user_id=edge_data['user_id']
+        )
+    
+    def _add_edge(self, edge: LineageEdge):
+        """Add edge to the edge list and adjacency maps"""
+        if edge.edge_id in self._edge_ids:
+            return
+        self._edge_ids.add(edge.edge_id)
+        self.edges.append(edge)
+        self._outgoing[edge.source_node_id].append(edge)
+        self._incoming[edge.target_node_id].append(edge)
+    
     def _load_lineage(self):
-        """Load existing lineage from disk"""
-        nodes_file = self.lineage_path / "nodes.json"
-        edges_file = self.lineage_path / "edges.json"
-        
+        """Load snapshot from disk and replay the journal"""
         try:
-            if nodes_file.exists():
-                with open(nodes_file, 'r') as f:
-                    nodes_data = json.load(f)
-                    for node_data in nodes_data:
-                        node = LineageNode(
-                            node_id=node_data['node_id'],
-                            node_type=LineageNodeType(node_data['node_type']),
-                            name=node_data['name'],
-                            created_at=node_data['created_at'],
-                            metadata=node_data['metadata']
-                        )
+            if self.nodes_file.exists():
+                with open(self.nodes_file, 'r') as f:
+                    for node_data in json.load(f):
+                        node = self._node_from_dict(node_data)
                         self.nodes[node.node_id] = node
             
-            if edges_file.exists():
-                with open(edges_file, 'r') as f:
-                    edges_data = json.load(f)
-                    for edge_data in edges_data:
-                        edge = LineageEdge(
-                            edge_id=edge_data['edge_id'],
-                            source_node_id=edge_data['source_node_id'],
-                            target_node_id=edge_data['target_node_id'],
-                            operation=LineageOperation(edge_data['operation']),
-                            operation_details=edge_data['operation_details'],
-                            created_at=edge_data['created_at'],
-                            user_id=edge_data['user_id']
-                        )
-                        self.edges.append(edge)
+            if self.edges_file.exists():
+                with open(self.edges_file, 'r') as f:
+                    for edge_data in json.load(f):
+                        self._add_edge(self._edge_from_dict(edge_data))
         
         except Exception as e:
             main_logger.error(f"Failed to load lineage: {e}")
+        
+        self._snapshot_entries = len(self.nodes) + len(self.edges)
+        
+        if not self.journal_file.exists():
+            return
+        
+        # Entries already in the snapshot (after an interrupted compaction)
+        # are skipped by ID
+        with open(self.journal_file, 'rb+') as f:
+            complete_bytes = 0
+            for line_number, line in enumerate(f, 1):
+                if not line.endswith(b"\n"):
+                    # A write interrupted mid-line; drop it so the next
+                    # append starts on a fresh line
+                    main_logger.error(f"Dropping incomplete lineage journal line {line_number}")
+                    f.truncate(complete_bytes)
+                    break
+                
+                complete_bytes += len(line)
+                if not line.strip():
+                    continue
+                try:
+                    entry = json.loads(line)
+                    if entry['kind'] == 'node':
+                        node = self._node_from_dict(entry['data'])
+                        self.nodes[node.node_id] = node
+                    else:
+                        self._add_edge(self._edge_from_dict(entry['data']))
+                    self._journal_entries += 1
+                except Exception as e:
+                    main_logger.error(f"Skipping unreadable lineage journal line {line_number}: {e}")
     
-    def _save_lineage(self):
-        """Save lineage to disk"""
+    def _append_journal(self, kind: str, data: Dict[str, Any]):
+        """Append one entry to the journal, compacting when it has grown"""
         try:
-            # Save nodes
-            nodes_file = self.lineage_path / "nodes.json"
-            with open(nodes_file, 'w') as f:
-                nodes_data = [node.to_dict() for node in self.nodes.values()]
-                json.dump(nodes_data, f, indent=2)
-            
-            # Save edges
-            edges_file = self.lineage_path / "edges.json"
-            with open(edges_file, 'w') as f:
-                edges_data = [edge.to_dict() for edge in self.edges]
-                json.dump(edges_data, f, indent=2)
+            with open(self.journal_file, 'a') as f:
+                f.write(json.dumps({'kind': kind, 'data': data}) + "\n")
+            self._journal_entries += 1
         
         except Exception as e:
             main_logger.error(f"Failed to save lineage: {e}")
+            return
+        
+        if self._journal_entries >= max(self.compact_threshold, self._snapshot_entries):
+            self.compact()
+    
+    def compact(self):
+        """Write all nodes and edges to the snapshot and empty the journal"""
+        with self._lock:
+            try:
+                self._write_json_atomic(self.nodes_file, [node.to_dict() for node in self.nodes.values()])
+                self._write_json_atomic(self.edges_file, [edge.to_dict() for edge in self.edges])
+                
+                # Only truncate once both snapshot files are in place
+                open(self.journal_file, 'w').close()
+                self._snapshot_entries = len(self.nodes) + len(self.edges)
+                self._journal_entries = 0
+            
+            except Exception as e:
+                main_logger.error(f"Failed to compact lineage: {e}")
+    
+    @staticmethod
+    def _write_json_atomic(path: Path, data: List[Dict[str, Any]]):
+        """Write JSON to a temporary file and rename it over path"""
+        tmp_path = path.with_suffix(path.suffix + ".tmp")
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, path)
     
     def create_node(
         self,
@@ -174,8 +266,9 @@ class DataLineageTracker:
             metadata=metadata or {}
         )
         
-        self.nodes[node_id] = node
-        self._save_lineage()
+        with self._lock:
+            self.nodes[node_id] = node
+            self._append_journal('node', node.to_dict())
         
         main_logger.info(
             f"Created lineage node: {name} ({node_type.value})",
@@ -223,8 +316,9 @@ class DataLineageTracker:
             user_id=user_id
         )
         
-        self.edges.append(edge)
-        self._save_lineage()
+        with self._lock:
+            self._add_edge(edge)
+            self._append_journal('edge', edge.to_dict())
         
         main_logger.info(
             f"Created lineage edge: {operation.value} from {source_node_id} to {target_node_id}",
@@ -484,11 +578,11 @@ class DataLineageTracker:
         node = self.nodes[node_id]
         
         # Find upstream nodes
-        upstream_edges = [e for e in self.edges if e.target_node_id == node_id]
+        upstream_edges = list(self._incoming.get(node_id, []))
         upstream_nodes = [self.nodes[e.source_node_id] for e in upstream_edges if e.source_node_id in self.nodes]
         
         # Find downstream nodes
-        downstream_edges = [e for e in self.edges if e.source_node_id == node_id]
+        downstream_edges = list(self._outgoing.get(node_id, []))
         downstream_nodes = [self.nodes[e.target_node_id] for e in downstream_edges if e.target_node_id in self.nodes]
         
         return {
@@ -516,17 +610,18 @@ class DataLineageTracker:
         current_id = node_id
         visited = set()
         
-        while current_id and current_id not in visited:
+        while current_id in self.nodes and current_id not in visited:
             visited.add(current_id)
-            path.insert(0, self.nodes[current_id].to_dict())
+            path.append(self.nodes[current_id].to_dict())
             
-            # Find parent
-            upstream_edges = [e for e in self.edges if e.target_node_id == current_id]
+            # Follow the first recorded parent
+            upstream_edges = self._incoming.get(current_id)
             if upstream_edges:
                 current_id = upstream_edges[0].source_node_id
             else:
                 break
         
+        path.reverse()
         return path
     
     def export_lineage_graph(self, output_path: Path):
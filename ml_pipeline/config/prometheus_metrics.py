@@ -3,7 +3,7 @@ Prometheus metrics for ML pipeline monitoring
 Exposes metrics for Grafana dashboards
 """
 from prometheus_client import Counter, Gauge, Histogram, Summary
-from typing import Dict, Any
+from typing import Dict, Any, List
 import time
 
 # Data ingestion metrics
@@ -137,6 +137,21 @@ disk_free_gb = Gauge(
     'Free disk space in GB'
 )
 
+# Inference batching metrics
+inference_batch_size = Histogram(
+    'ml_pipeline_inference_batch_size',
+    'Number of requests per micro-batched prediction',
+    ['model_name'],
+    buckets=[1, 2, 4, 8, 16, 32, 64, 128]
+)
+
+inference_batch_queue_delay = Histogram(
+    'ml_pipeline_inference_batch_queue_delay_seconds',
+    'Time a request waits for its micro-batch to be sent',
+    ['model_name'],
+    buckets=[0.0005, 0.001, 0.002, 0.005, 0.01, 0.025, 0.05, 0.1]
+)
+
 # Processing metrics
 processing_queue_size = Gauge(
     'ml_pipeline_processing_queue_size',
@@ -262,6 +277,13 @@ class MetricsCollector:
         disk_usage.set(metrics.get('disk_percent', 0))
         disk_free_gb.set(metrics.get('disk_free_gb', 0))
     
+    @staticmethod
+    def record_inference_batch(model_name: str, batch_size: int, queue_delays: List[float]):
+        """Record micro-batch size and per-request queueing delays"""
+        inference_batch_size.labels(model_name=model_name).observe(batch_size)
+        for delay in queue_delays:
+            inference_batch_queue_delay.labels(model_name=model_name).observe(delay)
+    
     @staticmethod
     def record_processing_error(operation: str, error_type: str):
         """Record processing error"""
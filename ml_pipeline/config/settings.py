@@ -43,6 +43,8 @@ class Settings(BaseSettings):
     REDIS_PASSWORD: Optional[str] = None
     REDIS_URL: str = f"redis://{REDIS_HOST}:{REDIS_PORT}/{REDIS_DB}"
     CACHE_TTL: int = 3600  # 1 hour
+    LOCAL_CACHE_MAX_BYTES: int = 256 * 1024 * 1024  # In-process tier, 256MB
+    LOCAL_CACHE_TTL: int = 300  # 5 minutes
     
     # Object storage (MinIO/S3)
     STORAGE_TYPE: str = "minio"  # or "s3"
@@ -74,6 +76,20 @@ class Settings(BaseSettings):
     MAX_FEATURE_EXTRACTION_TIME_SECONDS: int = 60
     MAX_SHAP_GENERATION_TIME_SECONDS: int = 2
     
+    # Inference serving (worker pools kept off the API event loop)
+    INFERENCE_WORKERS: int = 4
+    INFERENCE_MAX_QUEUE_DEPTH: int = 64
+    EXPLANATION_WORKERS: int = 2
+    EXPLANATION_MAX_QUEUE_DEPTH: int = 16
+    INFERENCE_TIMEOUT_SECONDS: float = 30.0
+    MICRO_BATCH_MAX_SIZE: int = 32
+    MICRO_BATCH_MAX_WAIT_MS: float = 2.0
+    MODEL_CACHE_MAX_BYTES: int = 2 * 1024 * 1024 * 1024  # Artifact bytes, 2GB
+    MODEL_CACHE_MAX_ENTRIES: int = 8
+    MODEL_POINTER_TTL_SECONDS: float = 5.0
+    EXPLANATION_CACHE_MAX_ENTRIES: int = 10000
+    EXPLANATION_CACHE_MAX_BYTES: int = 256 * 1024 * 1024  # Stored JSON bytes, 256MB
+    
     # Monitoring
     DRIFT_CHECK_INTERVAL_DAYS: int = 7
     RETRAINING_SCHEDULE: str = "monthly"
@@ -3,6 +3,8 @@
 from .data_acquisition_service import DataAcquisitionService
 from .schema_validator import SchemaValidator, ValidationResult
 from .provenance_tracker import ProvenanceTracker, ProvenanceRecord, DataSource, ProcessingStage
+from .provenance_store import ProvenanceStore
+from .source_reader import SourceFileReader
 from .adni import ADNIDataLoader
 from .oasis import OASISDataLoader
 from .nacc import NACCDataLoader
@@ -15,6 +17,8 @@ __all__ = [
     'ProvenanceRecord',
     'DataSource',
     'ProcessingStage',
+    'ProvenanceStore',
+    'SourceFileReader',
     'ADNIDataLoader',
     'OASISDataLoader',
     'NACCDataLoader'
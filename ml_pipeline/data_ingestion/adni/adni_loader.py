@@ -10,6 +10,8 @@ from requests.adapters import HTTPAdapter
 from urllib3.util.retry import Retry
 
 from ml_pipeline.config.settings import Settings
+from ml_pipeline.data_ingestion.schema_validator import SchemaValidator
+from ml_pipeline.data_ingestion.source_reader import SourceFileReader
 from ml_pipeline.data_ingestion.adni.parsers import (
     CognitiveAssessmentParser,
     CSFBiomarkerParser,
@@ -19,6 +21,10 @@ from ml_pipeline.data_ingestion.adni.parsers import (
 
 logger = logging.getLogger(__name__)
 
+# Identifier columns are read with one dtype in every data type, so
+# frames from different ADNI files merge on patient_id
+ID_DTYPES = {'RID': 'string'}
+
 
 class ADNIDataLoader:
     """
@@ -31,12 +37,18 @@ class ADNIDataLoader:
     - APOE genotype data
     """
     
-    def __init__(self, settings: Optional[Settings] = None):
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        reader: Optional[SourceFileReader] = None
+    ):
         """
         Initialize ADNI data loader.
         
         Args:
             settings: Configuration settings
+            reader: Shared source file reader (default: one caching under
+                PROCESSED_DATA_PATH/source_cache)
         """
         self.settings = settings or Settings()
         self.base_url = self.settings.ADNI_BASE_URL
@@ -50,6 +62,10 @@ class ADNIDataLoader:
         self.mri_parser = MRIMetadataParser()
         self.genetic_parser = GeneticDataParser()
         
+        # Typed, column-pruned and cached reads of source files
+        self.reader = reader or SourceFileReader(Path(self.settings.PROCESSED_DATA_PATH) / "source_cache")
+        self.schema_validator = SchemaValidator()
+        
         # Setup HTTP session with retry logic
         self.session = self._create_session()
         
@@ -68,6 +84,27 @@ class ADNIDataLoader:
         session.mount('https://', adapter)
         return session
     
+    def _read_dtypes(
+        self,
+        column_mapping: Dict[str, str],
+        schema_name: Optional[str] = None
+    ) -> Dict[str, str]:
+        """
+        Get dtypes for reading an ADNI source file.
+        
+        Args:
+            column_mapping: Source column name -> standardized column name
+            schema_name: Schema the parsed data is validated against, if any
+        
+        Returns:
+            Dictionary mapping source column names to dtypes
+        """
+        dtypes = {}
+        if schema_name is not None:
+            dtypes.update(self.schema_validator.get_read_dtypes(schema_name, column_mapping))
+        dtypes.update({col: dtype for col, dtype in ID_DTYPES.items() if col in column_mapping})
+        return dtypes
+    
     def download_adni_data(
         self,
         data_type: str,
@@ -152,7 +189,11 @@ class ADNIDataLoader:
         
         # Load raw data
         if file_path.exists() and file_path.stat().st_size > 0:
-            raw_data = pd.read_csv(file_path)
+            raw_data = self.reader.read_csv(
+                file_path,
+                columns=self.cognitive_parser.raw_columns,
+                dtypes=self._read_dtypes(self.cognitive_parser.column_mapping, 'adni_cognitive')
+            )
         else:
             # Return empty DataFrame with expected schema
             raw_data = pd.DataFrame()
@@ -185,7 +226,11 @@ class ADNIDataLoader:
         
         # Load raw data
         if file_path.exists() and file_path.stat().st_size > 0:
-            raw_data = pd.read_csv(file_path)
+            raw_data = self.reader.read_csv(
+                file_path,
+                columns=self.biomarker_parser.raw_columns,
+                dtypes=self._read_dtypes(self.biomarker_parser.column_mapping, 'adni_biomarker')
+            )
         else:
             raw_data = pd.DataFrame()
         
@@ -217,7 +262,11 @@ class ADNIDataLoader:
         
         # Load raw data
         if file_path.exists() and file_path.stat().st_size > 0:
-            raw_data = pd.read_csv(file_path)
+            raw_data = self.reader.read_csv(
+                file_path,
+                columns=self.mri_parser.raw_columns,
+                dtypes=self._read_dtypes(self.mri_parser.column_mapping)
+            )
         else:
             raw_data = pd.DataFrame()
         
@@ -247,7 +296,11 @@ class ADNIDataLoader:
         
         # Load raw data
         if file_path.exists() and file_path.stat().st_size > 0:
-            raw_data = pd.read_csv(file_path)
+            raw_data = self.reader.read_csv(
+                file_path,
+                columns=self.genetic_parser.raw_columns,
+                dtypes=self._read_dtypes(self.genetic_parser.column_mapping)
+            )
         else:
             raw_data = pd.DataFrame()
         
@@ -17,6 +17,20 @@ class CognitiveAssessmentParser:
             'patient_id', 'visit_date', 'mmse_score', 'adas_cog_score',
             'cdr_global', 'cdr_sob', 'moca_score'
         ]
+        
+        # Map ADNI column names to standardized names
+        self.column_mapping = {
+            'RID': 'patient_id',
+            'EXAMDATE': 'visit_date',
+            'MMSE': 'mmse_score',
+            'ADAS_COG': 'adas_cog_score',
+            'CDGLOBAL': 'cdr_global',
+            'CDRSB': 'cdr_sob',
+            'MOCA': 'moca_score'
+        }
+        
+        # Source columns read by the loaders
+        self.raw_columns = list(self.column_mapping)
     
     def parse(self, raw_data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -36,19 +50,8 @@ class CognitiveAssessmentParser:
         
         parsed = pd.DataFrame()
         
-        # Map ADNI column names to standardized names
-        column_mapping = {
-            'RID': 'patient_id',
-            'EXAMDATE': 'visit_date',
-            'MMSE': 'mmse_score',
-            'ADAS_COG': 'adas_cog_score',
-            'CDGLOBAL': 'cdr_global',
-            'CDRSB': 'cdr_sob',
-            'MOCA': 'moca_score'
-        }
-        
         # Rename columns if they exist
-        for adni_col, std_col in column_mapping.items():
+        for adni_col, std_col in self.column_mapping.items():
             if adni_col in raw_data.columns:
                 parsed[std_col] = raw_data[adni_col]
             else:
@@ -88,6 +91,18 @@ class CSFBiomarkerParser:
             'patient_id', 'visit_date', 'csf_ab42', 'csf_tau',
             'csf_ptau', 'ab42_tau_ratio', 'ptau_tau_ratio'
         ]
+        
+        # Map ADNI column names to standardized names
+        self.column_mapping = {
+            'RID': 'patient_id',
+            'EXAMDATE': 'visit_date',
+            'ABETA': 'csf_ab42',
+            'TAU': 'csf_tau',
+            'PTAU': 'csf_ptau'
+        }
+        
+        # Source columns read by the loaders
+        self.raw_columns = list(self.column_mapping)
     
     def parse(self, raw_data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -107,17 +122,8 @@ class CSFBiomarkerParser:
         
         parsed = pd.DataFrame()
         
-        # Map ADNI column names to standardized names
-        column_mapping = {
-            'RID': 'patient_id',
-            'EXAMDATE': 'visit_date',
-            'ABETA': 'csf_ab42',
-            'TAU': 'csf_tau',
-            'PTAU': 'csf_ptau'
-        }
-        
         # Rename columns if they exist
-        for adni_col, std_col in column_mapping.items():
+        for adni_col, std_col in self.column_mapping.items():
             if adni_col in raw_data.columns:
                 parsed[std_col] = raw_data[adni_col]
             else:
@@ -171,6 +177,22 @@ class MRIMetadataParser:
             'manufacturer', 'hippocampus_volume', 'ventricle_volume',
             'whole_brain_volume', 'icv'
         ]
+        
+        # Map ADNI column names to standardized names
+        self.column_mapping = {
+            'RID': 'patient_id',
+            'EXAMDATE': 'visit_date',
+            'SCANDATE': 'scan_date',
+            'MAGSTRENGTH': 'field_strength',
+            'MANUFACTURER': 'manufacturer',
+            'HIPPO': 'hippocampus_volume',
+            'VENTRICLES': 'ventricle_volume',
+            'WHOLEBRAIN': 'whole_brain_volume',
+            'ICV': 'icv'
+        }
+        
+        # Source columns read by the loaders
+        self.raw_columns = list(self.column_mapping)
     
     def parse(self, raw_data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -190,21 +212,8 @@ class MRIMetadataParser:
         
         parsed = pd.DataFrame()
         
-        # Map ADNI column names to standardized names
-        column_mapping = {
-            'RID': 'patient_id',
-            'EXAMDATE': 'visit_date',
-            'SCANDATE': 'scan_date',
-            'MAGSTRENGTH': 'field_strength',
-            'MANUFACTURER': 'manufacturer',
-            'HIPPO': 'hippocampus_volume',
-            'VENTRICLES': 'ventricle_volume',
-            'WHOLEBRAIN': 'whole_brain_volume',
-            'ICV': 'icv'
-        }
-        
         # Rename columns if they exist
-        for adni_col, std_col in column_mapping.items():
+        for adni_col, std_col in self.column_mapping.items():
             if adni_col in raw_data.columns:
                 parsed[std_col] = raw_data[adni_col]
             else:
@@ -242,6 +251,16 @@ class GeneticDataParser:
         self.expected_columns = [
             'patient_id', 'apoe_genotype', 'apoe_e4_count', 'apoe_risk_category'
         ]
+        
+        # Map ADNI column names to standardized names
+        self.column_mapping = {
+            'RID': 'patient_id',
+            'APGEN1': 'apoe_allele1',
+            'APGEN2': 'apoe_allele2'
+        }
+        
+        # Source columns read by the loaders
+        self.raw_columns = list(self.column_mapping)
     
     def parse(self, raw_data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -261,15 +280,8 @@ class GeneticDataParser:
         
         parsed = pd.DataFrame()
         
-        # Map ADNI column names to standardized names
-        column_mapping = {
-            'RID': 'patient_id',
-            'APGEN1': 'apoe_allele1',
-            'APGEN2': 'apoe_allele2'
-        }
-        
         # Rename columns if they exist
-        for adni_col, std_col in column_mapping.items():
+        for adni_col, std_col in self.column_mapping.items():
             if adni_col in raw_data.columns:
                 parsed[std_col] = raw_data[adni_col]
         
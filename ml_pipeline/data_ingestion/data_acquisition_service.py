@@ -1,6 +1,7 @@
 """Main data acquisition service integrating all loaders."""
 
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 from typing import Dict, List, Optional, Tuple
 from datetime import datetime
@@ -11,6 +12,7 @@ from ml_pipeline.data_ingestion.adni import ADNIDataLoader
 from ml_pipeline.data_ingestion.oasis import OASISDataLoader
 from ml_pipeline.data_ingestion.nacc import NACCDataLoader
 from ml_pipeline.data_ingestion.schema_validator import SchemaValidator
+from ml_pipeline.data_ingestion.source_reader import SourceFileReader
 from ml_pipeline.data_ingestion.provenance_tracker import (
     ProvenanceTracker,
     DataSource,
@@ -25,22 +27,32 @@ class DataAcquisitionService:
     Main service for acquiring biomedical data from multiple sources.
     
     Integrates ADNI, OASIS, and NACC data loaders with schema validation
-    and provenance tracking.
+    and provenance tracking. Sources and ADNI data types are loaded
+    concurrently, and all loaders share one source file reader so unchanged
+    files are not parsed again.
     """
     
-    def __init__(self, settings: Optional[Settings] = None):
+    def __init__(self, settings: Optional[Settings] = None, max_workers: int = 4):
         """
         Initialize data acquisition service.
         
         Args:
             settings: Configuration settings
+            max_workers: Number of source files read concurrently
         """
         self.settings = settings or Settings()
+        self.max_workers = max_workers
+        
+        # Shared reader caching parsed source files
+        self.source_reader = SourceFileReader(
+            Path(self.settings.PROCESSED_DATA_PATH) / "source_cache",
+            max_workers=max_workers
+        )
         
         # Initialize loaders
-        self.adni_loader = ADNIDataLoader(self.settings)
-        self.oasis_loader = OASISDataLoader(self.settings)
-        self.nacc_loader = NACCDataLoader(self.settings)
+        self.adni_loader = ADNIDataLoader(self.settings, reader=self.source_reader)
+        self.oasis_loader = OASISDataLoader(self.settings, reader=self.source_reader)
+        self.nacc_loader = NACCDataLoader(self.settings, reader=self.source_reader)
         
         # Initialize validators and trackers
         self.schema_validator = SchemaValidator()
@@ -70,27 +82,34 @@ class DataAcquisitionService:
         if data_types is None:
             data_types = ['cognitive', 'biomarkers', 'mri', 'genetic']
         
-        results = {}
+        # Loader and schema per data type (no specific schema for MRI metadata
+        # or genetic data)
+        loaders = {
+            'cognitive': (lambda: self.adni_loader.load_cognitive_assessments(date_range=date_range), 'adni_cognitive'),
+            'biomarkers': (lambda: self.adni_loader.load_csf_biomarkers(date_range=date_range), 'adni_biomarker'),
+            'mri': (lambda: self.adni_loader.load_mri_metadata(date_range=date_range), None),
+            'genetic': (lambda: self.adni_loader.load_genetic_data(), None)
+        }
         
         for data_type in data_types:
-            logger.info(f"Loading ADNI {data_type} data")
-            
-            # Load data
-            if data_type == 'cognitive':
-                data = self.adni_loader.load_cognitive_assessments(date_range=date_range)
-                schema_name = 'adni_cognitive'
-            elif data_type == 'biomarkers':
-                data = self.adni_loader.load_csf_biomarkers(date_range=date_range)
-                schema_name = 'adni_biomarker'
-            elif data_type == 'mri':
-                data = self.adni_loader.load_mri_metadata(date_range=date_range)
-                schema_name = None  # No specific schema for MRI metadata
-            elif data_type == 'genetic':
-                data = self.adni_loader.load_genetic_data()
-                schema_name = None  # No specific schema for genetic data
-            else:
+            if data_type not in loaders:
                 logger.warning(f"Unknown ADNI data type: {data_type}")
-                continue
+        data_types = [data_type for data_type in data_types if data_type in loaders]
+        
+        # Load data types concurrently; validation and provenance run in order
+        results = {}
+        if not data_types:
+            return results
+        
+        with ThreadPoolExecutor(max_workers=min(len(data_types), self.max_workers)) as executor:
+            futures = {}
+            for data_type in data_types:
+                logger.info(f"Loading ADNI {data_type} data")
+                futures[data_type] = executor.submit(loaders[data_type][0])
+        
+        for data_type in data_types:
+            data = futures[data_type].result()
+            schema_name = loaders[data_type][1]
             
             # Validate if requested and schema available
             if validate and schema_name:
@@ -230,11 +249,14 @@ class DataAcquisitionService:
         """
         logger.info("Acquiring data from all sources")
         
-        all_data = {
-            'adni': self.acquire_adni_data(validate=validate),
-            'oasis': self.acquire_oasis_data(validate=validate),
-            'nacc': self.acquire_nacc_data(validate=validate)
-        }
+        # Sources are independent, so acquire them concurrently
+        with ThreadPoolExecutor(max_workers=3, thread_name_prefix='acquire') as executor:
+            futures = {
+                'adni': executor.submit(self.acquire_adni_data, validate=validate),
+                'oasis': executor.submit(self.acquire_oasis_data, validate=validate),
+                'nacc': executor.submit(self.acquire_nacc_data, validate=validate)
+            }
+            all_data = {source: future.result() for source, future in futures.items()}
         
         # Calculate total records
         total_records = 0
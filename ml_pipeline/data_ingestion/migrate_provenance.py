@@ -0,0 +1,51 @@
+"""
+Provenance migration script
+Imports provenance records saved as one JSON file per record into the
+indexed provenance store
+
+Usage:
+    python -m ml_pipeline.data_ingestion.migrate_provenance [--json-dir DIR] [--db PATH]
+"""
+import argparse
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from ml_pipeline.config.settings import Settings
+from ml_pipeline.data_ingestion.provenance_store import ProvenanceStore
+
+
+def migrate_provenance(json_dir: Path, db_path: Path) -> dict:
+    """
+    Import JSON provenance records into the store.
+
+    Args:
+        json_dir: Directory containing <record_id>.json files
+        db_path: Path of the provenance store database
+
+    Returns:
+        Counts of imported, skipped and failed files
+    """
+    store = ProvenanceStore(db_path)
+    return store.import_json_records(json_dir)
+
+
+if __name__ == "__main__":
+    default_dir = Path(Settings().METADATA_PATH) / "provenance"
+
+    parser = argparse.ArgumentParser(description="Import JSON provenance records into the provenance store")
+    parser.add_argument("--json-dir", type=Path, default=default_dir, help="Directory of JSON records")
+    parser.add_argument("--db", type=Path, default=None, help="Store database (default: <json-dir>/provenance.db)")
+    args = parser.parse_args()
+
+    print(f"Importing provenance records from {args.json_dir}...")
+    counts = migrate_provenance(args.json_dir, args.db or args.json_dir / "provenance.db")
+
+    print(f"✓ Imported {counts['imported']} records")
+    print(f"  Already present: {counts['skipped']}")
+    if counts['failed']:
+        print(f"✗ Failed: {counts['failed']} (see log)")
+        sys.exit(1)
+    sys.exit(0)
@@ -7,6 +7,8 @@ from datetime import datetime
 import pandas as pd
 
 from ml_pipeline.config.settings import Settings
+from ml_pipeline.data_ingestion.schema_validator import SchemaValidator
+from ml_pipeline.data_ingestion.source_reader import SourceFileReader
 from ml_pipeline.data_ingestion.nacc.parsers import (
     ClinicalAssessmentParser,
     MedicalHistoryParser
@@ -26,12 +28,18 @@ class NACCDataLoader:
     - Neuropathology data
     """
     
-    def __init__(self, settings: Optional[Settings] = None):
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        reader: Optional[SourceFileReader] = None
+    ):
         """
         Initialize NACC data loader.
         
         Args:
             settings: Configuration settings
+            reader: Shared source file reader (default: one caching under
+                PROCESSED_DATA_PATH/source_cache)
         """
         self.settings = settings or Settings()
         self.data_dir = Path(self.settings.NACC_DATA_PATH or (Path(self.settings.RAW_DATA_PATH) / "nacc"))
@@ -41,6 +49,10 @@ class NACCDataLoader:
         self.clinical_parser = ClinicalAssessmentParser()
         self.medical_history_parser = MedicalHistoryParser()
         
+        # Typed, column-pruned and cached reads of source files
+        self.reader = reader or SourceFileReader(Path(self.settings.PROCESSED_DATA_PATH) / "source_cache")
+        self.schema_validator = SchemaValidator()
+        
         logger.info("NACC data loader initialized")
     
     def download_nacc_data(self, modules: List[str]) -> Path:
@@ -136,14 +148,11 @@ class NACCDataLoader:
             return pd.DataFrame()
         
         # Load and combine all clinical files
-        dfs = []
-        for file_path in uds_files:
-            try:
-                df = pd.read_csv(file_path)
-                dfs.append(df)
-                logger.info(f"Loaded {len(df)} records from {file_path.name}")
-            except Exception as e:
-                logger.error(f"Failed to load {file_path}: {e}")
+        dfs = self.reader.read_csv_files(
+            uds_files,
+            columns=self.clinical_parser.raw_columns,
+            dtypes=self.schema_validator.get_read_dtypes('nacc_clinical', self.clinical_parser.column_mapping)
+        )
         
         if not dfs:
             return pd.DataFrame()
@@ -181,14 +190,10 @@ class NACCDataLoader:
             return pd.DataFrame()
         
         # Load and combine all history files
-        dfs = []
-        for file_path in history_files:
-            try:
-                df = pd.read_csv(file_path)
-                dfs.append(df)
-                logger.info(f"Loaded {len(df)} records from {file_path.name}")
-            except Exception as e:
-                logger.error(f"Failed to load {file_path}: {e}")
+        dfs = self.reader.read_csv_files(
+            history_files,
+            columns=self.medical_history_parser.raw_columns
+        )
         
         if not dfs:
             return pd.DataFrame()
@@ -225,14 +230,7 @@ class NACCDataLoader:
             return pd.DataFrame()
         
         # Load and combine all neuropathology files
-        dfs = []
-        for file_path in neuropath_files:
-            try:
-                df = pd.read_csv(file_path)
-                dfs.append(df)
-                logger.info(f"Loaded {len(df)} records from {file_path.name}")
-            except Exception as e:
-                logger.error(f"Failed to load {file_path}: {e}")
+        dfs = self.reader.read_csv_files(neuropath_files)
         
         if not dfs:
             return pd.DataFrame()
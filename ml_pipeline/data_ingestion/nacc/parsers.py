@@ -18,28 +18,10 @@ class ClinicalAssessmentParser:
             'moca_score', 'cdr_global', 'cdr_sob', 'diagnosis',
             'functional_status', 'behavioral_symptoms'
         ]
-    
-    def parse(self, raw_data: pd.DataFrame) -> pd.DataFrame:
-        """
-        Parse clinical assessment data.
-        
-        Args:
-            raw_data: Raw DataFrame from NACC
-        
-        Returns:
-            Parsed DataFrame with standardized columns
-        """
-        if raw_data.empty:
-            logger.warning("Empty clinical assessment data")
-            return pd.DataFrame(columns=self.expected_columns)
-        
-        logger.info(f"Parsing {len(raw_data)} clinical assessment records")
-        
-        parsed = pd.DataFrame()
         
         # Map NACC column names to standardized names
         # NACC uses specific UDS variable names
-        column_mapping = {
+        self.column_mapping = {
             'NACCID': 'patient_id',
             'VISITNUM': 'visit_number',
             'VISITDATE': 'visit_date',
@@ -78,8 +60,29 @@ class ClinicalAssessmentParser:
             'NPIQINFX': 'npi_score'
         }
         
+        # Source columns read by the loaders
+        self.raw_columns = list(self.column_mapping)
+    
+    def parse(self, raw_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Parse clinical assessment data.
+        
+        Args:
+            raw_data: Raw DataFrame from NACC
+        
+        Returns:
+            Parsed DataFrame with standardized columns
+        """
+        if raw_data.empty:
+            logger.warning("Empty clinical assessment data")
+            return pd.DataFrame(columns=self.expected_columns)
+        
+        logger.info(f"Parsing {len(raw_data)} clinical assessment records")
+        
+        parsed = pd.DataFrame()
+        
         # Rename columns if they exist
-        for nacc_col, std_col in column_mapping.items():
+        for nacc_col, std_col in self.column_mapping.items():
             if nacc_col in raw_data.columns:
                 parsed[std_col] = raw_data[nacc_col]
         
@@ -162,27 +165,9 @@ class MedicalHistoryParser:
             'cardiovascular_disease', 'stroke', 'tbi', 'depression',
             'smoking_status', 'alcohol_use', 'bmi', 'family_history_dementia'
         ]
-    
-    def parse(self, raw_data: pd.DataFrame) -> pd.DataFrame:
-        """
-        Parse medical history data.
-        
-        Args:
-            raw_data: Raw DataFrame from NACC
-        
-        Returns:
-            Parsed DataFrame with standardized columns
-        """
-        if raw_data.empty:
-            logger.warning("Empty medical history data")
-            return pd.DataFrame(columns=self.expected_columns)
-        
-        logger.info(f"Parsing {len(raw_data)} medical history records")
-        
-        parsed = pd.DataFrame()
         
         # Map NACC column names to standardized names
-        column_mapping = {
+        self.column_mapping = {
             'NACCID': 'patient_id',
             
             # Medical conditions (typically 0=No, 1=Yes, 8=N/A, 9=Unknown)
@@ -231,8 +216,29 @@ class MedicalHistoryParser:
             'NACCDAD': 'father_dementia'
         }
         
+        # Source columns read by the loaders
+        self.raw_columns = list(self.column_mapping)
+    
+    def parse(self, raw_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Parse medical history data.
+        
+        Args:
+            raw_data: Raw DataFrame from NACC
+        
+        Returns:
+            Parsed DataFrame with standardized columns
+        """
+        if raw_data.empty:
+            logger.warning("Empty medical history data")
+            return pd.DataFrame(columns=self.expected_columns)
+        
+        logger.info(f"Parsing {len(raw_data)} medical history records")
+        
+        parsed = pd.DataFrame()
+        
         # Rename columns if they exist
-        for nacc_col, std_col in column_mapping.items():
+        for nacc_col, std_col in self.column_mapping.items():
             if nacc_col in raw_data.columns:
                 parsed[std_col] = raw_data[nacc_col]
         
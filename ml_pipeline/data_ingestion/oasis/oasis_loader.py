@@ -7,6 +7,8 @@ from datetime import datetime
 import pandas as pd
 
 from ml_pipeline.config.settings import Settings
+from ml_pipeline.data_ingestion.schema_validator import SchemaValidator
+from ml_pipeline.data_ingestion.source_reader import SourceFileReader
 from ml_pipeline.data_ingestion.oasis.parsers import (
     MRIVolumetricParser,
     CDRDemographicsParser
@@ -26,12 +28,18 @@ class OASISDataLoader:
     - Longitudinal data (OASIS-3)
     """
     
-    def __init__(self, settings: Optional[Settings] = None):
+    def __init__(
+        self,
+        settings: Optional[Settings] = None,
+        reader: Optional[SourceFileReader] = None
+    ):
         """
         Initialize OASIS data loader.
         
         Args:
             settings: Configuration settings
+            reader: Shared source file reader (default: one caching under
+                PROCESSED_DATA_PATH/source_cache)
         """
         self.settings = settings or Settings()
         self.data_dir = Path(self.settings.OASIS_DATA_PATH or (Path(self.settings.RAW_DATA_PATH) / "oasis"))
@@ -41,6 +49,10 @@ class OASISDataLoader:
         self.mri_parser = MRIVolumetricParser()
         self.cdr_demographics_parser = CDRDemographicsParser()
         
+        # Typed, column-pruned and cached reads of source files
+        self.reader = reader or SourceFileReader(Path(self.settings.PROCESSED_DATA_PATH) / "source_cache")
+        self.schema_validator = SchemaValidator()
+        
         logger.info("OASIS data loader initialized")
     
     def download_oasis_data(self, version: str = "OASIS-3") -> Path:
@@ -130,14 +142,11 @@ class OASISDataLoader:
             return pd.DataFrame()
         
         # Load and combine all MRI files
-        dfs = []
-        for file_path in mri_files:
-            try:
-                df = pd.read_csv(file_path)
-                dfs.append(df)
-                logger.info(f"Loaded {len(df)} records from {file_path.name}")
-            except Exception as e:
-                logger.error(f"Failed to load {file_path}: {e}")
+        dfs = self.reader.read_csv_files(
+            mri_files,
+            columns=self.mri_parser.raw_columns,
+            dtypes=self.schema_validator.get_read_dtypes('oasis_mri', self.mri_parser.column_mapping)
+        )
         
         if not dfs:
             return pd.DataFrame()
@@ -178,14 +187,10 @@ class OASISDataLoader:
             }
         
         # Load and combine all files
-        dfs = []
-        for file_path in demo_files:
-            try:
-                df = pd.read_csv(file_path)
-                dfs.append(df)
-                logger.info(f"Loaded {len(df)} records from {file_path.name}")
-            except Exception as e:
-                logger.error(f"Failed to load {file_path}: {e}")
+        dfs = self.reader.read_csv_files(
+            demo_files,
+            columns=self.cdr_demographics_parser.raw_columns
+        )
         
         if not dfs:
             return {
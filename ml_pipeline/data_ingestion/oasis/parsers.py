@@ -18,28 +18,10 @@ class MRIVolumetricParser:
             'hippocampus_right', 'hippocampus_total', 'entorhinal_cortex',
             'ventricle_volume', 'whole_brain_volume', 'icv', 'normalized_brain_volume'
         ]
-    
-    def parse(self, raw_data: pd.DataFrame) -> pd.DataFrame:
-        """
-        Parse MRI volumetric data.
-        
-        Args:
-            raw_data: Raw DataFrame from OASIS
-        
-        Returns:
-            Parsed DataFrame with standardized columns
-        """
-        if raw_data.empty:
-            logger.warning("Empty MRI volumetric data")
-            return pd.DataFrame(columns=self.expected_columns)
-        
-        logger.info(f"Parsing {len(raw_data)} MRI volumetric records")
-        
-        parsed = pd.DataFrame()
         
         # Map OASIS column names to standardized names
         # OASIS uses different naming conventions across versions
-        column_mapping = {
+        self.column_mapping = {
             # Common identifiers
             'Subject': 'patient_id',
             'MR ID': 'scan_id',
@@ -65,8 +47,29 @@ class MRIVolumetricParser:
             'BrainSegVolNotVent': 'brain_volume_no_ventricles'
         }
         
+        # Source columns read by the loaders
+        self.raw_columns = list(self.column_mapping)
+    
+    def parse(self, raw_data: pd.DataFrame) -> pd.DataFrame:
+        """
+        Parse MRI volumetric data.
+        
+        Args:
+            raw_data: Raw DataFrame from OASIS
+        
+        Returns:
+            Parsed DataFrame with standardized columns
+        """
+        if raw_data.empty:
+            logger.warning("Empty MRI volumetric data")
+            return pd.DataFrame(columns=self.expected_columns)
+        
+        logger.info(f"Parsing {len(raw_data)} MRI volumetric records")
+        
+        parsed = pd.DataFrame()
+        
         # Rename columns if they exist
-        for oasis_col, std_col in column_mapping.items():
+        for oasis_col, std_col in self.column_mapping.items():
             if oasis_col in raw_data.columns:
                 parsed[std_col] = raw_data[oasis_col]
         
@@ -137,6 +140,35 @@ class CDRDemographicsParser:
             'cdr_memory', 'cdr_orientation', 'cdr_judgment',
             'cdr_community', 'cdr_home', 'cdr_personal_care'
         ]
+        
+        # Map OASIS demographics column names to standardized names
+        self.demographics_mapping = {
+            'Subject': 'patient_id',
+            'M/F': 'sex',
+            'Hand': 'handedness',
+            'Age': 'age',
+            'Educ': 'education_years',
+            'SES': 'socioeconomic_status',
+            'Race': 'race',
+            'Ethnicity': 'ethnicity'
+        }
+        
+        # Map OASIS CDR column names to standardized names
+        self.cdr_mapping = {
+            'Subject': 'patient_id',
+            'Visit': 'visit_date',
+            'CDR': 'cdr_global',
+            'CDRSUM': 'cdr_sob',
+            'CDMEMORY': 'cdr_memory',
+            'CDORIENT': 'cdr_orientation',
+            'CDJUDGE': 'cdr_judgment',
+            'CDCOMMUN': 'cdr_community',
+            'CDHOME': 'cdr_home',
+            'CDCARE': 'cdr_personal_care'
+        }
+        
+        # Source columns read by the loaders
+        self.raw_columns = list(dict.fromkeys([*self.demographics_mapping, *self.cdr_mapping]))
     
     def parse(self, raw_data: pd.DataFrame) -> Dict[str, pd.DataFrame]:
         """
@@ -174,20 +206,8 @@ class CDRDemographicsParser:
         """Parse demographics data."""
         demographics = pd.DataFrame()
         
-        # Map OASIS column names to standardized names
-        column_mapping = {
-            'Subject': 'patient_id',
-            'M/F': 'sex',
-            'Hand': 'handedness',
-            'Age': 'age',
-            'Educ': 'education_years',
-            'SES': 'socioeconomic_status',
-            'Race': 'race',
-            'Ethnicity': 'ethnicity'
-        }
-        
         # Rename columns if they exist
-        for oasis_col, std_col in column_mapping.items():
+        for oasis_col, std_col in self.demographics_mapping.items():
             if oasis_col in raw_data.columns:
                 demographics[std_col] = raw_data[oasis_col]
         
@@ -225,22 +245,8 @@ class CDRDemographicsParser:
         """Parse CDR scores."""
         cdr = pd.DataFrame()
         
-        # Map OASIS column names to standardized names
-        column_mapping = {
-            'Subject': 'patient_id',
-            'Visit': 'visit_date',
-            'CDR': 'cdr_global',
-            'CDRSUM': 'cdr_sob',
-            'CDMEMORY': 'cdr_memory',
-            'CDORIENT': 'cdr_orientation',
-            'CDJUDGE': 'cdr_judgment',
-            'CDCOMMUN': 'cdr_community',
-            'CDHOME': 'cdr_home',
-            'CDCARE': 'cdr_personal_care'
-        }
-        
         # Rename columns if they exist
-        for oasis_col, std_col in column_mapping.items():
+        for oasis_col, std_col in self.cdr_mapping.items():
             if oasis_col in raw_data.columns:
                 cdr[std_col] = raw_data[oasis_col]
         
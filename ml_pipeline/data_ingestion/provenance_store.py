@@ -0,0 +1,313 @@
+"""Indexed SQLite storage for data provenance records."""
+
+import logging
+import sqlite3
+import json
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, List, Optional, Any, Iterable, Iterator, Tuple
+from datetime import datetime
+from enum import Enum
+
+logger = logging.getLogger(__name__)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS provenance_records (
+    record_id TEXT PRIMARY KEY,
+    dataset_name TEXT NOT NULL,
+    data_source TEXT NOT NULL,
+    processing_stage TEXT NOT NULL,
+    ingestion_timestamp TEXT NOT NULL,
+    source_file TEXT,
+    source_signature TEXT,
+    record_json TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_provenance_source
+    ON provenance_records (data_source, ingestion_timestamp);
+CREATE INDEX IF NOT EXISTS idx_provenance_stage
+    ON provenance_records (processing_stage, ingestion_timestamp);
+CREATE INDEX IF NOT EXISTS idx_provenance_timestamp
+    ON provenance_records (ingestion_timestamp);
+CREATE INDEX IF NOT EXISTS idx_provenance_source_file
+    ON provenance_records (source_file, source_signature);
+
+CREATE TABLE IF NOT EXISTS provenance_edges (
+    child_id TEXT NOT NULL,
+    parent_id TEXT NOT NULL,
+    PRIMARY KEY (child_id, parent_id)
+);
+CREATE INDEX IF NOT EXISTS idx_provenance_edges_parent
+    ON provenance_edges (parent_id);
+"""
+
+# Fixed-width timestamps so text comparison orders them correctly
+TIMESTAMP_FORMAT = "%Y-%m-%dT%H:%M:%S.%f"
+
+
+class ProvenanceStore:
+    """
+    SQLite store for provenance records.
+
+    Records are kept as JSON alongside indexed columns for data source,
+    processing stage, timestamp and source file, and parent links are kept
+    in an edge table so lineage is one recursive query.
+    """
+
+    def __init__(self, db_path: Path):
+        """
+        Initialize provenance store.
+
+        Args:
+            db_path: Path of the SQLite database file
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+
+        logger.info(f"Provenance store initialized at {self.db_path}")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, committing on success and rolling back on error."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def format_timestamp(timestamp: datetime) -> str:
+        """Format a timestamp as stored in the timestamp column."""
+        return timestamp.strftime(TIMESTAMP_FORMAT)
+
+    @staticmethod
+    def _value(value: Any) -> Any:
+        """Plain value of enum members."""
+        return value.value if isinstance(value, Enum) else value
+
+    def _record_row(self, record: Dict[str, Any]) -> Tuple:
+        """Row of the records table for a record dictionary."""
+        timestamp = record['ingestion_timestamp']
+        if isinstance(timestamp, str):
+            timestamp = datetime.fromisoformat(timestamp)
+
+        return (
+            record['record_id'],
+            record['dataset_name'],
+            self._value(record['data_source']),
+            self._value(record['processing_stage']),
+            self.format_timestamp(timestamp),
+            record.get('source_file'),
+            record.get('source_signature'),
+            json.dumps(record, default=str)
+        )
+
+    def save(self, record: Dict[str, Any]):
+        """
+        Insert or replace a record and its parent links.
+
+        Args:
+            record: Record dictionary (ProvenanceRecord.dict())
+        """
+        self.save_many([record], replace=True)
+
+    def save_many(self, records: Iterable[Dict[str, Any]], replace: bool = True) -> int:
+        """
+        Save records in one transaction.
+
+        Args:
+            records: Record dictionaries
+            replace: If False, records whose ID is already stored are skipped
+
+        Returns:
+            Number of records written
+        """
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        written = 0
+
+        with self._connect() as conn:
+            for record in records:
+                cursor = conn.execute(
+                    f"{verb} INTO provenance_records VALUES (?, ?, ?, ?, ?, ?, ?, ?)",
+                    self._record_row(record)
+                )
+                if cursor.rowcount == 0:
+                    continue
+
+                written += 1
+                conn.execute(
+                    "DELETE FROM provenance_edges WHERE child_id = ?",
+                    (record['record_id'],)
+                )
+                conn.executemany(
+                    "INSERT OR IGNORE INTO provenance_edges VALUES (?, ?)",
+                    [(record['record_id'], parent_id) for parent_id in record.get('parent_records') or []]
+                )
+
+        return written
+
+    def get(self, record_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a record by ID.
+
+        Args:
+            record_id: ID of provenance record
+
+        Returns:
+            Record dictionary or None if not found
+        """
+        with self._connect() as conn:
+            row = conn.execute(
+                "SELECT record_json FROM provenance_records WHERE record_id = ?",
+                (record_id,)
+            ).fetchone()
+
+        return json.loads(row[0]) if row else None
+
+    def query(
+        self,
+        data_source: Optional[str] = None,
+        processing_stage: Optional[str] = None,
+        start_date: Optional[datetime] = None,
+        end_date: Optional[datetime] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Get records matching the filters, oldest first.
+
+        Args:
+            data_source: Optional filter by data source
+            processing_stage: Optional filter by processing stage
+            start_date: Optional filter by start date (inclusive)
+            end_date: Optional filter by end date (inclusive)
+
+        Returns:
+            List of record dictionaries
+        """
+        clauses = []
+        params: List[Any] = []
+
+        if data_source:
+            clauses.append("data_source = ?")
+            params.append(self._value(data_source))
+        if processing_stage:
+            clauses.append("processing_stage = ?")
+            params.append(self._value(processing_stage))
+        if start_date:
+            clauses.append("ingestion_timestamp >= ?")
+            params.append(self.format_timestamp(start_date))
+        if end_date:
+            clauses.append("ingestion_timestamp <= ?")
+            params.append(self.format_timestamp(end_date))
+
+        sql = "SELECT record_json FROM provenance_records"
+        if clauses:
+            sql += " WHERE " + " AND ".join(clauses)
+        sql += " ORDER BY ingestion_timestamp, record_id"
+
+        with self._connect() as conn:
+            rows = conn.execute(sql, params).fetchall()
+
+        return [json.loads(row[0]) for row in rows]
+
+    def get_ancestors(self, record_id: str) -> List[Dict[str, Any]]:
+        """
+        Get a record and all records it derives from.
+
+        Args:
+            record_id: ID of provenance record
+
+        Returns:
+            List of record dictionaries, including the record itself
+        """
+        sql = """
+            WITH RECURSIVE lineage(record_id) AS (
+                SELECT ?
+                UNION
+                SELECT e.parent_id
+                FROM provenance_edges e
+                JOIN lineage l ON e.child_id = l.record_id
+            )
+            SELECT r.record_json
+            FROM provenance_records r
+            JOIN lineage l ON r.record_id = l.record_id
+        """
+        with self._connect() as conn:
+            rows = conn.execute(sql, (record_id,)).fetchall()
+
+        return [json.loads(row[0]) for row in rows]
+
+    def find_by_source(self, source_file: str, source_signature: str) -> List[Dict[str, Any]]:
+        """
+        Get records ingested from a source file with the given signature.
+
+        Args:
+            source_file: Source file path as recorded
+            source_signature: Size and mtime signature of the file
+
+        Returns:
+            List of record dictionaries
+        """
+        with self._connect() as conn:
+            rows = conn.execute(
+                "SELECT record_json FROM provenance_records "
+                "WHERE source_file = ? AND source_signature = ?",
+                (source_file, source_signature)
+            ).fetchall()
+
+        return [json.loads(row[0]) for row in rows]
+
+    def count(self) -> int:
+        """Number of stored records."""
+        with self._connect() as conn:
+            return conn.execute("SELECT COUNT(*) FROM provenance_records").fetchone()[0]
+
+    def import_json_records(self, json_dir: Path, batch_size: int = 1000) -> Dict[str, int]:
+        """
+        Import records saved as one JSON file per record.
+
+        Records already in the store are left unchanged, so the import can
+        be rerun. The JSON files are not modified.
+
+        Args:
+            json_dir: Directory containing <record_id>.json files
+            batch_size: Records written per transaction
+
+        Returns:
+            Counts of imported, skipped and failed files
+        """
+        counts = {'imported': 0, 'skipped': 0, 'failed': 0}
+        batch: List[Dict[str, Any]] = []
+
+        def flush():
+            written = self.save_many(batch, replace=False)
+            counts['imported'] += written
+            counts['skipped'] += len(batch) - written
+            batch.clear()
+
+        for record_file in sorted(Path(json_dir).glob("*.json")):
+            try:
+                with open(record_file, 'r') as f:
+                    record = json.load(f)
+                self._record_row(record)  # Reject records missing indexed fields
+                batch.append(record)
+            except Exception as e:
+                logger.error(f"Failed to import record from {record_file}: {e}")
+                counts['failed'] += 1
+                continue
+
+            if len(batch) >= batch_size:
+                flush()
+
+        if batch:
+            flush()
+
+        logger.info(
+            f"Imported {counts['imported']} provenance records from {json_dir} "
+            f"({counts['skipped']} already present, {counts['failed']} failed)"
+        )
+        return counts
@@ -7,11 +7,12 @@ from datetime import datetime
 from enum import Enum
 import json
 import hashlib
+import numpy as np
 import pandas as pd
 from pydantic import BaseModel, Field
 
 from ml_pipeline.config.settings import Settings
-from ml_pipeline.data_storage.database import get_db_session
+from ml_pipeline.data_ingestion.provenance_store import ProvenanceStore
 
 logger = logging.getLogger(__name__)
 
@@ -50,6 +51,9 @@ class ProvenanceRecord(BaseModel):
     num_columns: int = 0
     file_size_bytes: Optional[int] = None
     data_hash: Optional[str] = None
+    hash_method: Optional[str] = None  # None for records hashed from JSON text
+    source_signature: Optional[str] = None  # Size and mtime of source_file
+    source_checksum: Optional[str] = None  # SHA-256 of source_file
     
     # Processing information
     processing_steps: List[str] = []
@@ -78,6 +82,10 @@ class LineageNode(BaseModel):
 class ProvenanceTracker:
     """Tracker for data provenance and lineage."""
     
+    HASH_METHOD = "sha256-row-hashes-v1"
+    HASH_CHUNK_ROWS = 100_000
+    FILE_HASH_CHUNK_BYTES = 1024 * 1024
+    
     def __init__(self, settings: Optional[Settings] = None):
         """
         Initialize provenance tracker.
@@ -88,6 +96,13 @@ class ProvenanceTracker:
         self.settings = settings or Settings()
         self.metadata_dir = Path(self.settings.METADATA_PATH) / "provenance"
         self.metadata_dir.mkdir(parents=True, exist_ok=True)
+        self.store = ProvenanceStore(self.metadata_dir / "provenance.db")
+        
+        if self.store.count() == 0 and next(self.metadata_dir.glob("*.json"), None):
+            logger.warning(
+                f"Found JSON provenance records in {self.metadata_dir} that are not in the "
+                "provenance store; run python -m ml_pipeline.data_ingestion.migrate_provenance"
+            )
         
         logger.info("Provenance tracker initialized")
     
@@ -116,13 +131,25 @@ class ProvenanceTracker:
         """
         logger.info(f"Tracking ingestion for {dataset_name} from {data_source}")
         
-        # Calculate data hash
-        data_hash = self._calculate_dataframe_hash(data)
-        
-        # Get file size if source file provided
+        # Get file size and checksum if source file provided
         file_size = None
+        source_signature = None
+        source_checksum = None
         if source_file and source_file.exists():
-            file_size = source_file.stat().st_size
+            stat = source_file.stat()
+            file_size = stat.st_size
+            source_signature = f"{stat.st_size}:{stat.st_mtime_ns}"
+            
+            # Reuse the checksum recorded for an unchanged source file
+            source_checksum = self._find_source_checksum(source_file, source_signature)
+            if source_checksum:
+                logger.info(f"Source file {source_file} unchanged, reusing its checksum")
+            else:
+                source_checksum = self._calculate_file_checksum(source_file)
+        
+        # The frame is always hashed: parsing or filtering can change it even
+        # when the source file is unchanged
+        data_hash = self._calculate_dataframe_hash(data)
         
         # Create provenance record
         record = ProvenanceRecord(
@@ -135,6 +162,9 @@ class ProvenanceTracker:
             num_columns=len(data.columns),
             file_size_bytes=file_size,
             data_hash=data_hash,
+            hash_method=self.HASH_METHOD,
+            source_signature=source_signature,
+            source_checksum=source_checksum,
             metadata=metadata or {}
         )
         
@@ -188,6 +218,7 @@ class ProvenanceTracker:
             num_records=len(data),
             num_columns=len(data.columns),
             data_hash=data_hash,
+            hash_method=self.HASH_METHOD,
             processing_steps=processing_steps,
             parent_records=[parent_record_id],
             metadata=metadata or {}
@@ -233,6 +264,7 @@ class ProvenanceTracker:
             num_records=len(data),
             num_columns=len(data.columns),
             data_hash=data_hash,
+            hash_method=self.HASH_METHOD,
             processing_steps=[merge_description],
             parent_records=parent_record_ids,
             metadata=metadata or {}
@@ -257,42 +289,23 @@ class ProvenanceTracker:
         logger.info(f"Getting lineage for record {record_id}")
         
         lineage = {}
-        self._build_lineage_recursive(record_id, lineage)
+        for record_data in self.store.get_ancestors(record_id):
+            record = self._record_from_dict(record_data)
+            lineage[record.record_id] = LineageNode(
+                record_id=record.record_id,
+                dataset_name=record.dataset_name,
+                data_source=record.data_source,
+                processing_stage=record.processing_stage,
+                timestamp=record.ingestion_timestamp,
+                children=list(record.parent_records)
+            )
+        
+        if record_id not in lineage:
+            logger.warning(f"Record {record_id} not found")
         
         logger.info(f"Built lineage with {len(lineage)} nodes")
         return lineage
     
-    def _build_lineage_recursive(
-        self,
-        record_id: str,
-        lineage: Dict[str, LineageNode]
-    ):
-        """Recursively build lineage graph."""
-        if record_id in lineage:
-            return  # Already processed
-        
-        # Load record
-        record = self._load_record(record_id)
-        if not record:
-            logger.warning(f"Record {record_id} not found")
-            return
-        
-        # Create lineage node
-        node = LineageNode(
-            record_id=record.record_id,
-            dataset_name=record.dataset_name,
-            data_source=record.data_source,
-            processing_stage=record.processing_stage,
-            timestamp=record.ingestion_timestamp
-        )
-        
-        # Process parent records
-        for parent_id in record.parent_records:
-            node.children.append(parent_id)
-            self._build_lineage_recursive(parent_id, lineage)
-        
-        lineage[record_id] = node
-    
     def get_record(self, record_id: str) -> Optional[ProvenanceRecord]:
         """
         Get provenance record by ID.
@@ -327,65 +340,93 @@ class ProvenanceTracker:
         logger.info("Listing provenance records")
         
         records = []
-        
-        # Load all records
-        for record_file in self.metadata_dir.glob("*.json"):
+        for record_data in self.store.query(data_source, processing_stage, start_date, end_date):
             try:
-                record = self._load_record_from_file(record_file)
-                
-                # Apply filters
-                if data_source and record.data_source != data_source:
-                    continue
-                if processing_stage and record.processing_stage != processing_stage:
-                    continue
-                if start_date and record.ingestion_timestamp < start_date:
-                    continue
-                if end_date and record.ingestion_timestamp > end_date:
-                    continue
-                
-                records.append(record)
-                
+                records.append(self._record_from_dict(record_data))
             except Exception as e:
-                logger.error(f"Failed to load record from {record_file}: {e}")
+                logger.error(f"Failed to load record {record_data.get('record_id')}: {e}")
         
         logger.info(f"Found {len(records)} matching records")
         return records
     
     def _calculate_dataframe_hash(self, data: pd.DataFrame) -> str:
-        """Calculate hash of DataFrame for data integrity."""
-        # Convert DataFrame to string representation and hash
-        data_str = data.to_json(orient='records', date_format='iso')
-        return hashlib.sha256(data_str.encode()).hexdigest()
-    
-    def _save_record(self, record: ProvenanceRecord):
-        """Save provenance record to file."""
-        record_file = self.metadata_dir / f"{record.record_id}.json"
+        """
+        Calculate content hash of DataFrame for data integrity.
         
-        with open(record_file, 'w') as f:
-            json.dump(record.dict(), f, indent=2, default=str)
+        Column names, dtypes and the per-row hashes of
+        pd.util.hash_pandas_object are fed to SHA-256, HASH_CHUNK_ROWS rows
+        at a time, so memory stays bounded by the chunk rather than a text
+        copy of the frame. The index is not hashed.
+        """
+        digest = hashlib.sha256()
+        for column, dtype in data.dtypes.items():
+            digest.update(f"{column}|{dtype}|".encode())
+        digest.update(f"rows={len(data)}|".encode())
+        
+        for start in range(0, len(data), self.HASH_CHUNK_ROWS):
+            chunk = data.iloc[start:start + self.HASH_CHUNK_ROWS]
+            try:
+                row_hashes = pd.util.hash_pandas_object(chunk, index=False)
+            except TypeError:
+                # Unhashable cells (lists, dicts); hash their text instead
+                object_cols = chunk.select_dtypes(include='object').columns
+                row_hashes = pd.util.hash_pandas_object(
+                    chunk.astype({col: str for col in object_cols}), index=False
+                )
+            digest.update(np.ascontiguousarray(row_hashes.to_numpy()).tobytes())
         
-        logger.debug(f"Saved provenance record to {record_file}")
+        return digest.hexdigest()
     
-    def _load_record(self, record_id: str) -> Optional[ProvenanceRecord]:
-        """Load provenance record from file."""
-        record_file = self.metadata_dir / f"{record_id}.json"
+    def _calculate_file_checksum(self, source_file: Path) -> str:
+        """SHA-256 of a source file, read FILE_HASH_CHUNK_BYTES at a time."""
+        digest = hashlib.sha256()
+        with open(source_file, 'rb') as f:
+            for block in iter(lambda: f.read(self.FILE_HASH_CHUNK_BYTES), b''):
+                digest.update(block)
+        
+        return digest.hexdigest()
+    
+    def _find_source_checksum(self, source_file: Path, source_signature: str) -> Optional[str]:
+        """Find the checksum recorded for a source file with the same size and mtime."""
+        for record in self.store.find_by_source(str(source_file), source_signature):
+            if record.get('source_checksum'):
+                return record['source_checksum']
         
-        if not record_file.exists():
+        return None
+    
+    def _save_record(self, record: ProvenanceRecord):
+        """Save provenance record to the store."""
+        self.store.save(record.dict())
+        logger.debug(f"Saved provenance record {record.record_id}")
+    
+    def _load_record(self, record_id: str) -> Optional[ProvenanceRecord]:
+        """Load provenance record from the store."""
+        data = self.store.get(record_id)
+        if data is None:
             return None
         
-        return self._load_record_from_file(record_file)
+        return self._record_from_dict(data)
     
-    def _load_record_from_file(self, record_file: Path) -> ProvenanceRecord:
-        """Load provenance record from file path."""
-        with open(record_file, 'r') as f:
-            data = json.load(f)
-        
+    def _record_from_dict(self, data: Dict[str, Any]) -> ProvenanceRecord:
+        """Build provenance record from its saved dictionary."""
         # Convert timestamp strings back to datetime
-        if 'ingestion_timestamp' in data:
+        if isinstance(data.get('ingestion_timestamp'), str):
             data['ingestion_timestamp'] = datetime.fromisoformat(data['ingestion_timestamp'])
         
         return ProvenanceRecord(**data)
     
+    def import_json_records(self, json_dir: Optional[Path] = None) -> Dict[str, int]:
+        """
+        Import records saved as one JSON file per record into the store.
+        
+        Args:
+            json_dir: Directory of JSON records (defaults to metadata_dir)
+        
+        Returns:
+            Counts of imported, skipped and failed files
+        """
+        return self.store.import_json_records(json_dir or self.metadata_dir)
+    
     def export_lineage_graph(
         self,
         record_id: str,
@@ -1,11 +1,12 @@
 """Schema validation for biomedical datasets."""
 
 import logging
-from typing import Dict, List, Optional, Any
-from enum import Enum
+from dataclasses import dataclass
+from typing import Dict, List, Optional, Any, Tuple
+from enum import Enum, IntFlag
 import pandas as pd
 import numpy as np
-from pydantic import BaseModel, Field, validator
+from pydantic import BaseModel, Field, PrivateAttr, validator
 
 logger = logging.getLogger(__name__)
 
@@ -20,6 +21,14 @@ class DataType(str, Enum):
     DATETIME = "datetime"
 
 
+class RowError(IntFlag):
+    """Bits of the per-row error mask."""
+    NULL = 1
+    TYPE = 2
+    RANGE = 4
+    VALUE = 8
+
+
 class ColumnSchema(BaseModel):
     """Schema definition for a single column."""
     name: str
@@ -65,6 +74,36 @@ class ValidationResult(BaseModel):
     warnings: List[ValidationError] = []
     total_rows: int
     valid_rows: int
+    invalid_row_indices: List[Any] = []
+    
+    _row_errors: Optional[np.ndarray] = PrivateAttr(default=None)
+    _row_index: Optional[pd.Index] = PrivateAttr(default=None)
+    
+    def set_row_errors(self, row_errors: np.ndarray, index: pd.Index):
+        """Record the per-row error mask and derive valid row counts."""
+        self._row_errors = row_errors
+        self._row_index = index
+        invalid = row_errors != 0
+        self.valid_rows = int(len(row_errors) - invalid.sum())
+        self.invalid_row_indices = index[invalid].tolist()
+    
+    def get_row_errors(self) -> pd.Series:
+        """Get the RowError bits of each row, indexed like the validated data."""
+        if self._row_errors is None:
+            return pd.Series(dtype=np.uint8)
+        return pd.Series(self._row_errors, index=self._row_index, name='row_errors')
+    
+    def get_valid_mask(self) -> np.ndarray:
+        """Get a boolean array marking rows without row-level errors."""
+        if self._row_errors is None:
+            return np.ones(self.total_rows, dtype=bool)
+        return self._row_errors == 0
+    
+    def get_valid_row_indices(self) -> List[Any]:
+        """Get index labels of rows without row-level errors."""
+        if self._row_index is None:
+            return []
+        return self._row_index[self.get_valid_mask()].tolist()
     
     def add_error(self, error: ValidationError):
         """Add validation error."""
@@ -85,12 +124,39 @@ class ValidationResult(BaseModel):
         return summary
 
 
+@dataclass(frozen=True)
+class ColumnCheck:
+    """Checks for one column, resolved from its ColumnSchema once."""
+    name: str
+    data_type: DataType
+    nullable: bool
+    numeric: bool
+    min_value: Optional[float]
+    max_value: Optional[float]
+    allowed_values: Optional[Tuple[Any, ...]]
+
+
+@dataclass(frozen=True)
+class SchemaPlan:
+    """Compiled validation plan for a dataset schema."""
+    schema: DatasetSchema
+    required_columns: frozenset
+    column_names: frozenset
+    checks: Tuple[ColumnCheck, ...]
+
+
 class SchemaValidator:
     """Validator for dataset schemas."""
     
+    NUMERIC_TYPES = (DataType.INTEGER, DataType.FLOAT)
+    DATETIME_TYPES = (DataType.DATE, DataType.DATETIME)
+    BOOLEAN_VALUES = [True, False, 0, 1]
+    MAX_REPORTED_INDICES = 10
+    
     def __init__(self):
         """Initialize schema validator."""
         self.schemas = self._load_schemas()
+        self._plans: Dict[str, SchemaPlan] = {}
         logger.info("Schema validator initialized")
     
     def _load_schemas(self) -> Dict[str, DatasetSchema]:
@@ -172,6 +238,99 @@ class SchemaValidator:
         
         return schemas
     
+    def compile_schema(self, schema: DatasetSchema) -> SchemaPlan:
+        """
+        Resolve a schema into the checks run for each column.
+        
+        Args:
+            schema: Dataset schema to compile
+        
+        Returns:
+            SchemaPlan with one ColumnCheck per schema column
+        """
+        checks = []
+        for col_schema in schema.columns:
+            has_range = col_schema.min_value is not None or col_schema.max_value is not None
+            checks.append(ColumnCheck(
+                name=col_schema.name,
+                data_type=col_schema.data_type,
+                nullable=col_schema.nullable,
+                numeric=col_schema.data_type in self.NUMERIC_TYPES or has_range,
+                min_value=col_schema.min_value,
+                max_value=col_schema.max_value,
+                allowed_values=(
+                    tuple(col_schema.allowed_values)
+                    if col_schema.allowed_values is not None else None
+                )
+            ))
+        
+        return SchemaPlan(
+            schema=schema,
+            required_columns=frozenset(schema.get_required_columns()),
+            column_names=frozenset(schema.get_column_names()),
+            checks=tuple(checks)
+        )
+    
+    def get_plan(self, schema_name: str) -> SchemaPlan:
+        """
+        Get the compiled plan for a schema, compiling it on first use.
+        
+        Args:
+            schema_name: Name of schema
+        
+        Returns:
+            SchemaPlan for the schema
+        
+        Raises:
+            ValueError: If schema_name is not found
+        """
+        if schema_name not in self.schemas:
+            raise ValueError(f"Schema '{schema_name}' not found. Available schemas: {list(self.schemas.keys())}")
+        
+        schema = self.schemas[schema_name]
+        plan = self._plans.get(schema_name)
+        if plan is None or plan.schema is not schema:
+            plan = self.compile_schema(schema)
+            self._plans[schema_name] = plan
+        return plan
+    
+    def get_read_dtypes(
+        self,
+        schema_name: str,
+        column_mapping: Dict[str, str]
+    ) -> Dict[str, str]:
+        """
+        Get dtypes for reading source columns that map to schema columns.
+        
+        Numeric columns are read as float64 (integers may be missing) and
+        string columns as string. Dates, datetimes and booleans are left to
+        the parsers.
+        
+        Args:
+            schema_name: Name of schema the parsed data is validated against
+            column_mapping: Source column name -> schema column name
+        
+        Returns:
+            Dictionary mapping source column names to dtypes
+        
+        Raises:
+            ValueError: If schema_name is not found
+        """
+        plan = self.get_plan(schema_name)
+        schema_types = {check.name: check.data_type for check in plan.checks}
+        read_types = {
+            DataType.INTEGER: 'float64',
+            DataType.FLOAT: 'float64',
+            DataType.STRING: 'string'
+        }
+        
+        dtypes = {}
+        for source_col, schema_col in column_mapping.items():
+            data_type = schema_types.get(schema_col)
+            if data_type in read_types:
+                dtypes[source_col] = read_types[data_type]
+        return dtypes
+    
     def validate(
         self,
         data: pd.DataFrame,
@@ -181,21 +340,24 @@ class SchemaValidator:
         """
         Validate data against schema.
         
+        Each column is coerced once and checked for nulls, type, range and
+        allowed values; failing rows set RowError bits in a per-row mask.
+        valid_rows and invalid_row_indices are exact counts of rows without
+        row-level errors. Missing and extra columns are dataset-level issues
+        and do not mark rows.
+        
         Args:
             data: DataFrame to validate
             schema_name: Name of schema to validate against
             strict: If True, fail on warnings
         
         Returns:
-            ValidationResult with errors and warnings
+            ValidationResult with errors, warnings and the per-row error mask
         
         Raises:
             ValueError: If schema_name is not found
         """
-        if schema_name not in self.schemas:
-            raise ValueError(f"Schema '{schema_name}' not found. Available schemas: {list(self.schemas.keys())}")
-        
-        schema = self.schemas[schema_name]
+        plan = self.get_plan(schema_name)
         logger.info(f"Validating data against schema: {schema_name}")
         
         result = ValidationResult(
@@ -205,17 +367,17 @@ class SchemaValidator:
         )
         
         # Check for required columns
-        missing_required = set(schema.get_required_columns()) - set(data.columns)
+        missing_required = plan.required_columns - set(data.columns)
         if missing_required:
             result.add_error(ValidationError(
                 column='',
                 error_type='missing_required_columns',
-                message=f"Missing required columns: {missing_required}",
+                message=f"Missing required columns: {set(missing_required)}",
                 count=len(missing_required)
             ))
         
         # Check for extra columns (warning only)
-        extra_columns = set(data.columns) - set(schema.get_column_names())
+        extra_columns = set(data.columns) - plan.column_names
         if extra_columns:
             result.add_warning(ValidationError(
                 column='',
@@ -224,53 +386,20 @@ class SchemaValidator:
                 count=len(extra_columns)
             ))
         
+        row_errors = np.zeros(len(data), dtype=np.uint8)
+        
         # Validate each column
-        for col_schema in schema.columns:
-            if col_schema.name not in data.columns:
+        for check in plan.checks:
+            if check.name not in data.columns:
                 continue
             
-            col_data = data[col_schema.name]
+            column_errors = self._check_column(data[check.name], check)
+            row_errors |= column_errors
             
-            # Check nullability
-            if not col_schema.nullable:
-                null_count = col_data.isna().sum()
-                if null_count > 0:
-                    null_indices = data[col_data.isna()].index.tolist()[:10]  # First 10
-                    result.add_error(ValidationError(
-                        column=col_schema.name,
-                        error_type='null_values',
-                        message=f"Column '{col_schema.name}' contains {null_count} null values but is not nullable",
-                        row_indices=null_indices,
-                        count=null_count
-                    ))
-            
-            # Skip further validation for null values
-            non_null_data = col_data.dropna()
-            if non_null_data.empty:
-                continue
-            
-            # Validate data type
-            type_errors = self._validate_data_type(non_null_data, col_schema)
-            if type_errors:
-                result.add_error(type_errors)
-            
-            # Validate range
-            if col_schema.min_value is not None or col_schema.max_value is not None:
-                range_errors = self._validate_range(non_null_data, col_schema)
-                if range_errors:
-                    result.add_error(range_errors)
-            
-            # Validate allowed values
-            if col_schema.allowed_values is not None:
-                value_errors = self._validate_allowed_values(non_null_data, col_schema)
-                if value_errors:
-                    result.add_error(value_errors)
+            for error in self._describe_errors(data.index, column_errors, check):
+                result.add_error(error)
         
-        # Calculate valid rows (rows without errors)
-        if result.errors:
-            # Estimate valid rows (this is approximate)
-            error_rows = sum(e.count for e in result.errors if e.count > 0)
-            result.valid_rows = max(0, result.total_rows - error_rows)
+        result.set_row_errors(row_errors, data.index)
         
         # In strict mode, warnings become errors
         if strict and result.warnings:
@@ -281,89 +410,138 @@ class SchemaValidator:
         logger.info(f"Validation complete: {result.get_summary()}")
         return result
     
-    def _validate_data_type(
+    def filter_valid_rows(self, data: pd.DataFrame, result: ValidationResult) -> pd.DataFrame:
+        """
+        Keep only the rows of data without row-level errors.
+        
+        Args:
+            data: DataFrame that was validated
+            result: ValidationResult returned by validate for data
+        
+        Returns:
+            DataFrame of valid rows
+        """
+        if len(data) != result.total_rows:
+            raise ValueError(f"Data has {len(data)} rows but result covers {result.total_rows}")
+        return data[result.get_valid_mask()]
+    
+    def _check_column(self, col_data: pd.Series, check: ColumnCheck) -> np.ndarray:
+        """Get the RowError bits of each value of a column."""
+        errors = np.zeros(len(col_data), dtype=np.uint8)
+        
+        is_null = col_data.isna().to_numpy()
+        if not check.nullable:
+            errors[is_null] |= np.uint8(RowError.NULL)
+        
+        if is_null.all():
+            return errors
+        
+        # Coerce once; values that fail conversion become NaN/NaT
+        numeric_values = None
+        if check.numeric:
+            numeric_values = self._coerce_numeric(col_data)
+        
+        type_invalid = self._invalid_type(col_data, numeric_values, is_null, check)
+        errors[type_invalid] |= np.uint8(RowError.TYPE)
+        checkable = ~is_null & ~type_invalid
+        
+        if check.min_value is not None or check.max_value is not None:
+            out_of_range = np.zeros(len(col_data), dtype=bool)
+            with np.errstate(invalid='ignore'):
+                if check.min_value is not None:
+                    out_of_range |= numeric_values < check.min_value
+                if check.max_value is not None:
+                    out_of_range |= numeric_values > check.max_value
+            errors[checkable & out_of_range] |= np.uint8(RowError.RANGE)
+        
+        if check.allowed_values is not None:
+            if check.data_type in self.NUMERIC_TYPES:
+                allowed = pd.Series(numeric_values).isin(check.allowed_values).to_numpy()
+            else:
+                allowed = col_data.isin(check.allowed_values).to_numpy()
+            errors[checkable & ~allowed] |= np.uint8(RowError.VALUE)
+        
+        return errors
+    
+    @staticmethod
+    def _coerce_numeric(col_data: pd.Series) -> np.ndarray:
+        """Convert a column to float, with NaN for values that do not convert."""
+        if pd.api.types.is_bool_dtype(col_data.dtype):
+            return col_data.to_numpy(dtype=float, na_value=np.nan)
+        return pd.to_numeric(col_data, errors='coerce').to_numpy(dtype=float, na_value=np.nan)
+    
+    def _invalid_type(
         self,
-        data: pd.Series,
-        col_schema: ColumnSchema
-    ) -> Optional[ValidationError]:
-        """Validate data type of column."""
-        expected_type = col_schema.data_type
+        col_data: pd.Series,
+        numeric_values: Optional[np.ndarray],
+        is_null: np.ndarray,
+        check: ColumnCheck
+    ) -> np.ndarray:
+        """Mark non-null values that do not convert to the column's data type."""
+        expected_type = check.data_type
         
-        try:
+        if expected_type in self.NUMERIC_TYPES:
+            invalid = np.isnan(numeric_values) & ~is_null
             if expected_type == DataType.INTEGER:
-                # Check if values can be converted to int
-                pd.to_numeric(data, errors='raise', downcast='integer')
-            elif expected_type == DataType.FLOAT:
-                # Check if values can be converted to float
-                pd.to_numeric(data, errors='raise')
-            elif expected_type in [DataType.DATE, DataType.DATETIME]:
-                # Check if values can be converted to datetime
-                pd.to_datetime(data, errors='raise')
-            elif expected_type == DataType.BOOLEAN:
-                # Check if values are boolean-like
-                if not data.isin([True, False, 0, 1]).all():
-                    raise ValueError("Invalid boolean values")
-            
-            return None
-            
-        except Exception as e:
-            invalid_count = len(data)
-            return ValidationError(
-                column=col_schema.name,
-                error_type='invalid_data_type',
-                message=f"Column '{col_schema.name}' has invalid {expected_type.value} values",
-                count=invalid_count
-            )
+                with np.errstate(invalid='ignore'):
+                    invalid |= np.isfinite(numeric_values) & (numeric_values != np.floor(numeric_values))
+            return invalid
+        
+        if expected_type in self.DATETIME_TYPES:
+            if pd.api.types.is_datetime64_any_dtype(col_data.dtype):
+                return np.zeros(len(col_data), dtype=bool)
+            return self._coerce_datetime(col_data).isna().to_numpy() & ~is_null
+        
+        if expected_type == DataType.BOOLEAN:
+            return ~col_data.isin(self.BOOLEAN_VALUES).to_numpy() & ~is_null
+        
+        return np.zeros(len(col_data), dtype=bool)
     
-    def _validate_range(
-        self,
-        data: pd.Series,
-        col_schema: ColumnSchema
-    ) -> Optional[ValidationError]:
-        """Validate value range of column."""
-        numeric_data = pd.to_numeric(data, errors='coerce')
-        
-        out_of_range = pd.Series([False] * len(numeric_data), index=numeric_data.index)
-        
-        if col_schema.min_value is not None:
-            out_of_range |= numeric_data < col_schema.min_value
-        
-        if col_schema.max_value is not None:
-            out_of_range |= numeric_data > col_schema.max_value
-        
-        if out_of_range.any():
-            count = out_of_range.sum()
-            indices = data[out_of_range].index.tolist()[:10]  # First 10
-            return ValidationError(
-                column=col_schema.name,
-                error_type='out_of_range',
-                message=f"Column '{col_schema.name}' has {count} values outside range [{col_schema.min_value}, {col_schema.max_value}]",
-                row_indices=indices,
-                count=count
-            )
+    @staticmethod
+    def _coerce_datetime(col_data: pd.Series) -> pd.Series:
+        """Convert a column to datetime, with NaT for values that do not parse."""
+        try:
+            parsed = pd.to_datetime(col_data, errors='coerce')
+        except (TypeError, ValueError):
+            # Mixed time zones cannot share one dtype; parse values one by one
+            return col_data.map(lambda value: pd.to_datetime(value, errors='coerce'))
         
-        return None
+        # The inferred format may not fit every row; parse leftovers one by one
+        retry = parsed.isna() & col_data.notna()
+        if retry.any():
+            parsed[retry] = pd.to_datetime(col_data[retry], errors='coerce', format='mixed')
+        return parsed
     
-    def _validate_allowed_values(
+    def _describe_errors(
         self,
-        data: pd.Series,
-        col_schema: ColumnSchema
-    ) -> Optional[ValidationError]:
-        """Validate allowed values of column."""
-        invalid = ~data.isin(col_schema.allowed_values)
-        
-        if invalid.any():
-            count = invalid.sum()
-            indices = data[invalid].index.tolist()[:10]  # First 10
-            return ValidationError(
-                column=col_schema.name,
-                error_type='invalid_value',
-                message=f"Column '{col_schema.name}' has {count} values not in allowed set: {col_schema.allowed_values}",
-                row_indices=indices,
+        index: pd.Index,
+        column_errors: np.ndarray,
+        check: ColumnCheck
+    ) -> List[ValidationError]:
+        """Build one ValidationError per error type found in a column."""
+        errors = []
+        messages = {
+            RowError.NULL: ('null_values', "contains {count} null values but is not nullable"),
+            RowError.TYPE: ('invalid_data_type', f"has {{count}} invalid {check.data_type.value} values"),
+            RowError.RANGE: ('out_of_range', f"has {{count}} values outside range [{check.min_value}, {check.max_value}]"),
+            RowError.VALUE: ('invalid_value', f"has {{count}} values not in allowed set: {list(check.allowed_values or [])}")
+        }
+        
+        for flag, (error_type, template) in messages.items():
+            failing = (column_errors & flag) != 0
+            count = int(failing.sum())
+            if count == 0:
+                continue
+            
+            errors.append(ValidationError(
+                column=check.name,
+                error_type=error_type,
+                message=f"Column '{check.name}' " + template.format(count=count),
+                row_indices=index[failing][:self.MAX_REPORTED_INDICES].tolist(),
                 count=count
-            )
+            ))
         
-        return None
+        return errors
     
     def log_validation_errors(self, result: ValidationResult):
         """Log validation errors and warnings."""
@@ -0,0 +1,280 @@
+"""Typed, cached reading of source CSV files for the data loaders."""
+
+import logging
+import hashlib
+import json
+import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Any
+import pandas as pd
+
+logger = logging.getLogger(__name__)
+
+try:
+    import pyarrow as pa
+    import pyarrow.csv as pa_csv
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+
+class SourceFileReader:
+    """
+    Reader for source CSV files shared by the ADNI, OASIS and NACC loaders.
+
+    Files are read with the pyarrow CSV reader (when installed), pruned to
+    the columns the parsers use and typed with explicit dtypes. Each parsed
+    file is cached as Parquet, and a manifest records every file's size,
+    mtime and SHA-256 so unchanged files are not parsed again: the size and
+    mtime are checked first, and the checksum only when they differ.
+    """
+
+    MANIFEST_NAME = "manifest.json"
+    CHECKSUM_BLOCK_SIZE = 1024 * 1024
+
+    def __init__(
+        self,
+        cache_dir: Optional[Path] = None,
+        max_workers: int = 4
+    ):
+        """
+        Initialize source file reader.
+
+        Args:
+            cache_dir: Directory for parsed Parquet files and the manifest,
+                or None to disable caching
+            max_workers: Number of files read concurrently
+        """
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self.max_workers = max_workers
+        self._lock = threading.Lock()
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._manifest: Dict[str, Dict[str, Any]] = {}
+
+        if self.cache_dir:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            self._manifest = self._load_manifest()
+
+        logger.info(f"Source file reader initialized (pyarrow={PYARROW_AVAILABLE}, workers={max_workers})")
+
+    @property
+    def executor(self) -> ThreadPoolExecutor:
+        """Worker pool shared by all reads."""
+        with self._lock:
+            if self._executor is None:
+                self._executor = ThreadPoolExecutor(
+                    max_workers=self.max_workers,
+                    thread_name_prefix='source-reader'
+                )
+            return self._executor
+
+    def read_csv(
+        self,
+        file_path: Path,
+        columns: Optional[List[str]] = None,
+        dtypes: Optional[Dict[str, str]] = None
+    ) -> pd.DataFrame:
+        """
+        Read a CSV file, reusing its cached Parquet if the file is unchanged.
+
+        Args:
+            file_path: Path to CSV file
+            columns: Columns to read; columns missing from the file are
+                ignored. None reads all columns.
+            dtypes: Dtypes of source columns
+
+        Returns:
+            DataFrame with the requested columns present in the file
+        """
+        file_path = Path(file_path)
+        read_key = self._read_key(columns, dtypes)
+
+        checksum = None
+        if self.cache_dir:
+            checksum = self._file_checksum(file_path)
+            cached_file = self.cache_dir / f"{checksum[:16]}_{read_key}.parquet"
+            if cached_file.exists():
+                logger.info(f"Source file {file_path.name} unchanged, reusing parsed data")
+                return pd.read_parquet(cached_file)
+
+        data = self._parse_csv(file_path, columns, dtypes)
+
+        if self.cache_dir and PYARROW_AVAILABLE:
+            self._write_cache(data, cached_file)
+
+        return data
+
+    def read_csv_files(
+        self,
+        file_paths: List[Path],
+        columns: Optional[List[str]] = None,
+        dtypes: Optional[Dict[str, str]] = None
+    ) -> List[pd.DataFrame]:
+        """
+        Read CSV files concurrently on the worker pool.
+
+        Files that fail to load are logged and skipped.
+
+        Args:
+            file_paths: Paths to CSV files
+            columns: Columns to read (see read_csv)
+            dtypes: Dtypes of source columns
+
+        Returns:
+            DataFrames of the files that loaded, in file order
+        """
+        futures = [
+            (file_path, self.executor.submit(self.read_csv, file_path, columns, dtypes))
+            for file_path in file_paths
+        ]
+
+        dfs = []
+        for file_path, future in futures:
+            try:
+                df = future.result()
+                dfs.append(df)
+                logger.info(f"Loaded {len(df)} records from {Path(file_path).name}")
+            except Exception as e:
+                logger.error(f"Failed to load {file_path}: {e}")
+
+        return dfs
+
+    def _parse_csv(
+        self,
+        file_path: Path,
+        columns: Optional[List[str]],
+        dtypes: Optional[Dict[str, str]]
+    ) -> pd.DataFrame:
+        """Parse a CSV file, pruned to the requested columns and typed."""
+        usecols = None
+        if columns is not None:
+            header = pd.read_csv(file_path, nrows=0).columns
+            usecols = [col for col in header if col in set(columns)]
+            if not usecols:
+                logger.warning(f"None of the expected columns found in {file_path.name}")
+                return pd.DataFrame()
+
+        read_dtypes = None
+        if dtypes:
+            read_dtypes = {
+                col: dtype for col, dtype in dtypes.items()
+                if usecols is None or col in usecols
+            }
+
+        try:
+            return self._read_typed(file_path, usecols, read_dtypes)
+        except (ValueError, TypeError, ArithmeticError) as e:
+            if not read_dtypes:
+                raise
+            # A value that does not fit its dtype; let the parsers coerce it
+            logger.warning(f"Typed read of {file_path.name} failed ({e}); reading with inferred types")
+            return self._read_typed(file_path, usecols, None)
+
+    def _read_typed(
+        self,
+        file_path: Path,
+        usecols: Optional[List[str]],
+        dtypes: Optional[Dict[str, str]]
+    ) -> pd.DataFrame:
+        """Read a CSV file with the pyarrow CSV reader, or pandas without pyarrow."""
+        if not PYARROW_AVAILABLE:
+            return pd.read_csv(file_path, usecols=usecols, dtype=dtypes)
+
+        # pandas' pyarrow engine casts after type inference, which would drop
+        # leading zeros of string identifiers; give pyarrow the types up front
+        column_types = {
+            col: pa.string() if dtype == 'string' else pa.from_numpy_dtype(dtype)
+            for col, dtype in (dtypes or {}).items()
+        }
+        table = pa_csv.read_csv(
+            file_path,
+            convert_options=pa_csv.ConvertOptions(
+                include_columns=usecols,
+                column_types=column_types,
+                strings_can_be_null=True
+            )
+        )
+        data = table.to_pandas()
+        return data.astype(dtypes) if dtypes else data
+
+    @staticmethod
+    def _read_key(columns: Optional[List[str]], dtypes: Optional[Dict[str, str]]) -> str:
+        """Short hash identifying the columns and dtypes of a read."""
+        spec = json.dumps(
+            {
+                'columns': sorted(columns) if columns is not None else None,
+                'dtypes': dtypes or {}
+            },
+            sort_keys=True
+        )
+        return hashlib.sha256(spec.encode()).hexdigest()[:12]
+
+    def _file_checksum(self, file_path: Path) -> str:
+        """SHA-256 of a file, reused from the manifest if size and mtime match."""
+        stat = file_path.stat()
+        key = str(file_path.resolve())
+
+        with self._lock:
+            entry = self._manifest.get(key)
+        if entry and entry['size'] == stat.st_size and entry['mtime_ns'] == stat.st_mtime_ns:
+            return entry['sha256']
+
+        digest = hashlib.sha256()
+        with open(file_path, 'rb') as f:
+            for block in iter(lambda: f.read(self.CHECKSUM_BLOCK_SIZE), b''):
+                digest.update(block)
+        checksum = digest.hexdigest()
+
+        with self._lock:
+            previous = self._manifest.get(key)
+            self._manifest[key] = {
+                'size': stat.st_size,
+                'mtime_ns': stat.st_mtime_ns,
+                'sha256': checksum
+            }
+            if previous and previous['sha256'] != checksum:
+                self._remove_stale_cache(previous['sha256'])
+            self._save_manifest()
+
+        return checksum
+
+    def _write_cache(self, data: pd.DataFrame, cached_file: Path):
+        """Write parsed data to the Parquet cache."""
+        tmp_file = cached_file.with_name(f".{cached_file.name}.{threading.get_ident()}.tmp")
+        try:
+            data.to_parquet(tmp_file, index=False)
+            os.replace(tmp_file, cached_file)
+        except Exception as e:
+            # Mixed-type object columns cannot always be written; read again next time
+            logger.warning(f"Could not cache parsed data as {cached_file.name}: {e}")
+            tmp_file.unlink(missing_ok=True)
+
+    def _remove_stale_cache(self, checksum: str):
+        """Delete cached Parquet files of a checksum no source file has any more."""
+        if any(entry['sha256'] == checksum for entry in self._manifest.values()):
+            return
+        for cached_file in self.cache_dir.glob(f"{checksum[:16]}_*.parquet"):
+            cached_file.unlink(missing_ok=True)
+
+    def _load_manifest(self) -> Dict[str, Dict[str, Any]]:
+        """Load the checksum manifest."""
+        manifest_file = self.cache_dir / self.MANIFEST_NAME
+        if not manifest_file.exists():
+            return {}
+
+        try:
+            with open(manifest_file, 'r') as f:
+                return json.load(f)
+        except Exception as e:
+            logger.error(f"Failed to load source manifest, starting empty: {e}")
+            return {}
+
+    def _save_manifest(self):
+        """Write the checksum manifest atomically (caller holds the lock)."""
+        manifest_file = self.cache_dir / self.MANIFEST_NAME
+        tmp_file = manifest_file.with_suffix('.json.tmp')
+        with open(tmp_file, 'w') as f:
+            json.dump(self._manifest, f, indent=2)
+        os.replace(tmp_file, manifest_file)
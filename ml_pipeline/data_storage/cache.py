@@ -4,10 +4,15 @@ Implements caching for frequently accessed features and model predictions
 """
 import json
 import pickle
+import threading
+import time
+from collections import OrderedDict
 from typing import Any, Optional, Callable
 from functools import wraps
 import hashlib
 
+import pandas as pd
+import pyarrow as pa
 import redis
 from redis.connection import ConnectionPool
 
@@ -113,6 +118,52 @@ class RedisCache:
             )
             return False
     
+    def get_bytes(self, key: str) -> Optional[bytes]:
+        """
+        Get raw bytes from cache without unpickling
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached bytes if exists, None otherwise
+        """
+        try:
+            return self.client.get(key)
+        except Exception as e:
+            main_logger.error(
+                f"Failed to get cache key {key}: {str(e)}",
+                extra={'operation': 'cache_get', 'user_id': 'system'}
+            )
+            return None
+    
+    def set_bytes(
+        self,
+        key: str,
+        value: bytes,
+        ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Set raw bytes in cache without pickling
+        
+        Args:
+            key: Cache key
+            value: Bytes to cache
+            ttl: Time to live in seconds (default from settings)
+            
+        Returns:
+            True if successful
+        """
+        try:
+            self.client.setex(key, ttl or settings.CACHE_TTL, value)
+            return True
+        except Exception as e:
+            main_logger.error(
+                f"Failed to set cache key {key}: {str(e)}",
+                extra={'operation': 'cache_set', 'user_id': 'system'}
+            )
+            return False
+    
     def delete(self, key: str) -> bool:
         """
         Delete key from cache
@@ -243,6 +294,275 @@ class RedisCache:
             return False
 
 
+class LocalCache:
+    """
+    Bounded in-process LRU cache for serialized values
+    
+    Entries expire after a TTL, and least recently used entries are evicted
+    once the total size of cached values exceeds max_bytes.
+    """
+    
+    def __init__(
+        self,
+        max_bytes: Optional[int] = None,
+        ttl: Optional[int] = None
+    ):
+        """
+        Initialize local cache
+        
+        Args:
+            max_bytes: Maximum total size of cached values (default from settings)
+            ttl: Default time to live in seconds (default from settings)
+        """
+        self.max_bytes = max_bytes or settings.LOCAL_CACHE_MAX_BYTES
+        self.ttl = ttl or settings.LOCAL_CACHE_TTL
+        
+        self._entries: "OrderedDict[str, tuple]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.current_bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get value from cache
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached bytes if present and not expired, None otherwise
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            
+            if entry is None:
+                self.misses += 1
+                return None
+            
+            expires_at, value = entry
+            if expires_at < time.monotonic():
+                self._remove(key)
+                self.misses += 1
+                return None
+            
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return value
+    
+    def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Set value in cache, evicting least recently used entries to fit
+        
+        Args:
+            key: Cache key
+            value: Bytes to cache
+            ttl: Time to live in seconds
+            
+        Returns:
+            True if cached, False if the value is larger than the cache
+        """
+        if len(value) > self.max_bytes:
+            return False
+        
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            
+            while self._entries and self.current_bytes + len(value) > self.max_bytes:
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+            
+            self._entries[key] = (time.monotonic() + (ttl or self.ttl), value)
+            self.current_bytes += len(value)
+        
+        return True
+    
+    def delete(self, key: str) -> bool:
+        """
+        Delete key from cache
+        
+        Args:
+            key: Cache key to delete
+            
+        Returns:
+            True if the key was cached
+        """
+        with self._lock:
+            if key not in self._entries:
+                return False
+            self._remove(key)
+            return True
+    
+    def clear_prefix(self, prefix: str) -> int:
+        """
+        Clear all keys starting with a prefix
+        
+        Args:
+            prefix: Key prefix (e.g., "features:")
+            
+        Returns:
+            Number of keys deleted
+        """
+        with self._lock:
+            keys = [key for key in self._entries if key.startswith(prefix)]
+            for key in keys:
+                self._remove(key)
+            return len(keys)
+    
+    def get_stats(self) -> dict:
+        """
+        Get cache statistics
+        
+        Returns:
+            Dictionary with cache stats
+        """
+        with self._lock:
+            return {
+                'entries': len(self._entries),
+                'current_bytes': self.current_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self.hits,
+                'misses': self.misses,
+                'evictions': self.evictions,
+                'hit_rate': RedisCache._calculate_hit_rate(self.hits, self.misses)
+            }
+    
+    def _remove(self, key: str):
+        """Remove an entry; caller holds the lock"""
+        _, value = self._entries.pop(key)
+        self.current_bytes -= len(value)
+
+
+class TieredCache:
+    """
+    Two-tier byte cache: a bounded in-process LRU in front of Redis
+    
+    Reads check the local tier first and fall back to Redis, promoting
+    remote hits into the local tier. Writes go to both tiers.
+    """
+    
+    def __init__(
+        self,
+        remote: RedisCache,
+        local: Optional[LocalCache] = None
+    ):
+        """
+        Initialize tiered cache
+        
+        Args:
+            remote: Shared Redis cache
+            local: In-process cache (created from settings if not given)
+        """
+        self.remote = remote
+        self.local = local or LocalCache()
+    
+    def get(self, key: str) -> Optional[bytes]:
+        """
+        Get value from the nearest tier holding it
+        
+        Args:
+            key: Cache key
+            
+        Returns:
+            Cached bytes if exists, None otherwise
+        """
+        value = self.local.get(key)
+        if value is not None:
+            return value
+        
+        value = self.remote.get_bytes(key)
+        if not isinstance(value, bytes):
+            return None
+        
+        self.local.set(key, value)
+        return value
+    
+    def set(
+        self,
+        key: str,
+        value: bytes,
+        ttl: Optional[int] = None
+    ) -> bool:
+        """
+        Set value in both tiers
+        
+        Args:
+            key: Cache key
+            value: Bytes to cache
+            ttl: Time to live in seconds for the Redis tier
+            
+        Returns:
+            True if stored in Redis
+        """
+        self.local.set(key, value)
+        return bool(self.remote.set_bytes(key, value, ttl=ttl))
+    
+    def delete(self, key: str) -> bool:
+        """Delete key from both tiers"""
+        self.local.delete(key)
+        return bool(self.remote.delete(key))
+    
+    def clear_prefix(self, prefix: str) -> int:
+        """
+        Clear all keys starting with a prefix from both tiers
+        
+        Args:
+            prefix: Key prefix (e.g., "features:")
+            
+        Returns:
+            Number of keys deleted from Redis
+        """
+        self.local.clear_prefix(prefix)
+        return self.remote.clear_pattern(f"{prefix}*")
+    
+    def get_stats(self) -> dict:
+        """Get statistics for both tiers"""
+        return {
+            'local': self.local.get_stats(),
+            'remote': self.remote.get_stats()
+        }
+
+
+def frame_to_ipc(df: pd.DataFrame) -> bytes:
+    """
+    Serialize a DataFrame as an uncompressed Arrow IPC stream
+    
+    Args:
+        df: DataFrame to serialize
+        
+    Returns:
+        Arrow IPC bytes
+    """
+    table = pa.Table.from_pandas(df, preserve_index=False)
+    sink = pa.BufferOutputStream()
+    with pa.ipc.new_stream(sink, table.schema) as writer:
+        writer.write_table(table)
+    return sink.getvalue().to_pybytes()
+
+
+def frame_from_ipc(data: bytes) -> pd.DataFrame:
+    """
+    Deserialize a DataFrame from Arrow IPC bytes
+    
+    Arrow buffers reference the bytes directly, so the only copy is the
+    conversion into writable pandas blocks.
+    
+    Args:
+        data: Arrow IPC bytes
+        
+    Returns:
+        DataFrame
+    """
+    return pa.ipc.open_stream(pa.py_buffer(data)).read_all().to_pandas()
+
+
 # Global cache instance
 cache = RedisCache()
 
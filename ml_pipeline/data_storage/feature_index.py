@@ -1,30 +1,61 @@
 """
 Feature indexing system for fast lookups by patient_id and timestamp
-Maintains indexes in memory and on disk for efficient queries
+Maintains columnar indexes in memory and on disk for efficient queries
 """
 from pathlib import Path
 from typing import Dict, List, Optional, Set, Tuple
 from datetime import datetime, date
 import json
-import pickle
-from collections import defaultdict
+import os
+import numpy as np
 import pandas as pd
+import pyarrow as pa
+import pyarrow.compute as pc
+import pyarrow.parquet as pq
 
 from ml_pipeline.config.settings import settings
 from ml_pipeline.config.logging_config import main_logger
 
 
+# Visit dates are stored as day ordinals relative to the Unix epoch
+_EPOCH = date(1970, 1, 1)
+
+
+def _to_ordinal(value: date) -> int:
+    """Convert a date to days since the Unix epoch"""
+    if isinstance(value, datetime):
+        value = value.date()
+    return (value - _EPOCH).days
+
+
+def _from_ordinals(ordinals: np.ndarray) -> List[date]:
+    """Convert day ordinals back to date objects"""
+    return list(ordinals.astype('datetime64[D]').astype(object))
+
+
 class FeatureIndex:
     """
-    Index system for fast feature lookups
+    Columnar index system for fast feature lookups
+    
+    Every indexed record is stored as one slot in parallel NumPy arrays,
+    sorted by (patient, visit date):
+    - patient_codes: position of the patient ID in the sorted patient vocabulary
+    - file_ids: position of the source file in the file table
+    - row_offsets: row position within the source Parquet file
+    - date_ordinals: visit date as days since 1970-01-01
     
-    Maintains two primary indexes:
-    1. Patient ID index: Maps patient_id -> list of (file_path, row_group)
-    2. Timestamp index: Maps date -> list of (file_path, row_group)
+    A secondary permutation sorted by visit date backs date range queries, so
+    both patient and date lookups are binary searches.
     
-    Indexes are persisted to disk and loaded on startup
+    Each indexed file carries an (mtime, size, row count) fingerprint so that
+    refresh() only re-reads files that were added, rewritten or removed.
+    
+    Indexes are persisted to disk as a single .npz archive and loaded on startup
     """
     
+    INDEX_FILE = "feature_index.npz"
+    METADATA_FILE = "metadata.json"
+    
     def __init__(self, storage_path: Optional[Path] = None):
         """
         Initialize feature index
@@ -36,10 +67,8 @@ class FeatureIndex:
         self.index_path = self.storage_path / "_indexes"
         self.index_path.mkdir(parents=True, exist_ok=True)
         
-        # In-memory indexes
-        self.patient_index: Dict[str, List[Tuple[str, int]]] = defaultdict(list)
-        self.date_index: Dict[date, List[Tuple[str, int]]] = defaultdict(list)
-        self.cohort_index: Dict[str, Set[str]] = defaultdict(set)
+        # In-memory columnar index
+        self._reset_arrays()
         
         # Metadata
         self.index_metadata = {
@@ -57,6 +86,28 @@ class FeatureIndex:
             extra={'operation': 'index_init', 'user_id': 'system'}
         )
     
+    def _reset_arrays(self):
+        """Reset the in-memory index to an empty state"""
+        # Lookup tables
+        self.patients = np.array([], dtype=str)
+        self.files: List[str] = []
+        self.file_cohorts: List[str] = []
+        
+        # Per-file fingerprints used for incremental refresh
+        self.file_mtimes: List[int] = []
+        self.file_sizes: List[int] = []
+        self.file_rows: List[int] = []
+        
+        # Record arrays sorted by (patient_code, date_ordinal)
+        self.patient_codes = np.array([], dtype=np.int32)
+        self.file_ids = np.array([], dtype=np.int32)
+        self.row_offsets = np.array([], dtype=np.int32)
+        self.date_ordinals = np.array([], dtype=np.int32)
+        
+        # Permutation of records sorted by date, and the dates in that order
+        self.date_order = np.array([], dtype=np.int64)
+        self.sorted_dates = np.array([], dtype=np.int32)
+    
     def build_index(self, force_rebuild: bool = False):
         """
         Build or rebuild indexes from Parquet files
@@ -73,111 +124,539 @@ class FeatureIndex:
         
         start_time = datetime.now()
         
-        # Clear existing indexes
-        self.patient_index.clear()
-        self.date_index.clear()
-        self.cohort_index.clear()
-        
-        total_records = 0
-        min_date = None
-        max_date = None
-        
         # Scan all Parquet files
-        for cohort_dir in self.storage_path.glob("cohort=*"):
-            cohort = cohort_dir.name.split('=')[1]
-            
-            for parquet_file in cohort_dir.rglob("*.parquet"):
-                # Read file metadata
-                try:
-                    df = pd.read_parquet(
-                        parquet_file,
-                        columns=['patient_id', 'visit_date']
-                    )
-                    
-                    if df.empty:
-                        continue
-                    
-                    # Ensure visit_date is datetime
-                    if not pd.api.types.is_datetime64_any_dtype(df['visit_date']):
-                        df['visit_date'] = pd.to_datetime(df['visit_date'])
-                    
-                    # Build indexes
-                    file_path_str = str(parquet_file.relative_to(self.storage_path))
-                    
-                    for idx, row in df.iterrows():
-                        patient_id = row['patient_id']
-                        visit_date = row['visit_date'].date()
-                        
-                        # Patient index
-                        self.patient_index[patient_id].append((file_path_str, idx))
-                        
-                        # Date index
-                        self.date_index[visit_date].append((file_path_str, idx))
-                        
-                        # Cohort index
-                        self.cohort_index[cohort].add(patient_id)
-                        
-                        total_records += 1
-                        
-                        # Track date range
-                        if min_date is None or visit_date < min_date:
-                            min_date = visit_date
-                        if max_date is None or visit_date > max_date:
-                            max_date = visit_date
-                    
-                    main_logger.debug(
-                        f"Indexed {len(df)} records from {parquet_file.name}",
-                        extra={'operation': 'build_index', 'user_id': 'system'}
-                    )
-                    
-                except Exception as e:
-                    main_logger.error(
-                        f"Failed to index {parquet_file}: {str(e)}",
-                        extra={'operation': 'build_index', 'user_id': 'system'}
-                    )
+        self._reset_arrays()
+        self._add_files(self._discover_files())
         
-        # Update metadata
-        self.index_metadata = {
-            'last_updated': datetime.now(),
-            'total_records': total_records,
-            'total_patients': len(self.patient_index),
-            'date_range': (min_date, max_date)
-        }
+        self._update_metadata()
         
         # Persist indexes
         self._save_indexes()
         
         duration = (datetime.now() - start_time).total_seconds()
+        total_records = self.index_metadata['total_records']
+        total_patients = self.index_metadata['total_patients']
         
         main_logger.info(
-            f"Built indexes for {total_records} records from {len(self.patient_index)} patients "
+            f"Built indexes for {total_records} records from {total_patients} patients "
             f"in {duration:.2f}s",
             extra={
                 'operation': 'build_index',
                 'user_id': 'system',
                 'records': total_records,
-                'patients': len(self.patient_index)
+                'patients': total_patients
             }
         )
     
-    def get_patient_locations(self, patient_id: str) -> List[Tuple[Path, int]]:
+    def refresh(self, paths: Optional[List[Path]] = None) -> Dict[str, int]:
         """
-        Get file locations for a patient's features
+        Incrementally update indexes for added, rewritten or removed files
+        
+        Files whose fingerprint (mtime, size) matches the indexed one are
+        skipped. Records of rewritten or removed files are dropped, and only
+        new or rewritten files are read and merged into the sorted arrays.
+        
+        Args:
+            paths: Files to check, or None to check every file in the store
+            
+        Returns:
+            Dictionary with counts of added, updated, removed and unchanged files
+        """
+        start_time = datetime.now()
+        
+        # An index that was never built has to look at the whole store
+        if paths is None or not self.index_metadata['last_updated']:
+            candidates = self._discover_files()
+            scope = set(self.files)
+        else:
+            candidates = [
+                Path(path) for path in paths
+                if Path(path).exists() and self._file_cohort(self._relative_path(path))
+            ]
+            scope = {self._relative_path(path) for path in paths}
+        
+        file_ids = {file_path: file_id for file_id, file_path in enumerate(self.files)}
+        stats = {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 0}
+        
+        to_read = []
+        to_drop = []
+        seen = set()
+        
+        for path in candidates:
+            relative_path = self._relative_path(path)
+            seen.add(relative_path)
+            file_id = file_ids.get(relative_path)
+            
+            if file_id is None:
+                stats['added'] += 1
+                to_read.append(path)
+            elif self._fingerprint(path) != (
+                self.file_mtimes[file_id], self.file_sizes[file_id]
+            ):
+                stats['updated'] += 1
+                to_drop.append(file_id)
+                to_read.append(path)
+            else:
+                stats['unchanged'] += 1
+        
+        # Files that were indexed but no longer exist
+        for relative_path in scope - seen:
+            if relative_path in file_ids:
+                stats['removed'] += 1
+                to_drop.append(file_ids[relative_path])
+        
+        if not to_read and not to_drop:
+            return stats
+        
+        self._remove_files(to_drop)
+        records_added = self._add_files(to_read)
+        
+        self._update_metadata()
+        self._save_indexes()
+        
+        duration = (datetime.now() - start_time).total_seconds()
+        
+        main_logger.info(
+            f"Refreshed index: {stats['added']} added, {stats['updated']} updated, "
+            f"{stats['removed']} removed files ({records_added} records read) "
+            f"in {duration:.2f}s",
+            extra={
+                'operation': 'refresh_index',
+                'user_id': 'system',
+                'records': records_added
+            }
+        )
+        
+        return stats
+    
+    def _discover_files(self) -> List[Path]:
+        """Find all Parquet files in cohort partitions"""
+        return [
+            parquet_file
+            for cohort_dir in sorted(self.storage_path.glob("cohort=*"))
+            for parquet_file in sorted(cohort_dir.rglob("*.parquet"))
+        ]
+    
+    def _relative_path(self, path: Path) -> str:
+        """Get a file path relative to the feature store root"""
+        return str(Path(path).relative_to(self.storage_path))
+    
+    @staticmethod
+    def _file_cohort(relative_path: str) -> Optional[str]:
+        """Get the cohort of a file from its cohort=<name> partition directory"""
+        partition = Path(relative_path).parts[0]
+        if partition.startswith("cohort=") and len(Path(relative_path).parts) > 1:
+            return partition.split('=')[1]
+        return None
+    
+    @staticmethod
+    def _fingerprint(path: Path) -> Tuple[int, int]:
+        """Get the (mtime_ns, size) fingerprint of a file"""
+        stat = Path(path).stat()
+        return stat.st_mtime_ns, stat.st_size
+    
+    def _add_files(self, paths: List[Path]) -> int:
+        """
+        Read the key columns of files and merge their records into the index
+        
+        Args:
+            paths: Parquet files to index
+            
+        Returns:
+            Number of records added
+        """
+        id_chunks: List[pa.Array] = []
+        file_id_chunks: List[np.ndarray] = []
+        offset_chunks: List[np.ndarray] = []
+        date_chunks: List[np.ndarray] = []
+        
+        for parquet_file in paths:
+            try:
+                fingerprint = self._fingerprint(parquet_file)
+                num_rows, patient_ids, row_offsets, date_ordinals = \
+                    self._read_key_columns(parquet_file)
+            except Exception as e:
+                main_logger.error(
+                    f"Failed to index {parquet_file}: {str(e)}",
+                    extra={'operation': 'build_index', 'user_id': 'system'}
+                )
+                continue
+            
+            relative_path = self._relative_path(parquet_file)
+            file_id = len(self.files)
+            
+            # Register file with its fingerprint
+            self.files.append(relative_path)
+            self.file_cohorts.append(self._file_cohort(relative_path))
+            self.file_mtimes.append(fingerprint[0])
+            self.file_sizes.append(fingerprint[1])
+            self.file_rows.append(num_rows)
+            
+            id_chunks.append(patient_ids)
+            file_id_chunks.append(np.full(len(row_offsets), file_id, dtype=np.int32))
+            offset_chunks.append(row_offsets)
+            date_chunks.append(date_ordinals)
+            
+            main_logger.debug(
+                f"Indexed {len(row_offsets)} records from {parquet_file.name}",
+                extra={'operation': 'build_index', 'user_id': 'system'}
+            )
+        
+        if not id_chunks:
+            return 0
+        
+        # Dictionary-encode all patient IDs at once and merge into the sorted vocabulary
+        encoded = pc.dictionary_encode(pa.chunked_array(id_chunks, type=pa.string()).combine_chunks())
+        dictionary = np.array(encoded.dictionary.to_numpy(zero_copy_only=False), dtype=str)
+        
+        vocabulary = np.union1d(self.patients, dictionary)
+        if len(vocabulary) != len(self.patients):
+            # Re-code existing records against the grown vocabulary
+            remap = np.searchsorted(vocabulary, self.patients).astype(np.int32)
+            self.patient_codes = remap[self.patient_codes]
+            self.patients = vocabulary
+        
+        dictionary_codes = np.searchsorted(self.patients, dictionary).astype(np.int32)
+        patient_codes = dictionary_codes[encoded.indices.to_numpy(zero_copy_only=False)]
+        
+        self._insert_records(
+            patient_codes=patient_codes,
+            file_ids=np.concatenate(file_id_chunks),
+            row_offsets=np.concatenate(offset_chunks),
+            date_ordinals=np.concatenate(date_chunks)
+        )
+        
+        return len(patient_codes)
+    
+    def _remove_files(self, file_ids: List[int]):
+        """
+        Drop all records of the given files and compact the file table
+        
+        Args:
+            file_ids: File table positions to remove
+        """
+        if not file_ids:
+            return
+        
+        self._remove_records(~np.isin(self.file_ids, file_ids))
+        
+        dropped = set(file_ids)
+        remaining = [file_id for file_id in range(len(self.files)) if file_id not in dropped]
+        remap = np.full(len(self.files), -1, dtype=np.int32)
+        remap[remaining] = np.arange(len(remaining), dtype=np.int32)
+        self.file_ids = remap[self.file_ids]
+        
+        self.files = [self.files[i] for i in remaining]
+        self.file_cohorts = [self.file_cohorts[i] for i in remaining]
+        self.file_mtimes = [self.file_mtimes[i] for i in remaining]
+        self.file_sizes = [self.file_sizes[i] for i in remaining]
+        self.file_rows = [self.file_rows[i] for i in remaining]
+    
+    def _read_key_columns(
+        self,
+        parquet_file: Path
+    ) -> Tuple[int, pa.Array, np.ndarray, np.ndarray]:
+        """
+        Read the patient_id and visit_date columns of a Parquet file
+        
+        Args:
+            parquet_file: Parquet file to read
+            
+        Returns:
+            Tuple of (file row count, patient IDs, row offsets, date ordinals),
+            the last three restricted to rows with both keys present
+        """
+        table = pq.read_table(parquet_file, columns=['patient_id', 'visit_date'])
+        
+        patient_ids = pc.cast(table.column('patient_id'), pa.string())
+        visit_dates = table.column('visit_date')
+        
+        # Normalize visit_date to date32
+        if pa.types.is_timestamp(visit_dates.type) or pa.types.is_date(visit_dates.type):
+            visit_dates = pc.cast(visit_dates, pa.date32())
+        else:
+            visit_dates = pa.chunked_array([pa.array(
+                pd.to_datetime(visit_dates.to_pandas()).dt.normalize(),
+                type=pa.timestamp('ns')
+            )])
+            visit_dates = pc.cast(visit_dates, pa.date32())
+        
+        valid = pc.and_(pc.is_valid(patient_ids), pc.is_valid(visit_dates))
+        row_offsets = np.arange(table.num_rows, dtype=np.int32)
+        
+        if table.num_rows and not pc.all(valid).as_py():
+            mask = valid.to_numpy(zero_copy_only=False)
+            row_offsets = row_offsets[mask]
+            patient_ids = pc.filter(patient_ids, valid)
+            visit_dates = pc.filter(visit_dates, valid)
+        
+        date_ordinals = np.asarray(
+            pc.cast(visit_dates, pa.int32()).to_numpy(), dtype=np.int32
+        )
+        
+        return table.num_rows, patient_ids.combine_chunks(), row_offsets, date_ordinals
+    
+    @staticmethod
+    def _record_keys(patient_codes: np.ndarray, date_ordinals: np.ndarray) -> np.ndarray:
+        """Pack (patient_code, date_ordinal) into int64 keys that sort in index order"""
+        return (patient_codes.astype(np.int64) << 32) | (date_ordinals.astype(np.int64) + 2 ** 31)
+    
+    def _insert_records(
+        self,
+        patient_codes: np.ndarray,
+        file_ids: np.ndarray,
+        row_offsets: np.ndarray,
+        date_ordinals: np.ndarray
+    ):
+        """
+        Merge new records into the sorted record arrays and date permutation
+        
+        Only the new records are sorted; they are then merged into the existing
+        arrays with binary searches, so the cost is linear in the index size
+        rather than a full re-sort.
+        
+        Args:
+            patient_codes: Patient vocabulary positions
+            file_ids: File table positions
+            row_offsets: Row positions within files
+            date_ordinals: Visit date ordinals
+        """
+        order = np.lexsort((date_ordinals, patient_codes))
+        new_columns = {
+            'patient_codes': patient_codes[order],
+            'file_ids': file_ids[order],
+            'row_offsets': row_offsets[order],
+            'date_ordinals': date_ordinals[order],
+        }
+        
+        n_old = len(self.patient_codes)
+        n_new = len(order)
+        
+        # Final slots of old and new records in the merged (patient, date) order
+        positions = np.searchsorted(
+            self._record_keys(self.patient_codes, self.date_ordinals),
+            self._record_keys(new_columns['patient_codes'], new_columns['date_ordinals']),
+            side='right'
+        )
+        new_slots = positions + np.arange(n_new)
+        old_slots = np.arange(n_old) + np.searchsorted(positions, np.arange(n_old), side='right')
+        
+        for name, new_values in new_columns.items():
+            merged = np.empty(n_old + n_new, dtype=np.int32)
+            merged[old_slots] = getattr(self, name)
+            merged[new_slots] = new_values
+            setattr(self, name, merged)
+        
+        # Merge new records into the date permutation the same way
+        new_date_order = np.argsort(new_columns['date_ordinals'], kind='stable')
+        new_sorted_dates = new_columns['date_ordinals'][new_date_order]
+        
+        date_positions = np.searchsorted(self.sorted_dates, new_sorted_dates, side='right')
+        new_date_slots = date_positions + np.arange(n_new)
+        old_date_slots = np.arange(n_old) + np.searchsorted(
+            date_positions, np.arange(n_old), side='right'
+        )
+        
+        date_order = np.empty(n_old + n_new, dtype=np.int64)
+        date_order[old_date_slots] = old_slots[self.date_order]
+        date_order[new_date_slots] = new_slots[new_date_order]
+        
+        sorted_dates = np.empty(n_old + n_new, dtype=np.int32)
+        sorted_dates[old_date_slots] = self.sorted_dates
+        sorted_dates[new_date_slots] = new_sorted_dates
+        
+        self.date_order = date_order
+        self.sorted_dates = sorted_dates
+    
+    def _remove_records(self, keep: np.ndarray):
+        """
+        Drop records from the record arrays and date permutation
+        
+        Args:
+            keep: Boolean mask over records, True for records to keep
+        """
+        new_positions = np.cumsum(keep) - 1
+        kept_dates = keep[self.date_order]
+        
+        self.date_order = new_positions[self.date_order[kept_dates]].astype(np.int64)
+        self.sorted_dates = self.sorted_dates[kept_dates]
+        
+        self.patient_codes = self.patient_codes[keep]
+        self.file_ids = self.file_ids[keep]
+        self.row_offsets = self.row_offsets[keep]
+        self.date_ordinals = self.date_ordinals[keep]
+    
+    def _update_metadata(self):
+        """Recompute index metadata from the record arrays"""
+        if len(self.date_ordinals):
+            date_range = tuple(_from_ordinals(self.sorted_dates[[0, -1]]))
+        else:
+            date_range = (None, None)
+        
+        # Patient codes are sorted, so distinct patients are the number of runs
+        total_patients = (
+            int(np.count_nonzero(np.diff(self.patient_codes))) + 1
+            if len(self.patient_codes) else 0
+        )
+        
+        self.index_metadata = {
+            'last_updated': datetime.now(),
+            'total_records': int(len(self.patient_codes)),
+            'total_patients': total_patients,
+            'date_range': date_range
+        }
+    
+    def _patient_code(self, patient_id: str) -> Optional[int]:
+        """
+        Look up a patient's vocabulary position
         
         Args:
             patient_id: Patient ID
             
         Returns:
-            List of (file_path, row_index) tuples
+            Vocabulary position or None if the patient is unknown
         """
-        locations = self.patient_index.get(patient_id, [])
+        patient_id = str(patient_id)
+        code = int(np.searchsorted(self.patients, patient_id))
+        if code < len(self.patients) and self.patients[code] == patient_id:
+            return code
+        return None
+    
+    def _patient_slice(self, patient_id: str) -> slice:
+        """
+        Get the slice of record arrays holding a patient's records
         
-        # Convert relative paths to absolute
+        Args:
+            patient_id: Patient ID
+            
+        Returns:
+            Slice into the record arrays (empty if patient is unknown)
+        """
+        code = self._patient_code(patient_id)
+        if code is None:
+            return slice(0, 0)
+        
+        start = int(np.searchsorted(self.patient_codes, code, side='left'))
+        end = int(np.searchsorted(self.patient_codes, code, side='right'))
+        return slice(start, end)
+    
+    def _to_locations(
+        self,
+        file_ids: np.ndarray,
+        row_offsets: np.ndarray
+    ) -> List[Tuple[Path, int]]:
+        """Convert file IDs and row offsets to absolute (file_path, row_index) tuples"""
         return [
-            (self.storage_path / file_path, row_idx)
-            for file_path, row_idx in locations
+            (self.storage_path / self.files[file_id], int(row_idx))
+            for file_id, row_idx in zip(file_ids.tolist(), row_offsets.tolist())
         ]
     
+    def get_patient_locations(
+        self,
+        patient_id: str,
+        date_range: Optional[Tuple[date, date]] = None,
+        cohorts: Optional[List[str]] = None
+    ) -> List[Tuple[Path, int]]:
+        """
+        Get file locations for a patient's features
+        
+        Args:
+            patient_id: Patient ID
+            date_range: Optional (start_date, end_date) filter, inclusive
+            cohorts: Optional cohorts filter
+            
+        Returns:
+            List of (file_path, row_index) tuples
+        """
+        records = self._patient_slice(patient_id)
+        
+        if date_range and records.stop > records.start:
+            # Records are sorted by date within each patient
+            start_date, end_date = date_range
+            patient_dates = self.date_ordinals[records]
+            start = np.searchsorted(patient_dates, _to_ordinal(start_date), side='left')
+            end = np.searchsorted(patient_dates, _to_ordinal(end_date), side='right')
+            records = slice(records.start + int(start), records.start + int(end))
+        
+        file_ids = self.file_ids[records]
+        row_offsets = self.row_offsets[records]
+        
+        if cohorts:
+            mask = np.isin(file_ids, self._cohort_file_ids(cohorts))
+            file_ids = file_ids[mask]
+            row_offsets = row_offsets[mask]
+        
+        return self._to_locations(file_ids, row_offsets)
+    
+    def get_locations_by_file(
+        self,
+        patient_ids: List[str],
+        date_range: Optional[Tuple[date, date]] = None,
+        cohorts: Optional[List[str]] = None
+    ) -> Dict[Path, np.ndarray]:
+        """
+        Get row locations for many patients at once, grouped by file
+        
+        All patients are resolved with vectorized searches over the sorted
+        record arrays, so each file appears once however many of the
+        requested patients it holds.
+        
+        Args:
+            patient_ids: Patient IDs
+            date_range: Optional (start_date, end_date) filter, inclusive
+            cohorts: Optional cohorts filter
+            
+        Returns:
+            Dictionary mapping file path to sorted row offsets within the file
+        """
+        if len(self.patients) == 0 or not patient_ids:
+            return {}
+        
+        requested = np.unique(np.asarray([str(p) for p in patient_ids]))
+        codes = np.searchsorted(self.patients, requested)
+        codes = np.minimum(codes, len(self.patients) - 1)
+        codes = codes[self.patients[codes] == requested].astype(np.int64)
+        
+        if date_range:
+            # Records are sorted by (patient, date), so each range is one slice
+            start_date, end_date = date_range
+            keys = self._record_keys(self.patient_codes, self.date_ordinals)
+            starts = np.searchsorted(
+                keys, self._record_keys(codes, np.full(len(codes), _to_ordinal(start_date))), side='left'
+            )
+            ends = np.searchsorted(
+                keys, self._record_keys(codes, np.full(len(codes), _to_ordinal(end_date))), side='right'
+            )
+        else:
+            starts = np.searchsorted(self.patient_codes, codes, side='left')
+            ends = np.searchsorted(self.patient_codes, codes, side='right')
+        
+        # Expand the (start, end) slices into record positions
+        lengths = ends - starts
+        records = (
+            np.arange(lengths.sum())
+            - np.repeat(np.cumsum(lengths) - lengths, lengths)
+            + np.repeat(starts, lengths)
+        )
+        
+        file_ids = self.file_ids[records]
+        row_offsets = self.row_offsets[records]
+        
+        if cohorts:
+            mask = np.isin(file_ids, self._cohort_file_ids(cohorts))
+            file_ids = file_ids[mask]
+            row_offsets = row_offsets[mask]
+        
+        order = np.lexsort((row_offsets, file_ids))
+        file_ids = file_ids[order]
+        row_offsets = row_offsets[order]
+        
+        unique_ids, boundaries = np.unique(file_ids, return_index=True)
+        return {
+            self.storage_path / self.files[file_id]: offsets
+            for file_id, offsets in zip(unique_ids.tolist(), np.split(row_offsets, boundaries[1:]))
+        }
+    
     def get_date_locations(
         self,
         start_date: date,
@@ -196,16 +675,17 @@ class FeatureIndex:
         if end_date is None:
             end_date = start_date
         
-        locations = []
+        start = np.searchsorted(self.sorted_dates, _to_ordinal(start_date), side='left')
+        end = np.searchsorted(self.sorted_dates, _to_ordinal(end_date), side='right')
+        records = self.date_order[start:end]
         
-        for visit_date, locs in self.date_index.items():
-            if start_date <= visit_date <= end_date:
-                locations.extend(locs)
-        
-        # Convert relative paths to absolute
+        return self._to_locations(self.file_ids[records], self.row_offsets[records])
+    
+    def _cohort_file_ids(self, cohorts: List[str]) -> List[int]:
+        """Get file table positions of files belonging to any of the cohorts"""
         return [
-            (self.storage_path / file_path, row_idx)
-            for file_path, row_idx in locations
+            file_id for file_id, file_cohort in enumerate(self.file_cohorts)
+            if file_cohort in cohorts
         ]
     
     def get_cohort_patients(self, cohort: str) -> Set[str]:
@@ -218,7 +698,12 @@ class FeatureIndex:
         Returns:
             Set of patient IDs
         """
-        return self.cohort_index.get(cohort, set())
+        cohort_files = self._cohort_file_ids([cohort])
+        if not cohort_files:
+            return set()
+        
+        mask = np.isin(self.file_ids, cohort_files)
+        return set(self.patients[np.unique(self.patient_codes[mask])].tolist())
     
     def patient_exists(self, patient_id: str) -> bool:
         """
@@ -230,7 +715,8 @@ class FeatureIndex:
         Returns:
             True if patient exists
         """
-        return patient_id in self.patient_index
+        records = self._patient_slice(patient_id)
+        return records.stop > records.start
     
     def get_patient_visit_dates(self, patient_id: str) -> List[date]:
         """
@@ -242,16 +728,8 @@ class FeatureIndex:
         Returns:
             List of visit dates
         """
-        visit_dates = []
-        
-        for visit_date, locations in self.date_index.items():
-            for file_path, row_idx in locations:
-                # Check if this location belongs to the patient
-                patient_locations = self.patient_index.get(patient_id, [])
-                if (file_path, row_idx) in patient_locations:
-                    visit_dates.append(visit_date)
-        
-        return sorted(visit_dates)
+        # Records are already sorted by date within each patient
+        return _from_ordinals(self.date_ordinals[self._patient_slice(patient_id)])
     
     def get_statistics(self) -> Dict:
         """
@@ -260,16 +738,27 @@ class FeatureIndex:
         Returns:
             Dictionary with statistics
         """
+        cohorts = sorted(set(self.file_cohorts))
+        cohort_distribution = {
+            cohort: len(self.get_cohort_patients(cohort))
+            for cohort in cohorts
+        }
+        
         return {
             'total_records': self.index_metadata['total_records'],
             'total_patients': self.index_metadata['total_patients'],
-            'total_cohorts': len(self.cohort_index),
+            'total_cohorts': len([c for c, n in cohort_distribution.items() if n]),
+            'total_files': len(self.files),
             'date_range': self.index_metadata['date_range'],
             'last_updated': self.index_metadata['last_updated'],
-            'cohort_distribution': {
-                cohort: len(patients)
-                for cohort, patients in self.cohort_index.items()
-            }
+            'cohort_distribution': cohort_distribution,
+            'memory_bytes': int(sum(
+                arr.nbytes for arr in (
+                    self.patients, self.patient_codes, self.file_ids,
+                    self.row_offsets, self.date_ordinals, self.date_order,
+                    self.sorted_dates
+                )
+            ))
         }
     
     def update_index(
@@ -292,24 +781,36 @@ class FeatureIndex:
         """
         file_path_str = str(file_path.relative_to(self.storage_path))
         
-        # Update indexes
-        self.patient_index[patient_id].append((file_path_str, row_idx))
-        self.date_index[visit_date].append((file_path_str, row_idx))
-        self.cohort_index[cohort].add(patient_id)
-        
-        # Update metadata
-        self.index_metadata['total_records'] += 1
-        self.index_metadata['total_patients'] = len(self.patient_index)
-        
-        # Update date range
-        min_date, max_date = self.index_metadata['date_range']
-        if min_date is None or visit_date < min_date:
-            min_date = visit_date
-        if max_date is None or visit_date > max_date:
-            max_date = visit_date
-        self.index_metadata['date_range'] = (min_date, max_date)
-        
-        self.index_metadata['last_updated'] = datetime.now()
+        # Register file
+        if file_path_str in self.files:
+            file_id = self.files.index(file_path_str)
+        else:
+            file_id = len(self.files)
+            self.files.append(file_path_str)
+            self.file_cohorts.append(cohort)
+            
+            # Unknown fingerprint, so the next refresh re-reads the whole file
+            self.file_mtimes.append(0)
+            self.file_sizes.append(0)
+            self.file_rows.append(0)
+        
+        # Register patient, shifting codes of patients sorted after it
+        patient_id = str(patient_id)
+        code = self._patient_code(patient_id)
+        if code is None:
+            code = int(np.searchsorted(self.patients, patient_id))
+            self.patients = np.insert(self.patients, code, patient_id)
+            self.patient_codes = np.where(
+                self.patient_codes >= code, self.patient_codes + 1, self.patient_codes
+            ).astype(np.int32)
+        
+        self._insert_records(
+            patient_codes=np.array([code], dtype=np.int32),
+            file_ids=np.array([file_id], dtype=np.int32),
+            row_offsets=np.array([row_idx], dtype=np.int32),
+            date_ordinals=np.array([_to_ordinal(visit_date)], dtype=np.int32)
+        )
+        self._update_metadata()
     
     def remove_from_index(
         self,
@@ -323,74 +824,47 @@ class FeatureIndex:
             patient_id: Patient ID
             visit_date: Specific visit date to remove, or None for all
         """
-        if patient_id not in self.patient_index:
+        records = self._patient_slice(patient_id)
+        if records.stop == records.start:
             return
         
+        keep = np.ones(len(self.patient_codes), dtype=bool)
         if visit_date is None:
             # Remove all records for patient
-            locations = self.patient_index[patient_id]
-            
-            # Remove from date index
-            for file_path, row_idx in locations:
-                for date_key in list(self.date_index.keys()):
-                    self.date_index[date_key] = [
-                        loc for loc in self.date_index[date_key]
-                        if loc != (file_path, row_idx)
-                    ]
-                    if not self.date_index[date_key]:
-                        del self.date_index[date_key]
-            
-            # Remove from patient index
-            del self.patient_index[patient_id]
-            
-            # Remove from cohort indexes
-            for cohort in self.cohort_index:
-                self.cohort_index[cohort].discard(patient_id)
-            
-            self.index_metadata['total_records'] -= len(locations)
+            keep[records] = False
         else:
-            # Remove specific visit
-            locations = self.patient_index[patient_id]
-            
-            # Find and remove the specific visit
-            for file_path, row_idx in locations:
-                if (file_path, row_idx) in self.date_index.get(visit_date, []):
-                    self.patient_index[patient_id].remove((file_path, row_idx))
-                    self.date_index[visit_date].remove((file_path, row_idx))
-                    self.index_metadata['total_records'] -= 1
-                    break
-            
-            # If no more records for patient, remove from patient index
-            if not self.patient_index[patient_id]:
-                del self.patient_index[patient_id]
-                for cohort in self.cohort_index:
-                    self.cohort_index[cohort].discard(patient_id)
+            # Remove the first record of the specific visit
+            matches = np.flatnonzero(
+                self.date_ordinals[records] == _to_ordinal(visit_date)
+            )
+            if len(matches) == 0:
+                return
+            keep[records.start + matches[0]] = False
         
-        self.index_metadata['total_patients'] = len(self.patient_index)
-        self.index_metadata['last_updated'] = datetime.now()
+        self._remove_records(keep)
+        self._update_metadata()
     
     def _save_indexes(self):
         """Save indexes to disk"""
         try:
-            # Save patient index
-            with open(self.index_path / "patient_index.pkl", 'wb') as f:
-                pickle.dump(dict(self.patient_index), f)
-            
-            # Save date index (convert dates to strings for JSON)
-            date_index_serializable = {
-                str(date_key): locations
-                for date_key, locations in self.date_index.items()
-            }
-            with open(self.index_path / "date_index.json", 'w') as f:
-                json.dump(date_index_serializable, f)
-            
-            # Save cohort index (convert sets to lists)
-            cohort_index_serializable = {
-                cohort: list(patients)
-                for cohort, patients in self.cohort_index.items()
-            }
-            with open(self.index_path / "cohort_index.json", 'w') as f:
-                json.dump(cohort_index_serializable, f)
+            # Write to a temporary file first so readers never see a partial index
+            tmp_file = self.index_path / f"{self.INDEX_FILE}.tmp"
+            with open(tmp_file, 'wb') as f:
+                np.savez(
+                    f,
+                    patients=self.patients,
+                    files=np.array(self.files, dtype=str),
+                    file_cohorts=np.array(self.file_cohorts, dtype=str),
+                    file_mtimes=np.array(self.file_mtimes, dtype=np.int64),
+                    file_sizes=np.array(self.file_sizes, dtype=np.int64),
+                    file_rows=np.array(self.file_rows, dtype=np.int64),
+                    patient_codes=self.patient_codes,
+                    file_ids=self.file_ids,
+                    row_offsets=self.row_offsets,
+                    date_ordinals=self.date_ordinals,
+                    date_order=self.date_order
+                )
+            os.replace(tmp_file, self.index_path / self.INDEX_FILE)
             
             # Save metadata (convert dates to strings)
             metadata_serializable = self.index_metadata.copy()
@@ -402,8 +876,10 @@ class FeatureIndex:
                     str(metadata_serializable['date_range'][1])
                 )
             
-            with open(self.index_path / "metadata.json", 'w') as f:
+            tmp_file = self.index_path / f"{self.METADATA_FILE}.tmp"
+            with open(tmp_file, 'w') as f:
                 json.dump(metadata_serializable, f)
+            os.replace(tmp_file, self.index_path / self.METADATA_FILE)
             
             main_logger.debug(
                 "Indexes saved to disk",
@@ -419,51 +895,42 @@ class FeatureIndex:
     def _load_indexes(self):
         """Load indexes from disk"""
         try:
-            # Load patient index
-            patient_index_file = self.index_path / "patient_index.pkl"
-            if patient_index_file.exists():
-                with open(patient_index_file, 'rb') as f:
-                    self.patient_index = defaultdict(list, pickle.load(f))
+            index_file = self.index_path / self.INDEX_FILE
+            metadata_file = self.index_path / self.METADATA_FILE
             
-            # Load date index
-            date_index_file = self.index_path / "date_index.json"
-            if date_index_file.exists():
-                with open(date_index_file, 'r') as f:
-                    date_index_data = json.load(f)
-                    # Convert string dates back to date objects
-                    self.date_index = defaultdict(list, {
-                        datetime.fromisoformat(date_str).date(): locations
-                        for date_str, locations in date_index_data.items()
-                    })
+            # Indexes from the previous dict-based format are ignored and rebuilt
+            if not index_file.exists() or not metadata_file.exists():
+                return
             
-            # Load cohort index
-            cohort_index_file = self.index_path / "cohort_index.json"
-            if cohort_index_file.exists():
-                with open(cohort_index_file, 'r') as f:
-                    cohort_index_data = json.load(f)
-                    # Convert lists back to sets
-                    self.cohort_index = defaultdict(set, {
-                        cohort: set(patients)
-                        for cohort, patients in cohort_index_data.items()
-                    })
+            with np.load(index_file, allow_pickle=False) as arrays:
+                self.patients = arrays['patients']
+                self.files = arrays['files'].tolist()
+                self.file_cohorts = arrays['file_cohorts'].tolist()
+                self.file_mtimes = arrays['file_mtimes'].tolist()
+                self.file_sizes = arrays['file_sizes'].tolist()
+                self.file_rows = arrays['file_rows'].tolist()
+                self.patient_codes = arrays['patient_codes']
+                self.file_ids = arrays['file_ids']
+                self.row_offsets = arrays['row_offsets']
+                self.date_ordinals = arrays['date_ordinals']
+                self.date_order = arrays['date_order']
+            self.sorted_dates = self.date_ordinals[self.date_order]
             
             # Load metadata
-            metadata_file = self.index_path / "metadata.json"
-            if metadata_file.exists():
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
-                    
-                    # Convert strings back to appropriate types
-                    if metadata['last_updated']:
-                        metadata['last_updated'] = datetime.fromisoformat(metadata['last_updated'])
-                    
-                    if metadata['date_range'][0]:
-                        metadata['date_range'] = (
-                            datetime.fromisoformat(metadata['date_range'][0]).date(),
-                            datetime.fromisoformat(metadata['date_range'][1]).date()
-                        )
-                    
-                    self.index_metadata = metadata
+            with open(metadata_file, 'r') as f:
+                metadata = json.load(f)
+                
+                # Convert strings back to appropriate types
+                if metadata['last_updated']:
+                    metadata['last_updated'] = datetime.fromisoformat(metadata['last_updated'])
+                
+                if metadata['date_range'][0]:
+                    metadata['date_range'] = (
+                        datetime.fromisoformat(metadata['date_range'][0]).date(),
+                        datetime.fromisoformat(metadata['date_range'][1]).date()
+                    )
+                
+                self.index_metadata = metadata
             
             main_logger.debug(
                 "Indexes loaded from disk",
@@ -471,6 +938,7 @@ class FeatureIndex:
             )
             
         except Exception as e:
+            self._reset_arrays()
             main_logger.warning(
                 f"Failed to load indexes: {str(e)}. Will rebuild on first use.",
                 extra={'operation': 'load_indexes', 'user_id': 'system'}
@@ -0,0 +1,275 @@
+"""
+Manifest of live files for the log-structured feature store
+Tracks base, delta and tombstone files with their commit sequence numbers
+"""
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+from datetime import datetime
+import json
+import os
+import threading
+
+from ml_pipeline.config.logging_config import main_logger
+
+
+class FeatureManifest:
+    """
+    Manifest listing the live files of a feature store
+    
+    Every write is assigned a monotonically increasing sequence number.
+    Data files are either base files (the compacted state of a partition)
+    or delta files (appended rows). Tombstone files record deleted
+    (cohort, patient_id, visit_date) keys. A row is live when no data file
+    with a higher sequence holds the same key and no tombstone with a
+    higher sequence deletes it.
+    
+    The manifest is the single source of truth for which files are live:
+    files are written first and become visible only when a commit replaces
+    the manifest atomically. One writer process per storage path is
+    assumed; other instances pick up new commits on their next access.
+    """
+    
+    MANIFEST_FILE = "_manifest.json"
+    TOMBSTONE_DIR = "_tombstones"
+    
+    def __init__(self, storage_path: Path):
+        """
+        Initialize manifest
+        
+        Args:
+            storage_path: Root path of the feature store
+        """
+        self.storage_path = Path(storage_path)
+        self.manifest_path = self.storage_path / self.MANIFEST_FILE
+        self._lock = threading.RLock()
+        
+        self.version = 0
+        self.next_sequence = 1
+        self.files: Dict[str, Dict] = {}
+        self.tombstones: Dict[str, Dict] = {}
+        self.obsolete: Dict[str, str] = {}
+        self._loaded_stamp: Optional[Tuple[int, int]] = None
+        
+        if self.manifest_path.exists():
+            self._load()
+        else:
+            self._bootstrap()
+    
+    def allocate_sequence(self) -> int:
+        """
+        Reserve the next sequence number
+        
+        Returns:
+            Sequence number for a new file
+        """
+        with self._lock:
+            self._sync()
+            sequence = self.next_sequence
+            self.next_sequence += 1
+            return sequence
+    
+    def commit(
+        self,
+        add_files: Optional[Dict[str, Dict]] = None,
+        remove_files: Optional[List[str]] = None,
+        add_tombstones: Optional[Dict[str, Dict]] = None,
+        remove_tombstones: Optional[List[str]] = None
+    ) -> int:
+        """
+        Atomically apply a set of file changes
+        
+        Removed files are moved to the obsolete list rather than deleted, so
+        readers holding an older file list can finish; they are purged later
+        by purge_obsolete.
+        
+        Args:
+            add_files: Relative path -> entry for new data files
+            remove_files: Relative paths of data files that are no longer live
+            add_tombstones: Relative path -> entry for new tombstone files
+            remove_tombstones: Relative paths of tombstones that are no longer needed
+            
+        Returns:
+            New manifest version
+        """
+        with self._lock:
+            self._sync()
+            removed_at = datetime.now().isoformat()
+            
+            for rel_path in remove_files or []:
+                if self.files.pop(rel_path, None) is not None:
+                    self.obsolete[rel_path] = removed_at
+            
+            for rel_path in remove_tombstones or []:
+                if self.tombstones.pop(rel_path, None) is not None:
+                    self.obsolete[rel_path] = removed_at
+            
+            self.files.update(add_files or {})
+            self.tombstones.update(add_tombstones or {})
+            
+            self.version += 1
+            self._save()
+            return self.version
+    
+    def current_version(self) -> int:
+        """Get the latest committed manifest version"""
+        with self._lock:
+            self._sync()
+            return self.version
+    
+    def live_files(
+        self,
+        cohorts: Optional[List[str]] = None,
+        partition: Optional[str] = None
+    ) -> List[Tuple[str, Dict]]:
+        """
+        List live data files
+        
+        Args:
+            cohorts: Restrict to these cohorts
+            partition: Restrict to one partition directory
+            
+        Returns:
+            List of (relative path, entry) tuples in sequence order
+        """
+        with self._lock:
+            self._sync()
+            entries = [
+                (rel_path, dict(entry))
+                for rel_path, entry in self.files.items()
+                if (cohorts is None or entry['cohort'] in cohorts)
+                and (partition is None or entry['partition'] == partition)
+            ]
+        return sorted(entries, key=lambda item: item[1]['sequence'])
+    
+    def partitions(self) -> Dict[str, List[Tuple[str, Dict]]]:
+        """
+        Group live data files by partition
+        
+        Returns:
+            Dictionary mapping partition directory to its (relative path, entry) tuples
+        """
+        partitions: Dict[str, List[Tuple[str, Dict]]] = {}
+        for rel_path, entry in self.live_files():
+            partitions.setdefault(entry['partition'], []).append((rel_path, entry))
+        return partitions
+    
+    def live_tombstones(self) -> List[Tuple[str, Dict]]:
+        """
+        List live tombstone files
+        
+        Returns:
+            List of (relative path, entry) tuples in sequence order
+        """
+        with self._lock:
+            self._sync()
+            entries = [(rel_path, dict(entry)) for rel_path, entry in self.tombstones.items()]
+        return sorted(entries, key=lambda item: item[1]['sequence'])
+    
+    def is_live(self, rel_path: str) -> bool:
+        """Check whether a data file is live"""
+        with self._lock:
+            self._sync()
+            return rel_path in self.files
+    
+    def purge_obsolete(self, grace_seconds: float = 0) -> List[str]:
+        """
+        Delete files removed from the manifest more than grace_seconds ago
+        
+        Args:
+            grace_seconds: Minimum age of an obsolete file before it is deleted
+            
+        Returns:
+            Relative paths of deleted files
+        """
+        now = datetime.now()
+        
+        with self._lock:
+            self._sync()
+            expired = [
+                rel_path for rel_path, removed_at in self.obsolete.items()
+                if (now - datetime.fromisoformat(removed_at)).total_seconds() >= grace_seconds
+            ]
+            
+            if not expired:
+                return []
+            
+            for rel_path in expired:
+                (self.storage_path / rel_path).unlink(missing_ok=True)
+                del self.obsolete[rel_path]
+            
+            self._save()
+        
+        return expired
+    
+    def relative_path(self, file_path: Path) -> str:
+        """Get a file path relative to the storage root"""
+        return Path(file_path).relative_to(self.storage_path).as_posix()
+    
+    def _bootstrap(self):
+        """Register the files of a store written before the manifest existed"""
+        for cohort_dir in sorted(self.storage_path.glob("cohort=*")):
+            cohort = cohort_dir.name.split('=', 1)[1]
+            
+            for file_path in sorted(cohort_dir.rglob("*.parquet")):
+                rel_path = self.relative_path(file_path)
+                self.files[rel_path] = {
+                    'sequence': 0,
+                    'kind': 'base',
+                    'cohort': cohort,
+                    'partition': self.relative_path(file_path.parent),
+                    'rows': None
+                }
+        
+        if self.files:
+            main_logger.info(
+                f"Registered {len(self.files)} existing feature files in new manifest",
+                extra={'operation': 'manifest_bootstrap', 'user_id': 'system'}
+            )
+            self.version = 1
+            self._save()
+    
+    def _sync(self):
+        """Reload the manifest if another instance has committed since it was read"""
+        try:
+            stamp = self._file_stamp()
+        except FileNotFoundError:
+            return
+        
+        if stamp != self._loaded_stamp:
+            self._load()
+    
+    def _load(self):
+        """Load manifest from disk"""
+        stamp = self._file_stamp()
+        with open(self.manifest_path, 'r') as f:
+            data = json.load(f)
+        
+        self._loaded_stamp = stamp
+        
+        self.version = data['version']
+        self.next_sequence = data['next_sequence']
+        self.files = data['files']
+        self.tombstones = data['tombstones']
+        self.obsolete = data.get('obsolete', {})
+    
+    def _save(self):
+        """Write manifest atomically"""
+        data = {
+            'version': self.version,
+            'next_sequence': self.next_sequence,
+            'updated_at': datetime.now().isoformat(),
+            'files': self.files,
+            'tombstones': self.tombstones,
+            'obsolete': self.obsolete
+        }
+        
+        tmp_path = self.manifest_path.with_suffix('.json.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(data, f, indent=2)
+        os.replace(tmp_path, self.manifest_path)
+        self._loaded_stamp = self._file_stamp()
+    
+    def _file_stamp(self) -> Tuple[int, int]:
+        """Identify the manifest file on disk; replacing it changes the inode"""
+        stat = self.manifest_path.stat()
+        return stat.st_ino, stat.st_mtime_ns
@@ -3,20 +3,28 @@ Feature Store implementation using Parquet for efficient storage and retrieval
 Implements partitioning, indexing, compression, and caching
 """
 from pathlib import Path
-from typing import Dict, List, Optional, Tuple, Union
+from typing import Dict, Iterator, List, Optional, Set, Tuple, Union
 from datetime import datetime, date
+from concurrent.futures import Future, ThreadPoolExecutor
+import hashlib
+import json
+import threading
 import pandas as pd
 import pyarrow as pa
+import pyarrow.dataset as ds
 import pyarrow.parquet as pq
 import numpy as np
 from sqlalchemy.orm import Session
 
 from ml_pipeline.config.settings import settings
 from ml_pipeline.config.logging_config import main_logger
-from ml_pipeline.data_storage.cache import RedisCache
+from ml_pipeline.data_storage.cache import (
+    RedisCache, LocalCache, TieredCache, frame_to_ipc, frame_from_ipc
+)
 from ml_pipeline.data_storage.database import get_db_context
 from ml_pipeline.data_storage.models import ProcessedFeature
 from ml_pipeline.data_storage.feature_index import FeatureIndex
+from ml_pipeline.data_storage.feature_manifest import FeatureManifest
 from ml_pipeline.data_storage.compression_analyzer import CompressionAnalyzer
 
 
@@ -29,14 +37,30 @@ class FeatureStore:
     - Partitioning by date and cohort for fast queries
     - Compression to reduce storage by 50%+
     - Indexing by patient_id and timestamp
-    - Redis caching for frequently accessed features
+    - Row-group predicate pushdown on patient_id, visit_date and cohort
+    - Append-only delta files and tombstones, merged on read and compacted
+      in the background
+    - Two-tier caching (in-process LRU in front of Redis) of Arrow IPC
+      encoded results, keyed by manifest version
     """
     
+    # Columns identifying a record within a cohort
+    RECORD_KEY = ['patient_id', 'visit_date']
+    
+    # Identifier and bookkeeping columns excluded from training features
+    NON_FEATURE_COLUMNS = [
+        'diagnosis', 'patient_id', 'visit_date', 'cohort',
+        'ingestion_timestamp', 'data_source', 'feature_version',
+        'created_at', 'updated_at'
+    ]
+    
     def __init__(
         self,
         storage_path: Optional[Path] = None,
         cache_manager: Optional[RedisCache] = None,
-        use_index: bool = True
+        use_index: bool = True,
+        sort_on_write: bool = True,
+        local_cache: Optional[LocalCache] = None
     ):
         """
         Initialize feature store
@@ -45,23 +69,40 @@ class FeatureStore:
             storage_path: Path to store Parquet files
             cache_manager: Cache manager for Redis caching
             use_index: Whether to use indexing for fast lookups
+            sort_on_write: Whether to sort files by (patient_id, visit_date) so
+                row group min/max statistics are selective for point lookups
+            local_cache: In-process cache tier in front of Redis
         """
         self.storage_path = storage_path or settings.FEATURES_PATH
         self.storage_path.mkdir(parents=True, exist_ok=True)
         
+        # Manifest of live base, delta and tombstone files
+        self.manifest = FeatureManifest(self.storage_path)
+        
         self.cache_manager = cache_manager or RedisCache()
+        self.feature_cache = TieredCache(self.cache_manager, local_cache)
         
         # Initialize index
         self.use_index = use_index
         self.index = FeatureIndex(self.storage_path) if use_index else None
         
+        self.sort_on_write = sort_on_write
+        
+        # Files dropped from the manifest are kept this long so in-flight
+        # reads can finish before compaction deletes them
+        self.obsolete_file_grace_seconds = 60
+        self._compaction_lock = threading.Lock()
+        self._compaction_executor: Optional[ThreadPoolExecutor] = None
+        self._tombstone_cache: Tuple[Tuple[str, ...], pd.DataFrame] = ((), pd.DataFrame())
+        
         # Parquet write options for compression
         self.write_options = {
             'compression': 'snappy',  # Fast compression with good ratio
-            'compression_level': 9,
+            'compression_level': None,  # Snappy does not support compression levels
             'use_dictionary': True,
             'write_statistics': True,
             'data_page_size': 1024 * 1024,  # 1MB pages
+            'row_group_size': 64 * 1024,  # Small row groups for selective reads
         }
         
         main_logger.info(
@@ -105,6 +146,12 @@ class FeatureStore:
         """
         Write features to Parquet with partitioning and compression
         
+        Appends land in a new delta file per partition, so write cost does
+        not depend on how much data the partition already holds. Empty
+        partitions get a base file directly. With overwrite, a new base file
+        replaces every live file of the partition.
+        All partitions become visible together in a single manifest commit.
+        
         Args:
             features_df: DataFrame with processed features
             cohort: Data cohort (ADNI, OASIS, NACC)
@@ -141,39 +188,56 @@ class FeatureStore:
             features_df['year'] = features_df['visit_date'].dt.year
             features_df['month'] = features_df['visit_date'].dt.month
             
-            # Group by partition
-            for (year, month), group_df in features_df.groupby(['year', 'month']):
-                partition_path = self._get_partition_path(cohort, year, month)
-                file_path = partition_path / f"features_{cohort}_{year}_{month:02d}.parquet"
-                
-                # Drop partition columns before writing
-                write_df = group_df.drop(columns=['year', 'month'])
-                
-                # Write to Parquet
-                self._write_parquet_file(
-                    write_df,
-                    file_path,
-                    overwrite=overwrite
+            # Drop partition columns before writing
+            groups = [
+                (
+                    self._get_partition_path(cohort, year, month),
+                    f"features_{cohort}_{year}_{month:02d}",
+                    group_df.drop(columns=['year', 'month'])
                 )
-                
-                stats['partitions_written'] += 1
-                stats['total_size_bytes'] += file_path.stat().st_size
+                for (year, month), group_df in features_df.groupby(['year', 'month'])
+            ]
         else:
-            # Write without partitioning
-            file_path = self.storage_path / f"features_{cohort}.parquet"
-            self._write_parquet_file(
-                features_df,
-                file_path,
-                overwrite=overwrite
-            )
-            stats['partitions_written'] = 1
-            stats['total_size_bytes'] = file_path.stat().st_size
+            # Write without date partitioning
+            groups = [(self._get_cohort_path(cohort), f"features_{cohort}", features_df)]
+        
+        add_files = {}
+        replaced_files = []
+        written_files = []
+        
+        for partition_path, file_stem, write_df in groups:
+            partition = self.manifest.relative_path(partition_path)
+            live_files = self.manifest.live_files(partition=partition)
+            kind = 'base' if overwrite or not live_files else 'delta'
+            
+            sequence = self.manifest.allocate_sequence()
+            file_path = partition_path / f"{file_stem}.{kind}-{sequence:06d}.parquet"
+            
+            rows = self._write_parquet_file(write_df, file_path)
+            
+            add_files[self.manifest.relative_path(file_path)] = {
+                'sequence': sequence,
+                'kind': kind,
+                'cohort': cohort,
+                'partition': partition,
+                'rows': rows
+            }
+            
+            if overwrite:
+                replaced_files.extend(rel_path for rel_path, _ in live_files)
+            
+            written_files.append(file_path)
+            stats['partitions_written'] += 1
+            stats['total_size_bytes'] += file_path.stat().st_size
+        
+        if add_files:
+            self.manifest.commit(add_files=add_files, remove_files=replaced_files)
         
         duration = (datetime.now() - start_time).total_seconds()
         
-        # Rebuild index after writing
+        # Re-index only the files written by this commit
         if self.use_index and self.index:
-            self.index.build_index(force_rebuild=True)
+            self.index.refresh(paths=written_files)
         
         main_logger.info(
             f"Wrote {stats['total_records']} features to {stats['partitions_written']} partitions "
@@ -188,30 +252,44 @@ class FeatureStore:
         
         return stats
     
+    def _get_cohort_path(self, cohort: str) -> Path:
+        """
+        Get directory for features written without date partitioning
+        
+        Args:
+            cohort: Data cohort
+            
+        Returns:
+            Path to cohort directory
+        """
+        cohort_path = self.storage_path / f"cohort={cohort}"
+        cohort_path.mkdir(parents=True, exist_ok=True)
+        return cohort_path
+    
     def _write_parquet_file(
         self,
         df: pd.DataFrame,
-        file_path: Path,
-        overwrite: bool = False
-    ):
+        file_path: Path
+    ) -> int:
         """
-        Write DataFrame to Parquet file with compression
+        Write DataFrame to a new Parquet file with compression
         
         Args:
             df: DataFrame to write
             file_path: Output file path
-            overwrite: Whether to overwrite existing file
-        """
-        if file_path.exists() and not overwrite:
-            # Append mode - read existing and concatenate
-            existing_df = pd.read_parquet(file_path)
-            df = pd.concat([existing_df, df], ignore_index=True)
             
-            # Remove duplicates based on patient_id and visit_date
-            df = df.drop_duplicates(subset=['patient_id', 'visit_date'], keep='last')
+        Returns:
+            Number of rows written
+        """
+        # Keep the last row for each record key
+        df = df.drop_duplicates(subset=self.RECORD_KEY, keep='last')
+        
+        # Cluster rows so each row group covers a narrow patient/date range
+        if self.sort_on_write:
+            df = df.sort_values(['patient_id', 'visit_date'], kind='mergesort')
         
         # Convert to PyArrow table for better control
-        table = pa.Table.from_pandas(df)
+        table = pa.Table.from_pandas(df, preserve_index=False)
         
         # Write with compression
         pq.write_table(
@@ -221,8 +299,86 @@ class FeatureStore:
             compression_level=self.write_options['compression_level'],
             use_dictionary=self.write_options['use_dictionary'],
             write_statistics=self.write_options['write_statistics'],
-            data_page_size=self.write_options['data_page_size']
+            data_page_size=self.write_options['data_page_size'],
+            row_group_size=self.write_options['row_group_size']
         )
+        
+        return table.num_rows
+    
+    @staticmethod
+    def _build_filter(
+        patient_ids: Optional[List[str]] = None,
+        date_range: Optional[Tuple[date, date]] = None
+    ) -> Optional[ds.Expression]:
+        """
+        Build a pyarrow dataset filter for patient and visit date predicates
+        
+        The filter is evaluated against row group statistics first, so row
+        groups that cannot match are never decoded.
+        
+        Args:
+            patient_ids: Patient IDs to include
+            date_range: Tuple of (start_date, end_date), inclusive
+            
+        Returns:
+            Filter expression, or None if there are no predicates
+        """
+        expressions = []
+        
+        if patient_ids:
+            expressions.append(ds.field('patient_id').isin(list(patient_ids)))
+        
+        if date_range:
+            start_date, end_date = date_range
+            expressions.append(ds.field('visit_date') >= pa.scalar(pd.Timestamp(start_date)))
+            expressions.append(ds.field('visit_date') <= pa.scalar(pd.Timestamp(end_date)))
+        
+        if not expressions:
+            return None
+        
+        expression = expressions[0]
+        for other in expressions[1:]:
+            expression = expression & other
+        return expression
+    
+    @staticmethod
+    def _read_rows(
+        file_path: Path,
+        row_offsets: List[int],
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Read specific rows of a Parquet file, decoding only their row groups
+        
+        Args:
+            file_path: Parquet file to read
+            row_offsets: Row positions within the file
+            columns: Columns to read
+            
+        Returns:
+            DataFrame with the requested rows in file order
+        """
+        parquet_file = pq.ParquetFile(file_path)
+        metadata = parquet_file.metadata
+        
+        # Row position where each row group starts, plus the total row count
+        row_group_starts = np.cumsum(
+            [0] + [metadata.row_group(i).num_rows for i in range(metadata.num_row_groups)]
+        )
+        
+        row_offsets = np.unique(np.asarray(row_offsets, dtype=np.int64))
+        row_groups = np.searchsorted(row_group_starts, row_offsets, side='right') - 1
+        needed = np.unique(row_groups)
+        
+        table = parquet_file.read_row_groups(needed.tolist(), columns=columns)
+        
+        # Map file row positions to positions within the selected row groups
+        needed_sizes = row_group_starts[needed + 1] - row_group_starts[needed]
+        needed_bases = np.concatenate([[0], np.cumsum(needed_sizes)[:-1]])
+        position = np.searchsorted(needed, row_groups)
+        local_offsets = row_offsets - row_group_starts[row_groups] + needed_bases[position]
+        
+        return table.take(pa.array(local_offsets)).to_pandas()
     
     def read_features(
         self,
@@ -230,110 +386,59 @@ class FeatureStore:
         cohorts: Optional[List[str]] = None,
         date_range: Optional[Tuple[date, date]] = None,
         columns: Optional[List[str]] = None,
-        use_cache: bool = True
+        use_cache: bool = True,
+        max_workers: Optional[int] = None
     ) -> pd.DataFrame:
         """
         Read features from Parquet with filtering
         
+        Requested patients are resolved to row locations in one pass and
+        grouped by file, so each file is opened once per call.
+        
         Args:
             patient_ids: List of patient IDs to filter
             cohorts: List of cohorts to include
             date_range: Tuple of (start_date, end_date)
             columns: Specific columns to read
-            use_cache: Whether to use Redis cache
-            
+            use_cache: Whether to use the feature cache
+            max_workers: Number of threads reading files in parallel
+                (default reads files sequentially)
+                
         Returns:
             DataFrame with features
         """
         start_time = datetime.now()
         
         # Try cache first for single patient queries
+        cache_key = None
         if use_cache and patient_ids and len(patient_ids) == 1:
-            cache_key = f"features:{patient_ids[0]}"
-            cached_data = self.cache_manager.get(cache_key)
+            cache_key = self._cache_key(patient_ids[0], cohorts, date_range, columns)
+            cached_data = self.feature_cache.get(cache_key)
             if cached_data is not None:
                 main_logger.debug(
                     f"Cache hit for patient {patient_ids[0]}",
                     extra={'operation': 'read_features_cache', 'user_id': 'system'}
                 )
-                return pd.DataFrame(cached_data)
+                return frame_from_ipc(cached_data)
         
-        # Use index for faster lookups if available
-        if self.use_index and self.index and patient_ids:
-            return self._read_features_indexed(
-                patient_ids, cohorts, date_range, columns, use_cache
-            )
-        
-        # Read from Parquet files
-        dfs = []
-        
-        # Determine which partitions to read
-        cohorts_to_read = cohorts or ['ADNI', 'OASIS', 'NACC']
+        result_df = self._read_live_features(
+            patient_ids, cohorts, date_range, columns, max_workers=max_workers
+        )
         
-        for cohort in cohorts_to_read:
-            cohort_path = self.storage_path / f"cohort={cohort}"
-            
-            if not cohort_path.exists():
-                continue
-            
-            # Find all Parquet files in cohort
-            parquet_files = list(cohort_path.rglob("*.parquet"))
-            
-            for file_path in parquet_files:
-                # Read with filters if possible
-                filters = []
-                
-                if patient_ids:
-                    filters.append(('patient_id', 'in', patient_ids))
-                
-                if date_range:
-                    start_date, end_date = date_range
-                    filters.append(('visit_date', '>=', pd.Timestamp(start_date)))
-                    filters.append(('visit_date', '<=', pd.Timestamp(end_date)))
-                
-                try:
-                    df = pd.read_parquet(
-                        file_path,
-                        columns=columns,
-                        filters=filters if filters else None
-                    )
-                    
-                    if len(df) > 0:
-                        dfs.append(df)
-                        
-                except Exception as e:
-                    main_logger.warning(
-                        f"Failed to read {file_path}: {str(e)}",
-                        extra={'operation': 'read_features', 'user_id': 'system'}
-                    )
-        
-        if not dfs:
+        if result_df.empty:
             main_logger.warning(
                 "No features found matching criteria",
                 extra={'operation': 'read_features', 'user_id': 'system'}
             )
             return pd.DataFrame()
         
-        # Combine all DataFrames
-        result_df = pd.concat(dfs, ignore_index=True)
-        
-        # Apply additional filters if needed
-        if patient_ids:
-            result_df = result_df[result_df['patient_id'].isin(patient_ids)]
-        
-        if date_range:
-            start_date, end_date = date_range
-            result_df = result_df[
-                (result_df['visit_date'] >= pd.Timestamp(start_date)) &
-                (result_df['visit_date'] <= pd.Timestamp(end_date))
-            ]
+        result_df = result_df.drop(columns=['_cohort'])
         
         # Cache single patient results
-        if use_cache and patient_ids and len(patient_ids) == 1 and len(result_df) > 0:
-            cache_key = f"features:{patient_ids[0]}"
-            self.cache_manager.set(
+        if cache_key is not None:
+            self.feature_cache.set(
                 cache_key,
-                result_df.to_dict('records'),
+                frame_to_ipc(result_df),
                 ttl=settings.CACHE_TTL
             )
         
@@ -350,86 +455,429 @@ class FeatureStore:
         
         return result_df
     
-    def _read_features_indexed(
+    def _cache_key(
         self,
-        patient_ids: List[str],
+        patient_id: str,
+        cohorts: Optional[List[str]],
+        date_range: Optional[Tuple[date, date]],
+        columns: Optional[List[str]]
+    ) -> str:
+        """
+        Build the cache key for a single patient query
+        
+        The key includes the manifest version, so every committed write or
+        delete moves readers to fresh keys and stale entries simply expire.
+        
+        Args:
+            patient_id: Patient ID
+            cohorts: Cohorts filter
+            date_range: Date range filter
+            columns: Columns requested
+            
+        Returns:
+            Cache key
+        """
+        query = json.dumps({
+            'storage_path': str(self.storage_path),
+            'cohorts': sorted(cohorts) if cohorts else None,
+            'date_range': [str(d) for d in date_range] if date_range else None,
+            'columns': list(columns) if columns else None
+        }, sort_keys=True)
+        query_hash = hashlib.md5(query.encode()).hexdigest()[:16]
+        
+        return f"features:{patient_id}:v{self.manifest.current_version()}:{query_hash}"
+    
+    def _read_live_features(
+        self,
+        patient_ids: Optional[List[str]],
         cohorts: Optional[List[str]],
         date_range: Optional[Tuple[date, date]],
         columns: Optional[List[str]],
-        use_cache: bool
+        max_workers: Optional[int] = None
     ) -> pd.DataFrame:
+        """
+        Read matching rows from live files and merge them into their latest versions
+        
+        Args:
+            patient_ids: Patient IDs to include
+            cohorts: Cohorts to include
+            date_range: Date range filter
+            columns: Columns to return
+            max_workers: Number of threads reading files in parallel
+            
+        Returns:
+            DataFrame with the requested columns plus a _cohort column
+        """
+        # Record keys are always read so versions can be merged
+        read_columns = None
+        if columns is not None:
+            read_columns = list(dict.fromkeys(list(columns) + self.RECORD_KEY))
+        
+        # Use index for faster lookups if available
+        if self.use_index and self.index and patient_ids:
+            parts = self._read_parts_indexed(
+                patient_ids, cohorts, date_range, read_columns, max_workers
+            )
+        else:
+            parts = self._read_parts_scan(
+                patient_ids, cohorts, date_range, read_columns, max_workers
+            )
+        
+        return self._merge_versions(parts, columns)
+    
+    def _read_parts_scan(
+        self,
+        patient_ids: Optional[List[str]],
+        cohorts: Optional[List[str]],
+        date_range: Optional[Tuple[date, date]],
+        columns: Optional[List[str]],
+        max_workers: Optional[int] = None
+    ) -> List[Tuple[pd.DataFrame, Dict]]:
+        """
+        Scan live files with filters pushed down to row group statistics
+        
+        Args:
+            patient_ids: Patient IDs to include
+            cohorts: Cohorts to include
+            date_range: Date range filter
+            columns: Columns to read
+            max_workers: Number of threads reading files in parallel
+            
+        Returns:
+            List of (DataFrame, manifest entry) for each file with matching rows
+        """
+        # Determine which partitions to read
+        cohorts_to_read = cohorts or ['ADNI', 'OASIS', 'NACC']
+        filter_expression = self._build_filter(patient_ids, date_range)
+        
+        def read_file(item: Tuple[str, Dict]) -> Optional[Tuple[pd.DataFrame, Dict]]:
+            rel_path, entry = item
+            file_path = self.storage_path / rel_path
+            
+            try:
+                # Filters are pushed down to row group statistics
+                table = ds.dataset(file_path, format='parquet').to_table(
+                    columns=columns,
+                    filter=filter_expression
+                )
+                
+                if table.num_rows > 0:
+                    return table.to_pandas(), entry
+                    
+            except Exception as e:
+                main_logger.warning(
+                    f"Failed to read {file_path}: {str(e)}",
+                    extra={'operation': 'read_features', 'user_id': 'system'}
+                )
+            
+            return None
+        
+        return self._map_files(
+            read_file, self.manifest.live_files(cohorts=cohorts_to_read), max_workers
+        )
+    
+    def _read_parts_indexed(
+        self,
+        patient_ids: List[str],
+        cohorts: Optional[List[str]],
+        date_range: Optional[Tuple[date, date]],
+        columns: Optional[List[str]],
+        max_workers: Optional[int] = None
+    ) -> List[Tuple[pd.DataFrame, Dict]]:
         """
         Read features using index for faster lookups
         
+        Locations of all requested patients are grouped by file first, so
+        patients sharing a partition cost a single read of that file.
+        
         Args:
             patient_ids: List of patient IDs
             cohorts: Cohorts to filter
             date_range: Date range filter
             columns: Columns to read
-            use_cache: Whether to use cache
+            max_workers: Number of threads reading files in parallel
             
         Returns:
-            DataFrame with features
+            List of (DataFrame, manifest entry) for each file with matching rows
         """
-        dfs = []
+        live_files = dict(self.manifest.live_files(cohorts=cohorts))
         
-        for patient_id in patient_ids:
-            # Get file locations from index
-            locations = self.index.get_patient_locations(patient_id)
-            
-            if not locations:
-                continue
+        # Get file locations from index, already narrowed by cohort and date
+        locations = self.index.get_locations_by_file(
+            patient_ids,
+            date_range=date_range,
+            cohorts=cohorts
+        )
+        
+        # Skip files replaced by compaction or overwrite
+        files_to_read = []
+        for file_path, row_offsets in locations.items():
+            entry = live_files.get(self.manifest.relative_path(file_path))
+            if entry is not None:
+                files_to_read.append((file_path, row_offsets, entry))
+        
+        def read_file(item: Tuple[Path, np.ndarray, Dict]) -> Optional[Tuple[pd.DataFrame, Dict]]:
+            file_path, row_offsets, entry = item
             
-            # Group by file to minimize I/O
-            files_to_read = {}
-            for file_path, row_idx in locations:
-                if file_path not in files_to_read:
-                    files_to_read[file_path] = []
-                files_to_read[file_path].append(row_idx)
-            
-            # Read each file
-            for file_path, row_indices in files_to_read.items():
-                try:
-                    df = pd.read_parquet(file_path, columns=columns)
-                    
-                    # Filter by row indices
-                    df = df.iloc[row_indices]
-                    
-                    # Apply additional filters
-                    if cohorts and 'cohort' in df.columns:
-                        df = df[df['cohort'].isin(cohorts)]
-                    
-                    if date_range and 'visit_date' in df.columns:
-                        start_date, end_date = date_range
-                        df = df[
-                            (df['visit_date'] >= pd.Timestamp(start_date)) &
-                            (df['visit_date'] <= pd.Timestamp(end_date))
-                        ]
+            try:
+                # Decode only the row groups holding these rows
+                df = self._read_rows(file_path, row_offsets, columns=columns)
+                
+                if len(df) > 0:
+                    return df, entry
                     
-                    if len(df) > 0:
-                        dfs.append(df)
-                        
-                except Exception as e:
-                    main_logger.warning(
-                        f"Failed to read {file_path}: {str(e)}",
-                        extra={'operation': 'read_features_indexed', 'user_id': 'system'}
-                    )
-        
-        if not dfs:
+            except Exception as e:
+                main_logger.warning(
+                    f"Failed to read {file_path}: {str(e)}",
+                    extra={'operation': 'read_features_indexed', 'user_id': 'system'}
+                )
+            
+            return None
+        
+        return self._map_files(read_file, files_to_read, max_workers)
+    
+    @staticmethod
+    def _map_files(func, items: List, max_workers: Optional[int] = None) -> List:
+        """
+        Apply a file reader to each item, optionally on a thread pool
+        
+        Parquet decoding releases the GIL, so threads overlap I/O and
+        decompression across files.
+        
+        Args:
+            func: Reader returning a result or None
+            items: Items to read
+            max_workers: Number of threads, or None to read sequentially
+            
+        Returns:
+            Non-empty results in item order
+        """
+        if max_workers and max_workers > 1 and len(items) > 1:
+            with ThreadPoolExecutor(max_workers=min(max_workers, len(items))) as executor:
+                results = list(executor.map(func, items))
+        else:
+            results = [func(item) for item in items]
+        
+        return [result for result in results if result is not None]
+    
+    def _merge_versions(
+        self,
+        parts: List[Tuple[pd.DataFrame, Dict]],
+        columns: Optional[List[str]] = None
+    ) -> pd.DataFrame:
+        """
+        Merge rows read from base and delta files into their live versions
+        
+        When a record key appears in several files, the row from the file with
+        the highest sequence wins. Rows are dropped when a tombstone with a
+        higher sequence deletes their key.
+        
+        Args:
+            parts: List of (DataFrame, manifest entry) for each file read
+            columns: Columns to return, or None for all
+            
+        Returns:
+            DataFrame of live rows with a _cohort column
+        """
+        if not parts:
             return pd.DataFrame()
         
-        result_df = pd.concat(dfs, ignore_index=True)
+        key = ['_cohort'] + self.RECORD_KEY
         
-        # Cache single patient results
-        if use_cache and len(patient_ids) == 1 and len(result_df) > 0:
-            cache_key = f"features:{patient_ids[0]}"
-            self.cache_manager.set(
-                cache_key,
-                result_df.to_dict('records'),
-                ttl=settings.CACHE_TTL
+        df = pd.concat([
+            part.assign(_sequence=entry['sequence'], _cohort=entry['cohort'])
+            for part, entry in parts
+        ], ignore_index=True)
+        
+        # Keep the newest version of each key, preserving read order
+        if len({entry['sequence'] for _, entry in parts}) > 1:
+            superseded = df.sort_values('_sequence', kind='mergesort').duplicated(
+                subset=key, keep='last'
             )
+            df = df[~superseded.sort_index()]
         
-        return result_df
+        tombstones = self._load_tombstones()
+        if not tombstones.empty:
+            tombstones = tombstones.astype({'visit_date': df['visit_date'].dtype})
+            deleted_sequence = df[key].merge(tombstones, how='left', on=key)['_deleted_sequence']
+            df = df[~(deleted_sequence.to_numpy() > df['_sequence'].to_numpy())]
+        
+        df = df.drop(columns=['_sequence'])
+        if columns is not None:
+            df = df[list(columns) + ['_cohort']]
+        
+        return df.reset_index(drop=True)
+    
+    def _load_tombstones(self) -> pd.DataFrame:
+        """
+        Load live tombstones, reduced to the newest deletion of each key
+        
+        Returns:
+            DataFrame with _cohort, patient_id, visit_date and _deleted_sequence
+        """
+        tombstone_files = self.manifest.live_tombstones()
+        cache_key = tuple(rel_path for rel_path, _ in tombstone_files)
+        
+        if cache_key == self._tombstone_cache[0]:
+            return self._tombstone_cache[1]
+        
+        if tombstone_files:
+            tombstones = pd.concat([
+                pd.read_parquet(self.storage_path / rel_path).assign(
+                    _deleted_sequence=entry['sequence']
+                )
+                for rel_path, entry in tombstone_files
+            ], ignore_index=True).rename(columns={'cohort': '_cohort'})
+            
+            tombstones = tombstones.groupby(
+                ['_cohort'] + self.RECORD_KEY, as_index=False
+            )['_deleted_sequence'].max()
+        else:
+            tombstones = pd.DataFrame()
+        
+        self._tombstone_cache = (cache_key, tombstones)
+        return tombstones
+    
+    def stream_features(
+        self,
+        patient_ids: Optional[List[str]] = None,
+        cohorts: Optional[List[str]] = None,
+        date_range: Optional[Tuple[date, date]] = None,
+        columns: Optional[List[str]] = None,
+        batch_size: int = 64 * 1024
+    ) -> Tuple[pa.Schema, Iterator[pa.RecordBatch]]:
+        """
+        Stream features as Arrow record batches
+        
+        Partitions are read one at a time. A partition with a single live
+        file and no pending deletes is streamed straight from the Parquet
+        scanner; otherwise its files are merged before being emitted. Memory
+        is therefore bounded by the largest partition, not the result size.
+        
+        Args:
+            patient_ids: List of patient IDs to filter
+            cohorts: List of cohorts to include
+            date_range: Tuple of (start_date, end_date)
+            columns: Specific columns to read
+            batch_size: Maximum rows per record batch
+            
+        Returns:
+            Tuple of (schema shared by every batch, batch iterator)
+        """
+        cohorts_to_read = cohorts or ['ADNI', 'OASIS', 'NACC']
+        live_files = self.manifest.live_files(cohorts=cohorts_to_read)
+        
+        schemas = [
+            pq.read_schema(self.storage_path / rel_path).remove_metadata()
+            for rel_path, _ in live_files
+        ]
+        schema = pa.unify_schemas(schemas, promote_options='permissive') if schemas else pa.schema([])
+        if columns is not None:
+            schema = pa.schema([schema.field(name) for name in columns if name in schema.names])
+        
+        batches = self._iter_batches(
+            live_files, schema, patient_ids, date_range, columns, batch_size
+        )
+        return schema, batches
+    
+    def _iter_batches(
+        self,
+        live_files: List[Tuple[str, Dict]],
+        schema: pa.Schema,
+        patient_ids: Optional[List[str]],
+        date_range: Optional[Tuple[date, date]],
+        columns: Optional[List[str]],
+        batch_size: int
+    ) -> Iterator[pa.RecordBatch]:
+        """
+        Generate record batches partition by partition
+        
+        Args:
+            live_files: Live (relative path, entry) tuples to read
+            schema: Schema every batch is conformed to
+            patient_ids: Patient IDs to include
+            date_range: Date range filter
+            columns: Columns to return
+            batch_size: Maximum rows per record batch
+            
+        Yields:
+            Record batches conforming to schema
+        """
+        read_columns = None
+        if columns is not None:
+            read_columns = list(dict.fromkeys(list(columns) + self.RECORD_KEY))
+        
+        filter_expression = self._build_filter(patient_ids, date_range)
+        tombstones = self._load_tombstones()
+        
+        # Row locations for patient lookups, or None to scan
+        locations = None
+        if self.use_index and self.index and patient_ids:
+            locations = self.index.get_locations_by_file(patient_ids, date_range=date_range)
+        
+        partitions: Dict[str, List[Tuple[str, Dict]]] = {}
+        for rel_path, entry in live_files:
+            if locations is None or self.storage_path / rel_path in locations:
+                partitions.setdefault(entry['partition'], []).append((rel_path, entry))
+        
+        for files in partitions.values():
+            rel_path, entry = files[0]
+            pending_deletes = not tombstones.empty and bool((
+                (tombstones['_cohort'] == entry['cohort']) &
+                (tombstones['_deleted_sequence'] > entry['sequence'])
+            ).any())
+            
+            if locations is None and len(files) == 1 and not pending_deletes:
+                # Nothing to merge, stream directly from the scanner
+                scanner = ds.dataset(self.storage_path / rel_path, format='parquet').scanner(
+                    columns=columns, filter=filter_expression, batch_size=batch_size
+                )
+                for batch in scanner.to_batches():
+                    if batch.num_rows > 0:
+                        yield self._conform_batch(batch, schema)
+                continue
+            
+            parts = []
+            for rel_path, entry in files:
+                file_path = self.storage_path / rel_path
+                if locations is not None:
+                    df = self._read_rows(file_path, locations[file_path], columns=read_columns)
+                else:
+                    df = ds.dataset(file_path, format='parquet').to_table(
+                        columns=read_columns, filter=filter_expression
+                    ).to_pandas()
+                parts.append((df, entry))
+            
+            merged_df = self._merge_versions(parts, columns).drop(columns=['_cohort'])
+            if merged_df.empty:
+                continue
+            
+            table = pa.Table.from_pandas(merged_df, preserve_index=False)
+            for batch in table.to_batches(max_chunksize=batch_size):
+                yield self._conform_batch(batch, schema)
+    
+    @staticmethod
+    def _conform_batch(batch: pa.RecordBatch, schema: pa.Schema) -> pa.RecordBatch:
+        """
+        Cast a record batch to a target schema, filling missing columns with nulls
+        
+        Args:
+            batch: Record batch read from one file
+            schema: Target schema
+            
+        Returns:
+            Record batch with exactly the schema's columns and types
+        """
+        arrays = []
+        for field in schema:
+            index = batch.schema.get_field_index(field.name)
+            if index < 0:
+                arrays.append(pa.nulls(batch.num_rows, field.type))
+            else:
+                column = batch.column(index)
+                arrays.append(column if column.type == field.type else column.cast(field.type))
+        
+        return pa.RecordBatch.from_arrays(arrays, schema=schema)
     
     def rebuild_index(self):
         """Rebuild feature index"""
@@ -546,12 +994,7 @@ class FeatureStore:
         labels = df['diagnosis']
         
         # Drop non-feature columns
-        drop_cols = [
-            'diagnosis', 'patient_id', 'visit_date', 'cohort',
-            'ingestion_timestamp', 'data_source', 'feature_version',
-            'created_at', 'updated_at'
-        ]
-        features = df.drop(columns=[col for col in drop_cols if col in df.columns])
+        features = df.drop(columns=[col for col in self.NON_FEATURE_COLUMNS if col in df.columns])
         
         main_logger.info(
             f"Loaded training data: {len(features)} samples, {len(features.columns)} features",
@@ -565,6 +1008,80 @@ class FeatureStore:
         
         return features, labels
     
+    def stream_training_data(
+        self,
+        cohorts: Optional[List[str]] = None,
+        date_range: Optional[Tuple[date, date]] = None,
+        min_completeness: float = 0.7,
+        batch_size: int = 64 * 1024
+    ) -> Tuple[pa.Schema, Iterator[pa.RecordBatch]]:
+        """
+        Stream training features and labels as Arrow record batches
+        
+        A first streaming pass counts non-null values per column to apply
+        min_completeness, so neither pass holds the full dataset in memory.
+        Batches contain the feature columns followed by 'diagnosis'.
+        
+        The first pass runs before this returns, since it decides the
+        schema. Async callers should call this from a worker thread.
+        
+        Args:
+            cohorts: Cohorts to include
+            date_range: Date range filter
+            min_completeness: Minimum completeness threshold
+            batch_size: Maximum rows per record batch
+            
+        Returns:
+            Tuple of (schema shared by every batch, batch iterator)
+        """
+        schema, batches = self.stream_features(
+            cohorts=cohorts, date_range=date_range, batch_size=batch_size
+        )
+        
+        total_rows = 0
+        non_null = np.zeros(len(schema), dtype=np.int64)
+        for batch in batches:
+            total_rows += batch.num_rows
+            non_null += [batch.num_rows - column.null_count for column in batch.columns]
+        
+        if total_rows == 0:
+            raise ValueError("No training data found")
+        
+        completeness = non_null / total_rows
+        complete_cols = [
+            name for name, value in zip(schema.names, completeness)
+            if value >= min_completeness
+        ]
+        
+        low_completeness_cols = [name for name in schema.names if name not in complete_cols]
+        if low_completeness_cols:
+            main_logger.warning(
+                f"Dropping columns with low completeness: {low_completeness_cols}",
+                extra={'operation': 'stream_training_data', 'user_id': 'system'}
+            )
+        
+        if 'diagnosis' not in complete_cols:
+            raise ValueError("No diagnosis column found for labels")
+        
+        feature_cols = [col for col in complete_cols if col not in self.NON_FEATURE_COLUMNS]
+        
+        main_logger.info(
+            f"Streaming training data: {total_rows} samples, {len(feature_cols)} features",
+            extra={
+                'operation': 'stream_training_data',
+                'user_id': 'system',
+                'samples': total_rows,
+                'features': len(feature_cols)
+            }
+        )
+        
+        return self.stream_features(
+            cohorts=cohorts,
+            date_range=date_range,
+            columns=feature_cols + ['diagnosis'],
+            batch_size=batch_size
+        )
+    
     def get_feature_statistics(
         self,
         cohorts: Optional[List[str]] = None
@@ -609,14 +1126,16 @@ class FeatureStore:
         """
         total_size = 0
         file_count = 0
-        partition_count = 0
+        delta_file_count = 0
         
-        # Count files and sizes
-        for cohort_dir in self.storage_path.glob("cohort=*"):
-            partition_count += 1
-            for parquet_file in cohort_dir.rglob("*.parquet"):
-                file_count += 1
-                total_size += parquet_file.stat().st_size
+        # Count live files and sizes
+        for rel_path, entry in self.manifest.live_files():
+            file_count += 1
+            total_size += (self.storage_path / rel_path).stat().st_size
+            if entry['kind'] == 'delta':
+                delta_file_count += 1
+        
+        partition_count = len(list(self.storage_path.glob("cohort=*")))
         
         return {
             'storage_path': str(self.storage_path),
@@ -624,12 +1143,41 @@ class FeatureStore:
             'total_size_mb': total_size / 1024 / 1024,
             'total_size_gb': total_size / 1024 / 1024 / 1024,
             'file_count': file_count,
-            'partition_count': partition_count
+            'delta_file_count': delta_file_count,
+            'tombstone_count': len(self.manifest.live_tombstones()),
+            'partition_count': partition_count,
+            'manifest_version': self.manifest.current_version()
         }
     
-    def optimize_storage(self) -> Dict[str, int]:
+    def optimize_storage(self, background: bool = False) -> Union[Dict[str, int], Future]:
         """
-        Optimize storage by compacting small files
+        Compact delta files and tombstones into base files
+        
+        Each partition with more than one live file, or with rows deleted by
+        a tombstone, is merged into a single new base file. Tombstones that
+        no longer cover any older file are then dropped. Replaced files are
+        deleted on a later run, once the grace period has passed.
+        
+        Args:
+            background: Run compaction on a background thread
+            
+        Returns:
+            Dictionary with optimization statistics, or a Future resolving to
+            it when run in the background
+        """
+        if background:
+            if self._compaction_executor is None:
+                self._compaction_executor = ThreadPoolExecutor(
+                    max_workers=1, thread_name_prefix='feature-compaction'
+                )
+            return self._compaction_executor.submit(self.optimize_storage)
+        
+        with self._compaction_lock:
+            return self._compact()
+    
+    def _compact(self) -> Dict[str, int]:
+        """
+        Compact all partitions that have deltas or pending deletes
         
         Returns:
             Dictionary with optimization statistics
@@ -638,7 +1186,9 @@ class FeatureStore:
             'files_before': 0,
             'files_after': 0,
             'size_before': 0,
-            'size_after': 0
+            'size_after': 0,
+            'partitions_compacted': 0,
+            'tombstones_removed': 0
         }
         
         # Get initial stats
@@ -646,34 +1196,49 @@ class FeatureStore:
         stats['files_before'] = info['file_count']
         stats['size_before'] = info['total_size_bytes']
         
-        # Compact files by partition
-        for cohort_dir in self.storage_path.glob("cohort=*"):
-            for year_dir in cohort_dir.glob("year=*"):
-                for month_dir in year_dir.glob("month=*"):
-                    parquet_files = list(month_dir.glob("*.parquet"))
-                    
-                    if len(parquet_files) > 1:
-                        # Read all files in partition
-                        dfs = [pd.read_parquet(f) for f in parquet_files]
-                        combined_df = pd.concat(dfs, ignore_index=True)
-                        
-                        # Remove duplicates
-                        combined_df = combined_df.drop_duplicates(
-                            subset=['patient_id', 'visit_date'],
-                            keep='last'
-                        )
-                        
-                        # Delete old files
-                        for f in parquet_files:
-                            f.unlink()
-                        
-                        # Write compacted file
-                        cohort = cohort_dir.name.split('=')[1]
-                        year = int(year_dir.name.split('=')[1])
-                        month = int(month_dir.name.split('=')[1])
-                        
-                        new_file = month_dir / f"features_{cohort}_{year}_{month:02d}.parquet"
-                        self._write_parquet_file(combined_df, new_file, overwrite=True)
+        touched_files = [
+            self.storage_path / rel_path
+            for rel_path in self.manifest.purge_obsolete(self.obsolete_file_grace_seconds)
+        ]
+        
+        # Newest tombstone affecting each partition
+        tombstone_partitions = {
+            rel_path: self._tombstone_partitions(rel_path)
+            for rel_path, _ in self.manifest.live_tombstones()
+        }
+        latest_delete = {}
+        for rel_path, entry in self.manifest.live_tombstones():
+            for partition in tombstone_partitions[rel_path]:
+                latest_delete[partition] = max(latest_delete.get(partition, 0), entry['sequence'])
+        
+        for partition, files in self.manifest.partitions().items():
+            oldest_sequence = files[0][1]['sequence']
+            
+            if len(files) == 1 and latest_delete.get(partition, 0) <= oldest_sequence:
+                continue
+            
+            touched_files.extend(self._compact_partition(partition, files))
+            stats['partitions_compacted'] += 1
+        
+        # A tombstone is obsolete once every file it could apply to is newer
+        oldest_by_partition = {
+            partition: files[0][1]['sequence']
+            for partition, files in self.manifest.partitions().items()
+        }
+        obsolete_tombstones = [
+            rel_path
+            for rel_path, entry in self.manifest.live_tombstones()
+            if all(
+                oldest_by_partition.get(partition, float('inf')) > entry['sequence']
+                for partition in tombstone_partitions[rel_path]
+            )
+        ]
+        if obsolete_tombstones:
+            self.manifest.commit(remove_tombstones=obsolete_tombstones)
+            stats['tombstones_removed'] = len(obsolete_tombstones)
+        
+        if self.use_index and self.index and touched_files:
+            self.index.refresh(paths=touched_files)
         
         # Get final stats
         info = self.get_storage_info()
@@ -687,12 +1252,85 @@ class FeatureStore:
         
         main_logger.info(
             f"Storage optimized: {stats['files_before']} -> {stats['files_after']} files, "
+            f"{stats['partitions_compacted']} partitions compacted, "
             f"{compression_ratio:.1f}% size reduction",
             extra={'operation': 'optimize_storage', 'user_id': 'system'}
         )
         
         return stats
     
+    def _compact_partition(
+        self,
+        partition: str,
+        files: List[Tuple[str, Dict]]
+    ) -> List[Path]:
+        """
+        Fold the live files of a partition into a single base file
+        
+        The base file takes a sequence allocated before its inputs are read,
+        so deltas and tombstones committed during compaction still win over it.
+        
+        Args:
+            partition: Partition directory relative to the storage root
+            files: Live (relative path, entry) tuples of the partition
+            
+        Returns:
+            Paths of files added to or removed from the manifest
+        """
+        sequence = self.manifest.allocate_sequence()
+        
+        parts = [
+            (pd.read_parquet(self.storage_path / rel_path), entry)
+            for rel_path, entry in files
+        ]
+        merged_df = self._merge_versions(parts).drop(columns=['_cohort'], errors='ignore')
+        
+        add_files = {}
+        touched_files = [self.storage_path / rel_path for rel_path, _ in files]
+        
+        if not merged_df.empty:
+            file_stem = Path(files[0][0]).name.split('.')[0]
+            file_path = self.storage_path / partition / f"{file_stem}.base-{sequence:06d}.parquet"
+            
+            rows = self._write_parquet_file(merged_df, file_path)
+            
+            add_files[self.manifest.relative_path(file_path)] = {
+                'sequence': sequence,
+                'kind': 'base',
+                'cohort': files[0][1]['cohort'],
+                'partition': partition,
+                'rows': rows
+            }
+            touched_files.append(file_path)
+        
+        self.manifest.commit(
+            add_files=add_files,
+            remove_files=[rel_path for rel_path, _ in files]
+        )
+        
+        return touched_files
+    
+    def _tombstone_partitions(self, rel_path: str) -> Set[str]:
+        """
+        Get the partitions a tombstone file can delete rows from
+        
+        Args:
+            rel_path: Tombstone file relative to the storage root
+            
+        Returns:
+            Set of partition directories relative to the storage root
+        """
+        keys = pd.read_parquet(self.storage_path / rel_path, columns=['cohort', 'visit_date'])
+        
+        partitions = set()
+        for cohort, year, month in zip(
+            keys['cohort'], keys['visit_date'].dt.year, keys['visit_date'].dt.month
+        ):
+            partitions.add(f"cohort={cohort}")
+            partitions.add(f"cohort={cohort}/year={year}/month={month:02d}")
+        
+        return partitions
+    
     def clear_cache(self, patient_id: Optional[str] = None):
         """
         Clear cached features
@@ -701,11 +1339,10 @@ class FeatureStore:
             patient_id: Specific patient ID to clear, or None for all
         """
         if patient_id:
-            cache_key = f"features:{patient_id}"
-            self.cache_manager.delete(cache_key)
+            self.feature_cache.clear_prefix(f"features:{patient_id}:")
         else:
             # Clear all feature cache keys
-            self.cache_manager.clear_pattern("features:*")
+            self.feature_cache.clear_prefix("features:")
         
         main_logger.info(
             f"Cache cleared for {'patient ' + patient_id if patient_id else 'all patients'}",
@@ -729,12 +1366,9 @@ class FeatureStore:
         Returns:
             Number of records deleted
         """
-        # Read matching features
-        df = self.read_features(
-            patient_ids=patient_ids,
-            cohorts=cohorts,
-            date_range=date_range,
-            use_cache=False
+        # Read the live keys of matching features
+        df = self._read_live_features(
+            patient_ids, cohorts, date_range, columns=self.RECORD_KEY
         )
         
         if df.empty:
@@ -742,39 +1376,22 @@ class FeatureStore:
         
         deleted_count = len(df)
         
-        # For each partition, rewrite without deleted records
-        for cohort in df['cohort'].unique():
-            cohort_df = df[df['cohort'] == cohort]
-            
-            for (year, month), group_df in cohort_df.groupby([
-                cohort_df['visit_date'].dt.year,
-                cohort_df['visit_date'].dt.month
-            ]):
-                partition_path = self._get_partition_path(cohort, year, month)
-                file_path = partition_path / f"features_{cohort}_{year}_{month:02d}.parquet"
-                
-                if file_path.exists():
-                    # Read existing data
-                    existing_df = pd.read_parquet(file_path)
-                    
-                    # Remove records to delete
-                    mask = ~(
-                        existing_df['patient_id'].isin(group_df['patient_id']) &
-                        existing_df['visit_date'].isin(group_df['visit_date'])
-                    )
-                    remaining_df = existing_df[mask]
-                    
-                    if len(remaining_df) > 0:
-                        # Rewrite file
-                        self._write_parquet_file(remaining_df, file_path, overwrite=True)
-                    else:
-                        # Delete empty file
-                        file_path.unlink()
-        
-        # Clear cache for deleted patients
-        if patient_ids:
-            for patient_id in patient_ids:
-                self.clear_cache(patient_id)
+        # Record deleted keys in a tombstone instead of rewriting partitions
+        keys = df.rename(columns={'_cohort': 'cohort'})[['cohort'] + self.RECORD_KEY]
+        
+        tombstone_dir = self.storage_path / FeatureManifest.TOMBSTONE_DIR
+        tombstone_dir.mkdir(parents=True, exist_ok=True)
+        
+        sequence = self.manifest.allocate_sequence()
+        file_path = tombstone_dir / f"tombstone-{sequence:06d}.parquet"
+        pq.write_table(pa.Table.from_pandas(keys, preserve_index=False), file_path)
+        
+        self.manifest.commit(add_tombstones={
+            self.manifest.relative_path(file_path): {
+                'sequence': sequence,
+                'rows': len(keys)
+            }
+        })
         
         main_logger.info(
             f"Deleted {deleted_count} feature records",
@@ -8,6 +8,8 @@ from .range_validator import RangeValidator
 from .duplicate_detector import DuplicateDetector
 from .temporal_validator import TemporalValidator
 from .quality_reporter import QualityReporter
+from .column_profiler import ColumnProfiler, ColumnProfile
+from .streaming_validator import StreamingValidator
 from .data_validation_engine import DataValidationEngine
 
 __all__ = [
@@ -19,5 +21,8 @@ __all__ = [
     'DuplicateDetector',
     'TemporalValidator',
     'QualityReporter',
+    'ColumnProfiler',
+    'ColumnProfile',
+    'StreamingValidator',
     'DataValidationEngine'
 ]
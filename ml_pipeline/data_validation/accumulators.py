@@ -0,0 +1,369 @@
+"""Mergeable accumulators for validating datasets in record batches"""
+
+import pandas as pd
+import numpy as np
+import warnings
+from typing import Dict, List, Optional
+import logging
+
+from .column_profiler import ColumnProfile, ColumnProfiler
+
+logger = logging.getLogger(__name__)
+
+
+class TDigest:
+    """
+    Mergeable quantile sketch (merging t-digest with the arcsine scale)
+
+    Values are kept exactly until more than max_centroids are buffered, so
+    small columns get the same quantiles as Series.quantile. Larger columns
+    are compressed to about compression / 2 centroids, small near the tails
+    and large near the median.
+    """
+
+    def __init__(self, compression: float = 500.0, max_centroids: Optional[int] = None):
+        """
+        Initialize t-digest
+
+        Args:
+            compression: Scale parameter; higher keeps more centroids
+            max_centroids: Centroids held before compressing (default: 5 x compression)
+        """
+        self.compression = compression
+        self.max_centroids = max_centroids or int(5 * compression)
+        self.means = np.empty(0)
+        self.weights = np.empty(0)
+        self.count = 0.0
+        self.min = np.inf
+        self.max = -np.inf
+
+    def update(self, values: np.ndarray):
+        """Add values; NaNs are ignored"""
+        values = np.asarray(values, dtype=float)
+        values = values[~np.isnan(values)]
+        if len(values) == 0:
+            return
+
+        self.min = min(self.min, float(values.min()))
+        self.max = max(self.max, float(values.max()))
+        self._absorb(values, np.ones(len(values)))
+
+    def merge(self, other: 'TDigest') -> 'TDigest':
+        """Merge another digest into this one"""
+        if other.count > 0:
+            self.min = min(self.min, other.min)
+            self.max = max(self.max, other.max)
+            self._absorb(other.means, other.weights)
+        return self
+
+    def _absorb(self, means: np.ndarray, weights: np.ndarray):
+        """Add weighted points and compress if over max_centroids"""
+        means = np.concatenate([self.means, means])
+        weights = np.concatenate([self.weights, weights])
+        order = np.argsort(means, kind='stable')
+        means, weights = means[order], weights[order]
+        self.count = float(weights.sum())
+
+        if len(means) > self.max_centroids:
+            # Bucket points by the integer part of the scale function at
+            # their quantile; each bucket becomes one centroid
+            q = (np.cumsum(weights) - weights / 2) / self.count
+            k = self.compression / (2 * np.pi) * np.arcsin(2 * q - 1)
+            buckets = np.floor(k)
+            starts = np.concatenate([[0], np.flatnonzero(np.diff(buckets)) + 1])
+            weight_sums = np.add.reduceat(weights, starts)
+            means = np.add.reduceat(means * weights, starts) / weight_sums
+            weights = weight_sums
+
+        self.means, self.weights = means, weights
+
+    def quantile(self, q: float) -> float:
+        """
+        Estimate a quantile with linear interpolation between centroids
+
+        Ranks follow Series.quantile: quantile q sits at rank q * (n - 1).
+        """
+        if self.count == 0:
+            return np.nan
+        if q <= 0:
+            return self.min
+        if q >= 1:
+            return self.max
+
+        centers = np.cumsum(self.weights) - self.weights / 2
+        rank = q * (self.count - 1) + 0.5
+        return float(np.interp(
+            rank,
+            np.concatenate([[0.0], centers, [self.count]]),
+            np.concatenate([[self.min], self.means, [self.max]])
+        ))
+
+
+class ColumnStatsAccumulator:
+    """
+    Accumulate the statistics of a ColumnProfile over record batches
+
+    Null counts, means and standard deviations (merged with Chan's parallel
+    update), minima and maxima are exact; quartiles come from a t-digest per
+    numeric column. Numeric columns are fixed by the first batch; later
+    batches are coerced to numbers for those columns.
+    """
+
+    def __init__(self, compression: float = 500.0):
+        """
+        Initialize accumulator
+
+        Args:
+            compression: t-digest compression for the quartiles
+        """
+        self.compression = compression
+        self.columns: Optional[List[str]] = None
+        self.numeric_columns: List[str] = []
+        self.n_rows = 0
+        self.non_null: Optional[np.ndarray] = None
+        self.rows_with_missing = 0
+        self.completely_empty_rows = 0
+        self.digests: List[TDigest] = []
+        self._count = self._mean = self._m2 = self._min = self._max = None
+
+    def _initialize(self, batch: pd.DataFrame):
+        """Fix the column layout from the first batch"""
+        self.columns = list(batch.columns)
+        self.numeric_columns = ColumnProfiler.numeric_columns(batch)
+        k = len(self.numeric_columns)
+        self.non_null = np.zeros(len(self.columns), dtype=np.int64)
+        self.digests = [TDigest(self.compression) for _ in range(k)]
+        self._count = np.zeros(k)
+        self._mean = np.zeros(k)
+        self._m2 = np.zeros(k)
+        self._min = np.full(k, np.inf)
+        self._max = np.full(k, -np.inf)
+
+    def numeric_values(self, batch: pd.DataFrame) -> np.ndarray:
+        """Numeric columns of a batch as a float block"""
+        return pd.DataFrame({
+            column: pd.to_numeric(batch[column], errors='coerce')
+            for column in self.numeric_columns
+        }, index=batch.index).to_numpy(dtype=float, na_value=np.nan)
+
+    def update(self, batch: pd.DataFrame):
+        """Add one record batch"""
+        if self.columns is None:
+            self._initialize(batch)
+
+        is_null = batch.isna().to_numpy()
+        row_nulls = is_null.sum(axis=1)
+        self.non_null += len(batch) - is_null.sum(axis=0)
+        self.rows_with_missing += int((row_nulls > 0).sum())
+        if self.columns:
+            self.completely_empty_rows += int((row_nulls == len(self.columns)).sum())
+        self.n_rows += len(batch)
+
+        if not self.numeric_columns:
+            return
+
+        values = self.numeric_values(batch)
+        valid = ~np.isnan(values)
+        count = valid.sum(axis=0).astype(float)
+
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', category=RuntimeWarning)
+            mean = np.where(count > 0, np.where(valid, values, 0.0).sum(axis=0) / np.maximum(count, 1), 0.0)
+            m2 = (np.where(valid, values - mean, 0.0) ** 2).sum(axis=0)
+            self._min = np.fmin(self._min, np.nanmin(values, axis=0)) if len(values) else self._min
+            self._max = np.fmax(self._max, np.nanmax(values, axis=0)) if len(values) else self._max
+
+        self._combine_moments(count, mean, m2)
+
+        for j, digest in enumerate(self.digests):
+            digest.update(values[valid[:, j], j])
+
+    def _combine_moments(self, count: np.ndarray, mean: np.ndarray, m2: np.ndarray):
+        """Merge per-column count, mean and sum of squared deviations"""
+        total = self._count + count
+        delta = mean - self._mean
+        with np.errstate(invalid='ignore', divide='ignore'):
+            self._mean = np.where(total > 0, self._mean + delta * count / total, 0.0)
+            self._m2 = self._m2 + m2 + np.where(total > 0, delta ** 2 * self._count * count / total, 0.0)
+        self._count = total
+
+    def merge(self, other: 'ColumnStatsAccumulator') -> 'ColumnStatsAccumulator':
+        """Merge an accumulator built over other batches of the same dataset"""
+        if other.columns is None:
+            return self
+        if self.columns is None:
+            self.columns = list(other.columns)
+            self.numeric_columns = list(other.numeric_columns)
+            self.non_null = other.non_null.copy()
+            self.n_rows = other.n_rows
+            self.rows_with_missing = other.rows_with_missing
+            self.completely_empty_rows = other.completely_empty_rows
+            self.digests = [TDigest(self.compression).merge(d) for d in other.digests]
+            self._count, self._mean, self._m2 = other._count.copy(), other._mean.copy(), other._m2.copy()
+            self._min, self._max = other._min.copy(), other._max.copy()
+            return self
+
+        if other.columns != self.columns:
+            raise ValueError("Cannot merge accumulators over different columns")
+
+        self.non_null += other.non_null
+        self.n_rows += other.n_rows
+        self.rows_with_missing += other.rows_with_missing
+        self.completely_empty_rows += other.completely_empty_rows
+        self._min = np.fmin(self._min, other._min)
+        self._max = np.fmax(self._max, other._max)
+        self._combine_moments(other._count, other._mean, other._m2)
+        for digest, other_digest in zip(self.digests, other.digests):
+            digest.merge(other_digest)
+        return self
+
+    def to_profile(self) -> ColumnProfile:
+        """
+        Build the ColumnProfile of everything accumulated
+
+        Returns:
+            ColumnProfile with t-digest quartiles
+        """
+        columns = self.columns or []
+        count = self._count if self._count is not None else np.zeros(0)
+        has_values = count > 0
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            stats = np.column_stack([
+                count,
+                np.where(has_values, self._mean, np.nan),
+                np.where(count > 1, np.sqrt(self._m2 / np.maximum(count - 1, 1)), np.nan),
+                np.where(has_values, self._min, np.nan),
+                [digest.quantile(0.25) for digest in self.digests],
+                [digest.quantile(0.5) for digest in self.digests],
+                [digest.quantile(0.75) for digest in self.digests],
+                np.where(has_values, self._max, np.nan),
+            ]) if len(count) else np.empty((0, len(ColumnProfiler.STAT_NAMES)))
+
+        non_null = self.non_null if self.non_null is not None else np.zeros(0, dtype=np.int64)
+
+        return ColumnProfile(
+            dataset_hash=None,
+            n_rows=self.n_rows,
+            columns=list(columns),
+            non_null_counts=pd.Series(non_null, index=pd.Index(columns), dtype=np.int64),
+            rows_with_missing=self.rows_with_missing,
+            completely_empty_rows=self.completely_empty_rows,
+            numeric_stats=pd.DataFrame(
+                stats, index=pd.Index(self.numeric_columns), columns=ColumnProfiler.STAT_NAMES
+            )
+        )
+
+
+class RowHashAccumulator:
+    """
+    Accumulate 64-bit row hashes to find exact duplicate rows
+
+    Keeps one hash per row (8 bytes) in row order, so rows sharing a hash
+    can be reported with keep=False semantics, as DataFrame.duplicated.
+    Distinct rows collide with probability about n^2 / 2^65.
+    """
+
+    def __init__(self):
+        """Initialize accumulator"""
+        self._hashes: List[np.ndarray] = []
+
+    def update(self, batch: pd.DataFrame):
+        """Hash the rows of one record batch"""
+        # Hash numbers as floats so an integer column read back as float in
+        # a later batch (e.g. a CSV chunk with nulls) hashes the same
+        numeric = ColumnProfiler.numeric_columns(batch)
+        if numeric:
+            batch = batch.astype({column: float for column in numeric})
+        self._hashes.append(pd.util.hash_pandas_object(batch, index=False).to_numpy())
+
+    def merge(self, other: 'RowHashAccumulator') -> 'RowHashAccumulator':
+        """Append the rows of an accumulator built over later batches"""
+        self._hashes.extend(other._hashes)
+        return self
+
+    def duplicate_mask(self) -> np.ndarray:
+        """Mark rows whose hash occurs more than once"""
+        if not self._hashes:
+            return np.zeros(0, dtype=bool)
+
+        hashes = np.concatenate(self._hashes)
+        self._hashes = [hashes]
+        _, inverse, counts = np.unique(hashes, return_inverse=True, return_counts=True)
+        return counts[inverse] > 1
+
+
+class GroupCountAccumulator:
+    """Accumulate row counts per combination of values of some columns"""
+
+    def __init__(self, columns: List[str]):
+        """
+        Initialize accumulator
+
+        Args:
+            columns: Columns whose value combinations are counted
+        """
+        self.columns = columns
+        self.counts: Optional[pd.Series] = None
+
+    def update(self, batch: pd.DataFrame):
+        """Count the groups of one record batch; rows with nulls are skipped"""
+        if not self.columns:
+            return
+        self._add(batch.groupby(self.columns).size())
+
+    def merge(self, other: 'GroupCountAccumulator') -> 'GroupCountAccumulator':
+        """Add the counts of another accumulator"""
+        if other.counts is not None:
+            self._add(other.counts)
+        return self
+
+    def _add(self, counts: pd.Series):
+        if self.counts is None:
+            self.counts = counts
+        else:
+            self.counts = self.counts.add(counts, fill_value=0).astype(np.int64)
+
+
+class SampleAccumulator:
+    """Keep the first non-null values of every column, as Series.dropna().head() would"""
+
+    def __init__(self, sample_size: int = 1000):
+        """
+        Initialize accumulator
+
+        Args:
+            sample_size: Non-null values kept per column
+        """
+        self.sample_size = sample_size
+        self.samples: Dict[str, List[pd.Series]] = {}
+        self._sizes: Dict[str, int] = {}
+
+    def update(self, batch: pd.DataFrame):
+        """Take values from one record batch until each column is full"""
+        for column in batch.columns:
+            if column not in self.samples:
+                self.samples[column] = [batch[column].iloc[:0]]
+                self._sizes[column] = 0
+
+            needed = self.sample_size - self._sizes[column]
+            if needed > 0:
+                values = batch[column].dropna().head(needed)
+                if len(values) > 0:
+                    self.samples[column].append(values)
+                    self._sizes[column] += len(values)
+
+    def merge(self, other: 'SampleAccumulator') -> 'SampleAccumulator':
+        """Top up the samples with values from an accumulator over later batches"""
+        for column, parts in other.samples.items():
+            self.update(pd.DataFrame({column: pd.concat(parts)}))
+        return self
+
+    def to_frame(self) -> pd.DataFrame:
+        """Samples as one frame, shorter columns padded with nulls"""
+        if not self.samples:
+            return pd.DataFrame()
+        return pd.concat(
+            {column: pd.concat(parts, ignore_index=True) for column, parts in self.samples.items()},
+            axis=1
+        )
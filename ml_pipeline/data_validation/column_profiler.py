@@ -0,0 +1,202 @@
+"""Column Profiler Module - Shared per-column statistics for validators"""
+
+import pandas as pd
+import numpy as np
+import hashlib
+import warnings
+from collections import OrderedDict
+from dataclasses import dataclass
+from typing import Optional, List
+import logging
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ColumnProfile:
+    """Statistics computed once per dataset and shared by the validators"""
+    dataset_hash: Optional[str]
+    n_rows: int
+    columns: List[str]
+    non_null_counts: pd.Series
+    rows_with_missing: int
+    completely_empty_rows: int
+    numeric_stats: pd.DataFrame
+
+    @property
+    def numeric_columns(self) -> List[str]:
+        """Numeric columns in dataset order"""
+        return list(self.numeric_stats.index)
+
+    def matches(self, data: pd.DataFrame) -> bool:
+        """Check that the profile was computed for a frame of this shape"""
+        return len(data) == self.n_rows and list(data.columns) == self.columns
+
+
+class ColumnProfiler:
+    """Compute column statistics in one vectorized pass, cached by dataset hash"""
+
+    STAT_NAMES = ['count', 'mean', 'std', 'min', 'q1', 'median', 'q3', 'max']
+
+    def __init__(self, max_cached_profiles: int = 8, batch_columns: int = 64):
+        """
+        Initialize column profiler
+
+        Args:
+            max_cached_profiles: Number of dataset profiles kept in memory
+            batch_columns: Numeric columns converted and sorted together;
+                bounds the working memory to rows x batch_columns floats
+        """
+        self.max_cached_profiles = max_cached_profiles
+        self.batch_columns = batch_columns
+        self._profiles: "OrderedDict[str, ColumnProfile]" = OrderedDict()
+        logger.info(f"Initialized ColumnProfiler (cache={max_cached_profiles} profiles)")
+
+    def profile(self, data: pd.DataFrame) -> ColumnProfile:
+        """
+        Get the column profile of a dataset, computing it on a cache miss
+
+        Args:
+            data: DataFrame to profile
+
+        Returns:
+            ColumnProfile for the dataset
+        """
+        dataset_hash = self.dataset_hash(data)
+
+        if dataset_hash is not None and dataset_hash in self._profiles:
+            self._profiles.move_to_end(dataset_hash)
+            logger.info(f"Using cached column profile {dataset_hash[:12]}")
+            return self._profiles[dataset_hash]
+
+        profile = self.compute_profile(data, dataset_hash)
+
+        if dataset_hash is not None and self.max_cached_profiles > 0:
+            self._profiles[dataset_hash] = profile
+            while len(self._profiles) > self.max_cached_profiles:
+                self._profiles.popitem(last=False)
+
+        return profile
+
+    def clear_cache(self):
+        """Drop all cached profiles"""
+        self._profiles.clear()
+
+    @staticmethod
+    def dataset_hash(data: pd.DataFrame) -> Optional[str]:
+        """
+        Hash a dataset by column names, dtypes, index and values
+
+        Args:
+            data: DataFrame to hash
+
+        Returns:
+            Hex SHA-256 digest, or None if the values cannot be hashed
+        """
+        try:
+            row_hashes = pd.util.hash_pandas_object(data, index=True).to_numpy()
+        except TypeError:
+            # Unhashable cell values (lists, dicts); profile without caching
+            return None
+
+        digest = hashlib.sha256()
+        for column, dtype in data.dtypes.items():
+            digest.update(f"{column}|{dtype}|".encode())
+        digest.update(np.ascontiguousarray(row_hashes).tobytes())
+        return digest.hexdigest()
+
+    @staticmethod
+    def numeric_columns(data: pd.DataFrame) -> List[str]:
+        """Real-valued numeric columns (booleans excluded), in dataset order"""
+        return [
+            column for column, dtype in data.dtypes.items()
+            if pd.api.types.is_numeric_dtype(dtype)
+            and not pd.api.types.is_bool_dtype(dtype)
+            and not pd.api.types.is_complex_dtype(dtype)
+        ]
+    
+    def compute_profile(self, data: pd.DataFrame,
+                        dataset_hash: Optional[str] = None) -> ColumnProfile:
+        """
+        Compute null counts for every column and statistics for numeric columns
+
+        Numeric columns are converted to float blocks of batch_columns
+        columns and sorted once. Counts, means and standard deviations come
+        from the block, and min, max and quartiles are read off the sorted
+        block with the same linear interpolation as Series.quantile.
+
+        Args:
+            data: DataFrame to profile
+            dataset_hash: Hash to record in the profile
+
+        Returns:
+            ColumnProfile for the dataset
+        """
+        n_rows = len(data)
+        numeric_cols = self.numeric_columns(data)
+        numeric_set = set(numeric_cols)
+        other_cols = [col for col in data.columns if col not in numeric_set]
+
+        logger.info(f"Profiling {len(data.columns)} columns ({len(numeric_cols)} numeric)")
+
+        non_null = pd.Series(0, index=data.columns, dtype=np.int64)
+        row_nulls = np.zeros(n_rows, dtype=np.int64)
+
+        if other_cols:
+            is_null = data[other_cols].isna().to_numpy()
+            non_null[other_cols] = n_rows - is_null.sum(axis=0)
+            row_nulls += is_null.sum(axis=1)
+
+        stats = np.full((len(numeric_cols), len(self.STAT_NAMES)), np.nan)
+
+        for start in range(0, len(numeric_cols), self.batch_columns):
+            batch = numeric_cols[start:start + self.batch_columns]
+            values = data[batch].to_numpy(dtype=float, na_value=np.nan)
+            is_null = np.isnan(values)
+            row_nulls += is_null.sum(axis=1)
+
+            count = n_rows - is_null.sum(axis=0)
+            non_null[batch] = count
+            stats[start:start + len(batch)] = self._numeric_stats(values, is_null, count)
+
+        n_columns = len(data.columns)
+
+        return ColumnProfile(
+            dataset_hash=dataset_hash,
+            n_rows=n_rows,
+            columns=list(data.columns),
+            non_null_counts=non_null,
+            rows_with_missing=int((row_nulls > 0).sum()),
+            completely_empty_rows=int((row_nulls == n_columns).sum()) if n_columns > 0 else 0,
+            numeric_stats=pd.DataFrame(stats, index=pd.Index(numeric_cols), columns=self.STAT_NAMES)
+        )
+
+    @staticmethod
+    def _numeric_stats(values: np.ndarray, is_null: np.ndarray,
+                       count: np.ndarray) -> np.ndarray:
+        """Statistics of each column of a float block, as rows of STAT_NAMES"""
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', category=RuntimeWarning)
+            total = np.where(is_null, 0.0, values).sum(axis=0)
+            mean = np.where(count > 0, total / np.maximum(count, 1), np.nan)
+            squares = (np.where(is_null, 0.0, values - mean) ** 2).sum(axis=0)
+            std = np.where(count > 1, np.sqrt(squares / np.maximum(count - 1, 1)), np.nan)
+
+        # NaNs sort to the end, so each column's valid values are its first
+        # count entries
+        ordered = np.sort(values, axis=0)
+
+        def quantile(q: float) -> np.ndarray:
+            position = np.maximum(count - 1, 0) * q
+            lower = np.floor(position).astype(np.int64)
+            upper = np.ceil(position).astype(np.int64)
+            cols = np.arange(values.shape[1])
+            low_values = ordered[lower, cols] if len(ordered) else np.full(len(cols), np.nan)
+            high_values = ordered[upper, cols] if len(ordered) else np.full(len(cols), np.nan)
+            result = low_values + (high_values - low_values) * (position - lower)
+            return np.where(count > 0, result, np.nan)
+
+        return np.column_stack([
+            count, mean, std,
+            quantile(0.0), quantile(0.25), quantile(0.5), quantile(0.75), quantile(1.0)
+        ])
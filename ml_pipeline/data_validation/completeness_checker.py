@@ -2,9 +2,11 @@
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple
+from typing import Dict, List, Tuple, Optional
 import logging
 
+from .column_profiler import ColumnProfile
+
 logger = logging.getLogger(__name__)
 
 
@@ -21,18 +23,34 @@ class CompletenessChecker:
         self.completeness_threshold = completeness_threshold
         logger.info(f"Initialized CompletenessChecker with threshold={completeness_threshold*100}%")
     
-    def calculate_completeness(self, data: pd.DataFrame) -> Dict[str, float]:
+    @staticmethod
+    def _shape(data: pd.DataFrame, profile: Optional[ColumnProfile] = None) -> Tuple[int, int]:
+        """Rows and columns of the dataset, taken from the profile when given"""
+        if profile is not None:
+            return profile.n_rows, len(profile.columns)
+        return data.shape
+    
+    def calculate_completeness(self, data: pd.DataFrame,
+                               profile: Optional[ColumnProfile] = None) -> Dict[str, float]:
         """
         Calculate percentage of non-null values per column
         
         Args:
             data: DataFrame to analyze
+            profile: Precomputed column profile of data (optional)
             
         Returns:
             Dictionary mapping column names to completeness percentages
         """
         logger.info(f"Calculating completeness for {len(data.columns)} columns")
         
+        if profile is not None:
+            total_count = profile.n_rows
+            return {
+                column: (count / total_count if total_count > 0 else 0.0)
+                for column, count in profile.non_null_counts.items()
+            }
+        
         completeness = {}
         
         for column in data.columns:
@@ -43,18 +61,24 @@ class CompletenessChecker:
         
         return completeness
     
-    def get_overall_completeness(self, data: pd.DataFrame) -> float:
+    def get_overall_completeness(self, data: pd.DataFrame,
+                                 profile: Optional[ColumnProfile] = None) -> float:
         """
         Calculate overall dataset completeness
         
         Args:
             data: DataFrame to analyze
+            profile: Precomputed column profile of data (optional)
             
         Returns:
             Overall completeness percentage (0.0 to 1.0)
         """
-        total_cells = data.size
-        non_null_cells = data.notna().sum().sum()
+        n_rows, n_columns = self._shape(data, profile)
+        total_cells = n_rows * n_columns
+        if profile is not None:
+            non_null_cells = profile.non_null_counts.sum()
+        else:
+            non_null_cells = data.notna().sum().sum()
         
         overall = non_null_cells / total_cells if total_cells > 0 else 0.0
         
@@ -62,13 +86,15 @@ class CompletenessChecker:
         return overall
     
     def identify_incomplete_columns(self, data: pd.DataFrame,
-                                   threshold: float = None) -> List[str]:
+                                   threshold: float = None,
+                                   profile: Optional[ColumnProfile] = None) -> List[str]:
         """
         Identify columns below completeness threshold
         
         Args:
             data: DataFrame to analyze
             threshold: Completeness threshold (uses instance threshold if None)
+            profile: Precomputed column profile of data (optional)
             
         Returns:
             List of column names below threshold
@@ -76,7 +102,7 @@ class CompletenessChecker:
         if threshold is None:
             threshold = self.completeness_threshold
         
-        completeness = self.calculate_completeness(data)
+        completeness = self.calculate_completeness(data, profile=profile)
         
         incomplete_columns = [
             col for col, pct in completeness.items()
@@ -90,12 +116,14 @@ class CompletenessChecker:
         
         return incomplete_columns
     
-    def validate_dataset_completeness(self, data: pd.DataFrame) -> Tuple[bool, Dict]:
+    def validate_dataset_completeness(self, data: pd.DataFrame,
+                                      profile: Optional[ColumnProfile] = None) -> Tuple[bool, Dict]:
         """
         Validate that dataset meets completeness requirements
         
         Args:
             data: DataFrame to validate
+            profile: Precomputed column profile of data (optional)
             
         Returns:
             Tuple of (validation_passed, details_dict)
@@ -103,9 +131,10 @@ class CompletenessChecker:
         logger.info("Validating dataset completeness")
         
         # Calculate completeness metrics
-        column_completeness = self.calculate_completeness(data)
-        overall_completeness = self.get_overall_completeness(data)
-        incomplete_columns = self.identify_incomplete_columns(data)
+        column_completeness = self.calculate_completeness(data, profile=profile)
+        overall_completeness = self.get_overall_completeness(data, profile=profile)
+        incomplete_columns = self.identify_incomplete_columns(data, profile=profile)
+        n_rows, n_columns = self._shape(data, profile)
         
         # Check if dataset passes
         passes_validation = overall_completeness >= self.completeness_threshold
@@ -114,8 +143,8 @@ class CompletenessChecker:
             'overall_completeness': overall_completeness,
             'threshold': self.completeness_threshold,
             'validation_passed': passes_validation,
-            'total_columns': len(data.columns),
-            'total_rows': len(data),
+            'total_columns': n_columns,
+            'total_rows': n_rows,
             'incomplete_columns': incomplete_columns,
             'incomplete_columns_count': len(incomplete_columns),
             'column_completeness': column_completeness
@@ -128,57 +157,71 @@ class CompletenessChecker:
         
         return passes_validation, details
     
-    def get_missing_value_patterns(self, data: pd.DataFrame) -> Dict:
+    def get_missing_value_patterns(self, data: pd.DataFrame,
+                                   profile: Optional[ColumnProfile] = None) -> Dict:
         """
         Analyze missing value patterns in the dataset
         
         Args:
             data: DataFrame to analyze
+            profile: Precomputed column profile of data (optional)
             
         Returns:
             Dictionary with missing value pattern analysis
         """
         logger.info("Analyzing missing value patterns")
         
+        n_rows, n_columns = self._shape(data, profile)
+        total_cells = n_rows * n_columns
+        
         # Count missing values per column
-        missing_counts = data.isnull().sum()
-        missing_percentages = (missing_counts / len(data) * 100).round(2)
+        if profile is not None:
+            missing_counts = profile.n_rows - profile.non_null_counts
+        else:
+            missing_counts = data.isnull().sum()
+        missing_percentages = (missing_counts / n_rows * 100).round(2)
         
         # Identify columns with no missing values
         complete_columns = missing_counts[missing_counts == 0].index.tolist()
         
         # Identify columns with all missing values
-        empty_columns = missing_counts[missing_counts == len(data)].index.tolist()
-        
-        # Count rows with any missing values
-        rows_with_missing = data.isnull().any(axis=1).sum()
+        empty_columns = missing_counts[missing_counts == n_rows].index.tolist()
         
-        # Count completely empty rows
-        completely_empty_rows = data.isnull().all(axis=1).sum()
+        if profile is not None:
+            rows_with_missing = profile.rows_with_missing
+            completely_empty_rows = profile.completely_empty_rows
+        else:
+            # Count rows with any missing values
+            rows_with_missing = data.isnull().any(axis=1).sum()
+            
+            # Count completely empty rows
+            completely_empty_rows = data.isnull().all(axis=1).sum()
         
         patterns = {
             'total_missing_values': int(missing_counts.sum()),
-            'total_cells': data.size,
-            'missing_percentage': float(missing_counts.sum() / data.size * 100),
+            'total_cells': total_cells,
+            'missing_percentage': float(missing_counts.sum() / total_cells * 100),
             'columns_with_missing': int((missing_counts > 0).sum()),
             'complete_columns': complete_columns,
             'complete_columns_count': len(complete_columns),
             'empty_columns': empty_columns,
             'empty_columns_count': len(empty_columns),
             'rows_with_missing': int(rows_with_missing),
-            'rows_with_missing_percentage': float(rows_with_missing / len(data) * 100),
+            'rows_with_missing_percentage': float(rows_with_missing / n_rows * 100),
             'completely_empty_rows': int(completely_empty_rows),
             'missing_by_column': missing_percentages.to_dict()
         }
         
         return patterns
     
-    def generate_completeness_report(self, data: pd.DataFrame) -> Dict:
+    def generate_completeness_report(self, data: pd.DataFrame,
+                                     profile: Optional[ColumnProfile] = None) -> Dict:
         """
         Generate comprehensive completeness report
         
         Args:
             data: DataFrame to analyze
+            profile: Precomputed column profile of data (optional)
             
         Returns:
             Dictionary with complete analysis
@@ -186,13 +229,14 @@ class CompletenessChecker:
         logger.info("Generating completeness report")
         
         # Validate completeness
-        validation_passed, validation_details = self.validate_dataset_completeness(data)
+        validation_passed, validation_details = self.validate_dataset_completeness(data, profile=profile)
         
         # Get missing value patterns
-        patterns = self.get_missing_value_patterns(data)
+        patterns = self.get_missing_value_patterns(data, profile=profile)
         
         # Get top incomplete columns
-        column_completeness = self.calculate_completeness(data)
+        column_completeness = validation_details['column_completeness']
+        n_rows, n_columns = self._shape(data, profile)
         sorted_completeness = sorted(column_completeness.items(), key=lambda x: x[1])
         top_incomplete = [
             {'column': col, 'completeness': pct}
@@ -202,9 +246,9 @@ class CompletenessChecker:
         report = {
             'timestamp': pd.Timestamp.now().isoformat(),
             'dataset_info': {
-                'rows': len(data),
-                'columns': len(data.columns),
-                'total_cells': data.size
+                'rows': n_rows,
+                'columns': n_columns,
+                'total_cells': n_rows * n_columns
             },
             'validation': validation_details,
             'missing_patterns': patterns,
@@ -228,18 +272,20 @@ class CompletenessChecker:
         return f"Dataset completeness ({patterns['missing_percentage']:.1f}% missing) is below threshold. Consider imputation strategies or additional data collection."
     
     def suggest_columns_to_drop(self, data: pd.DataFrame,
-                               drop_threshold: float = 0.50) -> List[str]:
+                               drop_threshold: float = 0.50,
+                               profile: Optional[ColumnProfile] = None) -> List[str]:
         """
         Suggest columns that should be dropped due to low completeness
         
         Args:
             data: DataFrame to analyze
             drop_threshold: Threshold below which columns should be dropped
+            profile: Precomputed column profile of data (optional)
             
         Returns:
             List of column names to consider dropping
         """
-        completeness = self.calculate_completeness(data)
+        completeness = self.calculate_completeness(data, profile=profile)
         
         columns_to_drop = [
             col for col, pct in completeness.items()
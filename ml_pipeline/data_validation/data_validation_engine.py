@@ -13,6 +13,8 @@ from .range_validator import RangeValidator
 from .duplicate_detector import DuplicateDetector
 from .temporal_validator import TemporalValidator
 from .quality_reporter import QualityReporter
+from .column_profiler import ColumnProfiler
+from .streaming_validator import StreamingValidator
 
 logger = logging.getLogger(__name__)
 
@@ -40,6 +42,8 @@ class DataValidationEngine:
         self.duplicate_detector = DuplicateDetector()
         self.temporal_validator = TemporalValidator()
         self.quality_reporter = QualityReporter()
+        self.column_profiler = ColumnProfiler()
+        self.streaming_validator = StreamingValidator(self.quality_reporter)
         
         self.completeness_threshold = completeness_threshold
         self.k_anonymity_threshold = k_anonymity_threshold
@@ -68,14 +72,63 @@ class DataValidationEngine:
         logger.info(f"Starting validation for dataset: {dataset_name}")
         logger.info(f"Dataset shape: {data.shape}")
         
+        # Profile columns once; every validator reads statistics from it
+        profile = self.column_profiler.profile(data)
+        
         # Generate comprehensive quality report
         report = self.quality_reporter.generate_comprehensive_report(
             data=data,
             dataset_name=dataset_name,
             patient_id_col=patient_id_col,
+            visit_date_col=visit_date_col,
+            profile=profile
+        )
+        
+        return self._apply_validation_status(report, dataset_name, strict_mode)
+    
+    def validate_file(self,
+                      path: Path,
+                      dataset_name: str = "Unknown",
+                      patient_id_col: Optional[str] = None,
+                      visit_date_col: Optional[str] = None,
+                      strict_mode: bool = True,
+                      batch_size: Optional[int] = None) -> Dict:
+        """
+        Validate a Parquet or CSV file in record batches without loading it
+        
+        Produces the same report as validate_dataset. The file is read
+        twice; memory grows with the number of columns, the patient and
+        visit columns and one 8-byte hash per row, not with the full data.
+        Quartiles used for IQR outliers are t-digest estimates.
+        
+        Args:
+            path: Parquet or CSV file to validate
+            dataset_name: Name of the dataset
+            patient_id_col: Name of patient ID column (optional)
+            visit_date_col: Name of visit date column (optional)
+            strict_mode: If True, fail on any validation error
+            batch_size: Rows per record batch (default: the streaming validator's)
+            
+        Returns:
+            Dictionary with validation results and quality report
+        """
+        logger.info(f"Starting streaming validation for dataset: {dataset_name} ({path})")
+        
+        if batch_size is not None:
+            self.streaming_validator.batch_size = batch_size
+        
+        report = self.streaming_validator.validate(
+            path,
+            dataset_name=dataset_name,
+            patient_id_col=patient_id_col,
             visit_date_col=visit_date_col
         )
         
+        return self._apply_validation_status(report, dataset_name, strict_mode)
+    
+    def _apply_validation_status(self, report: Dict, dataset_name: str,
+                                 strict_mode: bool) -> Dict:
+        """Decide whether a quality report passes and record it in the report"""
         # Determine if validation passed
         if strict_mode:
             validation_passed = (
@@ -236,7 +289,8 @@ class DataValidationEngine:
             data=data,
             dataset_name=dataset_name,
             patient_id_col=patient_id_col,
-            visit_date_col=visit_date_col
+            visit_date_col=visit_date_col,
+            profile=self.column_profiler.profile(data)
         )
         
         if output_path:
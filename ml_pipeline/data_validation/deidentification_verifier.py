@@ -2,7 +2,7 @@
 
 import pandas as pd
 import numpy as np
-from typing import List, Dict, Tuple, Set
+from typing import List, Dict, Tuple, Set, Optional
 from collections import Counter
 import logging
 
@@ -162,6 +162,29 @@ class DeidentificationVerifier:
         # Group by quasi-identifiers and count occurrences
         try:
             grouped = data.groupby(quasi_identifiers).size()
+        except Exception as e:
+            logger.error(f"Error checking k-anonymity: {str(e)}")
+            return {
+                'k_anonymity_satisfied': False,
+                'error': str(e),
+                'quasi_identifiers': quasi_identifiers
+            }
+        
+        return self.k_anonymity_from_group_sizes(grouped, quasi_identifiers)
+    
+    def k_anonymity_from_group_sizes(self, grouped: pd.Series,
+                                     quasi_identifiers: List[str]) -> Dict:
+        """
+        Check k-anonymity from equivalence class sizes
+        
+        Args:
+            grouped: Number of rows per combination of quasi-identifier values
+            quasi_identifiers: Quasi-identifier columns the groups were formed on
+            
+        Returns:
+            Dictionary with k-anonymity results
+        """
+        try:
             min_k = grouped.min()
             max_k = grouped.max()
             mean_k = grouped.mean()
@@ -302,12 +325,20 @@ class DeidentificationVerifier:
         logger.info("ZIP code generalization verified")
         return True, {}
     
-    def comprehensive_verification(self, data: pd.DataFrame) -> Dict:
+    def comprehensive_verification(self, data: pd.DataFrame,
+                                   k_anonymity_result: Optional[Dict] = None,
+                                   age_data: Optional[pd.DataFrame] = None) -> Dict:
         """
         Perform comprehensive de-identification verification
         
+        When data is only a sample of a larger dataset, k-anonymity and age
+        generalization, which need every row, can be supplied separately.
+        
         Args:
             data: DataFrame to verify
+            k_anonymity_result: Precomputed check_k_anonymity result (optional)
+            age_data: Frame with every value over 89 of the age columns,
+                used for the age check instead of data (optional)
             
         Returns:
             Dictionary with all verification results
@@ -321,10 +352,11 @@ class DeidentificationVerifier:
         dates_ok, date_issues = self.verify_date_generalization(data)
         
         # Check k-anonymity
-        k_anonymity_result = self.check_k_anonymity(data)
+        if k_anonymity_result is None:
+            k_anonymity_result = self.check_k_anonymity(data)
         
         # Check age generalization
-        age_ok, age_issues = self.verify_age_generalization(data)
+        age_ok, age_issues = self.verify_age_generalization(data if age_data is None else age_data)
         
         # Check ZIP code generalization
         zip_ok, zip_issues = self.verify_zip_code_generalization(data)
@@ -2,8 +2,9 @@
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple, Optional
+from typing import Dict, Iterator, List, Tuple, Optional
 import logging
+import warnings
 
 logger = logging.getLogger(__name__)
 
@@ -11,6 +12,20 @@ logger = logging.getLogger(__name__)
 class DuplicateDetector:
     """Detect duplicate patient records and visits"""
     
+    # Hash tables of fuzzy matching; each keys rows by the bins of a few
+    # randomly chosen columns
+    FUZZY_TABLES = 32
+    FUZZY_TABLE_COLUMNS = 8
+    
+    # Bin width in multiples of the largest mean difference (1 - threshold)
+    FUZZY_BIN_RADII = 5.0
+    
+    # Cell of a missing value; rows only share it with rows missing that column
+    FUZZY_MISSING_CELL = np.iinfo(np.int64).min
+    
+    # Candidate pairs expanded and scored per batch
+    FUZZY_BATCH_PAIRS = 1_000_000
+    
     def __init__(self):
         """Initialize duplicate detector"""
         logger.info("Initialized DuplicateDetector")
@@ -35,20 +50,38 @@ class DuplicateDetector:
         else:
             duplicates = data.duplicated(keep=False)
         
+        return self.exact_duplicates_from_mask(
+            duplicates.to_numpy(), data.index, subset if subset else list(data.columns)
+        )
+    
+    def exact_duplicates_from_mask(self, duplicates: np.ndarray,
+                                   index: pd.Index,
+                                   columns_checked: List[str]) -> Dict:
+        """
+        Build the exact duplicate result from a row mask
+        
+        Args:
+            duplicates: Boolean mask of rows that have an identical row
+            index: Row labels of the dataset
+            columns_checked: Columns the rows were compared on
+            
+        Returns:
+            Dictionary with duplicate detection results
+        """
         duplicate_count = duplicates.sum()
         
         result = {
             'method': 'exact',
             'duplicate_rows': int(duplicate_count),
-            'duplicate_percentage': float(duplicate_count / len(data) * 100),
-            'unique_rows': int(len(data) - duplicate_count),
-            'total_rows': len(data),
-            'columns_checked': subset if subset else list(data.columns)
+            'duplicate_percentage': float(duplicate_count / len(index) * 100),
+            'unique_rows': int(len(index) - duplicate_count),
+            'total_rows': len(index),
+            'columns_checked': columns_checked
         }
         
         if duplicate_count > 0:
             # Get indices of duplicate rows
-            duplicate_indices = data[duplicates].index.tolist()
+            duplicate_indices = index[duplicates].tolist()
             result['duplicate_indices'] = duplicate_indices
             logger.warning(f"Found {duplicate_count} exact duplicate rows")
         else:
@@ -159,14 +192,24 @@ class DuplicateDetector:
     
     def detect_fuzzy_duplicates(self, data: pd.DataFrame,
                                columns: List[str],
-                               threshold: float = 0.95) -> Dict:
+                               threshold: float = 0.95,
+                               block_by: Optional[List[str]] = None,
+                               max_pairs: int = 20) -> Dict:
         """
         Detect fuzzy/near duplicates based on similarity threshold
         
+        Similarity is 1 minus the mean absolute difference of min-max
+        normalized values over the columns both rows have. Every row is
+        considered; see find_fuzzy_duplicate_pairs for how candidates are
+        generated and which pairs can be missed.
+        
         Args:
             data: DataFrame to analyze
             columns: Columns to compare for similarity
             threshold: Similarity threshold (0.0 to 1.0)
+            block_by: Columns whose values must match for rows to be compared
+                (e.g. patient ID or cohort)
+            max_pairs: Number of pairs to include in the result
             
         Returns:
             Dictionary with fuzzy duplicate results
@@ -174,7 +217,7 @@ class DuplicateDetector:
         logger.info(f"Detecting fuzzy duplicates with threshold={threshold}")
         
         # Check if columns exist
-        missing_cols = [col for col in columns if col not in data.columns]
+        missing_cols = [col for col in columns + (block_by or []) if col not in data.columns]
         if missing_cols:
             return {
                 'error': f"Columns not found: {missing_cols}",
@@ -190,54 +233,202 @@ class DuplicateDetector:
                 'provided_columns': columns
             }
         
-        # Normalize numeric columns
-        normalized_data = data[numeric_cols].copy()
-        for col in numeric_cols:
-            col_min = normalized_data[col].min()
-            col_max = normalized_data[col].max()
-            if col_max > col_min:
-                normalized_data[col] = (normalized_data[col] - col_min) / (col_max - col_min)
-        
-        # Find similar pairs (simplified approach for demonstration)
-        # In production, use more sophisticated methods like LSH or clustering
-        similar_pairs = []
-        
-        # Sample for performance (compare first 1000 rows)
-        sample_size = min(1000, len(data))
-        sample_indices = data.index[:sample_size]
-        
-        for i in range(len(sample_indices)):
-            for j in range(i + 1, len(sample_indices)):
-                idx_i = sample_indices[i]
-                idx_j = sample_indices[j]
-                
-                # Calculate similarity (1 - normalized distance)
-                diff = np.abs(normalized_data.loc[idx_i] - normalized_data.loc[idx_j])
-                similarity = 1 - diff.mean()
-                
-                if similarity >= threshold:
-                    similar_pairs.append({
-                        'index_1': int(idx_i),
-                        'index_2': int(idx_j),
-                        'similarity': float(similarity)
-                    })
+        pairs, candidate_count = self._fuzzy_pairs(data, numeric_cols, threshold, block_by)
         
         result = {
             'method': 'fuzzy',
             'threshold': threshold,
             'columns_compared': numeric_cols,
-            'rows_analyzed': sample_size,
-            'similar_pairs_found': len(similar_pairs),
-            'similar_pairs': similar_pairs[:20]  # Return top 20
+            'blocking_columns': block_by or [],
+            'rows_analyzed': len(data),
+            'candidate_pairs': candidate_count,
+            'similar_pairs_found': len(pairs),
+            'similar_pairs': pairs.head(max_pairs).to_dict('records')
         }
         
-        if similar_pairs:
-            logger.warning(f"Found {len(similar_pairs)} fuzzy duplicate pairs")
+        if len(pairs) > 0:
+            logger.warning(f"Found {len(pairs)} fuzzy duplicate pairs")
         else:
             logger.info("No fuzzy duplicates found")
         
         return result
     
+    def find_fuzzy_duplicate_pairs(self, data: pd.DataFrame,
+                                   columns: List[str],
+                                   threshold: float = 0.95,
+                                   block_by: Optional[List[str]] = None) -> pd.DataFrame:
+        """
+        Find near-duplicate row pairs
+        
+        Candidate pairs come from locality-sensitive hash tables. Each table
+        bins a few randomly chosen normalized columns, with bins several
+        similarity radii wide, and rows landing in the same bins of any table
+        become candidates. Every row is hashed once per table, so the work
+        grows with the number of rows plus candidates instead of all pairs.
+        Candidates are then scored exactly in vectorized batches, so every
+        reported pair meets the threshold.
+        
+        Matching is probabilistic but seeded, so results are repeatable.
+        Rows closer than the threshold share a table with high probability;
+        pairs just above the threshold, or missing different columns (a
+        missing value only shares a bin with other missing values), can be
+        missed.
+        
+        Args:
+            data: DataFrame to analyze
+            columns: Numeric columns to compare
+            threshold: Similarity threshold (0.0 to 1.0)
+            block_by: Columns whose values must match for rows to be compared
+            
+        Returns:
+            DataFrame with index_1, index_2 (row labels, in row order) and similarity
+        """
+        pairs, _ = self._fuzzy_pairs(data, columns, threshold, block_by)
+        return pairs
+    
+    def _fuzzy_pairs(self, data: pd.DataFrame,
+                     columns: List[str],
+                     threshold: float,
+                     block_by: Optional[List[str]]) -> Tuple[pd.DataFrame, int]:
+        """
+        Generate candidate pairs from binned hash tables and score them
+        
+        Each table bins FUZZY_TABLE_COLUMNS randomly chosen columns with a
+        random offset, and rows whose bins and block all match become
+        candidates. A row is only entered in tables where it has at least
+        half of the columns, so sparse rows do not pile into one bucket.
+        
+        Returns:
+            Tuple of (pairs DataFrame, number of candidate pairs scored)
+        """
+        values = self._normalize_for_similarity(data, columns)
+        n_rows, n_cols = values.shape
+        
+        if block_by:
+            blocks = data.groupby(block_by, dropna=False, sort=False).ngroup().to_numpy()
+        else:
+            blocks = np.zeros(n_rows, dtype=np.int64)
+        
+        observed = ~np.isnan(values)
+        filled = np.nan_to_num(values, nan=0.0)
+        width = max(self.FUZZY_BIN_RADII * (1.0 - threshold), 1e-12)
+        rng = np.random.default_rng(0)
+        
+        found = []
+        candidate_count = 0
+        
+        for _ in range(self.FUZZY_TABLES):
+            table_cols = rng.integers(0, n_cols, self.FUZZY_TABLE_COLUMNS)
+            offsets = rng.random(self.FUZZY_TABLE_COLUMNS) * width
+            
+            table_observed = observed[:, table_cols]
+            rows = np.flatnonzero(2 * table_observed.sum(axis=1) >= self.FUZZY_TABLE_COLUMNS)
+            cells = np.where(
+                table_observed[rows],
+                np.floor((filled[np.ix_(rows, table_cols)] + offsets) / width),
+                self.FUZZY_MISSING_CELL
+            ).astype(np.int64)
+            
+            for i, j in self._bucket_join(rows, self._cell_keys(cells, blocks[rows])):
+                # Drop hash collisions across blocks before scoring
+                same_block = blocks[i] == blocks[j]
+                i, j = i[same_block], j[same_block]
+                candidate_count += len(i)
+                
+                with warnings.catch_warnings():
+                    warnings.simplefilter('ignore', category=RuntimeWarning)
+                    similarity = 1 - np.nanmean(np.abs(values[i] - values[j]), axis=1)
+                
+                keep = similarity >= threshold
+                found.append((i[keep], j[keep], similarity[keep]))
+        
+        if found:
+            first = np.concatenate([f[0] for f in found])
+            second = np.concatenate([f[1] for f in found])
+            similarity = np.concatenate([f[2] for f in found])
+            
+            # Sort in row order; a pair can share buckets in several tables
+            _, unique = np.unique(first * n_rows + second, return_index=True)
+            first, second, similarity = first[unique], second[unique], similarity[unique]
+        else:
+            first = second = np.array([], dtype=np.int64)
+            similarity = np.array([])
+        
+        pairs = pd.DataFrame({
+            'index_1': data.index[first].tolist(),
+            'index_2': data.index[second].tolist(),
+            'similarity': similarity.astype(float)
+        })
+        
+        return pairs, candidate_count
+    
+    def _bucket_join(self, rows: np.ndarray,
+                     keys: np.ndarray) -> Iterator[Tuple[np.ndarray, np.ndarray]]:
+        """
+        Pair up rows that have the same bucket key
+        
+        Args:
+            rows: Row positions
+            keys: Bucket key of each row
+            
+        Yields:
+            Tuples of row position arrays of candidate pairs (first < second),
+            at most FUZZY_BATCH_PAIRS pairs per batch unless one row has more
+            matches
+        """
+        order = np.argsort(keys, kind='stable')
+        sorted_rows = rows[order]
+        sorted_keys = keys[order]
+        
+        # Each row is paired with the rows after it in its run of equal keys
+        run_starts = np.flatnonzero(np.r_[True, sorted_keys[1:] != sorted_keys[:-1]])
+        run_ends = np.r_[run_starts[1:], len(sorted_keys)]
+        run_lengths = np.diff(np.r_[run_starts, len(sorted_keys)])
+        counts = np.repeat(run_ends, run_lengths) - np.arange(len(sorted_keys)) - 1
+        
+        total = int(counts.sum())
+        if total == 0:
+            return
+        
+        # Split rows so each batch expands to about FUZZY_BATCH_PAIRS pairs
+        ends = np.cumsum(counts)
+        splits = np.searchsorted(ends, np.arange(self.FUZZY_BATCH_PAIRS, total, self.FUZZY_BATCH_PAIRS))
+        
+        for batch in np.split(np.arange(len(sorted_keys)), np.unique(splits + 1)):
+            batch_counts = counts[batch]
+            if not batch_counts.any():
+                continue
+            
+            # Expand each row's (position, position + count] match range
+            i = np.repeat(sorted_rows[batch], batch_counts)
+            starts = np.repeat(batch + 1 - np.cumsum(batch_counts) + batch_counts, batch_counts)
+            j = sorted_rows[np.arange(batch_counts.sum()) + starts]
+            
+            yield np.minimum(i, j), np.maximum(i, j)
+    
+    @staticmethod
+    def _cell_keys(cells: np.ndarray, blocks: np.ndarray) -> np.ndarray:
+        """Hash grid cell coordinates and block ID to one uint64 key per row"""
+        keys = blocks.astype(np.uint64)
+        for k in range(cells.shape[1]):
+            keys = keys * np.uint64(0x9E3779B97F4A7C15) + cells[:, k].astype(np.uint64)
+            keys ^= keys >> np.uint64(29)
+        return keys
+    
+    @staticmethod
+    def _normalize_for_similarity(data: pd.DataFrame, columns: List[str]) -> np.ndarray:
+        """Min-max normalize columns; constant columns are left as they are"""
+        values = data[columns].to_numpy(dtype=float, na_value=np.nan, copy=True)
+        
+        with warnings.catch_warnings():
+            warnings.simplefilter('ignore', category=RuntimeWarning)
+            col_min = np.nanmin(values, axis=0)
+            col_max = np.nanmax(values, axis=0)
+        
+        scale = col_max > col_min
+        values[:, scale] = (values[:, scale] - col_min[scale]) / (col_max[scale] - col_min[scale])
+        return values
+    
     def remove_duplicates(self, data: pd.DataFrame,
                          subset: Optional[List[str]] = None,
                          keep: str = 'first') -> Tuple[pd.DataFrame, Dict]:
@@ -276,7 +467,8 @@ class DuplicateDetector:
     
     def comprehensive_duplicate_check(self, data: pd.DataFrame,
                                      patient_id_col: Optional[str] = None,
-                                     visit_date_col: Optional[str] = None) -> Dict:
+                                     visit_date_col: Optional[str] = None,
+                                     exact_duplicates: Optional[Dict] = None) -> Dict:
         """
         Perform comprehensive duplicate detection
         
@@ -284,6 +476,8 @@ class DuplicateDetector:
             data: DataFrame to analyze
             patient_id_col: Name of patient ID column (optional)
             visit_date_col: Name of visit date column (optional)
+            exact_duplicates: Precomputed exact duplicate result, when data
+                holds only the patient and visit columns (optional)
             
         Returns:
             Dictionary with all duplicate detection results
@@ -299,9 +493,13 @@ class DuplicateDetector:
         }
         
         # Check exact duplicates
-        exact_duplicates = self.detect_exact_duplicates(data)
+        if exact_duplicates is None:
+            exact_duplicates = self.detect_exact_duplicates(data)
         results['exact_duplicates'] = exact_duplicates
-        
+
+        patient_duplicates = None
+        visit_duplicates = None
+
         # Check patient duplicates if column provided
         if patient_id_col:
             patient_duplicates = self.detect_patient_duplicates(data, patient_id_col)
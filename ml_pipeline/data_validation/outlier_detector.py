@@ -2,10 +2,13 @@
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Tuple
+import warnings
+from typing import Dict, List, Tuple, Optional
 from scipy import stats
 import logging
 
+from .column_profiler import ColumnProfile
+
 logger = logging.getLogger(__name__)
 
 
@@ -165,7 +168,8 @@ class OutlierDetector:
     
     def detect_outliers_dataframe(self, data: pd.DataFrame,
                                  method: str = 'both',
-                                 numeric_only: bool = True) -> Dict:
+                                 numeric_only: bool = True,
+                                 profile: Optional[ColumnProfile] = None) -> Dict:
         """
         Detect outliers across all numeric columns in a DataFrame
         
@@ -173,12 +177,17 @@ class OutlierDetector:
             data: DataFrame to analyze
             method: 'iqr', 'zscore', or 'both' (default: 'both')
             numeric_only: Only analyze numeric columns (default: True)
+            profile: Precomputed column profile of data (optional); quartiles,
+                means and standard deviations are taken from it
             
         Returns:
             Dictionary with outlier detection results per column
         """
         logger.info(f"Detecting outliers using {method} method")
         
+        if profile is not None and numeric_only:
+            return self._detect_outliers_profiled(data, method, profile)
+        
         if numeric_only:
             numeric_cols = data.select_dtypes(include=[np.number]).columns
         else:
@@ -201,8 +210,6 @@ class OutlierDetector:
             
             # If both methods used, find consensus outliers
             if method == 'both':
-                outliers_iqr, _ = self.detect_outliers_iqr(data[column])
-                outliers_z, _ = self.detect_outliers_zscore(data[column])
                 consensus_outliers = outliers_iqr & outliers_z
                 col_results['consensus_outliers'] = {
                     'count': int(consensus_outliers.sum()),
@@ -214,6 +221,104 @@ class OutlierDetector:
         
         return results
     
+    def _detect_outliers_profiled(self, data: pd.DataFrame, method: str,
+                                  profile: ColumnProfile) -> Dict:
+        """
+        Detect outliers with bounds taken from a column profile
+        
+        Each column is read once to compute both masks. Results match
+        detect_outliers_iqr and detect_outliers_zscore; columns without
+        valid values report an error and no outliers.
+        """
+        stats_table = profile.numeric_stats
+        index = data.index
+        n_rows = len(data)
+        results = {}
+        
+        for column in profile.numeric_columns:
+            col_stats = stats_table.loc[column]
+            col_results = {'column': column}
+            
+            if col_stats['count'] == 0:
+                empty_stats = {'error': 'No valid data', 'outlier_count': 0, 'outlier_percentage': 0.0}
+                if method in ['iqr', 'both']:
+                    col_results['iqr'] = dict(empty_stats)
+                    col_results['iqr_outlier_indices'] = []
+                if method in ['zscore', 'both']:
+                    col_results['zscore'] = dict(empty_stats)
+                    col_results['zscore_outlier_indices'] = []
+                if method == 'both':
+                    col_results['consensus_outliers'] = {'count': 0, 'percentage': 0.0, 'indices': []}
+                results[column] = col_results
+                continue
+            
+            values = data[column].to_numpy(dtype=float, na_value=np.nan)
+            
+            if method in ['iqr', 'both']:
+                Q1, Q3 = col_stats['q1'], col_stats['q3']
+                IQR = Q3 - Q1
+                lower_bound = Q1 - self.iqr_multiplier * IQR
+                upper_bound = Q3 + self.iqr_multiplier * IQR
+                
+                outliers_iqr = (values < lower_bound) | (values > upper_bound)
+                outlier_count = int(outliers_iqr.sum())
+                
+                col_results['iqr'] = {
+                    'method': 'IQR',
+                    'Q1': float(Q1),
+                    'Q3': float(Q3),
+                    'IQR': float(IQR),
+                    'lower_bound': float(lower_bound),
+                    'upper_bound': float(upper_bound),
+                    'outlier_count': outlier_count,
+                    'outlier_percentage': float(outlier_count / n_rows * 100)
+                }
+                col_results['iqr_outlier_indices'] = index[outliers_iqr].tolist()
+            
+            if method in ['zscore', 'both']:
+                mean, std = col_stats['mean'], col_stats['std']
+                
+                if std == 0:
+                    outliers_z = np.zeros(n_rows, dtype=bool)
+                    col_results['zscore'] = {
+                        'method': 'Z-score',
+                        'mean': float(mean),
+                        'std': 0.0,
+                        'outlier_count': 0,
+                        'warning': 'Zero standard deviation'
+                    }
+                else:
+                    z_scores = np.abs((values - mean) / std)
+                    outliers_z = z_scores > self.z_threshold
+                    outlier_count = int(outliers_z.sum())
+                    
+                    with warnings.catch_warnings():
+                        warnings.simplefilter('ignore', category=RuntimeWarning)
+                        max_z_score = float(np.nanmax(z_scores)) if n_rows > 0 else 0.0
+                    
+                    col_results['zscore'] = {
+                        'method': 'Z-score',
+                        'mean': float(mean),
+                        'std': float(std),
+                        'threshold': self.z_threshold,
+                        'max_z_score': max_z_score,
+                        'outlier_count': outlier_count,
+                        'outlier_percentage': float(outlier_count / n_rows * 100)
+                    }
+                col_results['zscore_outlier_indices'] = index[outliers_z].tolist()
+            
+            if method == 'both':
+                consensus_outliers = outliers_iqr & outliers_z
+                col_results['consensus_outliers'] = {
+                    'count': int(consensus_outliers.sum()),
+                    'percentage': float(consensus_outliers.sum() / n_rows * 100),
+                    'indices': index[consensus_outliers].tolist()
+                }
+            
+            results[column] = col_results
+        
+        return results
+    
     def get_outlier_values(self, data: pd.Series, outlier_mask: np.ndarray) -> List:
         """
         Get the actual outlier values
@@ -228,13 +333,15 @@ class OutlierDetector:
         return data[outlier_mask].tolist()
     
     def generate_outlier_report(self, data: pd.DataFrame,
-                               method: str = 'both') -> Dict:
+                               method: str = 'both',
+                               profile: Optional[ColumnProfile] = None) -> Dict:
         """
         Generate comprehensive outlier detection report
         
         Args:
             data: DataFrame to analyze
             method: Detection method ('iqr', 'zscore', or 'both')
+            profile: Precomputed column profile of data (optional)
             
         Returns:
             Dictionary with complete outlier analysis
@@ -242,8 +349,22 @@ class OutlierDetector:
         logger.info("Generating outlier detection report")
         
         # Detect outliers
-        outlier_results = self.detect_outliers_dataframe(data, method=method)
+        outlier_results = self.detect_outliers_dataframe(data, method=method, profile=profile)
+        
+        return self.build_outlier_report(outlier_results, method, len(data))
+    
+    def build_outlier_report(self, outlier_results: Dict, method: str, n_rows: int) -> Dict:
+        """
+        Summarize per-column outlier results into an outlier report
         
+        Args:
+            outlier_results: Results from detect_outliers_dataframe
+            method: Detection method the results were computed with
+            n_rows: Number of rows in the dataset
+            
+        Returns:
+            Dictionary with complete outlier analysis
+        """
         # Calculate summary statistics
         total_columns = len(outlier_results)
         columns_with_outliers = 0
@@ -293,7 +414,7 @@ class OutlierDetector:
             'timestamp': pd.Timestamp.now().isoformat(),
             'method': method,
             'dataset_info': {
-                'rows': len(data),
+                'rows': n_rows,
                 'columns': total_columns
             },
             'summary': {
@@ -345,30 +466,41 @@ Results:
         return summary.strip()
     
     def flag_extreme_outliers(self, data: pd.DataFrame,
-                             extreme_multiplier: float = 3.0) -> Dict:
+                             extreme_multiplier: float = 3.0,
+                             profile: Optional[ColumnProfile] = None) -> Dict:
         """
         Flag extreme outliers (beyond typical outlier thresholds)
         
         Args:
             data: DataFrame to analyze
             extreme_multiplier: Multiplier for extreme outlier detection
+            profile: Precomputed column profile of data (optional)
             
         Returns:
             Dictionary with extreme outlier information
         """
         logger.info(f"Flagging extreme outliers (IQR multiplier={extreme_multiplier})")
         
-        numeric_cols = data.select_dtypes(include=[np.number]).columns
+        if profile is not None:
+            numeric_cols = profile.numeric_columns
+        else:
+            numeric_cols = data.select_dtypes(include=[np.number]).columns
         extreme_outliers = {}
         
         for column in numeric_cols:
-            clean_data = data[column].dropna()
-            
-            if len(clean_data) == 0:
-                continue
-            
-            Q1 = clean_data.quantile(0.25)
-            Q3 = clean_data.quantile(0.75)
+            if profile is not None:
+                if profile.numeric_stats.at[column, 'count'] == 0:
+                    continue
+                Q1 = profile.numeric_stats.at[column, 'q1']
+                Q3 = profile.numeric_stats.at[column, 'q3']
+            else:
+                clean_data = data[column].dropna()
+                
+                if len(clean_data) == 0:
+                    continue
+                
+                Q1 = clean_data.quantile(0.25)
+                Q3 = clean_data.quantile(0.75)
             IQR = Q3 - Q1
             
             lower_bound = Q1 - extreme_multiplier * IQR
@@ -1,13 +1,58 @@
 """PHI Detection Module - Detects Protected Health Information in datasets"""
 
 import re
+import numpy as np
 import pandas as pd
-from typing import List, Dict, Set
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Iterator, Optional, Set, Tuple
 from datetime import datetime
 import logging
 
+try:
+    import pyarrow  # noqa: F401
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
+# Full scans match pyarrow-backed strings, whose regex kernels (RE2) run in
+# native code; object strings are matched value by value with Python's re
+TEXT_DTYPE = 'string[pyarrow]' if PYARROW_AVAILABLE else str
+
+
+def _scan_phi_chunk(text: pd.Series, combined_pattern: str,
+                    type_patterns: Dict[str, str]) -> Dict[str, np.ndarray]:
+    """
+    Scan one chunk of values for PHI patterns
+    
+    Runs in worker processes. The combined pattern rejects values without
+    any PHI in a single vectorized pass; only the values it matches are
+    tested against each pattern to find the PHI types they contain.
+    
+    Args:
+        text: Non-null column values as TEXT_DTYPE strings
+        combined_pattern: Alternation of all PHI patterns
+        type_patterns: PHI type -> pattern
+        
+    Returns:
+        Dictionary mapping PHI type to positions (within the chunk) of matching values
+    """
+    hits = np.flatnonzero(text.str.contains(combined_pattern, regex=True).to_numpy(dtype=bool))
+    
+    if len(hits) == 0:
+        return {}
+    
+    candidates = text.iloc[hits]
+    positions = {}
+    for phi_type, pattern in type_patterns.items():
+        matched = hits[candidates.str.contains(pattern, regex=True).to_numpy(dtype=bool)]
+        if len(matched) > 0:
+            positions[phi_type] = matched
+    
+    return positions
+
 
 class PHIDetector:
     """Detect Protected Health Information (PHI) according to HIPAA Safe Harbor method"""
@@ -34,9 +79,26 @@ class PHIDetector:
         'other_unique_identifiers'
     ]
     
-    def __init__(self):
-        """Initialize PHI detector with regex patterns"""
+    def __init__(self, full_scan: bool = False, n_jobs: int = 1,
+                 chunk_size: int = 100_000):
+        """
+        Initialize PHI detector with regex patterns
+        
+        Args:
+            full_scan: Check every value of text columns instead of the
+                first 1000 non-null values
+            n_jobs: Worker processes for full scans (1 scans in-process)
+            chunk_size: Values per full-scan chunk
+        """
         self.patterns = self._create_regex_patterns()
+        self.type_patterns = {
+            phi_type: self._pattern_source(pattern)
+            for phi_type, pattern in self.patterns.items()
+        }
+        self.combined_pattern = '|'.join(f'(?:{source})' for source in self.type_patterns.values())
+        self.full_scan = full_scan
+        self.n_jobs = n_jobs
+        self.chunk_size = chunk_size
         self.quarantine_path = None
         
     def _create_regex_patterns(self) -> Dict[str, re.Pattern]:
@@ -87,10 +149,30 @@ class PHIDetector:
         
         return patterns
     
+    @staticmethod
+    def _pattern_source(pattern: re.Pattern) -> str:
+        """Get a pattern's source with its case-insensitivity as an inline flag"""
+        if pattern.flags & re.IGNORECASE:
+            return f'(?i:{pattern.pattern})'
+        return pattern.pattern
+    
+    @staticmethod
+    def _is_text_column(series: pd.Series) -> bool:
+        """Check whether a column holds text that value patterns apply to"""
+        return (
+            pd.api.types.is_object_dtype(series.dtype) or
+            pd.api.types.is_string_dtype(series.dtype) or
+            isinstance(series.dtype, pd.CategoricalDtype)
+        )
+    
     def detect_phi(self, data: pd.DataFrame) -> Dict[str, List[str]]:
         """
         Detect potential PHI in dataset
         
+        Numeric, boolean and datetime columns are checked by name only;
+        text columns are also checked by value, sampled or in full
+        depending on full_scan.
+        
         Args:
             data: DataFrame to scan for PHI
             
@@ -101,6 +183,9 @@ class PHIDetector:
         
         phi_detected = {}
         
+        if self.full_scan:
+            value_masks = self.scan_phi_values(data)
+        
         for column in data.columns:
             # Check column name for PHI indicators
             column_phi = self._check_column_name(column)
@@ -111,8 +196,11 @@ class PHIDetector:
                     phi_detected[phi_type].append(column)
             
             # Check column values for PHI patterns
-            if data[column].dtype == 'object':
-                value_phi = self._check_column_values(data[column])
+            if self._is_text_column(data[column]):
+                if self.full_scan:
+                    value_phi = list(value_masks[column].columns) if column in value_masks else []
+                else:
+                    value_phi = self._check_column_values(data[column])
                 for phi_type in value_phi:
                     if phi_type not in phi_detected:
                         phi_detected[phi_type] = []
@@ -167,8 +255,106 @@ class PHIDetector:
         
         return detected
     
+    def scan_phi_values(self, data: pd.DataFrame,
+                        columns: Optional[List[str]] = None) -> Dict[str, pd.DataFrame]:
+        """
+        Check every value of the text columns for PHI patterns
+        
+        Values are scanned in chunks of chunk_size, on n_jobs worker
+        processes when n_jobs > 1. Each chunk is first matched against one
+        alternation of all patterns, so values without PHI cost a single
+        vectorized pass.
+        
+        Args:
+            data: DataFrame to scan
+            columns: Columns to scan (default: all text columns)
+            
+        Returns:
+            Dictionary mapping each column with PHI to a boolean DataFrame
+            (same index as data, one column per PHI type found) marking the
+            rows whose value matched
+        """
+        if columns is None:
+            columns = [col for col in data.columns if self._is_text_column(data[col])]
+        
+        logger.info(f"Full PHI scan of {len(columns)} columns x {len(data)} rows")
+        
+        positions: Dict[str, Dict[str, List[np.ndarray]]] = {}
+        for column, rows, chunk_positions in self._scan_chunks(data, columns):
+            for phi_type, matched in chunk_positions.items():
+                positions.setdefault(column, {}).setdefault(phi_type, []).append(rows[matched])
+        
+        value_masks = {}
+        for column, type_positions in positions.items():
+            masks = {}
+            for phi_type in self.patterns:
+                if phi_type in type_positions:
+                    mask = np.zeros(len(data), dtype=bool)
+                    mask[np.concatenate(type_positions[phi_type])] = True
+                    masks[phi_type] = mask
+            value_masks[column] = pd.DataFrame(masks, index=data.index)
+        
+        return value_masks
+    
+    def get_phi_row_mask(self, data: pd.DataFrame,
+                         columns: Optional[List[str]] = None) -> pd.Series:
+        """
+        Mark rows with a PHI match in any scanned column
+        
+        Args:
+            data: DataFrame to scan
+            columns: Columns to scan (default: all text columns)
+            
+        Returns:
+            Boolean Series with the same index as data
+        """
+        row_mask = np.zeros(len(data), dtype=bool)
+        for masks in self.scan_phi_values(data, columns).values():
+            row_mask |= masks.to_numpy().any(axis=1)
+        
+        return pd.Series(row_mask, index=data.index, name='phi_detected')
+    
+    def _scan_chunks(self, data: pd.DataFrame,
+                     columns: List[str]) -> Iterator[Tuple[str, np.ndarray, Dict[str, np.ndarray]]]:
+        """
+        Scan the non-null values of each column chunk by chunk
+        
+        Yields:
+            Tuples of (column, row positions of the chunk's values, PHI type ->
+            positions within the chunk)
+        """
+        def chunks():
+            for column in columns:
+                series = data[column]
+                rows = np.flatnonzero(series.notna().to_numpy())
+                for start in range(0, len(rows), self.chunk_size):
+                    chunk_rows = rows[start:start + self.chunk_size]
+                    yield column, chunk_rows, series.iloc[chunk_rows].astype(TEXT_DTYPE)
+        
+        if self.n_jobs <= 1:
+            for column, rows, values in chunks():
+                yield column, rows, _scan_phi_chunk(values, self.combined_pattern, self.type_patterns)
+            return
+        
+        with ProcessPoolExecutor(max_workers=self.n_jobs) as executor:
+            pending = deque()
+            
+            for column, rows, values in chunks():
+                pending.append((column, rows, executor.submit(
+                    _scan_phi_chunk, values, self.combined_pattern, self.type_patterns
+                )))
+                
+                if len(pending) >= 2 * self.n_jobs:
+                    column, rows, future = pending.popleft()
+                    yield column, rows, future.result()
+            
+            while pending:
+                column, rows, future = pending.popleft()
+                yield column, rows, future.result()
+    
     def quarantine_data(self, data: pd.DataFrame, phi_columns: List[str], 
-                       quarantine_path: str) -> pd.DataFrame:
+                       quarantine_path: str,
+                       row_mask: Optional[pd.Series] = None) -> pd.DataFrame:
         """
         Quarantine data containing PHI
         
@@ -176,14 +362,30 @@ class PHIDetector:
             data: Original DataFrame
             phi_columns: List of columns containing PHI
             quarantine_path: Path to save quarantined data
-            
+            row_mask: Boolean mask of rows containing PHI (e.g. from
+                get_phi_row_mask). When given, these whole rows are
+                quarantined and removed as well as the PHI columns.
+                
         Returns:
-            DataFrame with PHI columns removed
+            DataFrame with PHI columns (and PHI rows, if row_mask is given) removed
         """
         logger.warning(f"Quarantining {len(phi_columns)} columns with PHI")
         
         # Save quarantined data
-        quarantined = data[phi_columns].copy()
+        if row_mask is None:
+            quarantined = data[phi_columns].copy()
+        else:
+            row_mask = np.asarray(row_mask, dtype=bool)
+            logger.warning(f"Quarantining {int(row_mask.sum())} rows with PHI")
+            
+            # Whole rows with PHI values, plus the PHI columns of every other row
+            keep = row_mask | bool(phi_columns)
+            quarantined = data[keep].copy()
+            other_columns = [col for col in data.columns if col not in phi_columns]
+            quarantined[other_columns] = quarantined[other_columns].where(
+                np.broadcast_to(row_mask[keep][:, None], (int(keep.sum()), len(other_columns)))
+            )
+        
         quarantined['quarantine_timestamp'] = datetime.now()
         quarantined['quarantine_reason'] = 'PHI_DETECTED'
         
@@ -193,6 +395,9 @@ class PHIDetector:
         # Remove PHI columns from original data
         clean_data = data.drop(columns=phi_columns)
         
+        if row_mask is not None:
+            clean_data = clean_data[~row_mask]
+        
         return clean_data
     
     def validate_no_phi(self, data: pd.DataFrame) -> bool:
@@ -226,10 +431,25 @@ class PHIDetector:
         """
         phi_detected = self.detect_phi(data)
         
+        return self.build_phi_report(phi_detected, len(data.columns), len(data))
+    
+    def build_phi_report(self, phi_detected: Dict[str, List[str]],
+                         n_columns: int, n_rows: int) -> Dict:
+        """
+        Assemble a PHI report from detect_phi results
+        
+        Args:
+            phi_detected: PHI types mapped to the columns containing them
+            n_columns: Number of columns in the dataset
+            n_rows: Number of rows in the dataset
+            
+        Returns:
+            Dictionary with PHI detection results and statistics
+        """
         report = {
             'timestamp': datetime.now().isoformat(),
-            'total_columns': len(data.columns),
-            'total_rows': len(data),
+            'total_columns': n_columns,
+            'total_rows': n_rows,
             'phi_detected': bool(phi_detected),
             'phi_categories': list(phi_detected.keys()),
             'phi_columns': phi_detected,
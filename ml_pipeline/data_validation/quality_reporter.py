@@ -14,6 +14,7 @@ from .outlier_detector import OutlierDetector
 from .range_validator import RangeValidator
 from .duplicate_detector import DuplicateDetector
 from .temporal_validator import TemporalValidator
+from .column_profiler import ColumnProfiler, ColumnProfile
 
 logger = logging.getLogger(__name__)
 
@@ -30,27 +31,36 @@ class QualityReporter:
         self.range_validator = RangeValidator()
         self.duplicate_detector = DuplicateDetector()
         self.temporal_validator = TemporalValidator()
+        self.column_profiler = ColumnProfiler()
         
         logger.info("Initialized QualityReporter with all validators")
     
     def generate_comprehensive_report(self, data: pd.DataFrame,
                                      dataset_name: str = "Unknown",
                                      patient_id_col: Optional[str] = None,
-                                     visit_date_col: Optional[str] = None) -> Dict:
+                                     visit_date_col: Optional[str] = None,
+                                     profile: Optional[ColumnProfile] = None) -> Dict:
         """
         Generate comprehensive data quality report
         
+        Column statistics are computed once, or taken from profile, and
+        shared by the completeness, outlier and range checks.
+        
         Args:
             data: DataFrame to analyze
             dataset_name: Name of the dataset
             patient_id_col: Name of patient ID column (optional)
             visit_date_col: Name of visit date column (optional)
+            profile: Precomputed column profile of data (optional)
             
         Returns:
             Dictionary with complete quality analysis
         """
         logger.info(f"Generating comprehensive quality report for {dataset_name}")
         
+        if profile is None or not profile.matches(data):
+            profile = self.column_profiler.profile(data)
+        
         report = {
             'report_metadata': {
                 'dataset_name': dataset_name,
@@ -77,17 +87,17 @@ class QualityReporter:
         
         # 3. Completeness Check
         logger.info("Running completeness check...")
-        completeness_report = self.completeness_checker.generate_completeness_report(data)
+        completeness_report = self.completeness_checker.generate_completeness_report(data, profile=profile)
         report['completeness'] = completeness_report
         
         # 4. Outlier Detection
         logger.info("Running outlier detection...")
-        outlier_report = self.outlier_detector.generate_outlier_report(data, method='both')
+        outlier_report = self.outlier_detector.generate_outlier_report(data, method='both', profile=profile)
         report['outliers'] = outlier_report
         
         # 5. Range Validation
         logger.info("Running range validation...")
-        range_report = self.range_validator.generate_range_report(data)
+        range_report = self.range_validator.generate_range_report(data, profile=profile)
         report['range_validation'] = range_report
         
         # 6. Duplicate Detection
@@ -105,6 +115,18 @@ class QualityReporter:
             )
             report['temporal_consistency'] = temporal_report
         
+        return self.finalize_report(report)
+    
+    def finalize_report(self, report: Dict) -> Dict:
+        """
+        Add the quality score and overall assessment to a report
+        
+        Args:
+            report: Report with all validation sections filled in
+            
+        Returns:
+            The same report, completed
+        """
         # Overall Quality Score
         quality_score = self._calculate_quality_score(report)
         report['quality_score'] = quality_score
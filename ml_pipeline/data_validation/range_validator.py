@@ -5,6 +5,8 @@ import numpy as np
 from typing import Dict, List, Tuple, Optional
 import logging
 
+from .column_profiler import ColumnProfile
+
 logger = logging.getLogger(__name__)
 
 
@@ -184,12 +186,63 @@ class RangeValidator:
         
         return result
     
-    def validate_dataframe(self, data: pd.DataFrame) -> Dict:
+    def _validate_profiled_column(self, data: pd.Series, field_name: str,
+                                  profile: ColumnProfile) -> Dict:
+        """
+        Validate a numeric column using statistics from a column profile
+        
+        The column is read once for the violation counts; the value count,
+        minimum and maximum come from the profile. Results match
+        validate_column.
+        """
+        range_def = self.ranges[field_name]
+        min_val = range_def['min']
+        max_val = range_def['max']
+        col_stats = profile.numeric_stats.loc[data.name]
+        total_values = int(col_stats['count'])
+        
+        if total_values == 0:
+            return {
+                'field': field_name,
+                'validated': True,
+                'violations': 0,
+                'note': 'All values are NaN'
+            }
+        
+        values = data.to_numpy(dtype=float, na_value=np.nan)
+        below_min = values < min_val
+        above_max = values > max_val
+        violations = below_min | above_max
+        
+        violation_count = int(violations.sum())
+        
+        result = {
+            'field': field_name,
+            'validated': violation_count == 0,
+            'range': {'min': min_val, 'max': max_val, 'unit': range_def['unit']},
+            'violations': violation_count,
+            'violation_percentage': float(violation_count / total_values * 100),
+            'below_min_count': int(below_min.sum()),
+            'above_max_count': int(above_max.sum()),
+            'actual_min': float(col_stats['min']),
+            'actual_max': float(col_stats['max']),
+            'total_values': total_values
+        }
+        
+        if violation_count > 0:
+            # Get examples of violations in their original type
+            result['violation_examples'] = data[violations].head(5).tolist()
+        
+        return result
+    
+    def validate_dataframe(self, data: pd.DataFrame,
+                           profile: Optional[ColumnProfile] = None) -> Dict:
         """
         Validate all applicable columns in a DataFrame
         
         Args:
             data: DataFrame to validate
+            profile: Precomputed column profile of data (optional)
             
         Returns:
             Dictionary with validation results for all columns
@@ -210,7 +263,10 @@ class RangeValidator:
                     break
             
             if matching_range:
-                result = self.validate_column(data[column], matching_range)
+                if profile is not None and column in profile.numeric_stats.index:
+                    result = self._validate_profiled_column(data[column], matching_range, profile)
+                else:
+                    result = self.validate_column(data[column], matching_range)
                 results[column] = result
                 validated_count += 1
                 
@@ -233,21 +289,28 @@ class RangeValidator:
         
         return summary
     
-    def get_violations_summary(self, data: pd.DataFrame) -> List[Dict]:
+    def get_violations_summary(self, data: pd.DataFrame,
+                               profile: Optional[ColumnProfile] = None) -> List[Dict]:
         """
         Get summary of all range violations
         
         Args:
             data: DataFrame to analyze
+            profile: Precomputed column profile of data (optional)
             
         Returns:
             List of dictionaries with violation details
         """
-        validation_results = self.validate_dataframe(data)
+        validation_results = self.validate_dataframe(data, profile=profile)
         
+        return self._summarize_violations(validation_results['column_results'])
+    
+    @staticmethod
+    def _summarize_violations(column_results: Dict) -> List[Dict]:
+        """Collect violating columns from validate_dataframe column results"""
         violations = []
         
-        for column, result in validation_results['column_results'].items():
+        for column, result in column_results.items():
             if not result['validated'] and result['violations'] > 0:
                 violations.append({
                     'column': column,
@@ -264,26 +327,43 @@ class RangeValidator:
         
         return violations
     
-    def generate_range_report(self, data: pd.DataFrame) -> Dict:
+    def generate_range_report(self, data: pd.DataFrame,
+                              profile: Optional[ColumnProfile] = None) -> Dict:
         """
         Generate comprehensive range validation report
         
         Args:
             data: DataFrame to analyze
+            profile: Precomputed column profile of data (optional)
             
         Returns:
             Dictionary with complete range validation analysis
         """
         logger.info("Generating range validation report")
         
-        validation_results = self.validate_dataframe(data)
-        violations_summary = self.get_violations_summary(data)
+        validation_results = self.validate_dataframe(data, profile=profile)
+        
+        return self.build_range_report(validation_results, len(data), len(data.columns))
+    
+    def build_range_report(self, validation_results: Dict, n_rows: int, n_columns: int) -> Dict:
+        """
+        Assemble a range validation report from validate_dataframe results
+        
+        Args:
+            validation_results: Results from validate_dataframe
+            n_rows: Number of rows in the dataset
+            n_columns: Number of columns in the dataset
+            
+        Returns:
+            Dictionary with complete range validation analysis
+        """
+        violations_summary = self._summarize_violations(validation_results['column_results'])
         
         report = {
             'timestamp': pd.Timestamp.now().isoformat(),
             'dataset_info': {
-                'rows': len(data),
-                'columns': len(data.columns)
+                'rows': n_rows,
+                'columns': n_columns
             },
             'validation_summary': {
                 'total_columns': validation_results['total_columns'],
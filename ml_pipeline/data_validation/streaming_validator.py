@@ -0,0 +1,480 @@
+"""Streaming Validator Module - Validates datasets larger than memory in record batches"""
+
+import pandas as pd
+import numpy as np
+import pyarrow as pa
+import pyarrow.parquet as pq
+from typing import Dict, Iterator, List, Optional, Tuple, Union, Callable, Iterable
+from datetime import datetime
+from pathlib import Path
+import logging
+
+from .accumulators import (
+    ColumnStatsAccumulator,
+    RowHashAccumulator,
+    GroupCountAccumulator,
+    SampleAccumulator
+)
+from .column_profiler import ColumnProfile
+from .quality_reporter import QualityReporter
+
+logger = logging.getLogger(__name__)
+
+BatchSource = Union[str, Path, Callable[[], Iterable]]
+
+
+class StreamingValidationState:
+    """Mergeable accumulators for one pass over a dataset"""
+
+    def __init__(self, patient_id_col: Optional[str] = None,
+                 visit_date_col: Optional[str] = None,
+                 compression: float = 500.0,
+                 sample_size: int = 1000):
+        """
+        Initialize validation state
+
+        Args:
+            patient_id_col: Name of patient ID column (optional)
+            visit_date_col: Name of visit date column (optional)
+            compression: t-digest compression for the quartiles
+            sample_size: Non-null values kept per column for sampled checks
+        """
+        self.patient_id_col = patient_id_col
+        self.visit_date_col = visit_date_col
+        self.column_stats = ColumnStatsAccumulator(compression)
+        self.row_hashes = RowHashAccumulator()
+        self.samples = SampleAccumulator(sample_size)
+        self.quasi_identifier_counts: Optional[GroupCountAccumulator] = None
+        self.ages_over_89: Dict[str, List[pd.Series]] = {}
+        self.key_columns: List[pd.DataFrame] = []
+        self.phi_detected: Dict[str, List[str]] = {}
+        self.memory_bytes = 0
+        self.batches = 0
+
+    @property
+    def n_rows(self) -> int:
+        """Rows accumulated so far"""
+        return self.column_stats.n_rows
+
+    @property
+    def columns(self) -> List[str]:
+        """Columns of the dataset"""
+        return self.column_stats.columns or []
+
+    def merge(self, other: 'StreamingValidationState') -> 'StreamingValidationState':
+        """
+        Merge the state of a later part of the same dataset
+
+        Row-level results (duplicate and outlier indices) follow the order
+        the states are merged in.
+        """
+        self.column_stats.merge(other.column_stats)
+        self.row_hashes.merge(other.row_hashes)
+        self.samples.merge(other.samples)
+
+        if other.quasi_identifier_counts is not None:
+            if self.quasi_identifier_counts is None:
+                self.quasi_identifier_counts = GroupCountAccumulator(other.quasi_identifier_counts.columns)
+            self.quasi_identifier_counts.merge(other.quasi_identifier_counts)
+
+        for column, parts in other.ages_over_89.items():
+            self.ages_over_89.setdefault(column, []).extend(parts)
+
+        self.key_columns.extend(other.key_columns)
+
+        for phi_type, columns in other.phi_detected.items():
+            merged = self.phi_detected.setdefault(phi_type, [])
+            merged.extend(column for column in columns if column not in merged)
+
+        self.memory_bytes += other.memory_bytes
+        self.batches += other.batches
+        return self
+
+
+class StreamingValidator:
+    """
+    Validate Parquet/CSV datasets in record batches without loading them
+
+    A first pass over the batches fills mergeable accumulators: null counts,
+    exact means, standard deviations, minima and maxima, t-digest quartiles,
+    row hashes for exact duplicates, k-anonymity group counts, the patient
+    and visit columns, and the first non-null values of every column for the
+    sampled PHI and de-identification checks. A second pass counts outliers
+    and range violations against the final bounds. The result has the same
+    structure as QualityReporter.generate_comprehensive_report; IQR bounds
+    come from t-digest quartiles and are approximate on large columns.
+    """
+
+    def __init__(self, quality_reporter: Optional[QualityReporter] = None,
+                 batch_size: int = 65_536,
+                 compression: float = 500.0,
+                 sample_size: int = 1000):
+        """
+        Initialize streaming validator
+
+        Args:
+            quality_reporter: Reporter whose validators are used (default: new one)
+            batch_size: Rows per record batch read from files
+            compression: t-digest compression for the quartiles
+            sample_size: Non-null values kept per column for sampled checks
+        """
+        self.quality_reporter = quality_reporter or QualityReporter()
+        self.batch_size = batch_size
+        self.compression = compression
+        self.sample_size = sample_size
+
+        logger.info(f"Initialized StreamingValidator (batch_size={batch_size})")
+
+    def iter_batches(self, source: BatchSource) -> Iterator[pd.DataFrame]:
+        """
+        Read a source as DataFrames with row labels counting from 0 across batches
+
+        Args:
+            source: Parquet or CSV file path, or a callable returning an
+                iterable of DataFrames, pyarrow RecordBatches or Tables
+
+        Yields:
+            DataFrame per record batch
+        """
+        if callable(source):
+            batches = source()
+        else:
+            path = Path(source)
+            suffixes = [suffix.lower() for suffix in path.suffixes]
+            if '.parquet' in suffixes or '.pq' in suffixes:
+                batches = pq.ParquetFile(path).iter_batches(batch_size=self.batch_size)
+            elif '.csv' in suffixes:
+                batches = pd.read_csv(path, chunksize=self.batch_size)
+            else:
+                raise ValueError(f"Unsupported file type for streaming validation: {path}")
+
+        offset = 0
+        for batch in batches:
+            if isinstance(batch, (pa.RecordBatch, pa.Table)):
+                batch = batch.to_pandas()
+            batch.index = pd.RangeIndex(offset, offset + len(batch))
+            offset += len(batch)
+            yield batch
+
+    def new_state(self, patient_id_col: Optional[str] = None,
+                  visit_date_col: Optional[str] = None) -> StreamingValidationState:
+        """Create an empty validation state"""
+        return StreamingValidationState(
+            patient_id_col, visit_date_col, self.compression, self.sample_size
+        )
+
+    def update_state(self, state: StreamingValidationState, batch: pd.DataFrame):
+        """
+        Add one record batch to a validation state
+
+        Args:
+            state: State to update
+            batch: Record batch
+        """
+        reporter = self.quality_reporter
+
+        if state.column_stats.columns is None:
+            verifier = reporter.deidentification_verifier
+            state.quasi_identifier_counts = GroupCountAccumulator(verifier._detect_quasi_identifiers(batch))
+
+        state.column_stats.update(batch)
+        state.row_hashes.update(batch)
+        state.samples.update(batch)
+        state.quasi_identifier_counts.update(batch)
+
+        # Ages over 89 must all be generalized, so each one is kept
+        for column in batch.columns:
+            if 'age' in column.lower() and pd.api.types.is_numeric_dtype(batch[column]):
+                state.ages_over_89.setdefault(column, []).append(
+                    batch[column][batch[column] > 89].dropna()
+                )
+
+        key_cols = [col for col in (state.patient_id_col, state.visit_date_col)
+                    if col and col in batch.columns]
+        state.key_columns.append(batch[key_cols])
+
+        if reporter.phi_detector.full_scan:
+            for phi_type, columns in reporter.phi_detector.detect_phi(batch).items():
+                merged = state.phi_detected.setdefault(phi_type, [])
+                merged.extend(column for column in columns if column not in merged)
+
+        state.memory_bytes += int(batch.memory_usage(deep=True).sum())
+        state.batches += 1
+
+    def accumulate(self, batches: Iterable[pd.DataFrame],
+                   patient_id_col: Optional[str] = None,
+                   visit_date_col: Optional[str] = None) -> StreamingValidationState:
+        """
+        Run the first pass over record batches
+
+        Args:
+            batches: Record batches, e.g. from iter_batches
+            patient_id_col: Name of patient ID column (optional)
+            visit_date_col: Name of visit date column (optional)
+
+        Returns:
+            Filled validation state
+        """
+        state = self.new_state(patient_id_col, visit_date_col)
+        for batch in batches:
+            self.update_state(state, batch)
+
+        logger.info(f"Accumulated {state.n_rows:,} rows in {state.batches} batches")
+        return state
+
+    def validate(self, source: BatchSource,
+                 dataset_name: str = "Unknown",
+                 patient_id_col: Optional[str] = None,
+                 visit_date_col: Optional[str] = None) -> Dict:
+        """
+        Generate a comprehensive quality report by streaming a source twice
+
+        Args:
+            source: Parquet or CSV file path, or a callable returning a
+                fresh iterable of record batches on each call
+            dataset_name: Name of the dataset
+            patient_id_col: Name of patient ID column (optional)
+            visit_date_col: Name of visit date column (optional)
+
+        Returns:
+            Dictionary with complete quality analysis
+        """
+        logger.info(f"Streaming validation of {dataset_name}")
+
+        state = self.accumulate(self.iter_batches(source), patient_id_col, visit_date_col)
+        return self.build_report(state, self.iter_batches(source), dataset_name)
+
+    def build_report(self, state: StreamingValidationState,
+                     batches: Iterable[pd.DataFrame],
+                     dataset_name: str = "Unknown") -> Dict:
+        """
+        Finish validation from a filled state and a second pass over the batches
+
+        Args:
+            state: State from accumulate (or merged states)
+            batches: The same record batches again, in the same order
+            dataset_name: Name of the dataset
+
+        Returns:
+            Dictionary with complete quality analysis
+        """
+        reporter = self.quality_reporter
+        profile = state.column_stats.to_profile()
+        n_rows, columns = state.n_rows, state.columns
+        schema = pd.DataFrame(columns=columns)
+        sample = state.samples.to_frame()
+
+        outlier_results, range_results = self._scan_bounds(batches, profile)
+
+        report = {
+            'report_metadata': {
+                'dataset_name': dataset_name,
+                'generated_at': datetime.now().isoformat(),
+                'report_version': '1.0',
+                'streaming': {
+                    'batches': state.batches,
+                    'approximate_quartiles': True
+                }
+            },
+            'dataset_info': {
+                'rows': n_rows,
+                'columns': len(columns),
+                'column_names': list(columns),
+                'memory_usage_mb': float(state.memory_bytes / 1024 / 1024)
+            }
+        }
+
+        # 1. PHI Detection
+        logger.info("Running PHI detection...")
+        if reporter.phi_detector.full_scan:
+            phi_detected = state.phi_detected
+        else:
+            phi_detected = reporter.phi_detector.detect_phi(sample)
+        report['phi_detection'] = reporter.phi_detector.build_phi_report(
+            phi_detected, len(columns), n_rows
+        )
+
+        # 2. De-identification Verification
+        logger.info("Running de-identification verification...")
+        report['deidentification'] = reporter.deidentification_verifier.comprehensive_verification(
+            sample,
+            k_anonymity_result=self._k_anonymity_result(state),
+            age_data=self._age_data(state)
+        )
+
+        # 3. Completeness Check
+        logger.info("Running completeness check...")
+        report['completeness'] = reporter.completeness_checker.generate_completeness_report(
+            schema, profile=profile
+        )
+
+        # 4. Outlier Detection
+        logger.info("Running outlier detection...")
+        report['outliers'] = reporter.outlier_detector.build_outlier_report(
+            outlier_results, 'both', n_rows
+        )
+
+        # 5. Range Validation
+        logger.info("Running range validation...")
+        report['range_validation'] = reporter.range_validator.build_range_report(
+            range_results, n_rows, len(columns)
+        )
+
+        # 6. Duplicate Detection
+        logger.info("Running duplicate detection...")
+        dataset_info = {'rows': n_rows, 'columns': len(columns)}
+        key_frame = pd.concat(state.key_columns) if state.key_columns else pd.DataFrame()
+        exact_duplicates = reporter.duplicate_detector.exact_duplicates_from_mask(
+            state.row_hashes.duplicate_mask(), pd.RangeIndex(n_rows), list(columns)
+        )
+        duplicate_report = reporter.duplicate_detector.comprehensive_duplicate_check(
+            key_frame, state.patient_id_col, state.visit_date_col,
+            exact_duplicates=exact_duplicates
+        )
+        duplicate_report['dataset_info'] = dataset_info
+        report['duplicates'] = duplicate_report
+
+        # 7. Temporal Validation (if applicable)
+        if state.patient_id_col and state.visit_date_col:
+            logger.info("Running temporal validation...")
+            temporal_report = reporter.temporal_validator.comprehensive_temporal_validation(
+                key_frame, state.patient_id_col, state.visit_date_col
+            )
+            temporal_report['dataset_info'] = dict(dataset_info)
+            report['temporal_consistency'] = temporal_report
+
+        return reporter.finalize_report(report)
+
+    def _k_anonymity_result(self, state: StreamingValidationState) -> Optional[Dict]:
+        """k-anonymity over all rows, or None when there are no quasi-identifiers"""
+        counts = state.quasi_identifier_counts
+        if counts is None or not counts.columns:
+            return None
+
+        grouped = counts.counts if counts.counts is not None else pd.Series(dtype=np.int64)
+        return self.quality_reporter.deidentification_verifier.k_anonymity_from_group_sizes(
+            grouped, counts.columns
+        )
+
+    @staticmethod
+    def _age_data(state: StreamingValidationState) -> pd.DataFrame:
+        """Frame of every age value over 89, one column per numeric age column"""
+        if not state.ages_over_89:
+            return pd.DataFrame(columns=[col for col in state.columns if 'age' in col.lower()])
+
+        return pd.concat(
+            {column: pd.concat(parts, ignore_index=True) for column, parts in state.ages_over_89.items()},
+            axis=1
+        )
+
+    def _scan_bounds(self, batches: Iterable[pd.DataFrame],
+                     profile: ColumnProfile) -> Tuple[Dict, Dict]:
+        """
+        Second pass: count outliers and range violations against final bounds
+
+        Each batch is checked by the regular validators with the dataset
+        profile, and the per-batch results are added up.
+
+        Returns:
+            Tuple of (outlier results, range validation results) in the
+            formats of detect_outliers_dataframe and validate_dataframe
+        """
+        reporter = self.quality_reporter
+        numeric_columns = profile.numeric_columns
+        outlier_results: Dict = {}
+        column_results: Dict = {}
+
+        for batch in batches:
+            # Numeric columns follow the first batch; coerce later ones
+            for column in numeric_columns:
+                if not pd.api.types.is_numeric_dtype(batch[column]) or pd.api.types.is_bool_dtype(batch[column]):
+                    batch[column] = pd.to_numeric(batch[column], errors='coerce')
+
+            batch_outliers = reporter.outlier_detector.detect_outliers_dataframe(
+                batch, method='both', profile=profile
+            )
+            for column, result in batch_outliers.items():
+                self._merge_outlier_result(outlier_results, column, result)
+
+            batch_ranges = reporter.range_validator.validate_dataframe(batch, profile=profile)
+            for column, result in batch_ranges['column_results'].items():
+                self._merge_range_result(column_results, column, result,
+                                         profiled=column in profile.numeric_stats.index)
+
+        n_rows = profile.n_rows
+        for result in outlier_results.values():
+            for key in ['iqr', 'zscore']:
+                if 'outlier_percentage' in result.get(key, {}):
+                    result[key]['outlier_percentage'] = float(result[key]['outlier_count'] / n_rows * 100)
+            if 'consensus_outliers' in result:
+                consensus = result['consensus_outliers']
+                consensus['percentage'] = float(consensus['count'] / n_rows * 100)
+
+        for result in column_results.values():
+            if 'note' not in result:
+                result['validated'] = result['violations'] == 0
+                result['violation_percentage'] = float(result['violations'] / result['total_values'] * 100)
+
+        violation_count = sum(1 for result in column_results.values() if not result['validated'])
+        range_results = {
+            'timestamp': pd.Timestamp.now().isoformat(),
+            'total_columns': len(profile.columns),
+            'validated_columns': len(column_results),
+            'columns_with_violations': violation_count,
+            'validation_passed': violation_count == 0,
+            'column_results': column_results
+        }
+
+        return outlier_results, range_results
+
+    @staticmethod
+    def _merge_outlier_result(merged: Dict, column: str, result: Dict):
+        """Add one batch's detect_outliers_dataframe result for a column"""
+        if column not in merged:
+            merged[column] = {
+                key: (dict(value) if isinstance(value, dict) else list(value) if isinstance(value, list) else value)
+                for key, value in result.items()
+            }
+            return
+
+        total = merged[column]
+        for key in ['iqr', 'zscore']:
+            if key in result:
+                total[key]['outlier_count'] += result[key]['outlier_count']
+                if 'max_z_score' in result[key]:
+                    total[key]['max_z_score'] = float(np.fmax(total[key]['max_z_score'], result[key]['max_z_score']))
+                total[f'{key}_outlier_indices'].extend(result[f'{key}_outlier_indices'])
+
+        if 'consensus_outliers' in result:
+            total['consensus_outliers']['count'] += result['consensus_outliers']['count']
+            total['consensus_outliers']['indices'].extend(result['consensus_outliers']['indices'])
+
+    @staticmethod
+    def _merge_range_result(merged: Dict, column: str, result: Dict, profiled: bool):
+        """
+        Add one batch's range result for a column
+
+        Profiled columns report dataset-wide value counts and extremes in
+        every batch; other columns report their batch's and are combined.
+        """
+        if column not in merged or 'note' in merged[column]:
+            merged[column] = dict(result)
+            if 'violation_examples' in result:
+                merged[column]['violation_examples'] = list(result['violation_examples'])
+            return
+
+        if 'note' in result:
+            return
+
+        total = merged[column]
+        for key in ['violations', 'below_min_count', 'above_max_count']:
+            total[key] += result[key]
+
+        if not profiled:
+            total['total_values'] += result['total_values']
+            total['actual_min'] = min(total['actual_min'], result['actual_min'])
+            total['actual_max'] = max(total['actual_max'], result['actual_max'])
+
+        if result.get('violation_examples'):
+            examples = total.setdefault('violation_examples', [])
+            examples.extend(result['violation_examples'][:5 - len(examples)])
@@ -56,41 +56,49 @@ class TemporalValidator:
         else:
             dates = data[date_col]
         
-        # Check for chronological order within each patient
-        violations = []
-        patients_checked = 0
+        # Check for chronological order within each patient in one pass:
+        # rows are grouped by patient keeping their original order, and a
+        # patient violates when any visit is earlier than the visit before
+        # it or follows a missing date
+        codes, patient_ids = pd.factorize(data[patient_id_col])
+        date_values = self._date_values(dates)
+        
+        order = np.argsort(codes, kind='stable')
+        order = order[codes[order] >= 0]
+        group_codes = codes[order]
+        group_dates = date_values[order]
+        
+        visit_counts = np.bincount(group_codes, minlength=len(patient_ids))
+        patients_checked = int((visit_counts >= 2).sum())
+        
+        is_nat = np.isnat(group_dates)
+        same_patient = group_codes[1:] == group_codes[:-1]
+        out_of_order = same_patient & (
+            (is_nat[:-1] & ~is_nat[1:]) | (group_dates[1:] < group_dates[:-1])
+        )
+        violating = np.unique(group_codes[1:][out_of_order])
         
-        for patient_id in data[patient_id_col].unique():
-            patient_data = data[data[patient_id_col] == patient_id].copy()
-            patient_dates = dates[data[patient_id_col] == patient_id]
-            
-            if len(patient_data) < 2:
-                continue  # Skip patients with single visit
-            
-            patients_checked += 1
-            
-            # Check if dates are sorted
-            sorted_dates = patient_dates.sort_values()
-            
-            if not patient_dates.equals(sorted_dates):
-                violations.append({
-                    'patient_id': patient_id,
-                    'visit_count': len(patient_data),
-                    'dates': patient_dates.dt.strftime('%Y-%m-%d').tolist() if pd.api.types.is_datetime64_any_dtype(patient_dates) else patient_dates.tolist()
-                })
+        violations = []
+        for code in violating[:10]:
+            patient_dates = dates.iloc[order[group_codes == code]]
+            violations.append({
+                'patient_id': patient_ids[code],
+                'visit_count': int(visit_counts[code]),
+                'dates': patient_dates.dt.strftime('%Y-%m-%d').tolist()
+            })
         
         result = {
             'patient_id_column': patient_id_col,
             'date_column': date_col,
-            'total_patients': len(data[patient_id_col].unique()),
+            'total_patients': data[patient_id_col].nunique(dropna=False),
             'patients_with_multiple_visits': patients_checked,
-            'patients_with_violations': len(violations),
-            'validation_passed': len(violations) == 0
+            'patients_with_violations': len(violating),
+            'validation_passed': len(violating) == 0
         }
         
         if violations:
-            result['violations'] = violations[:10]  # Return first 10
-            logger.warning(f"Found {len(violations)} patients with non-chronological dates")
+            result['violations'] = violations  # First 10
+            logger.warning(f"Found {len(violating)} patients with non-chronological dates")
         else:
             logger.info("✓ All date sequences are chronological")
         
@@ -222,44 +230,55 @@ class TemporalValidator:
         else:
             dates = data[date_col]
         
-        # Calculate intervals for each patient
-        violations = []
-        all_intervals = []
+        # Calculate intervals between consecutive dated visits of each
+        # patient from one sort by patient and date
+        codes, patient_ids = pd.factorize(data[patient_id_col])
+        visit_counts = np.bincount(codes[codes >= 0], minlength=len(patient_ids))
+        
+        date_values = self._date_values(dates)
+        dated = np.flatnonzero((codes >= 0) & ~np.isnat(date_values))
+        dated = dated[np.argsort(date_values[dated], kind='stable')]
+        dated = dated[np.argsort(codes[dated], kind='stable')]
+        group_codes = codes[dated]
+        group_dates = date_values[dated]
+        
+        same_patient = group_codes[1:] == group_codes[:-1]
+        interval_codes = group_codes[1:][same_patient]
+        all_intervals = (
+            (group_dates[1:] - group_dates[:-1])[same_patient] // np.timedelta64(1, 'D')
+        ).astype(float)
+        
+        # Per-patient violation counts and interval extremes
+        too_short = np.bincount(
+            interval_codes, weights=all_intervals < min_interval_days, minlength=len(patient_ids)
+        )
+        too_long = np.bincount(
+            interval_codes, weights=all_intervals > max_interval_days, minlength=len(patient_ids)
+        )
+        violating = np.flatnonzero((too_short > 0) | (too_long > 0))
         
-        for patient_id in data[patient_id_col].unique():
-            patient_dates = dates[data[patient_id_col] == patient_id].sort_values()
-            
-            if len(patient_dates) < 2:
-                continue
-            
-            # Calculate intervals between consecutive visits
-            intervals = patient_dates.diff().dt.days.dropna()
-            all_intervals.extend(intervals.tolist())
-            
-            # Check for violations
-            too_short = intervals < min_interval_days
-            too_long = intervals > max_interval_days
-            
-            if too_short.any() or too_long.any():
-                violations.append({
-                    'patient_id': patient_id,
-                    'visit_count': len(patient_dates),
-                    'intervals_too_short': int(too_short.sum()),
-                    'intervals_too_long': int(too_long.sum()),
-                    'min_interval': float(intervals.min()),
-                    'max_interval': float(intervals.max())
-                })
+        violations = []
+        for code in violating[:10]:
+            intervals = all_intervals[interval_codes == code]
+            violations.append({
+                'patient_id': patient_ids[code],
+                'visit_count': int(visit_counts[code]),
+                'intervals_too_short': int(too_short[code]),
+                'intervals_too_long': int(too_long[code]),
+                'min_interval': float(intervals.min()),
+                'max_interval': float(intervals.max())
+            })
         
         result = {
             'patient_id_column': patient_id_col,
             'date_column': date_col,
             'min_interval_days': min_interval_days,
             'max_interval_days': max_interval_days,
-            'patients_with_violations': len(violations),
-            'validation_passed': len(violations) == 0
+            'patients_with_violations': len(violating),
+            'validation_passed': len(violating) == 0
         }
         
-        if all_intervals:
+        if len(all_intervals) > 0:
             result['interval_statistics'] = {
                 'mean_interval_days': float(np.mean(all_intervals)),
                 'median_interval_days': float(np.median(all_intervals)),
@@ -269,8 +288,8 @@ class TemporalValidator:
             }
         
         if violations:
-            result['violations'] = violations[:10]
-            logger.warning(f"Found {len(violations)} patients with invalid visit intervals")
+            result['violations'] = violations
+            logger.warning(f"Found {len(violating)} patients with invalid visit intervals")
         else:
             logger.info("✓ All visit intervals are within valid range")
         
@@ -320,46 +339,46 @@ class TemporalValidator:
         else:
             dates = data[date_col]
         
+        # Order each patient's non-missing values by date (missing dates
+        # last) and count the transitions against the expected trend
+        codes, patient_ids = pd.factorize(data[patient_id_col])
+        values = data[value_col].to_numpy()
+        date_values = self._date_values(dates)
+        
+        rows = np.flatnonzero((codes >= 0) & pd.notna(values))
+        rows = rows[np.argsort(date_values[rows], kind='stable')]
+        rows = rows[np.argsort(codes[rows], kind='stable')]
+        group_codes = codes[rows]
+        group_values = values[rows]
+        
+        value_counts = np.bincount(group_codes, minlength=len(patient_ids))
+        same_patient = group_codes[1:] == group_codes[:-1]
+        
         violations = []
         
-        for patient_id in data[patient_id_col].unique():
-            patient_mask = data[patient_id_col] == patient_id
-            patient_data = data[patient_mask].copy()
-            patient_data['_date'] = dates[patient_mask]
-            
-            # Sort by date
-            patient_data = patient_data.sort_values('_date')
+        # Check ordering if specified
+        if should_increase is not None:
+            steps = (group_values[1:] - group_values[:-1])[same_patient]
             
-            if len(patient_data) < 2:
-                continue
+            # Values should generally increase (or decrease); more than
+            # 30% transitions the other way is a violation
+            against = steps < 0 if should_increase else steps > 0
+            against_counts = np.bincount(
+                group_codes[1:][same_patient], weights=against, minlength=len(patient_ids)
+            ).astype(int)
+            violating = np.flatnonzero(
+                (value_counts >= 2) & (against_counts > value_counts * 0.3)
+            )
             
-            values = patient_data[value_col].dropna()
-            
-            if len(values) < 2:
-                continue
-            
-            # Check ordering if specified
-            if should_increase is not None:
-                if should_increase:
-                    # Check if values generally increase
-                    decreases = (values.diff() < 0).sum()
-                    if decreases > len(values) * 0.3:  # More than 30% decreases
-                        violations.append({
-                            'patient_id': patient_id,
-                            'expected': 'increasing',
-                            'decreases_found': int(decreases),
-                            'total_transitions': len(values) - 1
-                        })
-                else:
-                    # Check if values generally decrease
-                    increases = (values.diff() > 0).sum()
-                    if increases > len(values) * 0.3:  # More than 30% increases
-                        violations.append({
-                            'patient_id': patient_id,
-                            'expected': 'decreasing',
-                            'increases_found': int(increases),
-                            'total_transitions': len(values) - 1
-                        })
+            for code in violating:
+                violation = {
+                    'patient_id': patient_ids[code],
+                    'expected': 'increasing' if should_increase else 'decreasing'
+                }
+                key = 'decreases_found' if should_increase else 'increases_found'
+                violation[key] = int(against_counts[code])
+                violation['total_transitions'] = int(value_counts[code]) - 1
+                violations.append(violation)
         
         result = {
             'patient_id_column': patient_id_col,
@@ -378,6 +397,13 @@ class TemporalValidator:
         
         return result
     
+    @staticmethod
+    def _date_values(dates: pd.Series) -> np.ndarray:
+        """Get dates as a datetime64 array; timezone-aware dates are converted to UTC"""
+        if isinstance(dates.dtype, pd.DatetimeTZDtype):
+            dates = dates.dt.tz_convert(None)
+        return dates.to_numpy()
+    
     def comprehensive_temporal_validation(self, data: pd.DataFrame,
                                          patient_id_col: str = 'patient_id',
                                          date_col: str = 'visit_date') -> Dict:
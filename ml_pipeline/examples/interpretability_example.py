@@ -171,9 +171,11 @@ def main():
     logger.info(f"  Generation time: {complete_report['generation_time']:.2f}s")
     logger.info(f"  Visualizations: {len(complete_report['visualizations'])}")
     
-    # Save cache
-    logger.info("\n9. Saving explanation cache...")
-    interp_system.save_cache()
+    # Explanation cache (persisted as explanations are generated)
+    logger.info("\n9. Explanation cache...")
+    cache_stats = interp_system.get_cache_stats()
+    logger.info(f"  Cached explanations: {cache_stats['entries']}")
+    logger.info(f"  Hits/misses: {cache_stats['hits']}/{cache_stats['misses']}")
     
     logger.info("\n" + "=" * 80)
     logger.info("INTERPRETABILITY EXAMPLE COMPLETED")
@@ -0,0 +1,87 @@
+"""
+Benchmark for TemporalValidator on large longitudinal datasets
+
+Times the date sequence, visit interval and temporal ordering checks on
+synthetic cohorts of increasing size (up to 100,000 patients by default).
+
+Usage:
+    python temporal_validation_benchmark.py [n_patients ...]
+"""
+
+import logging
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+import pandas as pd
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from data_validation import TemporalValidator
+
+
+def create_cohort(n_patients: int, visits_per_patient: int = 6, seed: int = 42) -> pd.DataFrame:
+    """
+    Create a shuffled longitudinal cohort with some out-of-order and missing dates
+    
+    Args:
+        n_patients: Number of patients
+        visits_per_patient: Average number of visits per patient
+        seed: Random seed
+        
+    Returns:
+        DataFrame with patient_id, visit_date and mmse_score columns
+    """
+    rng = np.random.default_rng(seed)
+    
+    visit_counts = rng.integers(1, 2 * visits_per_patient, n_patients)
+    patient_index = np.repeat(np.arange(n_patients), visit_counts)
+    n_rows = len(patient_index)
+    
+    # Roughly six-monthly visits with jitter, starting at random baselines
+    baseline = rng.integers(0, 3650, n_patients)[patient_index]
+    visit_number = np.arange(n_rows) - np.repeat(np.cumsum(visit_counts) - visit_counts, visit_counts)
+    days = baseline + visit_number * 182 + rng.integers(-30, 30, n_rows)
+    
+    data = pd.DataFrame({
+        'patient_id': pd.Series(patient_index).map('P{:06d}'.format),
+        'visit_date': pd.Timestamp('2010-01-01') + pd.to_timedelta(days, unit='D'),
+        'mmse_score': 29 - visit_number * rng.random(n_rows) + rng.normal(0, 1, n_rows)
+    })
+    data.loc[rng.random(n_rows) < 0.01, 'visit_date'] = pd.NaT
+    data.loc[rng.random(n_rows) < 0.05, 'mmse_score'] = np.nan
+    
+    # Shuffle a small share of rows so some sequences are out of order
+    shuffled = rng.random(n_rows) < 0.02
+    data.loc[shuffled, 'visit_date'] = rng.permutation(data.loc[shuffled, 'visit_date'].to_numpy())
+    return data
+
+
+def run_benchmark(patient_counts):
+    """Time each temporal check for every cohort size"""
+    validator = TemporalValidator()
+    
+    print(f"{'patients':>10} {'rows':>10} {'sequences':>10} {'intervals':>10} {'ordering':>10}")
+    
+    for n_patients in patient_counts:
+        data = create_cohort(n_patients)
+        timings = []
+        
+        for check, kwargs in [
+            (validator.validate_date_sequences, {}),
+            (validator.validate_visit_intervals, {}),
+            (validator.validate_temporal_ordering, {'value_col': 'mmse_score', 'should_increase': False})
+        ]:
+            start = time.perf_counter()
+            check(data, **kwargs)
+            timings.append(time.perf_counter() - start)
+        
+        print(f"{n_patients:>10,} {len(data):>10,} " + " ".join(f"{t:>9.2f}s" for t in timings))
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.ERROR)
+    counts = [int(arg) for arg in sys.argv[1:]] or [1_000, 10_000, 100_000]
+    run_benchmark(counts)
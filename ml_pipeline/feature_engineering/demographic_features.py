@@ -21,6 +21,9 @@ logger = logging.getLogger(__name__)
 class DemographicFeatureProcessor:
     """Process demographic and lifestyle features"""
     
+    # Prefixes of one-hot encoded feature columns
+    ONE_HOT_PREFIXES = ('race_',)
+    
     def __init__(self):
         """Initialize demographic feature processor"""
         self.feature_columns = []
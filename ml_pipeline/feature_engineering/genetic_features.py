@@ -19,6 +19,9 @@ logger = logging.getLogger(__name__)
 class GeneticFeatureEncoder:
     """Encode genetic risk factors as ML features"""
     
+    # Prefixes of one-hot encoded feature columns
+    ONE_HOT_PREFIXES = ('apoe_risk_',)
+    
     def __init__(self):
         """Initialize genetic feature encoder"""
         self.feature_columns = []
@@ -209,7 +212,8 @@ class GeneticFeatureEncoder:
         risk_dummies = pd.get_dummies(
             risk['apoe_risk_level'],
             prefix='apoe_risk',
-            dummy_na=False
+            dummy_na=False,
+            dtype=float
         )
         risk = pd.concat([risk, risk_dummies], axis=1)
         
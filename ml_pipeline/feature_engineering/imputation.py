@@ -31,7 +31,8 @@ class MissingDataImputer:
         self.add_indicators = add_indicators
         self.imputer = None
         self.missing_indicators = {}
-        
+        self.empty_columns = []
+    
     def fit_transform(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         Fit imputer and transform data
@@ -105,6 +106,9 @@ class MissingDataImputer:
         self.missing_indicators = {
             col: True for col in missing_pct[missing_pct > 0].index
         }
+        
+        # Columns with no observed values are filled, never modelled
+        self.empty_columns = missing_pct[missing_pct == 100].index.tolist()
     
     def _create_missing_indicators(self, data: pd.DataFrame) -> pd.DataFrame:
         """
@@ -161,7 +165,7 @@ class MissingDataImputer:
         from sklearn.impute import SimpleImputer
         
         if self.imputer is None:
-            self.imputer = SimpleImputer(strategy='mean')
+            self.imputer = SimpleImputer(strategy='mean', keep_empty_features=True)
             imputed_array = self.imputer.fit_transform(data)
         else:
             imputed_array = self.imputer.transform(data)
@@ -185,7 +189,7 @@ class MissingDataImputer:
         from sklearn.impute import SimpleImputer
         
         if self.imputer is None:
-            self.imputer = SimpleImputer(strategy='median')
+            self.imputer = SimpleImputer(strategy='median', keep_empty_features=True)
             imputed_array = self.imputer.fit_transform(data)
         else:
             imputed_array = self.imputer.transform(data)
@@ -221,6 +225,7 @@ class MissingDataImputer:
             self.imputer = IterativeImputer(
                 max_iter=10,
                 random_state=42,
+                keep_empty_features=True,
                 verbose=0
             )
             imputed_array = self.imputer.fit_transform(data)
@@ -248,7 +253,7 @@ class MissingDataImputer:
         from sklearn.impute import KNNImputer
         
         if self.imputer is None:
-            self.imputer = KNNImputer(n_neighbors=5)
+            self.imputer = KNNImputer(n_neighbors=5, keep_empty_features=True)
             imputed_array = self.imputer.fit_transform(data)
         else:
             imputed_array = self.imputer.transform(data)
@@ -259,6 +264,88 @@ class MissingDataImputer:
             index=data.index
         )
     
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """
+        Export the fitted imputer as NumPy arrays
+        
+        Mean and median imputation store the fill statistics. Iterative
+        imputation also stores the linear model of every imputation step.
+        KNN imputation needs the full training matrix and is not supported.
+        
+        Returns:
+            Dictionary mapping names to arrays
+        """
+        if self.imputer is None:
+            raise ValueError("Imputer not fitted. Call fit_transform first.")
+        
+        state = {
+            'strategy': np.array(self.strategy),
+            'add_indicators': np.array(self.add_indicators),
+            'missing_indicators': np.array(list(self.missing_indicators), dtype=str),
+            'empty_columns': np.array(self.empty_columns, dtype=str)
+        }
+        
+        if isinstance(self.imputer, ArrayImputer):
+            state.update(self.imputer.get_state())
+            return state
+        
+        if self.strategy in ('mean', 'median'):
+            state['statistics'] = self.imputer.statistics_
+        elif self.strategy == 'iterative' and hasattr(self.imputer, 'imputation_sequence_'):
+            steps = self.imputer.imputation_sequence_
+            if not all(hasattr(step.estimator, 'coef_') for step in steps):
+                raise ValueError("Only linear iterative imputation estimators can be exported")
+            
+            n_features = len(self.imputer.initial_imputer_.statistics_)
+            empty = np.isin(self.imputer.feature_names_in_, self.empty_columns)
+            
+            state.update({
+                'statistics': self.imputer.initial_imputer_.statistics_,
+                'feat_idx': np.array([step.feat_idx for step in steps], dtype=np.int64),
+                'neighbor_offsets': np.cumsum(
+                    [0] + [len(step.neighbor_feat_idx) for step in steps]
+                ).astype(np.int64),
+                'neighbor_idx': np.concatenate(
+                    [np.asarray(step.neighbor_feat_idx, dtype=np.int64) for step in steps]
+                    or [np.array([], dtype=np.int64)]
+                ),
+                'coef': np.concatenate(
+                    [np.ravel(step.estimator.coef_) for step in steps] or [np.array([])]
+                ),
+                'intercept': np.array([float(step.estimator.intercept_) for step in steps]),
+                'n_iter': np.array(self.imputer.n_iter_),
+                'min_value': np.broadcast_to(self.imputer.min_value, n_features).astype(float),
+                'max_value': np.broadcast_to(self.imputer.max_value, n_features).astype(float),
+                'empty_features': empty
+            })
+        elif self.strategy == 'iterative':
+            # IterativeImputer unavailable; fit_transform fell back to mean imputation
+            state['statistics'] = self.imputer.statistics_
+        else:
+            raise ValueError(f"Imputation strategy '{self.strategy}' cannot be exported")
+        
+        return state
+    
+    @classmethod
+    def from_state(cls, state: Dict[str, np.ndarray]) -> 'MissingDataImputer':
+        """
+        Restore a fitted imputer from arrays produced by get_state
+        
+        Args:
+            state: Dictionary mapping names to arrays
+            
+        Returns:
+            Fitted MissingDataImputer
+        """
+        imputer = cls(
+            strategy=str(state['strategy']),
+            add_indicators=bool(state['add_indicators'])
+        )
+        imputer.missing_indicators = {col: True for col in state['missing_indicators'].tolist()}
+        imputer.empty_columns = state['empty_columns'].tolist()
+        imputer.imputer = ArrayImputer.from_state(state)
+        return imputer
+    
     def get_missingness_report(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         Generate a report on missing data patterns
@@ -326,3 +413,80 @@ class MissingDataImputer:
                 )
         
         return validation
+
+
+class ArrayImputer:
+    """
+    Fitted imputer restored from stored arrays
+    
+    Applies the same arithmetic as the scikit-learn imputer it was exported
+    from: missing values are first filled with the fit statistics, then, for
+    iterative imputation, each step predicts one feature's missing values
+    from its neighbor features with a linear model.
+    """
+    
+    ITERATIVE_KEYS = [
+        'feat_idx', 'neighbor_offsets', 'neighbor_idx', 'coef', 'intercept',
+        'n_iter', 'min_value', 'max_value', 'empty_features'
+    ]
+    
+    def __init__(self, statistics: np.ndarray, steps: Optional[Dict[str, np.ndarray]] = None):
+        """
+        Initialize array imputer
+        
+        Args:
+            statistics: Fill value for each feature
+            steps: Iterative imputation steps (see ITERATIVE_KEYS), or None
+        """
+        self.statistics = np.asarray(statistics, dtype=float)
+        self.steps = steps
+    
+    @classmethod
+    def from_state(cls, state: Dict[str, np.ndarray]) -> 'ArrayImputer':
+        """Create an array imputer from exported state"""
+        steps = None
+        if 'feat_idx' in state:
+            steps = {key: state[key] for key in cls.ITERATIVE_KEYS}
+        return cls(state['statistics'], steps)
+    
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """Export the imputer arrays"""
+        state = {'statistics': self.statistics}
+        state.update(self.steps or {})
+        return state
+    
+    def transform(self, X) -> np.ndarray:
+        """
+        Impute missing values
+        
+        Args:
+            X: Array-like with features in fit order
+            
+        Returns:
+            Array with imputed values
+        """
+        X = np.array(X, dtype=float)
+        missing = np.isnan(X)
+        Xt = np.where(missing, self.statistics, X)
+        
+        if self.steps is None:
+            return Xt
+        
+        steps = self.steps
+        mask = missing & ~steps['empty_features']
+        
+        if int(steps['n_iter']) == 0 or mask.all():
+            return Xt
+        
+        offsets = steps['neighbor_offsets']
+        for k, feat in enumerate(steps['feat_idx']):
+            rows = mask[:, feat]
+            if not rows.any():
+                continue
+            
+            neighbors = steps['neighbor_idx'][offsets[k]:offsets[k + 1]]
+            coef = steps['coef'][offsets[k]:offsets[k + 1]]
+            predicted = Xt[rows][:, neighbors] @ coef + steps['intercept'][k]
+            Xt[rows, feat] = np.clip(predicted, steps['min_value'][feat], steps['max_value'][feat])
+        
+        return Xt
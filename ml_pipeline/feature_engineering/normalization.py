@@ -238,6 +238,51 @@ class FeatureNormalizer:
         
         return params
     
+    def get_state(self) -> Dict[str, np.ndarray]:
+        """
+        Export the fitted normalizer as NumPy arrays
+        
+        Returns:
+            Dictionary mapping names to arrays
+        """
+        if self.scaler is None:
+            raise ValueError("Normalizer not fitted")
+        
+        state = {
+            'method': np.array(self.method),
+            'exclude_binary': np.array(self.exclude_binary),
+            'feature_columns': np.array(self.feature_columns, dtype=str),
+            'binary_columns': np.array(self.binary_columns, dtype=str)
+        }
+        
+        for attr in ArrayScaler.ATTRIBUTES[self.method]:
+            state[attr] = np.asarray(getattr(self.scaler, attr), dtype=float)
+        
+        return state
+    
+    @classmethod
+    def from_state(cls, state: Dict[str, np.ndarray]) -> 'FeatureNormalizer':
+        """
+        Restore a fitted normalizer from arrays produced by get_state
+        
+        Args:
+            state: Dictionary mapping names to arrays
+            
+        Returns:
+            Fitted FeatureNormalizer
+        """
+        normalizer = cls(
+            method=str(state['method']),
+            exclude_binary=bool(state['exclude_binary'])
+        )
+        normalizer.feature_columns = state['feature_columns'].tolist()
+        normalizer.binary_columns = state['binary_columns'].tolist()
+        normalizer.scaler = ArrayScaler(
+            normalizer.method,
+            **{attr: state[attr] for attr in ArrayScaler.ATTRIBUTES[normalizer.method]}
+        )
+        return normalizer
+    
     def inverse_transform(self, data: pd.DataFrame) -> pd.DataFrame:
         """
         Inverse transform normalized features back to original scale
@@ -326,3 +371,59 @@ class FeatureNormalizer:
         })
         
         return stats
+
+
+class ArrayScaler:
+    """
+    Fitted scaler restored from stored arrays
+    
+    Exposes the same fitted attributes and applies the same arithmetic as
+    the scikit-learn scaler it was exported from.
+    """
+    
+    ATTRIBUTES = {
+        'standard': ['mean_', 'scale_'],
+        'minmax': ['min_', 'scale_', 'data_min_', 'data_max_'],
+        'robust': ['center_', 'scale_']
+    }
+    
+    def __init__(self, method: str, **arrays: np.ndarray):
+        """
+        Initialize array scaler
+        
+        Args:
+            method: Normalization method ('standard', 'minmax', 'robust')
+            **arrays: Fitted attributes listed in ATTRIBUTES for the method
+        """
+        if method not in self.ATTRIBUTES:
+            raise ValueError(f"Unknown normalization method: {method}")
+        
+        self.method = method
+        for attr in self.ATTRIBUTES[method]:
+            setattr(self, attr, np.asarray(arrays[attr], dtype=float))
+    
+    def transform(self, X) -> np.ndarray:
+        """Scale features"""
+        X = np.array(X, dtype=float)
+        
+        if self.method == 'minmax':
+            X *= self.scale_
+            X += self.min_
+        else:
+            X -= self.mean_ if self.method == 'standard' else self.center_
+            X /= self.scale_
+        
+        return X
+    
+    def inverse_transform(self, X) -> np.ndarray:
+        """Undo feature scaling"""
+        X = np.array(X, dtype=float)
+        
+        if self.method == 'minmax':
+            X -= self.min_
+            X /= self.scale_
+        else:
+            X *= self.scale_
+            X += self.mean_ if self.method == 'standard' else self.center_
+        
+        return X
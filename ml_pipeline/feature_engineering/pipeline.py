@@ -15,9 +15,13 @@ Main pipeline that orchestrates all feature engineering steps:
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple, Union
 from pathlib import Path
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+import hashlib
 import logging
+import os
 
 from .cognitive_features import CognitiveFeatureExtractor
 from .biomarker_features import BiomarkerFeatureProcessor
@@ -31,15 +35,58 @@ from .feature_report import FeatureReportGenerator
 
 logger = logging.getLogger(__name__)
 
+# Fitted pipeline held by each chunk worker process
+_worker_pipeline: Optional['FeatureEngineeringPipeline'] = None
+
+
+def _run_extractor(extractor, data: pd.DataFrame) -> Tuple[pd.DataFrame, object]:
+    """
+    Run one extractor in a worker process
+    
+    The extractor is returned with its features so the state it records
+    (its feature columns) is carried back to the parent process.
+    """
+    features = extractor.extract_features(data)
+    return features, extractor
+
+
+def _init_chunk_worker(pipeline: 'FeatureEngineeringPipeline') -> None:
+    """Receive the fitted pipeline once per worker process"""
+    global _worker_pipeline
+    # The worker is already one of n_jobs processes; it must not start its own pool
+    pipeline.n_jobs = 1
+    _worker_pipeline = pipeline
+
+
+def _transform_chunk(
+    chunk: pd.DataFrame,
+    patient_id_col: str,
+    visit_date_col: str
+) -> pd.DataFrame:
+    """Transform one chunk with the worker's fitted pipeline"""
+    return _worker_pipeline.transform(chunk, patient_id_col, visit_date_col)
+
 
 class FeatureEngineeringPipeline:
     """Complete feature engineering pipeline for biomedical data"""
     
+    ARTIFACT_FORMAT_VERSION = 1
+    
+    EXTRACTORS = [
+        ('cognitive_extractor', 'Extracting cognitive features'),
+        ('biomarker_processor', 'Processing biomarker features'),
+        ('imaging_extractor', 'Extracting imaging features'),
+        ('genetic_encoder', 'Encoding genetic features'),
+        ('demographic_processor', 'Processing demographic features')
+    ]
+    
     def __init__(
         self,
         imputation_strategy: str = 'iterative',
         normalization_method: str = 'standard',
-        include_temporal: bool = True
+        include_temporal: bool = True,
+        n_jobs: int = 1,
+        chunk_size: int = 50000
     ):
         """
         Initialize feature engineering pipeline
@@ -48,10 +95,18 @@ class FeatureEngineeringPipeline:
             imputation_strategy: Strategy for missing data imputation
             normalization_method: Method for feature normalization
             include_temporal: Whether to include temporal features
+            n_jobs: Number of worker processes for feature extraction in
+                fit_transform and for transform_chunks (1 runs everything
+                sequentially in this process). transform always runs the
+                extractors in this process, so single inference calls pay
+                no pool start-up
+            chunk_size: Approximate number of rows per chunk in transform_chunks
         """
         self.imputation_strategy = imputation_strategy
         self.normalization_method = normalization_method
         self.include_temporal = include_temporal
+        self.n_jobs = n_jobs
+        self.chunk_size = chunk_size
         
         # Initialize extractors
         self.cognitive_extractor = CognitiveFeatureExtractor()
@@ -64,10 +119,17 @@ class FeatureEngineeringPipeline:
         # Initialize transformers
         self.imputer = MissingDataImputer(strategy=imputation_strategy)
         self.normalizer = FeatureNormalizer(method=normalization_method)
+        self.temporal_normalizer = FeatureNormalizer(method=normalization_method)
+        
+        # Columns seen at fit time, used to align the output of transform
+        self.feature_columns: List[str] = []
+        self.imputed_columns: List[str] = []
+        self.temporal_columns: List[str] = []
         
         # Initialize reporter
         self.reporter = FeatureReportGenerator()
         
+        self.content_hash: Optional[str] = None
         self.is_fitted = False
         
     def fit_transform(
@@ -89,38 +151,14 @@ class FeatureEngineeringPipeline:
         """
         logger.info("Starting feature engineering pipeline")
         
-        # Step 1: Extract cognitive features
-        logger.info("Step 1/9: Extracting cognitive features")
-        cognitive_features = self.cognitive_extractor.extract_features(data)
-        
-        # Step 2: Process biomarker features
-        logger.info("Step 2/9: Processing biomarker features")
-        biomarker_features = self.biomarker_processor.extract_features(data)
-        
-        # Step 3: Extract imaging features
-        logger.info("Step 3/9: Extracting imaging features")
-        imaging_features = self.imaging_extractor.extract_features(data)
-        
-        # Step 4: Encode genetic features
-        logger.info("Step 4/9: Encoding genetic features")
-        genetic_features = self.genetic_encoder.extract_features(data)
-        
-        # Step 5: Process demographic features
-        logger.info("Step 5/9: Processing demographic features")
-        demographic_features = self.demographic_processor.extract_features(data)
-        
-        # Combine all features
-        all_features = pd.concat([
-            cognitive_features,
-            biomarker_features,
-            imaging_features,
-            genetic_features,
-            demographic_features
-        ], axis=1)
+        # Steps 1-5: Extract cognitive, biomarker, imaging, genetic and demographic features
+        all_features = self._extract_features(data, log_steps=True, parallel=self.n_jobs > 1)
+        self.feature_columns = all_features.columns.tolist()
         
         # Step 6: Impute missing data
         logger.info("Step 6/9: Imputing missing data")
         imputed_features = self.imputer.fit_transform(all_features)
+        self.imputed_columns = imputed_features.columns.tolist()
         
         # Step 7: Normalize features
         logger.info("Step 7/9: Normalizing features")
@@ -132,9 +170,10 @@ class FeatureEngineeringPipeline:
             temporal_features = self.temporal_engineer.extract_features(
                 data, patient_id_col, visit_date_col
             )
+            self.temporal_columns = temporal_features.columns.tolist()
             
             # Normalize temporal features
-            temporal_normalized = self.normalizer.transform(temporal_features)
+            temporal_normalized = self.temporal_normalizer.fit_transform(temporal_features)
             
             # Combine with other features
             normalized_features = pd.concat([
@@ -143,6 +182,7 @@ class FeatureEngineeringPipeline:
             ], axis=1)
         else:
             logger.info("Step 8/9: Skipping temporal features")
+            self.temporal_columns = []
         
         # Step 9: Generate feature report
         logger.info("Step 9/9: Generating feature report")
@@ -175,32 +215,22 @@ class FeatureEngineeringPipeline:
         
         logger.info("Transforming new data")
         
-        # Extract features
-        cognitive_features = self.cognitive_extractor.extract_features(data)
-        biomarker_features = self.biomarker_processor.extract_features(data)
-        imaging_features = self.imaging_extractor.extract_features(data)
-        genetic_features = self.genetic_encoder.extract_features(data)
-        demographic_features = self.demographic_processor.extract_features(data)
-        
-        # Combine features
-        all_features = pd.concat([
-            cognitive_features,
-            biomarker_features,
-            imaging_features,
-            genetic_features,
-            demographic_features
-        ], axis=1)
-        
-        # Impute and normalize
-        imputed_features = self.imputer.transform(all_features)
+        # Extract features, aligned to the columns seen at fit time
+        all_features = self._align_features(self._extract_features(data))
+        
+        # Impute and normalize; missingness indicators for columns with no
+        # missing values in this data are all zero
+        imputed_features = self.imputer.transform(all_features).reindex(
+            columns=self.imputed_columns, fill_value=0.0
+        )
         normalized_features = self.normalizer.transform(imputed_features)
         
-        # Add temporal features if requested
-        if self.include_temporal and patient_id_col in data.columns:
+        # Add temporal features if they were fitted
+        if self.temporal_columns and patient_id_col in data.columns:
             temporal_features = self.temporal_engineer.extract_features(
                 data, patient_id_col, visit_date_col
-            )
-            temporal_normalized = self.normalizer.transform(temporal_features)
+            ).reindex(columns=self.temporal_columns)
+            temporal_normalized = self.temporal_normalizer.transform(temporal_features)
             normalized_features = pd.concat([
                 normalized_features,
                 temporal_normalized
@@ -208,6 +238,189 @@ class FeatureEngineeringPipeline:
         
         return normalized_features
     
+    def transform_chunks(
+        self,
+        data: Union[pd.DataFrame, Iterable[pd.DataFrame]],
+        patient_id_col: str = 'patient_id',
+        visit_date_col: str = 'visit_date',
+        n_jobs: Optional[int] = None
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Transform data chunk by chunk using the fitted pipeline
+        
+        Chunks are transformed in worker processes and yielded in input
+        order. At most two chunks per worker are in flight, so memory stays
+        bounded when re-featurizing a whole dataset. Temporal features are
+        computed per patient, so every chunk must hold all visits of its
+        patients; a DataFrame is split with iter_patient_chunks.
+        
+        Args:
+            data: Raw biomedical data, or an iterable of patient-partitioned chunks
+            patient_id_col: Name of patient ID column
+            visit_date_col: Name of visit date column
+            n_jobs: Number of worker processes (defaults to the pipeline's n_jobs)
+            
+        Yields:
+            DataFrame with engineered features for each chunk
+        """
+        if not self.is_fitted:
+            raise ValueError("Pipeline not fitted. Call fit_transform first.")
+        
+        if isinstance(data, pd.DataFrame):
+            chunks = self.iter_patient_chunks(data, patient_id_col, self.chunk_size)
+        else:
+            chunks = iter(data)
+        
+        n_jobs = n_jobs or self.n_jobs
+        
+        if n_jobs <= 1:
+            for chunk in chunks:
+                yield self.transform(chunk, patient_id_col, visit_date_col)
+            return
+        
+        logger.info(f"Transforming chunks on {n_jobs} worker processes")
+        
+        with ProcessPoolExecutor(
+            max_workers=n_jobs,
+            initializer=_init_chunk_worker,
+            initargs=(self,)
+        ) as executor:
+            pending = deque()
+            
+            for chunk in chunks:
+                pending.append(executor.submit(
+                    _transform_chunk, chunk, patient_id_col, visit_date_col
+                ))
+                
+                if len(pending) >= 2 * n_jobs:
+                    yield pending.popleft().result()
+            
+            while pending:
+                yield pending.popleft().result()
+    
+    @staticmethod
+    def iter_patient_chunks(
+        data: pd.DataFrame,
+        patient_id_col: str = 'patient_id',
+        chunk_size: int = 50000
+    ) -> Iterator[pd.DataFrame]:
+        """
+        Split data into chunks that keep each patient's rows together
+        
+        Patients are assigned to chunks whole, so a chunk can exceed
+        chunk_size by up to one patient's visits. Rows keep their original
+        order within each chunk.
+        
+        Args:
+            data: Raw biomedical data
+            patient_id_col: Name of patient ID column
+            chunk_size: Approximate number of rows per chunk
+            
+        Yields:
+            DataFrame chunks
+        """
+        if patient_id_col not in data.columns:
+            for start in range(0, len(data), chunk_size):
+                yield data.iloc[start:start + chunk_size]
+            return
+        
+        # Cumulative row count per patient, in order of first appearance
+        codes, _ = pd.factorize(data[patient_id_col], use_na_sentinel=False)
+        rows_per_patient = np.bincount(codes)
+        patient_chunk = (np.cumsum(rows_per_patient) - 1) // chunk_size
+        row_chunk = patient_chunk[codes]
+        
+        if len(row_chunk) == 0:
+            return
+        
+        # One stable sort groups rows by chunk, keeping their order within it
+        order = np.argsort(row_chunk, kind='stable')
+        boundaries = np.flatnonzero(np.diff(row_chunk[order])) + 1
+        
+        for rows in np.split(order, boundaries):
+            yield data.iloc[rows]
+    
+    def _extract_features(
+        self,
+        data: pd.DataFrame,
+        log_steps: bool = False,
+        parallel: bool = False
+    ) -> pd.DataFrame:
+        """
+        Run the cognitive, biomarker, imaging, genetic and demographic extractors
+        
+        The extractors are independent, so with parallel set they run
+        concurrently on a process pool of up to n_jobs workers. Results are
+        combined in the same order either way. Non-numeric columns (such as
+        category labels that are also one-hot encoded) are left out.
+        
+        Args:
+            data: Raw biomedical data
+            log_steps: Whether to log each extraction step
+            parallel: Whether to run the extractors on a process pool
+            
+        Returns:
+            DataFrame with combined extracted features
+        """
+        if parallel:
+            if log_steps:
+                logger.info(
+                    f"Steps 1-5/9: Running {len(self.EXTRACTORS)} extractors on "
+                    f"{min(self.n_jobs, len(self.EXTRACTORS))} worker processes"
+                )
+            
+            with ProcessPoolExecutor(max_workers=min(self.n_jobs, len(self.EXTRACTORS))) as executor:
+                futures = [
+                    executor.submit(_run_extractor, getattr(self, attr), data)
+                    for attr, _ in self.EXTRACTORS
+                ]
+                results = [future.result() for future in futures]
+            
+            feature_sets = []
+            for (attr, _), (features, extractor) in zip(self.EXTRACTORS, results):
+                setattr(self, attr, extractor)
+                feature_sets.append(features)
+        else:
+            feature_sets = []
+            for step, (attr, description) in enumerate(self.EXTRACTORS, start=1):
+                if log_steps:
+                    logger.info(f"Step {step}/9: {description}")
+                feature_sets.append(getattr(self, attr).extract_features(data))
+        
+        # Combine all features
+        all_features = pd.concat(feature_sets, axis=1)
+        
+        return all_features.select_dtypes(include=['number', 'bool'])
+    
+    def _align_features(self, features: pd.DataFrame) -> pd.DataFrame:
+        """
+        Align extracted features to the columns seen at fit time
+        
+        Absent features are missing, so the imputer fills them. The
+        exception is a one-hot column for a category absent from this data:
+        it is 0 in every row where another column of its encoding has a
+        value.
+        
+        Args:
+            features: Features extracted from new data
+            
+        Returns:
+            DataFrame with feature_columns in fit order
+        """
+        aligned = features.reindex(columns=self.feature_columns)
+        
+        for attr, _ in self.EXTRACTORS:
+            for prefix in getattr(getattr(self, attr), 'ONE_HOT_PREFIXES', ()):
+                encoding = [col for col in self.feature_columns if col.startswith(prefix)]
+                present = [col for col in encoding if col in features.columns]
+                absent = [col for col in encoding if col not in features.columns]
+                
+                if present and absent:
+                    encoded = features[present].notna().any(axis=1).to_numpy()
+                    aligned.loc[encoded, absent] = 0.0
+        
+        return aligned
+    
     def get_feature_names(self) -> List[str]:
         """
         Get list of all feature names
@@ -258,6 +471,143 @@ class FeatureEngineeringPipeline:
         # Save report
         self.reporter.save_report(self.feature_report, output_path)
     
+    def save(self, path: Union[str, Path]) -> str:
+        """
+        Save the fitted pipeline as a versioned NumPy artifact
+        
+        The artifact is a single .npz file of plain arrays: configuration,
+        feature-name order, imputation statistics and scaler parameters.
+        Nothing is pickled, so it loads quickly and safely. A SHA-256 content
+        hash over all arrays is stored with them and checked by load.
+        
+        Args:
+            path: Output file path (.npz)
+            
+        Returns:
+            Content hash of the artifact
+        """
+        if not self.is_fitted:
+            raise ValueError("Pipeline not fitted. Call fit_transform first.")
+        
+        arrays = {
+            'format_version': np.array(self.ARTIFACT_FORMAT_VERSION),
+            'config.imputation_strategy': np.array(self.imputation_strategy),
+            'config.normalization_method': np.array(self.normalization_method),
+            'config.include_temporal': np.array(self.include_temporal),
+            'columns.features': np.array(self.feature_columns, dtype=str),
+            'columns.imputed': np.array(self.imputed_columns, dtype=str),
+            'columns.temporal': np.array(self.temporal_columns, dtype=str)
+        }
+        
+        for attr, _ in self.EXTRACTORS + [('temporal_engineer', None)]:
+            arrays[f'extractor.{attr}'] = np.array(getattr(self, attr).feature_columns, dtype=str)
+        
+        components = [('imputer', self.imputer), ('normalizer', self.normalizer)]
+        if self.temporal_columns:
+            components.append(('temporal_normalizer', self.temporal_normalizer))
+        
+        for prefix, component in components:
+            for key, value in component.get_state().items():
+                arrays[f'{prefix}.{key}'] = np.asarray(value)
+        
+        content_hash = self._content_hash(arrays)
+        arrays['content_hash'] = np.array(content_hash)
+        
+        path = Path(path)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        
+        # Write to a temporary file first so readers never see a partial artifact
+        tmp_path = path.with_name(path.name + '.tmp')
+        with open(tmp_path, 'wb') as f:
+            np.savez(f, **arrays)
+        os.replace(tmp_path, path)
+        self.content_hash = content_hash
+        
+        logger.info(f"Saved fitted pipeline to {path} (hash {content_hash[:12]})")
+        return content_hash
+    
+    @classmethod
+    def load(cls, path: Union[str, Path], expected_hash: Optional[str] = None) -> 'FeatureEngineeringPipeline':
+        """
+        Load a fitted pipeline saved with save
+        
+        The loaded pipeline can transform data without refitting. The
+        feature report is not part of the artifact.
+        
+        Args:
+            path: Artifact file path (.npz)
+            expected_hash: Content hash the artifact must have, if known
+            
+        Returns:
+            Fitted FeatureEngineeringPipeline
+        """
+        with np.load(path, allow_pickle=False) as npz:
+            arrays = {key: npz[key] for key in npz.files}
+        
+        stored_hash = str(arrays.pop('content_hash'))
+        if cls._content_hash(arrays) != stored_hash:
+            raise ValueError(f"Pipeline artifact {path} is corrupt: content hash mismatch")
+        if expected_hash is not None and stored_hash != expected_hash:
+            raise ValueError(
+                f"Pipeline artifact {path} has hash {stored_hash}, expected {expected_hash}"
+            )
+        
+        format_version = int(arrays['format_version'])
+        if format_version > cls.ARTIFACT_FORMAT_VERSION:
+            raise ValueError(f"Unsupported pipeline artifact format version: {format_version}")
+        
+        pipeline = cls(
+            imputation_strategy=str(arrays['config.imputation_strategy']),
+            normalization_method=str(arrays['config.normalization_method']),
+            include_temporal=bool(arrays['config.include_temporal'])
+        )
+        
+        pipeline.feature_columns = arrays['columns.features'].tolist()
+        pipeline.imputed_columns = arrays['columns.imputed'].tolist()
+        pipeline.temporal_columns = arrays['columns.temporal'].tolist()
+        
+        for attr, _ in cls.EXTRACTORS + [('temporal_engineer', None)]:
+            getattr(pipeline, attr).feature_columns = arrays[f'extractor.{attr}'].tolist()
+        
+        def component_state(prefix: str) -> Dict[str, np.ndarray]:
+            return {
+                key[len(prefix) + 1:]: value
+                for key, value in arrays.items()
+                if key.startswith(prefix + '.')
+            }
+        
+        pipeline.imputer = MissingDataImputer.from_state(component_state('imputer'))
+        pipeline.normalizer = FeatureNormalizer.from_state(component_state('normalizer'))
+        if pipeline.temporal_columns:
+            pipeline.temporal_normalizer = FeatureNormalizer.from_state(
+                component_state('temporal_normalizer')
+            )
+        
+        pipeline.content_hash = stored_hash
+        pipeline.feature_report = None
+        pipeline.is_fitted = True
+        
+        logger.info(f"Loaded fitted pipeline from {path} (hash {stored_hash[:12]})")
+        return pipeline
+    
+    @staticmethod
+    def _content_hash(arrays: Dict[str, np.ndarray]) -> str:
+        """
+        Hash artifact arrays by name, dtype, shape and contents
+        
+        Args:
+            arrays: Dictionary mapping names to arrays
+            
+        Returns:
+            Hex SHA-256 digest
+        """
+        digest = hashlib.sha256()
+        for key in sorted(arrays):
+            value = np.ascontiguousarray(arrays[key])
+            digest.update(f"{key}|{value.dtype.str}|{value.shape}|".encode())
+            digest.update(value.tobytes())
+        return digest.hexdigest()
+    
     def validate_pipeline(self, data: pd.DataFrame) -> Dict[str, bool]:
         """
         Validate pipeline on data
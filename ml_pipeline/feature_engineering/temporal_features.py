@@ -11,7 +11,7 @@ Creates temporal features from longitudinal data including:
 
 import pandas as pd
 import numpy as np
-from typing import Dict, List, Optional
+from typing import Dict, List, Optional, Tuple
 from datetime import datetime
 import logging
 
@@ -244,39 +244,33 @@ class TemporalFeatureEngineer:
         Returns:
             Series with change rates
         """
-        change_rates = []
+        order, patient_start, block_start, _ = self._visit_order(
+            data, patient_id_col, visit_date_col
+        )
         
-        for idx, row in data.iterrows():
-            patient_id = row[patient_id_col]
-            current_date = row[visit_date_col]
-            current_value = row[measure_col]
-            
-            # Get patient's previous visits
-            patient_data = data[
-                (data[patient_id_col] == patient_id) &
-                (data[visit_date_col] < current_date)
-            ].sort_values(visit_date_col)
-            
-            if len(patient_data) == 0 or pd.isna(current_value):
-                # No previous data or missing current value
-                change_rates.append(0.0)
-            else:
-                # Get most recent previous visit
-                prev_row = patient_data.iloc[-1]
-                prev_value = prev_row[measure_col]
-                prev_date = prev_row[visit_date_col]
-                
-                if pd.isna(prev_value):
-                    change_rates.append(0.0)
-                else:
-                    # Calculate change per month
-                    time_diff_months = (current_date - prev_date).days / 30.44
-                    
-                    if time_diff_months > 0:
-                        rate = (current_value - prev_value) / time_diff_months
-                        change_rates.append(rate)
-                    else:
-                        change_rates.append(0.0)
+        values = data[measure_col].to_numpy(dtype=float, na_value=np.nan)[order]
+        dates = data[visit_date_col].to_numpy()[order]
+        
+        # The previous visit is the last row before the current same-date block
+        previous = block_start - 1
+        has_previous = previous >= patient_start
+        previous = np.where(has_previous, previous, 0)
+        
+        time_diff_months = ((dates - dates[previous]) // np.timedelta64(1, 'D')) / 30.44
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rates = (values - values[previous]) / time_diff_months
+        
+        valid = (
+            has_previous &
+            ~np.isnan(values) &
+            ~np.isnan(values[previous]) &
+            (time_diff_months > 0)
+        )
+        
+        # Rows without a previous visit or with missing values get 0.0
+        change_rates = np.zeros(len(data))
+        change_rates[order] = np.where(valid, rates, 0.0)
         
         return pd.Series(change_rates, index=data.index)
     
@@ -300,25 +294,18 @@ class TemporalFeatureEngineer:
         if visit_date_col not in data.columns:
             return pd.Series(np.nan, index=data.index)
         
-        frequencies = []
+        visits = data[[patient_id_col, visit_date_col]].sort_values(
+            [patient_id_col, visit_date_col], kind='mergesort'
+        )
+        
+        # Average time between consecutive visits per patient
+        gaps = visits.groupby(patient_id_col)[visit_date_col].diff()
+        mean_gaps = gaps.groupby(visits[patient_id_col]).mean()
         
-        for idx, row in data.iterrows():
-            patient_id = row[patient_id_col]
-            
-            # Get all visits for this patient
-            patient_visits = data[
-                data[patient_id_col] == patient_id
-            ][visit_date_col].sort_values()
-            
-            if len(patient_visits) <= 1:
-                frequencies.append(np.nan)
-            else:
-                # Calculate average time between visits
-                time_diffs = patient_visits.diff().dropna()
-                avg_diff_months = time_diffs.mean().days / 30.44
-                frequencies.append(avg_diff_months)
-        
-        return pd.Series(frequencies, index=data.index)
+        # Patients with a single visit have no gaps and get NaN
+        frequencies = mean_gaps.dt.days / 30.44
+        
+        return data[patient_id_col].map(frequencies).astype(float)
     
     def calculate_trajectory_features(
         self,
@@ -374,40 +361,79 @@ class TemporalFeatureEngineer:
         Returns:
             Series with trajectory classifications
         """
-        trajectories = []
+        order, patient_start, _, block_end = self._visit_order(
+            data, patient_id_col, visit_date_col
+        )
         
-        for idx, row in data.iterrows():
-            patient_id = row[patient_id_col]
-            current_date = row[visit_date_col]
-            
-            # Get patient's data up to current visit
-            patient_data = data[
-                (data[patient_id_col] == patient_id) &
-                (data[visit_date_col] <= current_date)
-            ].sort_values(visit_date_col)
-            
-            if len(patient_data) < 2:
-                # Not enough data to determine trajectory
-                trajectories.append(0)  # Assume stable
-            else:
-                # Calculate overall change
-                first_value = patient_data[measure_col].iloc[0]
-                last_value = patient_data[measure_col].iloc[-1]
-                
-                if pd.isna(first_value) or pd.isna(last_value):
-                    trajectories.append(0)
-                else:
-                    change = last_value - first_value
-                    
-                    if change <= declining_threshold:
-                        trajectories.append(1)  # Declining
-                    elif change >= abs(declining_threshold):
-                        trajectories.append(2)  # Improving
-                    else:
-                        trajectories.append(0)  # Stable
+        values = data[measure_col].to_numpy(dtype=float, na_value=np.nan)[order]
+        
+        # Visits up to the current one run from the patient's first visit to
+        # the end of the current same-date block
+        visit_count = block_end - patient_start + 1
+        change = values[block_end] - values[patient_start]
+        
+        with np.errstate(invalid='ignore'):
+            declining = (visit_count >= 2) & (change <= declining_threshold)
+            improving = (visit_count >= 2) & (change >= abs(declining_threshold))
+        
+        # Missing values or fewer than two visits are classified as stable (0)
+        trajectories = np.zeros(len(data), dtype=np.int64)
+        trajectories[order] = np.select([declining, improving], [1, 2], default=0)
         
         return pd.Series(trajectories, index=data.index)
     
+    @staticmethod
+    def _visit_order(
+        data: pd.DataFrame,
+        patient_id_col: str,
+        visit_date_col: str
+    ) -> Tuple[np.ndarray, np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Sort visits by patient and date for vectorized per-patient calculations
+        
+        Rows with a missing patient ID or visit date are left out, since they
+        never match a patient or date comparison. Visits on the same date keep
+        their original row order.
+        
+        Args:
+            data: DataFrame with longitudinal data
+            patient_id_col: Patient ID column name
+            visit_date_col: Visit date column name
+            
+        Returns:
+            Tuple of (order, patient_start, block_start, block_end) where order
+            holds row positions in sorted order and, for each sorted row, the
+            other arrays hold the sorted positions where its patient's visits
+            start and where its same-date block starts and ends
+        """
+        patients = data[patient_id_col].to_numpy()
+        dates = data[visit_date_col].to_numpy()
+        
+        valid = np.flatnonzero(pd.notna(patients) & pd.notna(dates))
+        keys = pd.DataFrame({'patient': patients[valid], 'date': dates[valid]})
+        sorted_keys = keys.sort_values(['patient', 'date'], kind='mergesort')
+        
+        order = valid[sorted_keys.index.to_numpy()]
+        sorted_patients = sorted_keys['patient'].to_numpy()
+        sorted_dates = sorted_keys['date'].to_numpy()
+        
+        n = len(order)
+        positions = np.arange(n)
+        
+        new_patient = np.ones(n, dtype=bool)
+        new_patient[1:] = sorted_patients[1:] != sorted_patients[:-1]
+        new_block = new_patient.copy()
+        new_block[1:] |= sorted_dates[1:] != sorted_dates[:-1]
+        
+        patient_start = np.maximum.accumulate(np.where(new_patient, positions, 0))
+        block_start = np.maximum.accumulate(np.where(new_block, positions, 0))
+        
+        last_in_block = np.ones(n, dtype=bool)
+        last_in_block[:-1] = new_block[1:]
+        block_end = np.minimum.accumulate(np.where(last_in_block, positions, n)[::-1])[::-1]
+        
+        return order, patient_start, block_start, block_end
+    
     def get_feature_names(self) -> List[str]:
         """Get list of extracted feature names"""
         return self.feature_columns
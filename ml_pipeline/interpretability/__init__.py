@@ -12,6 +12,7 @@ from ml_pipeline.interpretability.shap_explainer import (
 from ml_pipeline.interpretability.feature_importance import FeatureImportanceAnalyzer
 from ml_pipeline.interpretability.visualization import InterpretabilityVisualizer
 from ml_pipeline.interpretability.confidence_intervals import ConfidenceIntervalCalculator
+from ml_pipeline.interpretability.explanation_cache import ExplanationCache
 
 __all__ = [
     'SHAPExplainer',
@@ -19,5 +20,6 @@ __all__ = [
     'DeepSHAPExplainer',
     'FeatureImportanceAnalyzer',
     'InterpretabilityVisualizer',
-    'ConfidenceIntervalCalculator'
+    'ConfidenceIntervalCalculator',
+    'ExplanationCache'
 ]
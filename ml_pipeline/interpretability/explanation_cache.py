@@ -0,0 +1,372 @@
+"""
+Bounded, persistent cache of prediction explanations
+
+Explanations are stored in an SQLite database keyed by model version and
+feature-row hash, so warm explanations survive restarts and are shared by
+every worker process pointed at the same file. The cache is bounded by
+entry count and stored bytes and evicts least-recently-used entries.
+"""
+
+import hashlib
+import json
+import logging
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Dict, Iterator, List, Optional, Any, Sequence, Tuple
+
+import numpy as np
+
+logger = logging.getLogger(__name__)
+
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS explanations (
+    cache_key TEXT PRIMARY KEY,
+    model_version TEXT NOT NULL,
+    explanation_json TEXT NOT NULL,
+    size_bytes INTEGER NOT NULL,
+    last_access REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_explanations_last_access
+    ON explanations (last_access);
+CREATE INDEX IF NOT EXISTS idx_explanations_version
+    ON explanations (model_version);
+
+CREATE TABLE IF NOT EXISTS explanation_totals (
+    id INTEGER PRIMARY KEY CHECK (id = 0),
+    entries INTEGER NOT NULL,
+    total_bytes INTEGER NOT NULL
+);
+"""
+
+# SQLite limits the number of bound parameters per statement
+MAX_QUERY_PARAMETERS = 500
+
+
+class ExplanationCache:
+    """
+    SQLite-backed LRU cache of explanation dictionaries.
+
+    Explanations are stored as JSON. Limits are enforced across all
+    processes sharing the database: each write evicts the least recently
+    used entries until the cache is within max_entries and max_bytes.
+    Entry and byte totals are kept in a one-row table updated in the same
+    transaction, so writes never scan the cache.
+
+    Reads only write back an entry's access time once it is older than
+    touch_interval, so cache hits from many processes rarely contend for
+    the database's write lock. Recency is therefore tracked to within
+    touch_interval seconds.
+    """
+
+    def __init__(
+        self,
+        db_path: Path,
+        max_entries: int = 10000,
+        max_bytes: int = 256 * 1024 * 1024,
+        touch_interval: float = 60.0
+    ):
+        """
+        Initialize explanation cache.
+
+        Args:
+            db_path: Path of the SQLite database file
+            max_entries: Maximum number of cached explanations
+            max_bytes: Maximum total size of cached explanation JSON
+            touch_interval: Seconds before a hit updates an entry's access time
+        """
+        self.db_path = Path(db_path)
+        self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.max_entries = max_entries
+        self.max_bytes = max_bytes
+        self.touch_interval = touch_interval
+
+        self._stats_lock = threading.Lock()
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+        with self._connect() as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(SCHEMA)
+            # Seed the totals once, also for databases created without them
+            conn.execute(
+                "INSERT OR IGNORE INTO explanation_totals "
+                "SELECT 0, COUNT(*), COALESCE(SUM(size_bytes), 0) FROM explanations"
+            )
+
+        logger.info(f"Explanation cache initialized at {self.db_path}")
+
+    @contextmanager
+    def _connect(self) -> Iterator[sqlite3.Connection]:
+        """Open a connection, committing on success and rolling back on error."""
+        conn = sqlite3.connect(self.db_path, timeout=30)
+        try:
+            with conn:
+                yield conn
+        finally:
+            conn.close()
+
+    @staticmethod
+    def make_key(model_version: str, X: np.ndarray) -> str:
+        """
+        Cache key of a feature row for a model version.
+
+        The row is hashed as contiguous float64 values, so it gets the same
+        key whether it arrives alone, as (1, F) or sliced from a batch.
+
+        Args:
+            model_version: Version of the model explained
+            X: Feature vector
+
+        Returns:
+            Cache key string
+        """
+        values = np.ascontiguousarray(X, dtype=np.float64).reshape(-1)
+        return f"{model_version}:{hashlib.md5(values.tobytes()).hexdigest()}"
+
+    def get(self, key: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a cached explanation.
+
+        Args:
+            key: Cache key from make_key
+
+        Returns:
+            Explanation dictionary, or None if not cached
+        """
+        return self.get_many([key])[0]
+
+    def get_many(self, keys: Sequence[str]) -> List[Optional[Dict[str, Any]]]:
+        """
+        Get cached explanations and mark them recently used.
+
+        Args:
+            keys: Cache keys from make_key
+
+        Returns:
+            Explanation or None per key, in key order
+        """
+        found: Dict[str, Dict[str, Any]] = {}
+        stale: List[str] = []
+        now = time.time()
+
+        with self._connect() as conn:
+            for chunk in self._chunks(list(dict.fromkeys(keys))):
+                rows = conn.execute(
+                    f"SELECT cache_key, explanation_json, last_access FROM explanations "
+                    f"WHERE cache_key IN ({', '.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                for key, explanation_json, last_access in rows:
+                    found[key] = json.loads(explanation_json)
+                    if now - last_access >= self.touch_interval:
+                        stale.append(key)
+
+            # Only entries not touched for touch_interval take the write lock
+            for chunk in self._chunks(stale):
+                conn.execute(
+                    f"UPDATE explanations SET last_access = ? "
+                    f"WHERE cache_key IN ({', '.join('?' * len(chunk))})",
+                    [now] + chunk
+                )
+
+        results = [found.get(key) for key in keys]
+        hits = sum(result is not None for result in results)
+        with self._stats_lock:
+            self._hits += hits
+            self._misses += len(keys) - hits
+
+        return results
+
+    def put(self, key: str, model_version: str, explanation: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Store an explanation.
+
+        Args:
+            key: Cache key from make_key
+            model_version: Version of the model explained
+            explanation: Explanation dictionary
+
+        Returns:
+            The explanation as get will return it (see put_many)
+        """
+        return self.put_many([(key, explanation)], model_version)[0]
+
+    def put_many(
+        self,
+        items: Sequence[Tuple[str, Dict[str, Any]]],
+        model_version: str
+    ) -> List[Dict[str, Any]]:
+        """
+        Store explanations in one transaction and evict down to the limits.
+
+        Args:
+            items: (cache key, explanation) pairs
+            model_version: Version of the model explained
+
+        Returns:
+            The explanations as get will return them: decoded from the stored
+            JSON, so tuples become lists and NumPy values plain numbers.
+            Callers should return these on a miss so hits and misses match.
+        """
+        if not items:
+            return []
+
+        now = time.time()
+        encoded = [
+            (key, json.dumps(explanation, default=self._json_default))
+            for key, explanation in items
+        ]
+        # Last value wins for keys repeated in one call
+        rows = {
+            key: (key, model_version, explanation_json, len(explanation_json.encode()), now)
+            for key, explanation_json in encoded
+        }
+
+        with self._connect() as conn:
+            # Take the write lock up front so concurrent writers evict in turn
+            conn.execute("BEGIN IMMEDIATE")
+
+            replaced_entries, replaced_bytes = 0, 0
+            for chunk in self._chunks(list(rows)):
+                count, size = conn.execute(
+                    f"SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM explanations "
+                    f"WHERE cache_key IN ({', '.join('?' * len(chunk))})",
+                    chunk
+                ).fetchone()
+                replaced_entries += count
+                replaced_bytes += size
+
+            conn.executemany(
+                "INSERT OR REPLACE INTO explanations VALUES (?, ?, ?, ?, ?)",
+                rows.values()
+            )
+            self._add_totals(
+                conn,
+                len(rows) - replaced_entries,
+                sum(row[3] for row in rows.values()) - replaced_bytes
+            )
+            evicted = self._evict(conn)
+
+        if evicted:
+            with self._stats_lock:
+                self._evictions += evicted
+            logger.debug(f"Evicted {evicted} cached explanations")
+
+        return [json.loads(explanation_json) for _, explanation_json in encoded]
+
+    @staticmethod
+    def _add_totals(conn: sqlite3.Connection, entries: int, size_bytes: int):
+        """Adjust the entry and byte totals."""
+        conn.execute(
+            "UPDATE explanation_totals SET entries = entries + ?, total_bytes = total_bytes + ? "
+            "WHERE id = 0",
+            (entries, size_bytes)
+        )
+
+    @staticmethod
+    def _totals(conn: sqlite3.Connection) -> Tuple[int, int]:
+        """Current entry and byte totals."""
+        return conn.execute(
+            "SELECT entries, total_bytes FROM explanation_totals WHERE id = 0"
+        ).fetchone()
+
+    def _evict(self, conn: sqlite3.Connection) -> int:
+        """Delete least recently used entries until within limits."""
+        entries, total_bytes = self._totals(conn)
+        if entries <= self.max_entries and total_bytes <= self.max_bytes:
+            return 0
+
+        victims = []
+        freed_bytes = 0
+        # Walks the last_access index and stops once within limits
+        cursor = conn.execute(
+            "SELECT cache_key, size_bytes FROM explanations ORDER BY last_access"
+        )
+        for key, size_bytes in cursor:
+            if (entries - len(victims) <= self.max_entries
+                    and total_bytes - freed_bytes <= self.max_bytes):
+                break
+            victims.append(key)
+            freed_bytes += size_bytes
+        cursor.close()
+
+        for chunk in self._chunks(victims):
+            conn.execute(
+                f"DELETE FROM explanations WHERE cache_key IN ({', '.join('?' * len(chunk))})",
+                chunk
+            )
+        self._add_totals(conn, -len(victims), -freed_bytes)
+        return len(victims)
+
+    @staticmethod
+    def _chunks(keys: List[str]) -> Iterator[List[str]]:
+        """Split keys into chunks small enough to bind in one statement."""
+        for start in range(0, len(keys), MAX_QUERY_PARAMETERS):
+            yield keys[start:start + MAX_QUERY_PARAMETERS]
+
+    @staticmethod
+    def _json_default(value: Any) -> Any:
+        """Convert NumPy scalars and arrays for JSON."""
+        if isinstance(value, (np.generic, np.ndarray)):
+            return value.tolist()
+        return str(value)
+
+    def clear(self, model_version: Optional[str] = None) -> int:
+        """
+        Delete cached explanations.
+
+        Args:
+            model_version: Only delete this version's entries (default: all)
+
+        Returns:
+            Number of explanations deleted
+        """
+        with self._connect() as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            if model_version is None:
+                cursor = conn.execute("DELETE FROM explanations")
+                conn.execute("UPDATE explanation_totals SET entries = 0, total_bytes = 0 WHERE id = 0")
+                return cursor.rowcount
+
+            entries, size_bytes = conn.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM explanations "
+                "WHERE model_version = ?",
+                (model_version,)
+            ).fetchone()
+            conn.execute("DELETE FROM explanations WHERE model_version = ?", (model_version,))
+            self._add_totals(conn, -entries, -size_bytes)
+            return entries
+
+    def __len__(self) -> int:
+        with self._connect() as conn:
+            return self._totals(conn)[0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """
+        Get cache statistics.
+
+        Entry and byte totals cover every process sharing the database;
+        hit, miss and eviction counts are for this process.
+
+        Returns:
+            Dictionary with sizes, limits, hit/miss and eviction counts
+        """
+        with self._connect() as conn:
+            entries, total_bytes = self._totals(conn)
+
+        with self._stats_lock:
+            return {
+                'path': str(self.db_path),
+                'entries': entries,
+                'max_entries': self.max_entries,
+                'total_bytes': total_bytes,
+                'max_bytes': self.max_bytes,
+                'hits': self._hits,
+                'misses': self._misses,
+                'evictions': self._evictions
+            }
@@ -13,8 +13,6 @@ from typing import Dict, List, Optional, Tuple, Any
 import numpy as np
 import pandas as pd
 from pathlib import Path
-import pickle
-import hashlib
 
 from ml_pipeline.interpretability.shap_explainer import (
     TreeSHAPExplainer,
@@ -25,6 +23,7 @@ from ml_pipeline.interpretability.feature_importance import FeatureImportanceAna
 from ml_pipeline.interpretability.prediction_explainer import PredictionExplainer
 from ml_pipeline.interpretability.visualization import InterpretabilityVisualizer
 from ml_pipeline.interpretability.confidence_intervals import ConfidenceIntervalCalculator
+from ml_pipeline.interpretability.explanation_cache import ExplanationCache
 
 logger = logging.getLogger(__name__)
 
@@ -50,7 +49,11 @@ class InterpretabilitySystem:
         feature_names: List[str],
         output_dir: Path,
         cache_explanations: bool = True,
-        max_background_samples: int = 100
+        max_background_samples: int = 100,
+        model_version: Optional[str] = None,
+        cache_path: Optional[Path] = None,
+        cache_max_entries: int = 10000,
+        cache_max_bytes: int = 256 * 1024 * 1024
     ):
         """
         Initialize interpretability system.
@@ -62,6 +65,13 @@ class InterpretabilitySystem:
             output_dir: Directory for outputs
             cache_explanations: Whether to cache SHAP explanations
             max_background_samples: Maximum background samples for SHAP
+            model_version: Model version included in cache keys. Cached
+                explanations persist across restarts, so pass it whenever
+                the model can change under the same output directory
+            cache_path: Explanation cache database
+                (default: <output_dir>/cache/explanations.sqlite)
+            cache_max_entries: Maximum number of cached explanations
+            cache_max_bytes: Maximum total size of cached explanations
         """
         self.model = model
         self.model_type = model_type
@@ -70,6 +80,7 @@ class InterpretabilitySystem:
         self.output_dir.mkdir(parents=True, exist_ok=True)
         self.cache_explanations = cache_explanations
         self.max_background_samples = max_background_samples
+        self.model_version = model_version or 'unversioned'
         
         # Initialize components
         self.shap_explainer = None
@@ -84,11 +95,16 @@ class InterpretabilitySystem:
         self.ci_calculator = ConfidenceIntervalCalculator(confidence_level=0.95)
         self.prediction_explainer = None
         
-        # Cache for explanations
-        self.explanation_cache = {}
+        # Cache for explanations, shared by processes using the same database
+        self.explanation_cache = None
         self.cache_dir = self.output_dir / "cache"
         if cache_explanations:
             self.cache_dir.mkdir(exist_ok=True)
+            self.explanation_cache = ExplanationCache(
+                cache_path or self.cache_dir / "explanations.sqlite",
+                max_entries=cache_max_entries,
+                max_bytes=cache_max_bytes
+            )
         
         logger.info(f"Initialized InterpretabilitySystem for {model_type} model")
         logger.info(f"Output directory: {output_dir}")
@@ -186,9 +202,10 @@ class InterpretabilitySystem:
         # Check cache
         if use_cache and self.cache_explanations:
             cache_key = self._get_cache_key(X)
-            if cache_key in self.explanation_cache:
+            cached = self.explanation_cache.get(cache_key)
+            if cached is not None:
                 logger.debug("Using cached explanation")
-                return self.explanation_cache[cache_key]
+                return cached
         
         # Time the explanation generation
         start_time = time.time()
@@ -214,24 +231,94 @@ class InterpretabilitySystem:
         
         explanation['generation_time'] = elapsed_time
         
-        # Cache the explanation
+        # Cache the explanation, returning it as a later cache hit would
         if use_cache and self.cache_explanations:
-            self.explanation_cache[cache_key] = explanation
+            explanation = self.explanation_cache.put(cache_key, self.model_version, explanation)
         
         return explanation
     
+    def explain_batch(
+        self,
+        X_batch: np.ndarray,
+        predictions: np.ndarray,
+        probabilities: np.ndarray,
+        use_cache: bool = True
+    ) -> List[Dict[str, Any]]:
+        """
+        Generate comprehensive explanations for a batch of predictions.
+        
+        Cached rows are reused; SHAP values for the remaining rows are
+        computed in one call and split into per-row explanations.
+        
+        Args:
+            X_batch: Batch of feature vectors (n_samples, n_features)
+            predictions: Model predictions
+            probabilities: Prediction probabilities
+            use_cache: Whether to use cached explanations
+            
+        Returns:
+            List of explanation dictionaries, in row order
+        """
+        if self.shap_explainer is None:
+            raise ValueError("System must be initialized first")
+        
+        X_batch = np.asarray(X_batch)
+        if X_batch.ndim == 1:
+            X_batch = X_batch.reshape(1, -1)
+        
+        use_cache = use_cache and self.cache_explanations
+        explanations: List[Optional[Dict[str, Any]]] = [None] * len(X_batch)
+        
+        # Reuse cached rows
+        if use_cache:
+            cache_keys = [self._get_cache_key(row) for row in X_batch]
+            explanations = self.explanation_cache.get_many(cache_keys)
+        missing = [i for i, explanation in enumerate(explanations) if explanation is None]
+        
+        if missing:
+            start_time = time.time()
+            
+            computed = self.prediction_explainer.explain_batch_predictions(
+                X_batch[missing],
+                np.asarray(predictions)[missing],
+                np.asarray(probabilities)[missing],
+                top_n=5
+            )
+            
+            elapsed_time = time.time() - start_time
+            logger.info(
+                f"Explained {len(missing)} of {len(X_batch)} predictions in "
+                f"{elapsed_time:.3f}s ({len(X_batch) - len(missing)} cached)"
+            )
+            
+            for i, explanation in zip(missing, computed):
+                explanation['generation_time'] = elapsed_time / len(missing)
+                explanations[i] = explanation
+            
+            if use_cache:
+                stored = self.explanation_cache.put_many(
+                    [(cache_keys[i], explanations[i]) for i in missing],
+                    self.model_version
+                )
+                for i, explanation in zip(missing, stored):
+                    explanations[i] = explanation
+        
+        return explanations
+    
     def _get_cache_key(self, X: np.ndarray) -> str:
         """
         Generate cache key for feature vector.
         
+        Keys include the model version, so a new version never reuses
+        explanations of an earlier one.
+        
         Args:
             X: Feature vector
             
         Returns:
             Cache key string
         """
-        # Use hash of feature values
-        return hashlib.md5(X.tobytes()).hexdigest()
+        return ExplanationCache.make_key(self.model_version, X)
     
     def analyze_feature_importance(
         self,
@@ -398,37 +485,28 @@ class InterpretabilitySystem:
         
         return report
     
-    def save_cache(self):
-        """Save explanation cache to disk."""
-        if not self.cache_explanations or not self.explanation_cache:
-            return
+    def get_cache_stats(self) -> Dict[str, Any]:
+        """
+        Get explanation cache statistics.
         
-        cache_file = self.cache_dir / "explanation_cache.pkl"
+        Explanations are written to the cache database as they are
+        generated, so there is no separate save step.
         
-        with open(cache_file, 'wb') as f:
-            pickle.dump(self.explanation_cache, f)
+        Returns:
+            Dictionary with cache sizes, limits and hit/miss counts
+        """
+        if not self.cache_explanations:
+            return {'enabled': False}
         
-        logger.info(f"Saved {len(self.explanation_cache)} cached explanations to {cache_file}")
+        return {'enabled': True, 'model_version': self.model_version, **self.explanation_cache.get_stats()}
     
-    def load_cache(self):
-        """Load explanation cache from disk."""
+    def clear_cache(self):
+        """Clear cached explanations of this model version."""
         if not self.cache_explanations:
             return
         
-        cache_file = self.cache_dir / "explanation_cache.pkl"
-        
-        if cache_file.exists():
-            with open(cache_file, 'rb') as f:
-                self.explanation_cache = pickle.load(f)
-            
-            logger.info(f"Loaded {len(self.explanation_cache)} cached explanations")
-        else:
-            logger.info("No cache file found")
-    
-    def clear_cache(self):
-        """Clear explanation cache."""
-        self.explanation_cache = {}
-        logger.info("Explanation cache cleared")
+        cleared = self.explanation_cache.clear(self.model_version)
+        logger.info(f"Explanation cache cleared ({cleared} explanations)")
     
     def benchmark_performance(
         self,
@@ -74,11 +74,37 @@ class PredictionExplainer:
         # Get SHAP explanation
         shap_explanation = self.shap_explainer.explain_prediction(X)
         
+        explanation = self._build_explanation(shap_explanation, prediction, probability, top_n)
+        
+        logger.info(f"Explanation generated successfully")
+        logger.info(f"Top 5 features: {[f['feature'] for f in explanation['top_features']]}")
+        
+        return explanation
+    
+    def _build_explanation(
+        self,
+        shap_explanation: Dict[str, Any],
+        prediction: int,
+        probability: float,
+        top_n: int = 5
+    ) -> Dict[str, Any]:
+        """
+        Build a comprehensive explanation from a computed SHAP explanation.
+        
+        Args:
+            shap_explanation: Output of the SHAP explainer's explain_prediction
+            prediction: Model prediction (0 or 1)
+            probability: Prediction probability
+            top_n: Number of top features to include
+            
+        Returns:
+            Dictionary with comprehensive explanation
+        """
         # Get top contributing features
-        top_features = self.shap_explainer.get_top_features(X, top_n=top_n)
+        top_features = shap_explanation['sorted_features'][:top_n]
         
         # Get feature contributions (positive and negative)
-        contributions = self.shap_explainer.get_feature_contributions(X)
+        contributions = self._split_contributions(shap_explanation['shap_values'])
         
         # Generate human-readable explanation
         explanation_text = self._generate_explanation_text(
@@ -125,11 +151,32 @@ class PredictionExplainer:
             'computation_time': shap_explanation.get('computation_time', 0.0)
         }
         
-        logger.info(f"Explanation generated successfully")
-        logger.info(f"Top 5 features: {[f['feature'] for f in explanation['top_features']]}")
-        
         return explanation
     
+    @staticmethod
+    def _split_contributions(shap_values: Dict[str, float]) -> Dict[str, List[Tuple[str, float]]]:
+        """
+        Split SHAP values into positive and negative contributions.
+        
+        Args:
+            shap_values: SHAP value per feature
+            
+        Returns:
+            Dictionary with 'positive' and 'negative' (feature, magnitude)
+            lists, largest first
+        """
+        positive = [(feature, value) for feature, value in shap_values.items() if value > 0]
+        negative = [(feature, abs(value)) for feature, value in shap_values.items() if value < 0]
+        
+        # Sort by magnitude
+        positive.sort(key=lambda x: x[1], reverse=True)
+        negative.sort(key=lambda x: x[1], reverse=True)
+        
+        return {
+            'positive': positive,
+            'negative': negative
+        }
+    
     def _calculate_confidence(self, probability: float) -> str:
         """
         Calculate confidence level from probability.
@@ -243,6 +290,9 @@ class PredictionExplainer:
         """
         Generate explanations for a batch of predictions.
         
+        SHAP values for the whole batch are computed in one call when the
+        SHAP explainer supports it, instead of once per row.
+        
         Args:
             X_batch: Batch of feature vectors
             predictions: Array of predictions
@@ -254,15 +304,27 @@ class PredictionExplainer:
         """
         logger.info(f"Generating explanations for {len(X_batch)} predictions")
         
-        explanations = []
+        X_batch = np.asarray(X_batch)
+        if X_batch.ndim == 1:
+            X_batch = X_batch.reshape(1, -1)
         
-        for i in range(len(X_batch)):
-            X = X_batch[i:i+1]
-            pred = int(predictions[i])
-            prob = float(probabilities[i])
-            
-            explanation = self.explain_single_prediction(X, pred, prob, top_n)
-            explanations.append(explanation)
+        if hasattr(self.shap_explainer, 'explain_predictions'):
+            shap_explanations = self.shap_explainer.explain_predictions(X_batch)
+        else:
+            shap_explanations = [
+                self.shap_explainer.explain_prediction(X_batch[i:i+1])
+                for i in range(len(X_batch))
+            ]
+        
+        explanations = [
+            self._build_explanation(
+                shap_explanation,
+                int(predictions[i]),
+                float(probabilities[i]),
+                top_n
+            )
+            for i, shap_explanation in enumerate(shap_explanations)
+        ]
         
         logger.info(f"Generated {len(explanations)} explanations")
         
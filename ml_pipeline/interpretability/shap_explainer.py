@@ -90,16 +90,11 @@ class SHAPExplainer:
         start_time = time.time()
         
         # Calculate SHAP values
-        shap_values = self.explainer.shap_values(X)
+        shap_values = self._positive_class(self.explainer.shap_values(X))
         
         elapsed_time = time.time() - start_time
         logger.debug(f"SHAP calculation took {elapsed_time:.3f} seconds")
         
-        # Handle different SHAP value formats
-        if isinstance(shap_values, list):
-            # For binary classification, use positive class (index 1)
-            shap_values = shap_values[1]
-        
         # Get SHAP values for the single prediction
         if shap_values.ndim > 1:
             shap_values = shap_values[0]
@@ -107,6 +102,60 @@ class SHAPExplainer:
         if not return_dict:
             return shap_values
         
+        return self._explanation_from_values(shap_values, elapsed_time)
+    
+    def explain_predictions(self, X_batch: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Generate SHAP explanations for a batch with one SHAP call.
+        
+        Each explanation has the same form as explain_prediction's; its
+        computation_time is the batch time divided by the batch size.
+        
+        Args:
+            X_batch: Batch of feature vectors (n_samples, n_features)
+            
+        Returns:
+            List of explanation dictionaries, one per row
+        """
+        start_time = time.time()
+        shap_values = self.explain_batch(X_batch)
+        per_row_time = (time.time() - start_time) / max(len(X_batch), 1)
+        
+        return [
+            self._explanation_from_values(row, per_row_time)
+            for row in shap_values
+        ]
+    
+    @staticmethod
+    def _positive_class(shap_values) -> np.ndarray:
+        """
+        Select positive-class SHAP values.
+        
+        Binary classifiers give a list of per-class arrays, or an array
+        with a trailing class axis in newer SHAP versions.
+        """
+        if isinstance(shap_values, list):
+            # For binary classification, use positive class (index 1)
+            return shap_values[1]
+        if shap_values.ndim == 3:
+            return shap_values[:, :, 1]
+        return shap_values
+    
+    def _explanation_from_values(
+        self,
+        shap_values: np.ndarray,
+        computation_time: float
+    ) -> Dict[str, Any]:
+        """
+        Build an explanation dictionary from one row of SHAP values.
+        
+        Args:
+            shap_values: SHAP values of one prediction (n_features,)
+            computation_time: Seconds spent computing them
+            
+        Returns:
+            Dictionary with SHAP values and explanation details
+        """
         # Create feature-value mapping
         feature_shap_dict = {
             feature: float(shap_values[i])
@@ -124,7 +173,7 @@ class SHAPExplainer:
             'shap_values': feature_shap_dict,
             'sorted_features': sorted_features,
             'base_value': float(self.expected_value),
-            'computation_time': elapsed_time
+            'computation_time': computation_time
         }
         
         return explanation
@@ -154,10 +203,7 @@ class SHAPExplainer:
         logger.info(f"Batch SHAP calculation took {elapsed_time:.3f} seconds")
         
         # Handle different formats
-        if isinstance(shap_values, list):
-            shap_values = shap_values[1]
-        
-        return shap_values
+        return self._positive_class(shap_values)
     
     def get_top_features(
         self,
@@ -432,6 +478,45 @@ class EnsembleSHAPExplainer:
             return {'individual_explanations': individual_explanations}
         
         # Aggregate SHAP values using ensemble weights
+        return self._aggregate(individual_explanations)
+    
+    def explain_predictions(self, X_batch: np.ndarray) -> List[Dict[str, Any]]:
+        """
+        Generate aggregated SHAP explanations for a batch.
+        
+        Each model computes SHAP values for the whole batch in one call.
+        
+        Args:
+            X_batch: Batch of feature vectors (n_samples, n_features)
+            
+        Returns:
+            List of explanation dictionaries in explain_prediction's form
+        """
+        per_model = {
+            model_name: explainer.explain_predictions(X_batch)
+            for model_name, explainer in self.explainers.items()
+        }
+        
+        explanations = []
+        for i in range(len(X_batch)):
+            individual_explanations = {
+                model_name: model_explanations[i]
+                for model_name, model_explanations in per_model.items()
+            }
+            explanations.append(self._aggregate(individual_explanations))
+        
+        return explanations
+    
+    def _aggregate(self, individual_explanations: Dict[str, Dict[str, Any]]) -> Dict[str, Any]:
+        """
+        Aggregate per-model explanations of one prediction using ensemble weights.
+        
+        Args:
+            individual_explanations: Explanation per model name
+            
+        Returns:
+            Aggregated explanation dictionary
+        """
         aggregated_shap = {feature: 0.0 for feature in self.feature_names}
         aggregated_base = 0.0
         
@@ -10,7 +10,7 @@ import joblib
 import json
 from datetime import datetime
 from pathlib import Path
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, List, Optional, Any, Tuple, Callable
 from sqlalchemy.orm import Session
 from sqlalchemy import desc
 
@@ -30,8 +30,15 @@ class ModelRegistry:
     - Managing production deployments
     - Comparing model versions
     - Rolling back to previous versions
+    - Storing fitted feature pipelines with model versions
     """
     
+    FEATURE_PIPELINE_ARTIFACT = 'feature_pipeline.npz'
+    FEATURE_PIPELINE_METADATA = 'feature_pipeline.json'
+    
+    # Callbacks run with (model_name, version_id) after any promotion
+    _promotion_listeners: List[Callable[[str, str], None]] = []
+    
     def __init__(self, storage_path: str = None):
         """
         Initialize the model registry
@@ -76,7 +83,8 @@ class ModelRegistry:
         n_validation_samples: int = None,
         n_test_samples: int = None,
         notes: str = None,
-        user_id: str = "system"
+        user_id: str = "system",
+        feature_pipeline: Any = None
     ) -> str:
         """
         Register a new model version with automatic versioning
@@ -95,7 +103,8 @@ class ModelRegistry:
             n_test_samples: Number of test samples
             notes: Additional notes about the model
             user_id: User who registered the model
-        
+            feature_pipeline: Fitted FeatureEngineeringPipeline to store with the model
+            
         Returns:
             version_id: Unique version identifier for the registered model
         """
@@ -128,6 +137,11 @@ class ModelRegistry:
             with open(features_path, 'w') as f:
                 json.dump(feature_names, f, indent=2)
         
+        # Save fitted feature pipeline if provided
+        feature_pipeline_hash = None
+        if feature_pipeline is not None:
+            feature_pipeline_hash = self._save_feature_pipeline(model_dir, feature_pipeline)
+        
         # Store metadata in database
         with get_db_session() as db:
             model_version = ModelVersion(
@@ -168,7 +182,8 @@ class ModelRegistry:
                     'model_name': model_name,
                     'model_type': model_type,
                     'metrics': metrics,
-                    'dataset_version': dataset_version
+                    'dataset_version': dataset_version,
+                    'feature_pipeline_hash': feature_pipeline_hash
                 },
                 success=True
             )
@@ -274,6 +289,99 @@ class ModelRegistry:
         
         return model, metadata
     
+    def register_feature_pipeline(
+        self,
+        model_name: str,
+        version_id: str,
+        feature_pipeline: Any
+    ) -> str:
+        """
+        Store a fitted feature pipeline next to a registered model version
+        
+        The pipeline is saved as a NumPy artifact with a content hash, so
+        inference jobs can transform features without refitting.
+        
+        Args:
+            model_name: Name of the model
+            version_id: Version ID of the model
+            feature_pipeline: Fitted FeatureEngineeringPipeline
+            
+        Returns:
+            Content hash of the stored pipeline artifact
+        """
+        model_dir = self.storage_path / model_name / version_id
+        if not model_dir.exists():
+            raise ValueError(f"Model version not found: {model_name} {version_id}")
+        
+        return self._save_feature_pipeline(model_dir, feature_pipeline)
+    
+    def load_feature_pipeline(
+        self,
+        model_name: str,
+        version_id: str = None
+    ) -> Any:
+        """
+        Load the fitted feature pipeline stored with a model version
+        
+        Args:
+            model_name: Name of the model
+            version_id: Specific version ID (if None, loads the production version's pipeline)
+            
+        Returns:
+            Fitted FeatureEngineeringPipeline
+        """
+        from ml_pipeline.feature_engineering.pipeline import FeatureEngineeringPipeline
+        
+        if version_id is None:
+            model_version = self.get_model_version(model_name)
+            if not model_version:
+                raise ValueError(f"Model not found: {model_name} (production)")
+            model_dir = Path(model_version.artifact_path).parent
+        else:
+            model_dir = self.storage_path / model_name / version_id
+        
+        artifact_path = model_dir / self.FEATURE_PIPELINE_ARTIFACT
+        metadata_path = model_dir / self.FEATURE_PIPELINE_METADATA
+        if not artifact_path.exists():
+            raise FileNotFoundError(f"Feature pipeline artifact not found: {artifact_path}")
+        
+        expected_hash = None
+        if metadata_path.exists():
+            with open(metadata_path, 'r') as f:
+                expected_hash = json.load(f).get('content_hash')
+        
+        pipeline = FeatureEngineeringPipeline.load(artifact_path, expected_hash=expected_hash)
+        
+        logger.info(f"Loaded feature pipeline for {model_name} from {model_dir.name}")
+        
+        return pipeline
+    
+    def _save_feature_pipeline(self, model_dir: Path, feature_pipeline: Any) -> str:
+        """
+        Save a fitted feature pipeline artifact and its metadata
+        
+        Args:
+            model_dir: Directory of the model version
+            feature_pipeline: Fitted FeatureEngineeringPipeline
+            
+        Returns:
+            Content hash of the artifact
+        """
+        artifact_path = model_dir / self.FEATURE_PIPELINE_ARTIFACT
+        content_hash = feature_pipeline.save(artifact_path)
+        
+        with open(model_dir / self.FEATURE_PIPELINE_METADATA, 'w') as f:
+            json.dump({
+                'content_hash': content_hash,
+                'format_version': feature_pipeline.ARTIFACT_FORMAT_VERSION,
+                'n_features': len(feature_pipeline.get_feature_names()),
+                'saved_at': datetime.utcnow().isoformat()
+            }, f, indent=2)
+        
+        logger.info(f"Feature pipeline artifact saved to {artifact_path}")
+        
+        return content_hash
+    
     def list_versions(
         self, 
         model_name: str, 
@@ -460,8 +568,44 @@ class ModelRegistry:
             logger.info(
                 f"Promoted {model_name} v{version_id} to production"
             )
-            
-            return True
+        
+        self._notify_promotion(model_name, version_id)
+        
+        return True
+    
+    @classmethod
+    def add_promotion_listener(cls, listener: Callable[[str, str], None]):
+        """
+        Register a callback run after a version is promoted to production
+        
+        Listeners are shared by all registry instances in the process, so
+        caches of production models can react to promotions made through
+        any of them. Errors raised by listeners are logged, not propagated.
+        
+        Args:
+            listener: Callable taking (model_name, version_id)
+        """
+        if listener not in cls._promotion_listeners:
+            cls._promotion_listeners.append(listener)
+    
+    @classmethod
+    def remove_promotion_listener(cls, listener: Callable[[str, str], None]):
+        """
+        Unregister a promotion callback
+        
+        Args:
+            listener: Callable previously registered
+        """
+        if listener in cls._promotion_listeners:
+            cls._promotion_listeners.remove(listener)
+    
+    def _notify_promotion(self, model_name: str, version_id: str):
+        """Run promotion listeners"""
+        for listener in list(self._promotion_listeners):
+            try:
+                listener(model_name, version_id)
+            except Exception as e:
+                logger.error(f"Promotion listener failed for {model_name} v{version_id}: {e}")
     
     def rollback_to_version(
         self, 
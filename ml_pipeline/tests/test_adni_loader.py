@@ -0,0 +1,67 @@
+"""
+Tests for ADNI Data Loader
+
+Tests cover:
+- Patient identifiers read with the same dtype for every data type
+- Merging data types on patient_id
+"""
+from types import SimpleNamespace
+
+import pytest
+
+import pandas as pd
+
+from ml_pipeline.data_ingestion.adni.adni_loader import ADNIDataLoader
+
+
+@pytest.fixture
+def loader(tmp_path):
+    """Create loader with data directories under tmp_path"""
+    settings = SimpleNamespace(
+        ADNI_BASE_URL='https://adni.example.org',
+        ADNI_API_KEY='test',
+        RAW_DATA_PATH=str(tmp_path / "raw"),
+        PROCESSED_DATA_PATH=str(tmp_path / "processed")
+    )
+    return ADNIDataLoader(settings=settings)
+
+
+@pytest.fixture
+def adni_files(tmp_path):
+    """Write cognitive, biomarker, MRI and genetic files for two patients"""
+    files = {
+        'cognitive': "RID,EXAMDATE,MMSE,CDGLOBAL\n101,2020-01-15,28,0\n102,2020-02-01,22,0.5\n",
+        'biomarker': "RID,EXAMDATE,ABETA,TAU,PTAU\n101,2020-01-20,900,250,22\n102,2020-02-03,600,400,35\n",
+        'mri': "RID,EXAMDATE,MAGSTRENGTH,HIPPO\n101,2020-01-22,3.0,7000\n102,2020-02-05,1.5,6200\n",
+        'genetic': "RID,APGEN1,APGEN2\n101,3,3\n102,3,4\n"
+    }
+    paths = {}
+    for data_type, content in files.items():
+        paths[data_type] = tmp_path / f"{data_type}.csv"
+        paths[data_type].write_text(content)
+    return paths
+
+
+class TestADNIDataLoader:
+    """Test suite for ADNIDataLoader"""
+
+    def test_patient_id_dtype_matches(self, loader, adni_files):
+        """Every data type reads patient_id with the same dtype"""
+        frames = [
+            loader.load_cognitive_assessments(file_path=adni_files['cognitive']),
+            loader.load_csf_biomarkers(file_path=adni_files['biomarker']),
+            loader.load_mri_metadata(file_path=adni_files['mri']),
+            loader.load_genetic_data(file_path=adni_files['genetic'])
+        ]
+
+        assert {str(frame['patient_id'].dtype) for frame in frames} == {'string'}
+
+    def test_merge_data_types(self, loader, adni_files):
+        """Cognitive and genetic data merge on patient_id"""
+        cognitive = loader.load_cognitive_assessments(file_path=adni_files['cognitive'])
+        genetic = loader.load_genetic_data(file_path=adni_files['genetic'])
+
+        merged = cognitive.merge(genetic[['patient_id', 'apoe_e4_count']], on='patient_id')
+
+        assert len(merged) == 2
+        assert merged.set_index('patient_id')['apoe_e4_count'].to_dict() == {'101': 0, '102': 1}
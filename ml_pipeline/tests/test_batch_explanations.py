@@ -0,0 +1,168 @@
+"""
+Tests for Batch Explanations
+
+Tests cover:
+- Batch explanations matching single-prediction explanations
+- Computing SHAP values for a batch in one call
+- Reusing cached rows and computing only the misses
+- Cache keys shared between single and batch explanations
+- Cached explanations surviving restarts, per model version
+- Per-class SHAP output formats
+"""
+import numpy as np
+import pytest
+
+pytest.importorskip("shap")
+pytest.importorskip("matplotlib")
+
+from ml_pipeline.interpretability import shap_explainer as shap_explainer_module
+from ml_pipeline.interpretability.interpretability_system import InterpretabilitySystem
+
+
+FEATURE_NAMES = ['age', 'mmse_score', 'csf_ab42', 'apoe_e4_count']
+COEFFICIENTS = np.array([0.5, -1.0, 0.25, 2.0])
+
+
+class FakeTreeExplainer:
+    """Linear SHAP explainer counting calls and rows"""
+
+    calls = []
+    output = 'list'
+
+    def __init__(self, model):
+        self.expected_value = [0.7, 0.3]
+
+    def shap_values(self, X):
+        X = np.asarray(X, dtype=float)
+        FakeTreeExplainer.calls.append(len(X))
+        values = X * COEFFICIENTS
+        if FakeTreeExplainer.output == 'list':
+            return [-values, values]
+        if FakeTreeExplainer.output == 'array3d':
+            return np.stack([-values, values], axis=-1)
+        return values
+
+
+@pytest.fixture
+def interp_system(tmp_path, monkeypatch):
+    """Create tree interpretability system over the fake explainer"""
+    FakeTreeExplainer.calls = []
+    FakeTreeExplainer.output = 'list'
+    monkeypatch.setattr(shap_explainer_module.shap, 'TreeExplainer', FakeTreeExplainer)
+
+    system = InterpretabilitySystem(
+        model=object(),
+        model_type='tree',
+        feature_names=FEATURE_NAMES,
+        output_dir=tmp_path
+    )
+    system.initialize()
+    return system
+
+
+@pytest.fixture
+def batch():
+    """Create feature matrix with predictions and probabilities"""
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(6, len(FEATURE_NAMES)))
+    probabilities = rng.uniform(size=6)
+    predictions = (probabilities > 0.5).astype(int)
+    return X, predictions, probabilities
+
+
+def comparable(explanation):
+    """Explanation without timing fields"""
+    return {
+        key: value for key, value in explanation.items()
+        if key not in ('computation_time', 'generation_time')
+    }
+
+
+class TestBatchExplanations:
+    """Test suite for batch explanations"""
+
+    def test_batch_matches_single(self, interp_system, batch):
+        """Each batch explanation equals the single-prediction explanation"""
+        X, predictions, probabilities = batch
+
+        batch_explanations = interp_system.explain_batch(X, predictions, probabilities, use_cache=False)
+
+        assert len(batch_explanations) == len(X)
+        for i, explanation in enumerate(batch_explanations):
+            single = interp_system.explain_prediction(
+                X[i:i+1], int(predictions[i]), float(probabilities[i]), use_cache=False
+            )
+            assert comparable(explanation) == comparable(single)
+            assert explanation['generation_time'] >= 0
+
+    def test_batch_uses_one_shap_call(self, interp_system, batch):
+        """SHAP values for the batch are computed in a single call"""
+        X, predictions, probabilities = batch
+
+        interp_system.explain_batch(X, predictions, probabilities)
+
+        assert FakeTreeExplainer.calls == [len(X)]
+
+    def test_single_prediction_uses_one_shap_call(self, interp_system, batch):
+        """A single explanation computes SHAP values once"""
+        X, predictions, probabilities = batch
+
+        interp_system.explain_prediction(X[:1], int(predictions[0]), float(probabilities[0]))
+
+        assert FakeTreeExplainer.calls == [1]
+
+    def test_cached_rows_reused(self, interp_system, batch):
+        """Rows explained before are served from cache; only misses are computed"""
+        X, predictions, probabilities = batch
+        first = interp_system.explain_prediction(X[2], int(predictions[2]), float(probabilities[2]))
+        interp_system.explain_batch(X[:2], predictions[:2], probabilities[:2])
+        FakeTreeExplainer.calls = []
+
+        explanations = interp_system.explain_batch(X, predictions, probabilities)
+
+        assert FakeTreeExplainer.calls == [len(X) - 3]
+        assert explanations[2] == first
+        assert len(interp_system.explanation_cache) == len(X)
+
+        FakeTreeExplainer.calls = []
+        interp_system.explain_batch(X, predictions, probabilities)
+        assert FakeTreeExplainer.calls == []
+
+    def test_cache_persists_per_model_version(self, interp_system, batch, tmp_path):
+        """A restarted system reuses explanations only for the same version"""
+        X, predictions, probabilities = batch
+        interp_system.model_version = 'v1'
+        interp_system.explain_batch(X, predictions, probabilities)
+
+        def restarted(model_version):
+            system = InterpretabilitySystem(
+                model=object(),
+                model_type='tree',
+                feature_names=FEATURE_NAMES,
+                output_dir=tmp_path,
+                model_version=model_version
+            )
+            system.initialize()
+            return system
+
+        FakeTreeExplainer.calls = []
+        restarted('v1').explain_batch(X, predictions, probabilities)
+        assert FakeTreeExplainer.calls == []
+
+        restarted('v2').explain_batch(X, predictions, probabilities)
+        assert FakeTreeExplainer.calls == [len(X)]
+
+    @pytest.mark.parametrize('output', ['list', 'array3d', 'array2d'])
+    def test_shap_output_formats(self, interp_system, batch, output):
+        """Positive-class values are selected from every SHAP output format"""
+        X, predictions, probabilities = batch
+        FakeTreeExplainer.output = output
+
+        explanations = interp_system.prediction_explainer.explain_batch_predictions(
+            X, predictions, probabilities
+        )
+
+        expected = X[0] * COEFFICIENTS
+        top = explanations[0]['top_features'][0]
+        assert top['feature'] == FEATURE_NAMES[int(np.argmax(np.abs(expected)))]
+        assert top['shap_value'] == pytest.approx(expected[np.argmax(np.abs(expected))])
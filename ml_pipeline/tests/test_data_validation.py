@@ -4,7 +4,11 @@ Basic tests for data validation engine
 
 import pandas as pd
 import numpy as np
+import pytest
 import sys
+import tempfile
+import time
+import warnings
 from pathlib import Path
 
 # Add parent directory to path
@@ -17,8 +21,10 @@ from data_validation import (
     OutlierDetector,
     RangeValidator,
     DuplicateDetector,
-    TemporalValidator
+    TemporalValidator,
+    ColumnProfiler
 )
+from data_validation.accumulators import TDigest
 
 
 def create_test_data():
@@ -56,6 +62,69 @@ def test_phi_detector():
     print(f"✓ PHI detector works correctly: detected {len(phi_detected_with_email)} PHI categories")
 
 
+def test_phi_full_scan():
+    """Test full PHI scan finds values past the sample and masks their rows"""
+    print("\n=== Testing PHI Full Scan ===")
+    
+    data = pd.DataFrame({
+        'notes': ['Follow-up visit, no concerns'] * 3000,
+        'site': pd.Categorical(['A', 'B', 'C'] * 1000),
+        'score': np.arange(3000)
+    })
+    data.loc[2500, 'notes'] = 'Reached patient at john.doe@example.com'
+    data.loc[2700, 'notes'] = 'Seen by Dr. Smith, call 555-123-4567'
+    data.loc[10, 'notes'] = None
+    
+    assert PHIDetector().detect_phi(data) == {}, "Sampled scan should stop at 1000 values"
+    
+    for n_jobs in [1, 2]:
+        detector = PHIDetector(full_scan=True, n_jobs=n_jobs, chunk_size=700)
+        phi_detected = detector.detect_phi(data)
+        assert set(phi_detected) == {'email_addresses', 'names', 'phone_numbers'}, "PHI types missed"
+        assert all(columns == ['notes'] for columns in phi_detected.values())
+    
+    masks = detector.scan_phi_values(data)
+    assert list(masks) == ['notes'], "Only the notes column has PHI"
+    assert masks['notes'].index.equals(data.index)
+    assert masks['notes']['email_addresses'].sum() == 1
+    assert masks['notes']['names'].tolist() == masks['notes']['phone_numbers'].tolist()
+    
+    row_mask = detector.get_phi_row_mask(data)
+    assert row_mask[row_mask].index.tolist() == [2500, 2700], "Wrong PHI rows"
+    
+    with tempfile.TemporaryDirectory() as temp_dir:
+        quarantine_path = Path(temp_dir) / 'quarantine.csv'
+        clean_data = detector.quarantine_data(data, [], str(quarantine_path), row_mask=row_mask)
+        quarantined = pd.read_csv(quarantine_path)
+    
+    assert len(clean_data) == len(data) - 2, "PHI rows not removed"
+    assert quarantined['score'].tolist() == [2500, 2700], "PHI rows not quarantined"
+    print(f"✓ Full PHI scan works: {int(row_mask.sum())} rows with PHI")
+
+
+def test_phi_scan_text_dtypes():
+    """Test pyarrow-backed and object strings find the same PHI"""
+    print("\n=== Testing PHI Scan Text Dtypes ===")
+    
+    from data_validation import phi_detector
+    
+    values = pd.Series([
+        'no concerns', 'call 555-123-4567', 'john@x.com', 'MRN: ab12345678',
+        'visit 2020-01-02', 'Dr. Smith here', 'ip 10.0.0.1', 'zip 12345',
+        'VIN 1HGCM82633A004352', 'fax 555 222 3333', 'Acct #ZZ998877', 42
+    ] * 50)
+    detector = PHIDetector()
+    
+    results = [
+        phi_detector._scan_phi_chunk(values.astype(dtype), detector.combined_pattern, detector.type_patterns)
+        for dtype in [str, phi_detector.TEXT_DTYPE]
+    ]
+    
+    assert results[0].keys() == results[1].keys(), "PHI types differ between dtypes"
+    for phi_type in results[0]:
+        assert np.array_equal(results[0][phi_type], results[1][phi_type]), f"{phi_type} positions differ"
+    print(f"✓ {phi_detector.TEXT_DTYPE} scan matches object scan for {len(results[0])} PHI types")
+
 def test_completeness_checker():
     """Test completeness checking"""
     print("\n=== Testing Completeness Checker ===")
@@ -117,6 +186,58 @@ def test_duplicate_detector():
     print(f"✓ Duplicate detector works: {result['duplicate_rows']} duplicates found")
 
 
+def test_fuzzy_duplicate_detector():
+    """Test fuzzy duplicate detection scales with rows on wide, sparse data"""
+    print("\n=== Testing Fuzzy Duplicate Detector ===")
+    
+    rng = np.random.default_rng(0)
+    n_rows, n_planted = 20000, 200
+    columns = [f"feature_{k}" for k in range(30)]
+    values = rng.random((n_rows, len(columns)))
+    values[rng.random(values.shape) < 0.2] = np.nan
+    
+    # Near-copies of other rows; half also lose one more value
+    sources = rng.choice(n_rows // 2, n_planted, replace=False)
+    copies = sources + n_rows // 2
+    values[copies] = values[sources] + rng.normal(0, 0.005, (n_planted, len(columns)))
+    for row in copies[:n_planted // 2]:
+        values[row, rng.choice(np.flatnonzero(~np.isnan(values[row])))] = np.nan
+    
+    data = pd.DataFrame(values, columns=columns)
+    data['site'] = rng.integers(0, 3, n_rows)
+    data.loc[copies, 'site'] = data.loc[sources, 'site'].to_numpy()
+    data.index = np.arange(n_rows) * 2 + 5
+    
+    detector = DuplicateDetector()
+    start = time.perf_counter()
+    result = detector.detect_fuzzy_duplicates(data, columns, threshold=0.95, block_by=['site'], max_pairs=5)
+    elapsed = time.perf_counter() - start
+    
+    # Pairwise comparison would score 200 million pairs
+    assert result['candidate_pairs'] < 10 * n_rows, "Candidate pairs not close to linear in rows"
+    assert elapsed < 30, f"Fuzzy matching took {elapsed:.1f}s"
+    
+    pairs = detector.find_fuzzy_duplicate_pairs(data, columns, threshold=0.95, block_by=['site'])
+    found = set(zip(pairs['index_1'], pairs['index_2']))
+    planted = set(zip(data.index[sources], data.index[copies]))
+    assert planted <= found, f"{len(planted - found)} planted duplicates missed"
+    
+    # Every reported pair is scored exactly and shares a site
+    normalized = (values - np.nanmin(values, axis=0)) / (np.nanmax(values, axis=0) - np.nanmin(values, axis=0))
+    first = data.index.get_indexer(pairs['index_1'])
+    second = data.index.get_indexer(pairs['index_2'])
+    with warnings.catch_warnings():
+        warnings.simplefilter('ignore', category=RuntimeWarning)
+        similarity = 1 - np.nanmean(np.abs(normalized[first] - normalized[second]), axis=1)
+    assert np.allclose(pairs['similarity'], similarity), "Similarity not exact"
+    assert (similarity >= 0.95).all(), "Pairs below threshold reported"
+    assert (data['site'].to_numpy()[first] == data['site'].to_numpy()[second]).all(), "Pairs cross blocks"
+    
+    assert result['similar_pairs_found'] == len(pairs), "Pair count mismatch"
+    assert len(result['similar_pairs']) == 5, "Reported pairs not capped"
+    print(f"✓ Fuzzy duplicate detector works: {result['similar_pairs_found']} pairs from "
+          f"{result['candidate_pairs']} candidates in {elapsed:.2f}s")
+
 def test_temporal_validator():
     """Test temporal validation"""
     print("\n=== Testing Temporal Validator ===")
@@ -133,6 +254,129 @@ def test_temporal_validator():
     print(f"✓ Temporal validator works: {result['validation_passed']}")
 
 
+def test_temporal_validator_violations():
+    """Test temporal checks report the expected patients in first-seen order"""
+    print("\n=== Testing Temporal Validator Violations ===")
+    
+    validator = TemporalValidator()
+    data = pd.DataFrame({
+        'patient_id': ['B', 'A', 'B', 'A', 'C', 'A', 'B', None, 'D', 'D'],
+        'visit_date': pd.to_datetime([
+            '2020-06-01', '2020-01-01', '2020-01-01', '2020-01-05',
+            '2020-01-01', pd.NaT, '2023-01-01', '2020-01-01', pd.NaT, '2020-03-01'
+        ]),
+        'mmse_score': [25, 28, 27, 29, 30, 30, 20, 10, 22, 24]
+    })
+    
+    sequences = validator.validate_date_sequences(data)
+    assert sequences['total_patients'] == 5, "Missing patient ID not counted"
+    assert sequences['patients_with_multiple_visits'] == 3, "Multi-visit patients miscounted"
+    assert [v['patient_id'] for v in sequences['violations']] == ['B', 'D'], "Wrong sequence violations"
+    assert sequences['violations'][0]['dates'] == ['2020-06-01', '2020-01-01', '2023-01-01']
+    
+    intervals = validator.validate_visit_intervals(data, min_interval_days=7, max_interval_days=730)
+    assert [v['patient_id'] for v in intervals['violations']] == ['B', 'A'], "Wrong interval violations"
+    assert intervals['violations'][0]['intervals_too_long'] == 1
+    assert intervals['violations'][1]['min_interval'] == 4.0
+    assert intervals['interval_statistics']['max_interval_days'] == 944.0
+    
+    ordering = validator.validate_temporal_ordering(
+        data, value_col='mmse_score', should_increase=False
+    )
+    assert [v['patient_id'] for v in ordering['violations']] == ['A'], "Wrong ordering violations"
+    assert ordering['violations'][0]['increases_found'] == 2
+    assert ordering['violations'][0]['total_transitions'] == 2
+    print(f"✓ Temporal violations found: {sequences['patients_with_violations']} sequence, "
+          f"{intervals['patients_with_violations']} interval, {ordering['patients_with_violations']} ordering")
+
+def test_column_profiler():
+    """Test shared column profile matches per-validator statistics"""
+    print("\n=== Testing Column Profiler ===")
+    
+    data = create_test_data()
+    data.loc[0, 'mmse_score'] = 100
+    data.loc[3:8, 'csf_ab42'] = np.nan
+    data.loc[5, 'patient_id'] = None
+    data['empty_score'] = np.nan
+    
+    profiler = ColumnProfiler(batch_columns=2)
+    profile = profiler.profile(data)
+    assert profiler.profile(data.copy()) is profile, "Profile not cached by dataset hash"
+    
+    stats = profile.numeric_stats
+    for column in ['age', 'mmse_score', 'csf_ab42', 'hippocampus_volume']:
+        clean = data[column].dropna()
+        assert stats.at[column, 'count'] == len(clean)
+        assert np.isclose(stats.at[column, 'mean'], clean.mean())
+        assert np.isclose(stats.at[column, 'std'], clean.std())
+        assert np.isclose(stats.at[column, 'q1'], clean.quantile(0.25))
+        assert np.isclose(stats.at[column, 'q3'], clean.quantile(0.75))
+        assert stats.at[column, 'min'] == clean.min() and stats.at[column, 'max'] == clean.max()
+    
+    checker = CompletenessChecker()
+    assert checker.calculate_completeness(data, profile=profile) == pytest.approx(checker.calculate_completeness(data))
+    assert checker.get_missing_value_patterns(data, profile=profile) == checker.get_missing_value_patterns(data)
+    
+    detector = OutlierDetector()
+    profiled = detector.detect_outliers_dataframe(data, profile=profile)
+    for column in ['age', 'mmse_score', 'csf_ab42', 'hippocampus_volume']:
+        expected = detector.detect_outliers_dataframe(data[[column]])[column]
+        for key in ['iqr', 'zscore', 'consensus_outliers']:
+            assert profiled[column][key] == pytest.approx(expected[key]), f"{column} {key} differs"
+        assert profiled[column]['iqr_outlier_indices'] == expected['iqr_outlier_indices']
+    assert profiled['mmse_score']['iqr_outlier_indices'] == [0]
+    assert profiled['empty_score']['iqr']['outlier_count'] == 0
+    
+    validator = RangeValidator()
+    assert validator.generate_range_report(data, profile=profile)['violations'] == \
+        validator.generate_range_report(data)['violations']
+    print(f"✓ Column profiler works: {len(profile.numeric_columns)} numeric columns profiled once")
+
+
+def test_streaming_validation():
+    """Test streaming validation of a Parquet file matches in-memory validation"""
+    print("\n=== Testing Streaming Validation ===")
+    
+    data = create_test_data()
+    data.loc[0, 'mmse_score'] = 100
+    data.loc[3:8, 'csf_ab42'] = np.nan
+    data['sex'] = ['M', 'F'] * 25
+    data = pd.concat([data, data.iloc[[2, 4]]], ignore_index=True)
+    
+    engine = DataValidationEngine()
+    expected = engine.validate_dataset(data, "Test Dataset", 'patient_id', 'visit_date')
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        path = Path(tmp_dir) / 'test.parquet'
+        data.to_parquet(path)
+        report = engine.validate_file(path, "Test Dataset", 'patient_id', 'visit_date', batch_size=16)
+    
+    assert report['report_metadata']['streaming']['batches'] == 4
+    for section in ['phi_detection', 'deidentification', 'completeness', 'duplicates', 'temporal_consistency']:
+        for key in ['timestamp']:
+            report[section].pop(key, None)
+            expected[section].pop(key, None)
+        assert report[section] == expected[section], f"{section} differs"
+    for column, result in expected['outliers']['detailed_results'].items():
+        streamed = report['outliers']['detailed_results'][column]
+        assert streamed['iqr'] == pytest.approx(result['iqr'])
+        assert streamed['zscore'] == pytest.approx(result['zscore'])
+        assert streamed['consensus_outliers'] == result['consensus_outliers']
+    assert report['range_validation']['violations'] == expected['range_validation']['violations']
+    assert report['quality_score'] == expected['quality_score']
+    assert report['validation_passed'] == expected['validation_passed']
+    
+    # Quartiles of large columns are sketched; merged digests stay close
+    values = np.random.default_rng(0).lognormal(size=200_000)
+    first, second = TDigest(), TDigest()
+    first.update(values[:100_000])
+    second.update(values[100_000:])
+    merged = first.merge(second)
+    for q in [0.25, 0.5, 0.75]:
+        assert abs(merged.quantile(q) - np.quantile(values, q)) / np.quantile(values, q) < 0.01
+    print(f"✓ Streaming validation matches: quality score {report['quality_score']['overall_score']:.1f}/100")
+
+
 def test_data_validation_engine():
     """Test main validation engine"""
     print("\n=== Testing Data Validation Engine ===")
@@ -169,11 +413,17 @@ def run_all_tests():
     
     try:
         test_phi_detector()
+        test_phi_full_scan()
+        test_phi_scan_text_dtypes()
         test_completeness_checker()
         test_outlier_detector()
         test_range_validator()
         test_duplicate_detector()
+        test_fuzzy_duplicate_detector()
         test_temporal_validator()
+        test_temporal_validator_violations()
+        test_column_profiler()
+        test_streaming_validation()
         test_data_validation_engine()
         
         print("\n" + "="*60)
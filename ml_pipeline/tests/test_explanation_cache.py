@@ -0,0 +1,161 @@
+"""
+Tests for Explanation Cache
+
+Tests cover:
+- Storing and retrieving explanations in row order
+- Persistence across cache instances sharing a database
+- Cache keys that include the model version
+- LRU eviction by entry and byte limits
+- Entry and byte totals kept without scanning
+- Throttled access-time updates on reads
+- Hits and misses returning the same shape
+- Clearing one model version
+"""
+import sqlite3
+
+import numpy as np
+import pytest
+
+# The interpretability package imports shap and matplotlib on import
+pytest.importorskip("shap")
+pytest.importorskip("matplotlib")
+
+from ml_pipeline.interpretability.explanation_cache import ExplanationCache
+
+
+def make_explanation(i, padding=0):
+    """Create explanation dictionary"""
+    return {
+        'prediction': {'class': i % 2, 'probability': 0.1 * i},
+        'top_features': [{'feature': 'mmse_score', 'shap_value': float(i)}],
+        'explanation_text': 'x' * padding,
+        'base_value': np.float64(0.25)
+    }
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    """Path of the cache database"""
+    return tmp_path / "cache" / "explanations.sqlite"
+
+
+class TestExplanationCache:
+    """Test suite for ExplanationCache"""
+
+    def test_put_and_get(self, db_path):
+        """Explanations round-trip and misses return None in key order"""
+        cache = ExplanationCache(db_path)
+        cache.put_many([('a', make_explanation(1)), ('b', make_explanation(2))], 'v1')
+
+        results = cache.get_many(['b', 'missing', 'a'])
+
+        assert results[0]['top_features'][0]['shap_value'] == 2.0
+        assert results[1] is None
+        assert results[2]['base_value'] == 0.25
+        assert cache.get_stats()['hits'] == 2
+        assert cache.get_stats()['misses'] == 1
+
+    def test_shared_across_instances(self, db_path):
+        """Another cache on the same database sees stored explanations"""
+        ExplanationCache(db_path).put('a', 'v1', make_explanation(1))
+
+        assert ExplanationCache(db_path).get('a') == {
+            **make_explanation(1), 'base_value': 0.25
+        }
+
+    def test_keys_include_model_version(self):
+        """Keys differ by version but not by row shape or dtype"""
+        row = np.array([1.0, 2.0, 3.0], dtype=np.float32)
+
+        key = ExplanationCache.make_key('v1', row)
+
+        assert key == ExplanationCache.make_key('v1', row.astype(np.float64).reshape(1, -1))
+        assert key == ExplanationCache.make_key('v1', np.array([[0.0, 0.0, 0.0], [1.0, 2.0, 3.0]])[1])
+        assert key != ExplanationCache.make_key('v2', row)
+
+    def test_evicts_least_recently_used_by_entries(self, db_path):
+        """The least recently read entries are evicted past max_entries"""
+        cache = ExplanationCache(db_path, max_entries=3, touch_interval=0.0)
+        for key in ['a', 'b', 'c']:
+            cache.put(key, 'v1', make_explanation(1))
+        cache.get('a')
+
+        cache.put('d', 'v1', make_explanation(1))
+
+        assert len(cache) == 3
+        assert cache.get('b') is None
+        assert cache.get('a') is not None
+        assert cache.get_stats()['evictions'] == 1
+
+    def test_evicts_by_bytes(self, db_path):
+        """Total stored bytes stay within max_bytes"""
+        cache = ExplanationCache(db_path, max_bytes=5000)
+        for i in range(10):
+            cache.put(f"k{i}", 'v1', make_explanation(i, padding=1000))
+
+        stats = cache.get_stats()
+        assert stats['total_bytes'] <= 5000
+        assert 0 < stats['entries'] < 10
+        assert cache.get('k9') is not None
+
+    def test_clear_model_version(self, db_path):
+        """Clearing a version leaves other versions cached"""
+        cache = ExplanationCache(db_path)
+        cache.put('v1:a', 'v1', make_explanation(1))
+        cache.put('v2:a', 'v2', make_explanation(2))
+
+        assert cache.clear('v1') == 1
+        assert cache.get('v1:a') is None
+        assert cache.get('v2:a') is not None
+        assert cache.clear() == 1
+
+    def test_totals_match_contents(self, db_path):
+        """Totals follow inserts, replacements, evictions and clears"""
+        cache = ExplanationCache(db_path, max_entries=5)
+
+        def actual():
+            with sqlite3.connect(db_path) as conn:
+                return conn.execute(
+                    "SELECT COUNT(*), COALESCE(SUM(size_bytes), 0) FROM explanations"
+                ).fetchone()
+
+        cache.put_many([(f"k{i}", make_explanation(i)) for i in range(4)], 'v1')
+        cache.put_many([('k0', make_explanation(0, padding=500)), ('k0', make_explanation(0))], 'v1')
+        cache.put_many([(f"n{i}", make_explanation(i)) for i in range(3)], 'v2')
+        stats = cache.get_stats()
+        assert (stats['entries'], stats['total_bytes']) == actual()
+        assert stats['entries'] == 5
+
+        cache.clear('v2')
+        assert (len(cache), cache.get_stats()['total_bytes']) == actual()
+
+        assert ExplanationCache(db_path).get_stats()['entries'] == actual()[0]
+
+    def test_reads_throttle_access_updates(self, db_path):
+        """Hits only rewrite access times older than touch_interval"""
+        def last_access():
+            with sqlite3.connect(db_path) as conn:
+                return conn.execute("SELECT last_access FROM explanations").fetchone()[0]
+
+        ExplanationCache(db_path).put('a', 'v1', make_explanation(1))
+        stored = last_access()
+
+        ExplanationCache(db_path, touch_interval=3600.0).get('a')
+        assert last_access() == stored
+
+        ExplanationCache(db_path, touch_interval=0.0).get('a')
+        assert last_access() > stored
+
+    def test_hit_and_miss_shapes_match(self, db_path):
+        """put returns the explanation exactly as a later get does"""
+        cache = ExplanationCache(db_path)
+        explanation = {
+            'sorted_features': [('mmse_score', -1.5), ('age', 0.5)],
+            'base_value': np.float32(0.5)
+        }
+
+        stored = cache.put('a', 'v1', explanation)
+
+        assert stored == cache.get('a')
+        assert stored['sorted_features'] == [['mmse_score', -1.5], ['age', 0.5]]
+        assert type(stored['base_value']) is float
@@ -0,0 +1,200 @@
+"""
+Tests for Feature Index
+
+Tests cover:
+- Columnar index build from partitioned Parquet files
+- Patient and date range lookups
+- Batched multi-patient lookups grouped by file
+- Persistence and reload
+- Single-record updates and removals
+"""
+import pytest
+import tempfile
+import shutil
+from pathlib import Path
+from datetime import date
+
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+from ml_pipeline.data_storage.feature_index import FeatureIndex
+
+
+def write_partition(storage_path: Path, cohort: str, month: int, df: pd.DataFrame) -> Path:
+    """Write a DataFrame as a feature store partition file"""
+    partition_path = storage_path / f"cohort={cohort}" / "year=2020" / f"month={month:02d}"
+    partition_path.mkdir(parents=True, exist_ok=True)
+    file_path = partition_path / f"features_{cohort}_2020_{month:02d}.parquet"
+    pq.write_table(pa.Table.from_pandas(df), file_path)
+    return file_path
+
+
+@pytest.fixture
+def temp_storage():
+    """Create temporary storage directory for tests"""
+    temp_dir = tempfile.mkdtemp()
+    yield Path(temp_dir)
+    shutil.rmtree(temp_dir)
+
+
+@pytest.fixture
+def populated_storage(temp_storage):
+    """Storage with two cohorts and a non-contiguous DataFrame index"""
+    write_partition(temp_storage, 'ADNI', 1, pd.DataFrame({
+        'patient_id': ['P2', 'P1', 'P2'],
+        'visit_date': pd.to_datetime(['2020-01-20', '2020-01-05', '2020-01-03']),
+        'mmse_score': [28, 27, 29]
+    }, index=[10, 20, 30]))
+    write_partition(temp_storage, 'NACC', 2, pd.DataFrame({
+        'patient_id': ['P3', 'P1', None],
+        'visit_date': pd.to_datetime(['2020-02-10', '2020-02-01', '2020-02-02']),
+        'mmse_score': [24, 26, 25]
+    }))
+    return temp_storage
+
+
+class TestFeatureIndex:
+    """Test suite for FeatureIndex"""
+    
+    def test_build_index(self, populated_storage):
+        """Test index build counts records, patients and cohorts"""
+        index = FeatureIndex(populated_storage)
+        index.build_index()
+        
+        stats = index.get_statistics()
+        assert stats['total_records'] == 5  # Row with null patient_id is skipped
+        assert stats['total_patients'] == 3
+        assert stats['cohort_distribution'] == {'ADNI': 2, 'NACC': 2}
+        assert stats['date_range'] == (date(2020, 1, 3), date(2020, 2, 10))
+    
+    def test_patient_locations_are_row_positions(self, populated_storage):
+        """Test locations resolve to the patient's rows via iloc"""
+        index = FeatureIndex(populated_storage)
+        index.build_index()
+        
+        locations = index.get_patient_locations('P2')
+        assert len(locations) == 2
+        
+        for file_path, row_idx in locations:
+            row = pd.read_parquet(file_path).iloc[row_idx]
+            assert row['patient_id'] == 'P2'
+        
+        assert index.get_patient_locations('missing') == []
+    
+    def test_patient_visit_dates_sorted(self, populated_storage):
+        """Test visit dates are returned in chronological order"""
+        index = FeatureIndex(populated_storage)
+        index.build_index()
+        
+        assert index.get_patient_visit_dates('P1') == [date(2020, 1, 5), date(2020, 2, 1)]
+        assert index.get_patient_visit_dates('P2') == [date(2020, 1, 3), date(2020, 1, 20)]
+    
+    def test_locations_by_file(self, populated_storage):
+        """Test batched lookups match per-patient lookups grouped by file"""
+        index = FeatureIndex(populated_storage)
+        index.build_index()
+        
+        for date_range, cohorts in [
+            (None, None),
+            ((date(2020, 1, 4), date(2020, 2, 5)), None),
+            (None, ['NACC'])
+        ]:
+            batched = index.get_locations_by_file(
+                ['P2', 'missing', 'P1', 'P1'], date_range=date_range, cohorts=cohorts
+            )
+            expected = {}
+            for patient_id in ['P1', 'P2']:
+                for file_path, row_idx in index.get_patient_locations(patient_id, date_range, cohorts):
+                    expected.setdefault(file_path, []).append(row_idx)
+            
+            assert {path: rows.tolist() for path, rows in batched.items()} == {
+                path: sorted(rows) for path, rows in expected.items()
+            }
+        
+        assert index.get_locations_by_file(['missing']) == {}
+    
+    def test_date_locations(self, populated_storage):
+        """Test date range lookups are inclusive"""
+        index = FeatureIndex(populated_storage)
+        index.build_index()
+        
+        assert len(index.get_date_locations(date(2020, 1, 5), date(2020, 2, 1))) == 3
+        assert len(index.get_date_locations(date(2020, 2, 10))) == 1
+        assert index.get_date_locations(date(2021, 1, 1)) == []
+    
+    def test_cohort_patients(self, populated_storage):
+        """Test cohort membership lookups"""
+        index = FeatureIndex(populated_storage)
+        index.build_index()
+        
+        assert index.get_cohort_patients('ADNI') == {'P1', 'P2'}
+        assert index.get_cohort_patients('NACC') == {'P1', 'P3'}
+        assert index.get_cohort_patients('OASIS') == set()
+    
+    def test_persistence(self, populated_storage):
+        """Test indexes are reloaded from disk"""
+        index = FeatureIndex(populated_storage)
+        index.build_index()
+        
+        reloaded = FeatureIndex(populated_storage)
+        assert reloaded.get_statistics()['total_records'] == 5
+        assert reloaded.get_patient_locations('P1') == index.get_patient_locations('P1')
+        assert reloaded.index_metadata['date_range'] == index.index_metadata['date_range']
+    
+    def test_update_and_remove(self, populated_storage):
+        """Test single-record updates and removals"""
+        index = FeatureIndex(populated_storage)
+        index.build_index()
+        
+        file_path = next(populated_storage.rglob("*ADNI*.parquet"))
+        index.update_index('P0', date(2020, 1, 1), file_path, 0, 'ADNI')
+        assert index.patient_exists('P0')
+        assert index.get_patient_locations('P1') != []
+        
+        index.remove_from_index('P1', visit_date=date(2020, 1, 5))
+        assert index.get_patient_visit_dates('P1') == [date(2020, 2, 1)]
+        
+        index.remove_from_index('P1')
+        assert not index.patient_exists('P1')
+        assert index.get_statistics()['total_records'] == 4
+    
+    def test_refresh_skips_unchanged_files(self, populated_storage):
+        """Test refresh only re-reads files whose fingerprint changed"""
+        index = FeatureIndex(populated_storage)
+        index.build_index()
+        
+        stats = index.refresh()
+        assert stats == {'added': 0, 'updated': 0, 'removed': 0, 'unchanged': 2}
+    
+    def test_refresh_added_updated_removed(self, populated_storage):
+        """Test refresh merges file changes and matches a full rebuild"""
+        index = FeatureIndex(populated_storage)
+        index.build_index()
+        
+        # Rewrite ADNI, add OASIS, remove NACC
+        adni_file = write_partition(populated_storage, 'ADNI', 1, pd.DataFrame({
+            'patient_id': ['P4', 'P2'],
+            'visit_date': pd.to_datetime(['2020-01-02', '2020-01-30']),
+            'mmse_score': [30, 28]
+        }))
+        oasis_file = write_partition(populated_storage, 'OASIS', 3, pd.DataFrame({
+            'patient_id': ['P0'],
+            'visit_date': pd.to_datetime(['2020-03-01']),
+            'mmse_score': [22]
+        }))
+        nacc_file = next(populated_storage.rglob("*NACC*.parquet"))
+        nacc_file.unlink()
+        
+        stats = index.refresh(paths=[adni_file, oasis_file, nacc_file])
+        assert stats == {'added': 1, 'updated': 1, 'removed': 1, 'unchanged': 0}
+        
+        rebuilt = FeatureIndex(populated_storage)
+        rebuilt.build_index(force_rebuild=True)
+        
+        for patient_id in ['P0', 'P1', 'P2', 'P3', 'P4']:
+            assert index.get_patient_locations(patient_id) == rebuilt.get_patient_locations(patient_id)
+            assert index.get_patient_visit_dates(patient_id) == rebuilt.get_patient_visit_dates(patient_id)
+        
+        assert len(index.get_date_locations(date(2020, 1, 1), date(2020, 3, 31))) == 3
+        assert index.get_statistics()['total_patients'] == 3
@@ -0,0 +1,226 @@
+"""
+Tests for Feature Engineering Pipeline
+
+Tests cover:
+- Parallel extractor execution on a process pool
+- Patient-partitioned chunking
+- Aligning new data to the fitted columns before imputation
+- Chunked transform matching a full-frame transform
+- No nested process pools in chunk workers or single transforms
+- Saved pipeline artifacts and their registration with model versions
+"""
+import copy
+
+import pytest
+import numpy as np
+import pandas as pd
+
+from ml_pipeline.feature_engineering import pipeline as pipeline_module
+from ml_pipeline.feature_engineering.pipeline import FeatureEngineeringPipeline
+from ml_pipeline.models.model_registry import ModelRegistry
+
+
+def create_raw_data(n_patients: int = 40, n_visits: int = 3, seed: int = 42) -> pd.DataFrame:
+    """Create synthetic longitudinal biomedical data with missing values"""
+    rng = np.random.default_rng(seed)
+    n = n_patients * n_visits
+    
+    data = pd.DataFrame({
+        'patient_id': np.repeat([f'P{i:03d}' for i in range(n_patients)], n_visits),
+        'visit_date': pd.Timestamp('2020-01-01') + pd.to_timedelta(
+            np.tile(np.arange(n_visits) * 180, n_patients) + rng.integers(0, 30, n), unit='D'
+        ),
+        'MMSE': rng.integers(15, 30, n).astype(float),
+        'MoCA': rng.integers(12, 28, n).astype(float),
+        'CDR': rng.choice([0, 0.5, 1, 2], n),
+        'CSF_AB42': rng.uniform(300, 800, n),
+        'CSF_TAU': rng.uniform(200, 600, n),
+        'hippocampus_left': rng.uniform(2000, 4000, n),
+        'hippocampus_right': rng.uniform(2000, 4000, n),
+        'intracranial_volume': rng.uniform(1200000, 1600000, n),
+        'APOE': rng.choice(['e3/e3', 'e3/e4', 'e4/e4', 'e2/e3'], n),
+        'age': rng.integers(60, 85, n).astype(float),
+        'sex': rng.choice([0, 1], n),
+        'education': rng.integers(8, 20, n).astype(float),
+        'race': rng.choice(['white', 'black', 'asian', 'hispanic'], n),
+        'bmi': rng.uniform(18, 35, n)
+    })
+    
+    for col in ['MoCA', 'CSF_TAU', 'bmi']:
+        data.loc[rng.choice(n, size=n // 10, replace=False), col] = np.nan
+    
+    # Shuffle so patients' visits are not contiguous
+    return data.sample(frac=1, random_state=seed)
+
+
+@pytest.fixture(scope='module')
+def raw_data():
+    """Synthetic raw data"""
+    return create_raw_data()
+
+
+@pytest.fixture(scope='module')
+def fitted_pipeline(raw_data):
+    """Pipeline fitted sequentially"""
+    pipeline = FeatureEngineeringPipeline(imputation_strategy='mean')
+    features = pipeline.fit_transform(raw_data.copy())
+    return pipeline, features
+
+
+class TestFeatureEngineeringPipeline:
+    """Test suite for FeatureEngineeringPipeline execution modes"""
+    
+    def test_parallel_fit_matches_sequential(self, raw_data, fitted_pipeline):
+        """Test extractors on a process pool give the same features and state"""
+        sequential, expected = fitted_pipeline
+        
+        parallel = FeatureEngineeringPipeline(imputation_strategy='mean', n_jobs=3)
+        features = parallel.fit_transform(raw_data.copy())
+        
+        pd.testing.assert_frame_equal(features, expected)
+        assert parallel.get_feature_names() == sequential.get_feature_names()
+    
+    def test_patient_chunks_keep_patients_together(self, raw_data):
+        """Test chunks cover every row once and never split a patient"""
+        chunks = list(FeatureEngineeringPipeline.iter_patient_chunks(raw_data, chunk_size=25))
+        
+        assert len(chunks) > 1
+        assert sorted(pd.concat(chunks).index) == sorted(raw_data.index)
+        
+        patients = [set(chunk['patient_id']) for chunk in chunks]
+        assert sum(len(p) for p in patients) == len(set().union(*patients))
+        
+        positions = [raw_data.index.get_indexer(chunk.index) for chunk in chunks]
+        assert all((np.diff(p) > 0).all() for p in positions)
+    
+    @pytest.mark.parametrize('n_jobs', [1, 2])
+    def test_chunked_transform_matches_transform(self, raw_data, fitted_pipeline, n_jobs):
+        """Test chunked transform output equals a single full-frame transform"""
+        pipeline, _ = fitted_pipeline
+        expected = pipeline.transform(raw_data.copy())
+        
+        pipeline.chunk_size = 25
+        chunks = list(pipeline.transform_chunks(raw_data.copy(), n_jobs=n_jobs))
+        
+        assert len(chunks) > 1
+        pd.testing.assert_frame_equal(pd.concat(chunks).loc[expected.index], expected)
+    
+    def test_chunked_transform_with_parallel_pipeline(self, raw_data):
+        """Test a pipeline built with n_jobs > 1 chunks on its own worker count"""
+        pipeline = FeatureEngineeringPipeline(imputation_strategy='mean', n_jobs=2, chunk_size=25)
+        pipeline.fit_transform(raw_data.copy())
+        expected = pipeline.transform(raw_data.copy())
+        
+        chunks = list(pipeline.transform_chunks(raw_data.copy()))
+        
+        assert len(chunks) > 1
+        pd.testing.assert_frame_equal(pd.concat(chunks).loc[expected.index], expected)
+    
+    def test_chunk_workers_run_sequentially(self, fitted_pipeline):
+        """Test each chunk worker's pipeline copy does not start its own pool"""
+        pipeline = copy.deepcopy(fitted_pipeline[0])
+        pipeline.n_jobs = 4
+        
+        try:
+            pipeline_module._init_chunk_worker(pipeline)
+            assert pipeline_module._worker_pipeline.n_jobs == 1
+        finally:
+            pipeline_module._worker_pipeline = None
+    
+    def test_transform_does_not_start_pool(self, raw_data, fitted_pipeline, monkeypatch):
+        """Test transform runs extractors in-process even with n_jobs > 1"""
+        pipeline = copy.deepcopy(fitted_pipeline[0])
+        pipeline.n_jobs = 4
+        
+        def no_pool(*args, **kwargs):
+            raise AssertionError("transform started a process pool")
+        
+        monkeypatch.setattr(pipeline_module, 'ProcessPoolExecutor', no_pool)
+        
+        features = pipeline.transform(raw_data.copy())
+        pd.testing.assert_frame_equal(features, fitted_pipeline[0].transform(raw_data.copy()))
+    
+    def test_absent_features_are_imputed(self, raw_data, fitted_pipeline):
+        """Test absent continuous features are imputed, not zero-filled"""
+        pipeline, _ = fitted_pipeline
+        new_data = raw_data[raw_data['race'] == 'white'].drop(columns=['bmi'])
+        
+        aligned = pipeline._align_features(pipeline._extract_features(new_data))
+        
+        assert list(aligned.columns) == pipeline.feature_columns
+        assert aligned['bmi'].isna().all()
+        assert (aligned[['race_asian', 'race_black', 'race_hispanic']] == 0).all().all()
+        
+        features = pipeline.transform(new_data)
+        expected = pipeline.transform(raw_data[raw_data['race'] == 'white'].assign(bmi=np.nan))
+        pd.testing.assert_series_equal(features['bmi'], expected['bmi'])
+        assert features['bmi'].nunique() == 1
+    
+    def test_chunked_transform_requires_fit(self, raw_data):
+        """Test chunked transform refuses an unfitted pipeline"""
+        with pytest.raises(ValueError):
+            next(FeatureEngineeringPipeline().transform_chunks(raw_data))
+    
+    @pytest.mark.parametrize('imputation_strategy, normalization_method', [
+        ('mean', 'standard'),
+        ('median', 'minmax'),
+        ('iterative', 'robust')
+    ])
+    def test_saved_pipeline_transforms_like_fitted(
+        self, raw_data, tmp_path, imputation_strategy, normalization_method
+    ):
+        """Test a loaded artifact reproduces the fitted pipeline's transform"""
+        pipeline = FeatureEngineeringPipeline(
+            imputation_strategy=imputation_strategy,
+            normalization_method=normalization_method
+        )
+        pipeline.fit_transform(raw_data.copy())
+        
+        content_hash = pipeline.save(tmp_path / 'pipeline.npz')
+        loaded = FeatureEngineeringPipeline.load(tmp_path / 'pipeline.npz')
+        
+        assert loaded.content_hash == content_hash
+        assert loaded.get_feature_names() == pipeline.get_feature_names()
+        
+        expected = pipeline.transform(raw_data.copy())
+        pd.testing.assert_frame_equal(
+            loaded.transform(raw_data.copy()), expected, check_exact=False, rtol=1e-9
+        )
+        
+        # Arrays only; nothing needs unpickling
+        np.load(tmp_path / 'pipeline.npz', allow_pickle=False).close()
+    
+    def test_corrupt_artifact_is_rejected(self, fitted_pipeline, tmp_path):
+        """Test the content hash detects modified arrays"""
+        pipeline, _ = fitted_pipeline
+        path = tmp_path / 'pipeline.npz'
+        content_hash = pipeline.save(path)
+        
+        with np.load(path) as npz:
+            arrays = dict(npz)
+        arrays['normalizer.mean_'] = arrays['normalizer.mean_'] + 1.0
+        np.savez(path, **arrays)
+        
+        with pytest.raises(ValueError, match="content hash"):
+            FeatureEngineeringPipeline.load(path)
+        
+        pipeline.save(path)
+        with pytest.raises(ValueError, match="expected"):
+            FeatureEngineeringPipeline.load(path, expected_hash=content_hash[::-1])
+    
+    def test_registry_stores_pipeline_with_model_version(self, raw_data, fitted_pipeline, tmp_path):
+        """Test the registry saves and reloads the pipeline next to a model version"""
+        pipeline, _ = fitted_pipeline
+        registry = ModelRegistry(storage_path=str(tmp_path))
+        (tmp_path / 'classifier' / 'v1').mkdir(parents=True)
+        
+        content_hash = registry.register_feature_pipeline('classifier', 'v1', pipeline)
+        loaded = registry.load_feature_pipeline('classifier', 'v1')
+        
+        assert loaded.content_hash == content_hash
+        pd.testing.assert_frame_equal(
+            loaded.transform(raw_data.copy()), pipeline.transform(raw_data.copy())
+        )
+        
+        with pytest.raises(ValueError):
+            registry.register_feature_pipeline('classifier', 'v2', pipeline)
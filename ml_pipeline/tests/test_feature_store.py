@@ -0,0 +1,369 @@
+"""
+Tests for Feature Store
+
+Tests cover:
+- Partitioned writes with sort-on-write
+- Indexed and scan reads with patient, date and cohort predicates
+- Batched multi-patient reads with one read per file
+- Row-group selective reads
+- Delta appends, tombstone deletes and compaction
+- Two-tier feature cache keyed by manifest version
+- Streaming Arrow IPC and NDJSON reads
+- Training-data scans running off the event loop
+"""
+import asyncio
+import json
+import pytest
+import tempfile
+import shutil
+from pathlib import Path
+from datetime import date
+from unittest.mock import MagicMock, patch
+
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from ml_pipeline.api.feature_api import router, get_feature_store
+from ml_pipeline.data_storage.cache import LocalCache
+from ml_pipeline.data_storage.feature_store import FeatureStore
+
+
+def create_features(n_patients: int = 40, n_visits: int = 6, seed: int = 42) -> pd.DataFrame:
+    """Create synthetic longitudinal features"""
+    rng = np.random.default_rng(seed)
+    rows = []
+    for i in range(n_patients):
+        for v in range(n_visits):
+            rows.append({
+                'patient_id': f'P{i:03d}',
+                'visit_date': pd.Timestamp('2020-01-01') + pd.Timedelta(days=int(rng.integers(0, 365))),
+                'mmse_score': float(rng.integers(15, 30))
+            })
+    return pd.DataFrame(rows).drop_duplicates(subset=['patient_id', 'visit_date'])
+
+
+def normalize(df: pd.DataFrame) -> pd.DataFrame:
+    """Sort features for order-independent comparison"""
+    return df.sort_values(['patient_id', 'visit_date'])[
+        ['patient_id', 'visit_date', 'mmse_score']
+    ].reset_index(drop=True)
+
+
+@pytest.fixture
+def temp_storage():
+    """Create temporary storage directory for tests"""
+    temp_dir = tempfile.mkdtemp()
+    yield Path(temp_dir)
+    shutil.rmtree(temp_dir)
+
+
+@pytest.fixture
+def features():
+    """Synthetic feature DataFrame"""
+    return create_features()
+
+
+@pytest.fixture
+def store(temp_storage, features):
+    """Feature store with ADNI features written"""
+    feature_store = FeatureStore(storage_path=temp_storage, cache_manager=MagicMock())
+    feature_store.write_features(features.copy(), cohort='ADNI')
+    return feature_store
+
+
+class TestFeatureStore:
+    """Test suite for FeatureStore"""
+    
+    def test_sort_on_write(self, store, temp_storage):
+        """Test partition files are sorted by patient_id and visit_date"""
+        for file_path in temp_storage.rglob("*.parquet"):
+            df = pq.read_table(file_path, columns=['patient_id', 'visit_date']).to_pandas()
+            assert df.equals(df.sort_values(['patient_id', 'visit_date']).reset_index(drop=True))
+    
+    def test_indexed_and_scan_reads_match(self, store, temp_storage, features):
+        """Test indexed and pushed-down scan reads return the same rows"""
+        patient_ids = ['P001', 'P017', 'P039']
+        date_range = (date(2020, 3, 1), date(2020, 9, 30))
+        
+        expected = features[
+            features['patient_id'].isin(patient_ids) &
+            (features['visit_date'] >= pd.Timestamp(date_range[0])) &
+            (features['visit_date'] <= pd.Timestamp(date_range[1]))
+        ]
+        
+        indexed = store.read_features(
+            patient_ids=patient_ids, date_range=date_range, use_cache=False
+        )
+        scan_store = FeatureStore(
+            storage_path=temp_storage, cache_manager=MagicMock(), use_index=False
+        )
+        scanned = scan_store.read_features(
+            patient_ids=patient_ids, date_range=date_range, use_cache=False
+        )
+        
+        pd.testing.assert_frame_equal(normalize(indexed), normalize(expected), check_dtype=False)
+        pd.testing.assert_frame_equal(normalize(scanned), normalize(expected), check_dtype=False)
+    
+    def test_batched_read_opens_each_file_once(self, store, features):
+        """Test many-patient reads group locations by file before reading"""
+        patient_ids = [f'P{i:03d}' for i in range(0, 40, 2)]
+        expected = features[features['patient_id'].isin(patient_ids)]
+        
+        with patch.object(FeatureStore, '_read_rows', wraps=FeatureStore._read_rows) as read_rows:
+            df = store.read_features(patient_ids=patient_ids, use_cache=False)
+        
+        files_read = [call.args[0] for call in read_rows.call_args_list]
+        assert len(files_read) == len(set(files_read))
+        pd.testing.assert_frame_equal(normalize(df), normalize(expected), check_dtype=False)
+        
+        threaded = store.read_features(patient_ids=patient_ids, use_cache=False, max_workers=4)
+        pd.testing.assert_frame_equal(normalize(threaded), normalize(df))
+    
+    def test_cohort_filter(self, store):
+        """Test cohort predicates exclude other cohorts"""
+        assert store.read_features(patient_ids=['P001'], cohorts=['NACC'], use_cache=False).empty
+        assert not store.read_features(patient_ids=['P001'], cohorts=['ADNI'], use_cache=False).empty
+    
+    def test_column_projection(self, store, features):
+        """Test filters still apply when key columns are not projected"""
+        df = store.read_features(
+            patient_ids=['P005'], columns=['mmse_score'], use_cache=False
+        )
+        assert list(df.columns) == ['mmse_score']
+        assert len(df) == (features['patient_id'] == 'P005').sum()
+    
+    def test_read_rows_selects_row_groups(self, temp_storage):
+        """Test row reads across several row groups"""
+        feature_store = FeatureStore(storage_path=temp_storage, cache_manager=MagicMock())
+        feature_store.write_options['row_group_size'] = 10
+        
+        df = create_features(n_patients=20, n_visits=3)
+        feature_store.write_features(df.copy(), cohort='ADNI', partition_by_date=False)
+        
+        [(rel_path, entry)] = feature_store.manifest.live_files()
+        assert entry['partition'] == 'cohort=ADNI'
+        file_path = temp_storage / rel_path
+        assert pq.ParquetFile(file_path).metadata.num_row_groups > 1
+        
+        full = pd.read_parquet(file_path)
+        rows = feature_store._read_rows(file_path, [25, 3, 41], columns=['patient_id', 'mmse_score'])
+        pd.testing.assert_frame_equal(
+            rows.reset_index(drop=True),
+            full.iloc[[3, 25, 41]][['patient_id', 'mmse_score']].reset_index(drop=True)
+        )
+    
+    def test_append_writes_delta_files(self, store, temp_storage):
+        """Test appends add delta files and newer rows replace older ones"""
+        files_before = len(store.manifest.live_files())
+        
+        update = pd.DataFrame({
+            'patient_id': ['P001', 'P999'],
+            'visit_date': pd.to_datetime(['2020-02-01', '2020-02-01']),
+            'mmse_score': [99.0, 20.0]
+        })
+        existing = store.read_features(patient_ids=['P001'], use_cache=False)
+        update.loc[0, 'visit_date'] = existing['visit_date'].iloc[0]
+        
+        stats = store.write_features(update, cohort='ADNI')
+        
+        deltas = [entry for _, entry in store.manifest.live_files() if entry['kind'] == 'delta']
+        assert len(store.manifest.live_files()) == files_before + stats['partitions_written']
+        assert len(deltas) == stats['partitions_written']
+        
+        for feature_store in [store, FeatureStore(temp_storage, MagicMock(), use_index=False)]:
+            df = feature_store.read_features(patient_ids=['P001', 'P999'], use_cache=False)
+            p001 = df[df['patient_id'] == 'P001']
+            assert len(p001) == len(existing)
+            assert p001.loc[p001['visit_date'] == update.loc[0, 'visit_date'], 'mmse_score'].tolist() == [99.0]
+            assert (df['patient_id'] == 'P999').sum() == 1
+    
+    def test_delete_writes_tombstone(self, store, temp_storage, features):
+        """Test deletes are recorded as tombstones and hidden from reads"""
+        files_before = store.manifest.live_files()
+        
+        deleted = store.delete_features(patient_ids=['P002', 'P003'])
+        
+        assert deleted == features['patient_id'].isin(['P002', 'P003']).sum()
+        assert store.manifest.live_files() == files_before
+        assert len(store.manifest.live_tombstones()) == 1
+        assert store.read_features(patient_ids=['P002'], use_cache=False).empty
+        
+        scanned = FeatureStore(temp_storage, MagicMock(), use_index=False).read_features(use_cache=False)
+        assert len(scanned) == len(features) - deleted
+        
+        # Rows written after the delete are visible again
+        store.write_features(features[features['patient_id'] == 'P002'].copy(), cohort='ADNI')
+        assert len(store.read_features(patient_ids=['P002'], use_cache=False)) == (features['patient_id'] == 'P002').sum()
+    
+    def test_compaction_folds_deltas_and_tombstones(self, store, features):
+        """Test compaction leaves one base file per partition with the same live rows"""
+        store.obsolete_file_grace_seconds = 0
+        store.write_features(create_features(n_patients=10, seed=7), cohort='ADNI')
+        store.delete_features(patient_ids=['P004'])
+        expected = normalize(store.read_features(use_cache=False))
+        
+        stats = store.optimize_storage()
+        
+        assert stats['partitions_compacted'] > 0
+        assert stats['tombstones_removed'] == 1
+        assert store.manifest.live_tombstones() == []
+        
+        partitions = store.manifest.partitions()
+        assert all(len(files) == 1 for files in partitions.values())
+        assert all(files[0][1]['kind'] == 'base' for files in partitions.values())
+        
+        pd.testing.assert_frame_equal(normalize(store.read_features(use_cache=False)), expected)
+        indexed = store.read_features(patient_ids=['P001', 'P004'], use_cache=False)
+        pd.testing.assert_frame_equal(
+            normalize(indexed), expected[expected['patient_id'].isin(['P001', 'P004'])].reset_index(drop=True)
+        )
+        
+        # Replaced files are deleted on the next run
+        store.optimize_storage(background=True).result()
+        live = {rel_path for rel_path, _ in store.manifest.live_files()}
+        on_disk = {
+            path.relative_to(store.storage_path).as_posix()
+            for path in store.storage_path.glob("cohort=*/**/*.parquet")
+        }
+        assert on_disk == live
+    
+    def test_overwrite_replaces_partition(self, store, features):
+        """Test overwrite replaces every live file of the partition"""
+        store.write_features(create_features(n_patients=5, seed=3), cohort='ADNI')
+        
+        replacement = features[features['visit_date'].dt.month == 1].head(3).copy()
+        store.write_features(replacement.copy(), cohort='ADNI', overwrite=True)
+        
+        january = store.read_features(
+            date_range=(date(2020, 1, 1), date(2020, 1, 31)), use_cache=False
+        )
+        assert normalize(january).equals(normalize(replacement))
+    
+    def test_existing_store_is_bootstrapped(self, temp_storage, features):
+        """Test files written before the manifest existed are registered as base files"""
+        partition_path = temp_storage / "cohort=ADNI" / "year=2020" / "month=01"
+        partition_path.mkdir(parents=True)
+        legacy = features[features['visit_date'].dt.month == 1]
+        legacy.to_parquet(partition_path / "features_ADNI_2020_01.parquet", index=False)
+        
+        feature_store = FeatureStore(temp_storage, MagicMock(), use_index=False)
+        
+        assert [entry['sequence'] for _, entry in feature_store.manifest.live_files()] == [0]
+        assert len(feature_store.read_features(use_cache=False)) == len(legacy)
+    
+    def test_cache_hits_and_write_invalidation(self, store, features):
+        """Test cached reads round-trip through Arrow IPC and writes move to new keys"""
+        first = store.read_features(patient_ids=['P001'])
+        cached = store.read_features(patient_ids=['P001'])
+        
+        assert store.feature_cache.local.get_stats()['hits'] == 1
+        pd.testing.assert_frame_equal(cached, first)
+        
+        # Different filters do not share an entry
+        projected = store.read_features(patient_ids=['P001'], columns=['mmse_score'])
+        assert list(projected.columns) == ['mmse_score']
+        
+        update = first[['patient_id', 'visit_date']].head(1).assign(mmse_score=0.0)
+        store.write_features(update, cohort='ADNI')
+        
+        refreshed = store.read_features(patient_ids=['P001'])
+        assert 0.0 in refreshed['mmse_score'].tolist()
+        assert store.feature_cache.local.get_stats()['hits'] == 1
+    
+    def test_stream_features_matches_read(self, store, temp_storage, features):
+        """Test streamed batches share one schema and merge deltas and tombstones"""
+        store.write_features(create_features(n_patients=5, seed=9), cohort='ADNI')
+        store.delete_features(patient_ids=['P010'])
+        expected = store.read_features(use_cache=False)
+        
+        schema, batches = store.stream_features(batch_size=16)
+        batches = list(batches)
+        
+        assert len(batches) > 1
+        assert all(batch.schema == schema for batch in batches)
+        streamed = pa.Table.from_batches(batches, schema=schema).to_pandas()
+        pd.testing.assert_frame_equal(normalize(streamed), normalize(expected), check_dtype=False)
+        
+        schema, batches = store.stream_features(patient_ids=['P001', 'P010'], columns=['mmse_score'])
+        assert schema.names == ['mmse_score']
+        assert sum(batch.num_rows for batch in batches) == (expected['patient_id'] == 'P001').sum()
+    
+    def test_streaming_endpoints(self, store, features):
+        """Test query and training-data endpoints stream Arrow IPC and NDJSON"""
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_feature_store] = lambda: store
+        client = TestClient(app)
+        
+        response = client.post("/api/v1/features/query", json={"cohorts": ["ADNI"], "format": "arrow"})
+        assert response.headers['content-type'] == 'application/vnd.apache.arrow.stream'
+        table = pa.ipc.open_stream(response.content).read_all()
+        assert table.num_rows == len(features)
+        
+        response = client.get("/api/v1/features/patient/P001", params={"format": "ndjson"})
+        lines = response.text.splitlines()
+        assert len(lines) == (features['patient_id'] == 'P001').sum()
+        assert all(json.loads(line)['patient_id'] == 'P001' for line in lines)
+        
+        store.write_features(features.assign(diagnosis=1).copy(), cohort='ADNI', overwrite=True)
+        response = client.get("/api/v1/features/training-data", params={"format": "arrow", "cohorts": ["ADNI"]})
+        table = pa.ipc.open_stream(response.content).read_all()
+        assert table.column_names == ['mmse_score', 'diagnosis']
+        assert table.num_rows == len(features)
+    
+    def test_training_data_scan_runs_in_worker_thread(self, store, features):
+        """Test the training-data completeness pass does not block the event loop"""
+        app = FastAPI()
+        app.include_router(router)
+        app.dependency_overrides[get_feature_store] = lambda: store
+        client = TestClient(app)
+        store.write_features(features.assign(diagnosis=1).copy(), cohort='ADNI', overwrite=True)
+        
+        on_event_loop = []
+        stream_training_data = store.stream_training_data
+        
+        def recording_stream_training_data(**kwargs):
+            try:
+                asyncio.get_running_loop()
+                on_event_loop.append(True)
+            except RuntimeError:
+                on_event_loop.append(False)
+            return stream_training_data(**kwargs)
+        
+        with patch.object(store, 'stream_training_data', recording_stream_training_data):
+            response = client.get("/api/v1/features/training-data", params={"format": "ndjson"})
+        
+        assert response.status_code == 200
+        assert len(response.text.splitlines()) == len(features)
+        assert on_event_loop == [False]
+
+
+class TestLocalCache:
+    """Test suite for the in-process cache tier"""
+    
+    def test_evicts_least_recently_used_by_bytes(self):
+        """Test entries are evicted in LRU order once max_bytes is exceeded"""
+        cache = LocalCache(max_bytes=100, ttl=60)
+        cache.set('a', b'x' * 40)
+        cache.set('b', b'x' * 40)
+        cache.get('a')
+        cache.set('c', b'x' * 40)
+        
+        assert cache.get('b') is None
+        assert cache.get('a') is not None
+        assert cache.get('c') is not None
+        assert cache.get_stats()['current_bytes'] == 80
+        assert cache.get_stats()['evictions'] == 1
+        assert not cache.set('big', b'x' * 101)
+    
+    def test_expired_entries_are_misses(self):
+        """Test entries past their TTL are dropped"""
+        cache = LocalCache(max_bytes=100, ttl=60)
+        cache.set('a', b'x', ttl=-1)
+        
+        assert cache.get('a') is None
+        assert cache.get_stats()['current_bytes'] == 0
@@ -0,0 +1,108 @@
+"""
+Tests for Inference Executor
+
+Tests cover:
+- Running blocking calls without stalling the event loop
+- Per-stage queue and run timings
+- Rejecting calls when the queue is saturated
+- Timeouts keeping their slot until the worker finishes
+"""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from ml_pipeline.api.inference_executor import (
+    InferenceExecutor,
+    InferenceQueueFull,
+    InferenceTimeout
+)
+
+
+@pytest.fixture
+def executor():
+    """Create executor with one worker and one queue slot"""
+    executor = InferenceExecutor("test", max_workers=1, max_queue_depth=1, timeout=5)
+    yield executor
+    executor.shutdown()
+
+
+class TestInferenceExecutor:
+    """Test suite for InferenceExecutor"""
+
+    def test_event_loop_stays_responsive(self, executor):
+        """Other coroutines run while a blocking call is in progress"""
+        async def scenario():
+            ticks = []
+
+            async def ticker():
+                for _ in range(5):
+                    ticks.append(time.perf_counter())
+                    await asyncio.sleep(0.01)
+
+            await asyncio.gather(executor.run(time.sleep, 0.2), ticker())
+            return ticks
+
+        ticks = asyncio.run(scenario())
+        assert len(ticks) == 5
+        assert ticks[-1] - ticks[0] < 0.15
+
+    def test_timings(self, executor):
+        """Queue and run time are recorded under the stage name"""
+        timings = {}
+        result = asyncio.run(executor.run(lambda x: x * 2, 21, stage='predict', timings=timings))
+
+        assert result == 42
+        assert set(timings) == {'predict', 'predict_queue'}
+        assert timings['predict'] >= 0
+
+    def test_saturated_queue_rejects(self, executor):
+        """Calls beyond workers plus queue depth fail fast"""
+        release = threading.Event()
+
+        async def scenario():
+            running = [asyncio.ensure_future(executor.run(release.wait)) for _ in range(2)]
+            await asyncio.sleep(0.05)
+            assert executor.get_stats()['queued'] == 1
+
+            with pytest.raises(InferenceQueueFull):
+                await executor.run(lambda: None)
+
+            release.set()
+            await asyncio.gather(*running)
+
+        asyncio.run(scenario())
+        stats = executor.get_stats()
+        assert stats['in_flight'] == 0
+        assert stats['rejected'] == 1
+
+    def test_errors_release_slot(self, executor):
+        """Exceptions propagate and free the slot"""
+        def fail():
+            raise ValueError("bad input")
+
+        with pytest.raises(ValueError):
+            asyncio.run(executor.run(fail))
+        assert executor.get_stats()['in_flight'] == 0
+
+    def test_timeout_keeps_slot_until_done(self):
+        """A timed-out call counts against the limit until it finishes"""
+        executor = InferenceExecutor("slow", max_workers=1, max_queue_depth=0, timeout=0.05)
+        release = threading.Event()
+
+        try:
+            with pytest.raises(InferenceTimeout):
+                asyncio.run(executor.run(release.wait))
+            assert executor.get_stats()['in_flight'] == 1
+
+            with pytest.raises(InferenceQueueFull):
+                asyncio.run(executor.run(lambda: None))
+
+            release.set()
+            time.sleep(0.05)
+            assert executor.get_stats()['in_flight'] == 0
+            assert executor.get_stats()['timed_out'] == 1
+        finally:
+            release.set()
+            executor.shutdown()
@@ -0,0 +1,122 @@
+"""
+Tests for Micro-Batcher
+
+Tests cover:
+- Coalescing concurrent single-row requests into vectorized calls
+- Sending a lone request without waiting
+- Maximum batch size
+- Propagating batch failures to every caller
+- Batch size and queueing delay statistics
+"""
+import asyncio
+import threading
+import time
+
+import numpy as np
+import pytest
+
+from ml_pipeline.api.inference_executor import InferenceExecutor
+from ml_pipeline.api.micro_batcher import MicroBatcher
+
+
+class RecordingModel:
+    """Row-sum model recording the size of each call"""
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.batch_sizes = []
+        self._lock = threading.Lock()
+
+    def __call__(self, X):
+        with self._lock:
+            self.batch_sizes.append(len(X))
+        time.sleep(self.delay)
+        return X.sum(axis=1)
+
+
+@pytest.fixture
+def executor():
+    """Create executor for batched calls"""
+    executor = InferenceExecutor("test", max_workers=2, max_queue_depth=8)
+    yield executor
+    executor.shutdown()
+
+
+class TestMicroBatcher:
+    """Test suite for MicroBatcher"""
+
+    def test_concurrent_requests_are_batched(self, executor):
+        """Concurrent requests share calls and each gets its own row"""
+        model = RecordingModel()
+        batcher = MicroBatcher("test", model, executor, max_batch_size=32, max_wait_ms=50)
+
+        async def scenario():
+            return await asyncio.gather(*[
+                batcher.predict(np.array([[float(i), 1.0]])) for i in range(20)
+            ])
+
+        results = asyncio.run(scenario())
+
+        assert [float(r) for r in results] == [i + 1.0 for i in range(20)]
+        assert sum(model.batch_sizes) == 20
+        assert len(model.batch_sizes) < 20
+        assert batcher.get_stats()['mean_batch_size'] > 1
+
+    def test_lone_request_is_not_delayed(self, executor):
+        """With no batch running, a request is sent at once"""
+        model = RecordingModel(delay=0)
+        batcher = MicroBatcher("test", model, executor, max_wait_ms=1000)
+
+        start = time.perf_counter()
+        result = asyncio.run(batcher.predict(np.array([1.0, 2.0])))
+
+        assert float(result) == 3.0
+        assert time.perf_counter() - start < 0.5
+
+    def test_max_batch_size(self, executor):
+        """No call exceeds the maximum batch size"""
+        model = RecordingModel()
+        batcher = MicroBatcher("test", model, executor, max_batch_size=4, max_wait_ms=50)
+
+        async def scenario():
+            await asyncio.gather(*[batcher.predict(np.ones(3)) for _ in range(17)])
+
+        asyncio.run(scenario())
+
+        assert max(model.batch_sizes) <= 4
+        assert sum(model.batch_sizes) == 17
+
+    def test_batch_failure_reaches_every_caller(self, executor):
+        """Every request in a failing batch receives the error"""
+        def fail(X):
+            raise ValueError("model error")
+
+        batcher = MicroBatcher("test", fail, executor)
+
+        async def scenario():
+            return await asyncio.gather(
+                *[batcher.predict(np.ones(2)) for _ in range(5)],
+                return_exceptions=True
+            )
+
+        results = asyncio.run(scenario())
+        assert all(isinstance(r, ValueError) for r in results)
+
+    def test_timings_and_stats(self, executor):
+        """Callers receive batch timings and stats count every request"""
+        batcher = MicroBatcher("test", RecordingModel(), executor, max_wait_ms=20)
+        timings = [{} for _ in range(6)]
+
+        async def scenario():
+            await asyncio.gather(*[
+                batcher.predict(np.ones(2), timings=t) for t in timings
+            ])
+
+        asyncio.run(scenario())
+
+        for t in timings:
+            assert {'batch_wait', 'batch_size', 'predict_queue', 'predict'} <= set(t)
+        stats = batcher.get_stats()
+        assert stats['requests'] == 6
+        assert stats['pending'] == 0
+        assert stats['largest_batch'] == max(t['batch_size'] for t in timings)
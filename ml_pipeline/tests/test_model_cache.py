@@ -0,0 +1,207 @@
+"""
+Tests for Model Cache
+
+Tests cover:
+- Caching production models by version
+- Picking up promotions after the pointer TTL
+- Serving the previous version while a promoted version preloads
+- LRU eviction by entry and byte limits
+- Loading a version once under concurrent misses
+"""
+import threading
+import time
+from types import SimpleNamespace
+
+import pytest
+
+from ml_pipeline.api.model_cache import ModelCache
+
+
+class FakeRegistry:
+    """Registry with an in-memory production pointer"""
+
+    def __init__(self, tmp_path, load_delay: float = 0.0):
+        self.tmp_path = tmp_path
+        self.load_delay = load_delay
+        self.production = {}
+        self.loads = []
+        self.pointer_lookups = 0
+        self.fail_versions = set()
+
+    def add_version(self, model_name, version_id, size=100, production=True):
+        artifact = self.tmp_path / f"{version_id}.pkl"
+        artifact.write_bytes(b"x" * size)
+        if production:
+            self.production[model_name] = version_id
+
+    def get_model_version(self, model_name, version_id=None):
+        if version_id is None:
+            self.pointer_lookups += 1
+            version_id = self.production.get(model_name)
+            if version_id is None:
+                return None
+        return SimpleNamespace(
+            version_id=version_id,
+            artifact_path=str(self.tmp_path / f"{version_id}.pkl")
+        )
+
+    def load_model(self, model_name, version_id=None):
+        time.sleep(self.load_delay)
+        if version_id in self.fail_versions:
+            raise FileNotFoundError(f"Model artifact not found: {version_id}")
+        self.loads.append(version_id)
+        return f"model-{version_id}", {'version_id': version_id, 'model_name': model_name}
+
+
+def wait_for_loads(cache, timeout=2.0):
+    """Wait until no background load is running"""
+    deadline = time.time() + timeout
+    while cache.get_stats()['loading'] and time.time() < deadline:
+        time.sleep(0.01)
+    time.sleep(0.02)
+
+
+@pytest.fixture
+def registry(tmp_path):
+    """Create registry with one production model"""
+    registry = FakeRegistry(tmp_path)
+    registry.add_version('ensemble', 'v1')
+    return registry
+
+
+def make_cache(registry, **kwargs):
+    """Create cache over a fake registry"""
+    options = {'max_bytes': 10_000, 'max_entries': 4, 'pointer_ttl': 60.0}
+    options.update(kwargs)
+    return ModelCache(lambda: registry, **options)
+
+
+class TestModelCache:
+    """Test suite for ModelCache"""
+
+    def test_cached_by_version(self, registry):
+        """Models load once and the pointer is looked up once per TTL"""
+        cache = make_cache(registry)
+
+        for _ in range(5):
+            model, metadata = cache.get('ensemble')
+
+        assert model == 'model-v1'
+        assert metadata['version_id'] == 'v1'
+        assert registry.loads == ['v1']
+        assert registry.pointer_lookups == 1
+        assert cache.keys() == ['ensemble_v1']
+
+    def test_unknown_model(self, registry):
+        """Models without a production version raise ValueError"""
+        with pytest.raises(ValueError):
+            make_cache(registry).get('missing')
+
+    def test_external_promotion_picked_up(self, registry):
+        """A promotion elsewhere is served once the pointer expires and it loads"""
+        cache = make_cache(registry, pointer_ttl=0.0)
+        cache.get('ensemble')
+
+        registry.add_version('ensemble', 'v2')
+        model, _ = cache.get('ensemble')
+        assert model == 'model-v1'  # Previous version serves while v2 loads
+
+        wait_for_loads(cache)
+        model, _ = cache.get('ensemble')
+        assert model == 'model-v2'
+        assert cache.get_stats()['serving'] == {'ensemble': 'v2'}
+
+    def test_promotion_preloads_without_cold_start(self, tmp_path):
+        """on_promotion loads in the background; requests never wait for it"""
+        registry = FakeRegistry(tmp_path, load_delay=0.2)
+        registry.add_version('ensemble', 'v1')
+        cache = make_cache(registry)
+        cache.get('ensemble')
+
+        registry.add_version('ensemble', 'v2')
+        cache.on_promotion('ensemble', 'v2')
+
+        start = time.perf_counter()
+        model, _ = cache.get('ensemble')
+        assert model == 'model-v1'
+        assert time.perf_counter() - start < 0.1
+
+        wait_for_loads(cache)
+        assert cache.get('ensemble')[0] == 'model-v2'
+        assert registry.loads == ['v1', 'v2']
+
+    def test_failed_preload_keeps_serving(self, registry):
+        """A version that fails to load does not interrupt serving"""
+        cache = make_cache(registry)
+        cache.get('ensemble')
+
+        registry.add_version('ensemble', 'v2')
+        registry.fail_versions.add('v2')
+        cache.on_promotion('ensemble', 'v2')
+        wait_for_loads(cache)
+
+        assert cache.get('ensemble')[0] == 'model-v1'
+
+    def test_evicts_by_entries_and_bytes(self, registry):
+        """Least recently used models are evicted; eviction is reported"""
+        evicted = []
+        cache = make_cache(registry, max_entries=2, max_bytes=250, on_evict=lambda *key: evicted.append(key))
+
+        registry.add_version('xgboost', 'x1')
+        registry.add_version('random_forest', 'r1')
+        cache.get('ensemble')
+        cache.get('xgboost')
+        cache.get('ensemble')
+        cache.get('random_forest')
+
+        assert evicted == [('xgboost', 'x1')]
+        assert cache.keys() == ['ensemble_v1', 'random_forest_r1']
+
+        registry.add_version('neural_network', 'n1', size=200)
+        cache.get('neural_network')
+        assert cache.get_stats()['total_bytes'] <= 250
+        assert cache.keys() == ['neural_network_n1']
+
+    def test_replaced_versions_evicted_first(self, registry):
+        """Versions no longer in production go before production versions"""
+        cache = make_cache(registry, pointer_ttl=0.0, max_entries=2)
+        cache.get('ensemble')
+
+        registry.add_version('ensemble', 'v2')
+        cache.get('ensemble')
+        wait_for_loads(cache)
+        cache.get('ensemble')
+
+        registry.add_version('xgboost', 'x1')
+        cache.get('xgboost')
+
+        assert cache.keys() == ['ensemble_v2', 'xgboost_x1']
+
+    def test_concurrent_misses_load_once(self, tmp_path):
+        """Concurrent requests for a cold version share one load"""
+        registry = FakeRegistry(tmp_path, load_delay=0.1)
+        registry.add_version('ensemble', 'v1')
+        cache = make_cache(registry)
+
+        results = []
+        threads = [
+            threading.Thread(target=lambda: results.append(cache.get('ensemble')[0]))
+            for _ in range(8)
+        ]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert results == ['model-v1'] * 8
+        assert registry.loads == ['v1']
+
+    def test_clear(self, registry):
+        """Clearing drops models and reports them to on_evict"""
+        evicted = []
+        cache = make_cache(registry, on_evict=lambda *key: evicted.append(key))
+        cache.get('ensemble')
+
+        assert cache.clear() == 1
+        assert len(cache) == 0
+        assert evicted == [('ensemble', 'v1')]
@@ -0,0 +1,99 @@
+"""
+Tests for Provenance Store
+
+Tests cover:
+- Saving and loading records
+- Indexed filtering by source, stage and timestamp
+- Lineage through the parent-child edge table
+- Importing one-JSON-file-per-record directories
+"""
+import pytest
+import json
+import tempfile
+import shutil
+from pathlib import Path
+from datetime import datetime
+
+from ml_pipeline.data_ingestion.provenance_store import ProvenanceStore
+
+
+def make_record(record_id: str, minute: int, data_source: str = 'ADNI',
+                processing_stage: str = 'raw', parents=None) -> dict:
+    """Create a record dictionary as saved by ProvenanceTracker"""
+    return {
+        'record_id': record_id,
+        'dataset_name': f"dataset_{record_id}",
+        'data_source': data_source,
+        'processing_stage': processing_stage,
+        'ingestion_timestamp': datetime(2024, 1, 1, 0, minute),
+        'parent_records': parents or [],
+        'metadata': {}
+    }
+
+
+@pytest.fixture
+def temp_dir():
+    """Create temporary directory for tests"""
+    path = tempfile.mkdtemp()
+    yield Path(path)
+    shutil.rmtree(path)
+
+
+@pytest.fixture
+def store(temp_dir):
+    """Store with a diamond-shaped lineage: d <- (b, c) <- a"""
+    store = ProvenanceStore(temp_dir / "provenance.db")
+    store.save(make_record('a', 0))
+    store.save(make_record('b', 1, processing_stage='cleaned', parents=['a']))
+    store.save(make_record('c', 2, data_source='NACC', parents=['a']))
+    store.save(make_record('d', 3, data_source='DERIVED', processing_stage='transformed', parents=['b', 'c']))
+    store.save(make_record('e', 4, data_source='OASIS'))
+    return store
+
+
+class TestProvenanceStore:
+    """Test suite for ProvenanceStore"""
+
+    def test_get(self, store):
+        """Records round-trip by ID"""
+        record = store.get('b')
+        assert record['dataset_name'] == 'dataset_b'
+        assert record['parent_records'] == ['a']
+        assert datetime.fromisoformat(record['ingestion_timestamp']) == datetime(2024, 1, 1, 0, 1)
+        assert store.get('missing') is None
+        assert store.count() == 5
+
+    def test_query_filters(self, store):
+        """Filters combine and results are ordered by timestamp"""
+        assert [r['record_id'] for r in store.query()] == ['a', 'b', 'c', 'd', 'e']
+        assert [r['record_id'] for r in store.query(data_source='ADNI')] == ['a', 'b']
+        assert [r['record_id'] for r in store.query(processing_stage='raw')] == ['a', 'c', 'e']
+        assert [r['record_id'] for r in store.query(
+            start_date=datetime(2024, 1, 1, 0, 1),
+            end_date=datetime(2024, 1, 1, 0, 3)
+        )] == ['b', 'c', 'd']
+
+    def test_ancestors(self, store):
+        """Lineage follows every parent once"""
+        assert sorted(r['record_id'] for r in store.get_ancestors('d')) == ['a', 'b', 'c', 'd']
+        assert [r['record_id'] for r in store.get_ancestors('e')] == ['e']
+        assert store.get_ancestors('missing') == []
+
+    def test_replace_updates_edges(self, store):
+        """Saving a record again replaces its parent links"""
+        store.save(make_record('d', 3, parents=['c']))
+        assert sorted(r['record_id'] for r in store.get_ancestors('d')) == ['a', 'c', 'd']
+
+    def test_import_json_records(self, temp_dir):
+        """JSON records are imported once; bad files are counted"""
+        json_dir = temp_dir / "json"
+        json_dir.mkdir()
+        for record in [make_record('a', 0), make_record('b', 1, parents=['a'])]:
+            with open(json_dir / f"{record['record_id']}.json", 'w') as f:
+                json.dump(record, f, default=str)
+        (json_dir / "broken.json").write_text("{")
+
+        store = ProvenanceStore(temp_dir / "provenance.db")
+        assert store.import_json_records(json_dir) == {'imported': 2, 'skipped': 0, 'failed': 1}
+        assert store.import_json_records(json_dir) == {'imported': 0, 'skipped': 2, 'failed': 1}
+        assert sorted(r['record_id'] for r in store.get_ancestors('b')) == ['a', 'b']
@@ -0,0 +1,106 @@
+"""
+Tests for Provenance Tracker Hashing
+
+Tests cover:
+- Content hashes stable across runs and tracker instances
+- Hashes changing with values and dtypes but not the index
+- Source file checksums recorded separately from the frame hash
+- Reusing the checksum of an unchanged source file
+"""
+import pytest
+import numpy as np
+import pandas as pd
+from types import SimpleNamespace
+
+from ml_pipeline.data_ingestion.provenance_tracker import DataSource, ProvenanceTracker
+
+
+def make_tracker(metadata_path):
+    """Create tracker storing records under metadata_path"""
+    return ProvenanceTracker(SimpleNamespace(METADATA_PATH=metadata_path))
+
+
+@pytest.fixture
+def tracker(tmp_path):
+    """Tracker with an empty store"""
+    return make_tracker(tmp_path / "metadata")
+
+
+@pytest.fixture
+def frame():
+    """Frame with numeric, text and missing values"""
+    return pd.DataFrame({
+        'patient_id': ['P001', 'P002', 'P003'],
+        'mmse': [28, 24, 19],
+        'csf_ab42': [612.5, np.nan, 480.0]
+    })
+
+
+class TestProvenanceTrackerHashing:
+    """Test suite for ProvenanceTracker content hashing"""
+
+    def test_hash_stable_across_runs(self, tmp_path, tracker, frame):
+        """The same frame hashes the same in another tracker instance"""
+        first = tracker._calculate_dataframe_hash(frame)
+
+        assert tracker._calculate_dataframe_hash(frame.copy()) == first
+        assert make_tracker(tmp_path / "other")._calculate_dataframe_hash(frame) == first
+
+    def test_hash_changes_with_values(self, tracker, frame):
+        """Changing one value changes the hash"""
+        changed = frame.copy()
+        changed.loc[1, 'mmse'] = 25
+
+        assert tracker._calculate_dataframe_hash(changed) != tracker._calculate_dataframe_hash(frame)
+
+    def test_hash_changes_with_dtypes(self, tracker, frame):
+        """Equal values with another dtype hash differently"""
+        changed = frame.astype({'mmse': 'float64'})
+
+        assert tracker._calculate_dataframe_hash(changed) != tracker._calculate_dataframe_hash(frame)
+
+    def test_hash_ignores_index(self, tracker, frame):
+        """Relabelling the index does not change the hash"""
+        relabelled = frame.set_axis([10, 20, 30])
+
+        assert tracker._calculate_dataframe_hash(relabelled) == tracker._calculate_dataframe_hash(frame)
+
+    def test_hash_chunking(self, tracker, frame, monkeypatch):
+        """Hashing in chunks gives the same result as one pass"""
+        expected = tracker._calculate_dataframe_hash(frame)
+        monkeypatch.setattr(ProvenanceTracker, 'HASH_CHUNK_ROWS', 2)
+
+        assert tracker._calculate_dataframe_hash(frame) == expected
+
+    def test_unchanged_file_reuses_checksum_not_frame_hash(self, tmp_path, tracker, monkeypatch):
+        """A re-ingested unchanged file keeps its checksum, but new data gets its own hash"""
+        source_file = tmp_path / "source.csv"
+        source_file.write_text("a\n1\n2\n")
+
+        first = tracker.track_ingestion('ds', DataSource.ADNI, pd.DataFrame({'a': [1, 2]}), source_file=source_file)
+
+        checksum_calls = []
+        monkeypatch.setattr(
+            tracker, '_calculate_file_checksum',
+            lambda path: checksum_calls.append(path) or 'recomputed'
+        )
+        different = pd.DataFrame({'a': [999, -5]})
+        second = tracker.track_ingestion('ds', DataSource.ADNI, different, source_file=source_file)
+
+        assert checksum_calls == []
+        assert second.source_checksum == first.source_checksum
+        assert second.data_hash == tracker._calculate_dataframe_hash(different)
+        assert second.data_hash != first.data_hash
+
+    def test_changed_file_gets_new_checksum(self, tmp_path, tracker):
+        """A modified source file is checksummed again"""
+        source_file = tmp_path / "source.csv"
+        source_file.write_text("a\n1\n2\n")
+        first = tracker.track_ingestion('ds', DataSource.ADNI, pd.DataFrame({'a': [1, 2]}), source_file=source_file)
+
+        source_file.write_text("a\n1\n2\n3\n")
+        second = tracker.track_ingestion('ds', DataSource.ADNI, pd.DataFrame({'a': [1, 2, 3]}), source_file=source_file)
+
+        assert second.source_signature != first.source_signature
+        assert second.source_checksum != first.source_checksum
+        assert tracker.get_record(second.record_id).source_checksum == second.source_checksum
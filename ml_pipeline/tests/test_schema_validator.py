@@ -0,0 +1,126 @@
+"""
+Tests for Schema Validator
+
+Tests cover:
+- Per-row error masks across null, type, range and allowed-value checks
+- Exact valid row counts and indices
+- Filtering valid rows
+- Compiled plan reuse
+"""
+import pytest
+
+import pandas as pd
+
+from ml_pipeline.data_ingestion.schema_validator import SchemaValidator, RowError
+
+
+@pytest.fixture
+def validator():
+    """Create schema validator"""
+    return SchemaValidator()
+
+
+@pytest.fixture
+def clinical_data():
+    """NACC clinical rows with one kind of error per row after the first"""
+    return pd.DataFrame({
+        'patient_id': ['P1', 'P2', None, 'P4', 'P5', 'P6'],
+        'visit_date': ['2020-01-01', '2020-02-03', '2020-03-01', 'not a date', '03/04/2021', '2020-06-01'],
+        'visit_number': [1, 2, 3, 4, 2.5, 1],
+        'mmse_score': [28, 27, 26, 25, 24, 40],
+        'cdr_global': [0, 0.5, 1, 2, 3, 7],
+        'data_source': 'NACC',
+        'ingestion_timestamp': pd.Timestamp('2024-01-01')
+    }, index=[10, 11, 12, 13, 14, 15])
+
+
+class TestSchemaValidator:
+    """Test suite for SchemaValidator"""
+
+    def test_valid_data(self, validator, clinical_data):
+        """Rows without errors pass and keep every row"""
+        data = clinical_data.loc[[10, 11]]
+        result = validator.validate(data, 'nacc_clinical')
+
+        assert result.valid
+        assert result.valid_rows == 2
+        assert result.invalid_row_indices == []
+        assert validator.filter_valid_rows(data, result).equals(data)
+
+    def test_row_error_mask(self, validator, clinical_data):
+        """Each failing check sets its bit on the failing rows only"""
+        result = validator.validate(clinical_data, 'nacc_clinical')
+        row_errors = result.get_row_errors()
+
+        assert not result.valid
+        assert row_errors[10] == 0
+        assert row_errors[11] == 0
+        assert row_errors[12] == RowError.NULL
+        assert row_errors[13] == RowError.TYPE
+        assert row_errors[14] == RowError.TYPE
+        assert row_errors[15] == RowError.RANGE | RowError.VALUE
+
+    def test_exact_valid_rows(self, validator, clinical_data):
+        """Valid row counts and indices are exact, not estimated"""
+        result = validator.validate(clinical_data, 'nacc_clinical')
+
+        assert result.total_rows == 6
+        assert result.valid_rows == 2
+        assert result.get_valid_row_indices() == [10, 11]
+        assert result.invalid_row_indices == [12, 13, 14, 15]
+        assert list(validator.filter_valid_rows(clinical_data, result).index) == [10, 11]
+
+    def test_single_bad_value_does_not_fail_column(self, validator, clinical_data):
+        """A bad value marks its own row, not the whole column"""
+        result = validator.validate(clinical_data, 'nacc_clinical')
+        errors = {(e.column, e.error_type): e for e in result.errors}
+
+        date_error = errors[('visit_date', 'invalid_data_type')]
+        assert date_error.count == 1
+        assert date_error.row_indices == [13]
+
+        integer_error = errors[('visit_number', 'invalid_data_type')]
+        assert integer_error.count == 1
+        assert integer_error.row_indices == [14]
+
+        assert errors[('mmse_score', 'out_of_range')].row_indices == [15]
+        assert errors[('cdr_global', 'invalid_value')].row_indices == [15]
+        assert errors[('patient_id', 'null_values')].row_indices == [12]
+
+    def test_numeric_strings(self, validator, clinical_data):
+        """Numeric strings are coerced before range and allowed-value checks"""
+        data = clinical_data.loc[[10, 11]].astype({'mmse_score': str, 'cdr_global': str})
+        result = validator.validate(data, 'nacc_clinical')
+
+        assert result.valid
+        assert result.valid_rows == 2
+
+    def test_missing_required_columns(self, validator, clinical_data):
+        """Missing columns fail validation without marking rows"""
+        data = clinical_data.loc[[10, 11]].drop(columns=['data_source'])
+        result = validator.validate(data, 'nacc_clinical')
+
+        assert not result.valid
+        assert result.errors[0].error_type == 'missing_required_columns'
+        assert result.valid_rows == 2
+
+    def test_plan_is_compiled_once(self, validator, clinical_data):
+        """Plans are reused until the schema is replaced"""
+        plan = validator.get_plan('nacc_clinical')
+        validator.validate(clinical_data, 'nacc_clinical')
+        assert validator.get_plan('nacc_clinical') is plan
+
+        validator.schemas['nacc_clinical'] = validator.schemas['adni_cognitive']
+        assert validator.get_plan('nacc_clinical') is not plan
+
+    def test_filter_rejects_other_data(self, validator, clinical_data):
+        """Filtering requires the frame that was validated"""
+        result = validator.validate(clinical_data, 'nacc_clinical')
+
+        with pytest.raises(ValueError):
+            validator.filter_valid_rows(clinical_data.iloc[:3], result)
+
+    def test_unknown_schema(self, validator, clinical_data):
+        """Unknown schema names raise ValueError"""
+        with pytest.raises(ValueError):
+            validator.validate(clinical_data, 'unknown')
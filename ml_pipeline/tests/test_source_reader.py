@@ -0,0 +1,95 @@
+"""
+Tests for Source File Reader
+
+Tests cover:
+- Column pruning and typed reads
+- Reusing cached parsed files for unchanged sources
+- Re-parsing and cache cleanup for changed sources
+- Concurrent multi-file reads
+"""
+import os
+
+import pytest
+
+import pandas as pd
+
+from ml_pipeline.data_ingestion import source_reader
+from ml_pipeline.data_ingestion.source_reader import SourceFileReader
+
+
+@pytest.fixture
+def csv_file(tmp_path):
+    """Source CSV with one column the parsers do not use"""
+    file_path = tmp_path / "ADNIMERGE.csv"
+    pd.DataFrame({
+        'RID': ['001', '002', '003'],
+        'MMSE': [28, 27, 30],
+        'UNUSED': ['a', 'b', 'c']
+    }).to_csv(file_path, index=False)
+    return file_path
+
+
+@pytest.fixture
+def reader(tmp_path):
+    """Create reader caching under a temporary directory"""
+    return SourceFileReader(tmp_path / "cache", max_workers=2)
+
+
+class TestSourceFileReader:
+    """Test suite for SourceFileReader"""
+
+    def test_pruned_typed_read(self, reader, csv_file):
+        """Only requested columns are read, with the given dtypes"""
+        data = reader.read_csv(csv_file, columns=['RID', 'MMSE', 'MISSING'], dtypes={'RID': 'string', 'MMSE': 'float64'})
+
+        assert list(data.columns) == ['RID', 'MMSE']
+        assert data['RID'].tolist() == ['001', '002', '003']
+        assert data['MMSE'].dtype == 'float64'
+
+    def test_no_matching_columns(self, reader, csv_file):
+        """A file without any requested column reads as empty"""
+        assert reader.read_csv(csv_file, columns=['OTHER']).empty
+
+    def test_unchanged_file_is_not_parsed_again(self, reader, csv_file, monkeypatch):
+        """A second read of an unchanged file comes from the cache"""
+        pytest.importorskip('pyarrow')
+        first = reader.read_csv(csv_file, columns=['RID', 'MMSE'], dtypes={'RID': 'string'})
+
+        def fail(*args, **kwargs):
+            raise AssertionError("file parsed again")
+
+        monkeypatch.setattr(reader, '_parse_csv', fail)
+        second = SourceFileReader(reader.cache_dir).read_csv(csv_file, columns=['RID', 'MMSE'], dtypes={'RID': 'string'})
+        pd.testing.assert_frame_equal(first, second, check_dtype=False)
+
+        # Manifest lets a new reader skip rehashing unchanged files
+        monkeypatch.setattr(source_reader.hashlib, 'sha256', fail)
+        SourceFileReader(reader.cache_dir)._file_checksum(csv_file)
+
+    def test_changed_file_is_parsed_again(self, reader, csv_file):
+        """A changed file is re-parsed and its old cache entry removed"""
+        pytest.importorskip('pyarrow')
+        reader.read_csv(csv_file, columns=['RID', 'MMSE'])
+        old_checksum = reader._file_checksum(csv_file)
+
+        pd.DataFrame({'RID': ['004'], 'MMSE': [20]}).to_csv(csv_file, index=False)
+        stat = csv_file.stat()
+        os.utime(csv_file, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+        data = reader.read_csv(csv_file, columns=['RID', 'MMSE'])
+
+        assert data['RID'].tolist() == [4]
+        assert not list(reader.cache_dir.glob(f"{old_checksum[:16]}_*.parquet"))
+
+    def test_read_csv_files(self, reader, csv_file, tmp_path):
+        """Files are read concurrently in order, skipping failures"""
+        other_file = tmp_path / "other.csv"
+        pd.DataFrame({'RID': ['004'], 'MMSE': [25]}).to_csv(other_file, index=False)
+
+        dfs = reader.read_csv_files(
+            [csv_file, tmp_path / "missing.csv", other_file],
+            columns=['RID', 'MMSE'],
+            dtypes={'RID': 'string'}
+        )
+
+        assert [len(df) for df in dfs] == [3, 1]
+        assert dfs[1]['RID'].tolist() == ['004']
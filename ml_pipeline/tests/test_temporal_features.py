@@ -0,0 +1,206 @@
+"""
+Tests for Temporal Feature Engineering
+
+Tests cover:
+- Parity of vectorized change rate, visit frequency and trajectory
+  calculations with the row-wise reference implementations
+- Missing values, missing dates, same-day visits and unsorted input
+"""
+import pytest
+import numpy as np
+import pandas as pd
+
+from ml_pipeline.feature_engineering.temporal_features import TemporalFeatureEngineer
+
+
+def reference_change_rate(data, patient_id_col, visit_date_col, measure_col):
+    """Row-wise change rate, as originally implemented"""
+    change_rates = []
+    
+    for idx, row in data.iterrows():
+        patient_id = row[patient_id_col]
+        current_date = row[visit_date_col]
+        current_value = row[measure_col]
+        
+        patient_data = data[
+            (data[patient_id_col] == patient_id) &
+            (data[visit_date_col] < current_date)
+        ].sort_values(visit_date_col)
+        
+        if len(patient_data) == 0 or pd.isna(current_value):
+            change_rates.append(0.0)
+        else:
+            prev_row = patient_data.iloc[-1]
+            prev_value = prev_row[measure_col]
+            prev_date = prev_row[visit_date_col]
+            
+            if pd.isna(prev_value):
+                change_rates.append(0.0)
+            else:
+                time_diff_months = (current_date - prev_date).days / 30.44
+                
+                if time_diff_months > 0:
+                    change_rates.append((current_value - prev_value) / time_diff_months)
+                else:
+                    change_rates.append(0.0)
+    
+    return pd.Series(change_rates, index=data.index)
+
+
+def reference_visit_frequency(data, patient_id_col, visit_date_col):
+    """Row-wise visit frequency, as originally implemented"""
+    frequencies = []
+    
+    for idx, row in data.iterrows():
+        patient_visits = data[
+            data[patient_id_col] == row[patient_id_col]
+        ][visit_date_col].sort_values()
+        
+        if len(patient_visits) <= 1:
+            frequencies.append(np.nan)
+        else:
+            time_diffs = patient_visits.diff().dropna()
+            frequencies.append(time_diffs.mean().days / 30.44)
+    
+    return pd.Series(frequencies, index=data.index)
+
+
+def reference_trajectory(data, patient_id_col, visit_date_col, measure_col, declining_threshold):
+    """Row-wise trajectory classification, as originally implemented"""
+    trajectories = []
+    
+    for idx, row in data.iterrows():
+        patient_data = data[
+            (data[patient_id_col] == row[patient_id_col]) &
+            (data[visit_date_col] <= row[visit_date_col])
+        ].sort_values(visit_date_col)
+        
+        if len(patient_data) < 2:
+            trajectories.append(0)
+        else:
+            first_value = patient_data[measure_col].iloc[0]
+            last_value = patient_data[measure_col].iloc[-1]
+            
+            if pd.isna(first_value) or pd.isna(last_value):
+                trajectories.append(0)
+            else:
+                change = last_value - first_value
+                
+                if change <= declining_threshold:
+                    trajectories.append(1)
+                elif change >= abs(declining_threshold):
+                    trajectories.append(2)
+                else:
+                    trajectories.append(0)
+    
+    return pd.Series(trajectories, index=data.index)
+
+
+def create_longitudinal_data(n_patients: int = 60, seed: int = 0) -> pd.DataFrame:
+    """Create shuffled longitudinal data with gaps, same-day visits and missing values"""
+    rng = np.random.default_rng(seed)
+    rows = []
+    
+    for i in range(n_patients):
+        visit_date = pd.Timestamp('2015-01-01') + pd.Timedelta(days=int(rng.integers(0, 365)))
+        mmse = float(rng.integers(20, 30))
+        hippocampus = float(rng.normal(7000, 300))
+        
+        for _ in range(int(rng.integers(1, 9))):
+            rows.append({
+                'patient_id': f'P{i:03d}',
+                'visit_date': visit_date,
+                'mmse_total': mmse if rng.random() > 0.15 else np.nan,
+                'hippocampus_total': hippocampus if rng.random() > 0.15 else np.nan
+            })
+            
+            # Some visits fall on the same day as the previous one
+            if rng.random() > 0.2:
+                visit_date += pd.Timedelta(days=int(rng.integers(1, 400)))
+            mmse += float(rng.integers(-4, 3))
+            hippocampus += float(rng.normal(-60, 80))
+    
+    data = pd.DataFrame(rows)
+    data.loc[rng.choice(len(data), size=5, replace=False), 'visit_date'] = pd.NaT
+    
+    # Shuffle rows and use a non-default index
+    data = data.sample(frac=1, random_state=seed)
+    data.index = rng.permutation(len(data)) * 3 + 7
+    return data
+
+
+@pytest.fixture
+def engineer():
+    """Temporal feature engineer"""
+    return TemporalFeatureEngineer()
+
+
+@pytest.fixture(params=[0, 1, 2])
+def longitudinal_data(request):
+    """Synthetic longitudinal data for several seeds"""
+    return create_longitudinal_data(seed=request.param)
+
+
+class TestTemporalFeatureParity:
+    """Vectorized calculations match the row-wise reference implementations"""
+    
+    @pytest.mark.parametrize('measure_col', ['mmse_total', 'hippocampus_total'])
+    def test_change_rate(self, engineer, longitudinal_data, measure_col):
+        """Test change rates match the reference"""
+        result = engineer._calculate_change_rate(
+            longitudinal_data, 'patient_id', 'visit_date', measure_col
+        )
+        expected = reference_change_rate(
+            longitudinal_data, 'patient_id', 'visit_date', measure_col
+        )
+        
+        pd.testing.assert_series_equal(result, expected, rtol=0, atol=0)
+    
+    def test_visit_frequency(self, engineer, longitudinal_data):
+        """Test visit frequencies match the reference"""
+        result = engineer.calculate_visit_frequency(longitudinal_data, 'patient_id', 'visit_date')
+        expected = reference_visit_frequency(longitudinal_data, 'patient_id', 'visit_date')
+        
+        pd.testing.assert_series_equal(result, expected, check_names=False, rtol=0, atol=0)
+    
+    @pytest.mark.parametrize('measure_col, threshold', [
+        ('mmse_total', -2),
+        ('hippocampus_total', -100)
+    ])
+    def test_trajectory(self, engineer, longitudinal_data, measure_col, threshold):
+        """Test trajectory classes match the reference"""
+        result = engineer._classify_trajectory(
+            longitudinal_data, 'patient_id', 'visit_date', measure_col, threshold
+        )
+        expected = reference_trajectory(
+            longitudinal_data, 'patient_id', 'visit_date', measure_col, threshold
+        )
+        
+        pd.testing.assert_series_equal(result, expected)
+    
+    def test_single_visit_patients(self, engineer):
+        """Test patients with one visit get default values"""
+        data = pd.DataFrame({
+            'patient_id': ['A', 'B'],
+            'visit_date': pd.to_datetime(['2020-01-01', '2020-06-01']),
+            'mmse_total': [28.0, 25.0]
+        })
+        
+        assert engineer._calculate_change_rate(
+            data, 'patient_id', 'visit_date', 'mmse_total'
+        ).tolist() == [0.0, 0.0]
+        assert engineer.calculate_visit_frequency(data, 'patient_id', 'visit_date').isna().all()
+        assert engineer._classify_trajectory(
+            data, 'patient_id', 'visit_date', 'mmse_total', -2
+        ).tolist() == [0, 0]
+    
+    def test_extract_features(self, engineer):
+        """Test full temporal feature extraction on complete data"""
+        data = create_longitudinal_data(n_patients=20, seed=5).dropna(subset=['visit_date'])
+        features = engineer.extract_features(data.copy())
+        
+        expected_rate = reference_change_rate(data, 'patient_id', 'visit_date', 'mmse_total')
+        pd.testing.assert_series_equal(
+            features['mmse_decline_rate'], expected_rate, check_names=False
+        )
+        assert all(engineer.validate_features(features).values())